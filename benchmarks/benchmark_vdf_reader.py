@@ -0,0 +1,151 @@
+import argparse
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+import vdf
+
+from steamflow.local_library_service import (
+    APPMANIFEST_KEY_PATH,
+    extract_localconfig_app_stats,
+    extract_localconfig_app_stats_from_bytes,
+    get_localconfig_steam_data,
+)
+from steamflow.vdf_reader import parse_vdf_bytes
+
+
+def build_manifest(app_id, depot_count=6):
+    return {
+        "AppState": {
+            "appid": str(app_id),
+            "universe": "1",
+            "LauncherPath": "C:\\Program Files (x86)\\Steam\\steam.exe",
+            "name": f"Synthetic Game {app_id}",
+            "StateFlags": "4",
+            "installdir": f"Synthetic Game {app_id}",
+            "LastUpdated": "1712345678",
+            "LastPlayed": "1712345678",
+            "SizeOnDisk": "12345678901",
+            "StagingSize": "0",
+            "buildid": "13371337",
+            "LastOwner": "76561198000000000",
+            "BytesToDownload": "0",
+            "BytesDownloaded": "0",
+            "BytesToStage": "0",
+            "BytesStaged": "0",
+            "TargetBuildID": "0",
+            "AutoUpdateBehavior": "0",
+            "InstalledDepots": {
+                str(app_id + index + 1): {"manifest": str(random.getrandbits(63)), "size": "123456789"}
+                for index in range(depot_count)
+            },
+            "UserConfig": {"language": "english"},
+            "MountedConfig": {"language": "english"},
+        }
+    }
+
+
+def build_localconfig(app_count, friend_count):
+    return {
+        "UserLocalConfigStore": {
+            "friends": {
+                str(76561198000000000 + index): {"name": f"friend {index}", "NameHistory": {"0": f"old {index}"}}
+                for index in range(friend_count)
+            },
+            "Software": {
+                "Valve": {
+                    "Steam": {
+                        "apps": {
+                            str(index * 10): {
+                                "LastPlayed": str(1700000000 + index),
+                                "Playtime": str(index % 5000),
+                                "Playtime2wks": "0",
+                                "cloud": {"last_sync_state": "synchronized", "quota_bytes": "1000000"},
+                                "autocloud": {"lastlaunch": str(1700000000 + index), "lastexit": "0"},
+                            }
+                            for index in range(app_count)
+                        },
+                    }
+                }
+            },
+            "WebStorage": {f"key_{index}": "x" * 200 for index in range(app_count)},
+        }
+    }
+
+
+def time_call(callback, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        callback()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def run_manifest_benchmark(manifest_count, repeat):
+    manifests = [vdf.dumps(build_manifest(1000 + index * 10), pretty=True).encode("utf-8") for index in range(manifest_count)]
+
+    def with_vdf():
+        for data in manifests:
+            vdf.load(io.StringIO(data.decode("utf-8", errors="ignore"))).get("AppState", {})
+
+    def with_reader():
+        for data in manifests:
+            parse_vdf_bytes(data, key_path=APPMANIFEST_KEY_PATH).get("AppState", {})
+
+    return time_call(with_vdf, repeat), time_call(with_reader, repeat)
+
+
+def run_localconfig_benchmark(app_count, friend_count, repeat):
+    data = vdf.dumps(build_localconfig(app_count, friend_count), pretty=True).encode("utf-8")
+
+    def with_vdf():
+        root = vdf.load(io.StringIO(data.decode("utf-8", errors="ignore")))
+        return extract_localconfig_app_stats(get_localconfig_steam_data(root))
+
+    def with_reader():
+        return extract_localconfig_app_stats_from_bytes(data)
+
+    if with_vdf() != with_reader():
+        raise AssertionError("vdf_reader returned different localconfig stats than vdf.load")
+    return len(data), time_call(with_vdf, repeat), time_call(with_reader, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare steamflow.vdf_reader with vdf.load on synthetic Steam files.")
+    parser.add_argument("--manifests", type=int, default=400)
+    parser.add_argument("--apps", type=int, default=4000)
+    parser.add_argument("--friends", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(1)
+    sample = vdf.dumps(build_manifest(1000), pretty=True).encode("utf-8")
+    expected = vdf.load(io.StringIO(sample.decode("utf-8")))["AppState"]
+    filtered = parse_vdf_bytes(sample, key_path=APPMANIFEST_KEY_PATH)["AppState"]
+    if any(expected[key] != value for key, value in filtered.items()):
+        raise AssertionError("vdf_reader returned different manifest values than vdf.load")
+
+    vdf_ms, reader_ms = run_manifest_benchmark(args.manifests, args.repeat)
+    print(f"appmanifest x{args.manifests}: vdf.load {vdf_ms:.1f} ms, vdf_reader {reader_ms:.1f} ms ({vdf_ms / reader_ms:.1f}x)")
+
+    size, vdf_ms, reader_ms = run_localconfig_benchmark(args.apps, args.friends, args.repeat)
+    print(
+        f"localconfig {size / (1024 * 1024):.1f} MB: vdf.load {vdf_ms:.1f} ms, "
+        f"vdf_reader {reader_ms:.1f} ms ({vdf_ms / reader_ms:.1f}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -30,14 +30,40 @@ LIGHTWEIGHT_METHODS = {
 }
 
 
-def get_request_method():
+def get_request():
     if len(sys.argv) <= 1:
-        return ""
+        return {}
     try:
         request = json.loads(sys.argv[1])
     except (json.JSONDecodeError, TypeError, ValueError):
-        return ""
-    return str(request.get("method", ""))
+        return {}
+    return request if isinstance(request, dict) else {}
+
+
+def get_request_method():
+    return str(get_request().get("method", ""))
+
+
+def forward_to_query_daemon(request):
+    from steamflow.query_daemon import (
+        forward_query_daemon_request,
+        should_forward_rpc_request,
+        start_query_daemon_process,
+    )
+
+    if not should_forward_rpc_request(request):
+        return False
+    payloads = forward_query_daemon_request(plugindir, request)
+    if payloads is None:
+        try:
+            start_query_daemon_process(plugindir)
+        except Exception:
+            pass
+        return False
+    for payload in payloads:
+        sys.stdout.write(payload)
+    sys.stdout.flush()
+    return True
 
 
 def get_plugin_class():
@@ -53,7 +79,15 @@ def get_plugin_class():
 
 
 if __name__ == "__main__":
+    if forward_to_query_daemon(get_request()):
+        sys.exit(0)
     plugin = get_plugin_class()()
     run = getattr(plugin, "run", None)
     if callable(run):
         run()
+    finish_short_lived_request = getattr(plugin, "finish_short_lived_request", None)
+    if callable(finish_short_lived_request):
+        try:
+            finish_short_lived_request()
+        except Exception:
+            pass
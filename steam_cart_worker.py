@@ -14,6 +14,7 @@ if str(LIB_PATH) not in sys.path:
 from steamflow.cart import open_steam_cart, perform_add_to_cart
 from steamflow.feature_health import (
     classify_feature_error,
+    get_feature_health_store,
     record_feature_failure,
     record_feature_success,
 )
@@ -50,19 +51,21 @@ def main():
     try:
         logger.info("Steam cart worker started for app %s", app_id)
         package = perform_add_to_cart(secure_settings_dir, steamid64, app_id, logger=logger)
-        record_feature_success(feature_health_cache_file, "steam_session_token")
-        record_feature_success(feature_health_cache_file, "steam_cart")
+        with get_feature_health_store(feature_health_cache_file).batch():
+            record_feature_success(feature_health_cache_file, "steam_session_token")
+            record_feature_success(feature_health_cache_file, "steam_cart")
         logger.info("Steam cart worker added package %s for app %s", package.get("packageid"), app_id)
         open_steam_cart()
         logger.info("Steam cart opened for app %s", app_id)
         return 0
     except Exception as error:
         reason = classify_feature_error(error, "steam_cart")
-        if reason in {"token_not_found", "htmlcache_missing", "token_rejected", "token_expired", "auth_rejected"}:
-            record_feature_failure(feature_health_cache_file, "steam_session_token", error, reason=reason)
-            record_feature_failure(feature_health_cache_file, "steam_cart", error, reason="dependency_failed")
-        else:
-            record_feature_failure(feature_health_cache_file, "steam_cart", error, reason=reason)
+        with get_feature_health_store(feature_health_cache_file).batch():
+            if reason in {"token_not_found", "htmlcache_missing", "token_rejected", "token_expired", "auth_rejected"}:
+                record_feature_failure(feature_health_cache_file, "steam_session_token", error, reason=reason)
+                record_feature_failure(feature_health_cache_file, "steam_cart", error, reason="dependency_failed")
+            else:
+                record_feature_failure(feature_health_cache_file, "steam_cart", error, reason=reason)
         logger.exception("Steam cart worker failed for app %s", app_id)
         return 1
     finally:
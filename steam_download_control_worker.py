@@ -15,6 +15,7 @@ from steamflow.download_control import perform_download_control
 from steamflow.download_status_cache import set_download_control_status_hint
 from steamflow.feature_health import (
     classify_feature_error,
+    get_feature_health_store,
     record_feature_failure,
     record_feature_success,
 )
@@ -54,17 +55,19 @@ def main():
         logger.info("Download control worker started for app %s action=%s", app_id, action)
         perform_download_control(secure_settings_dir, steamid64, app_id, action, logger=logger)
         set_download_control_status_hint(PROJECT_ROOT / "cache_download_progress.json", app_id, action)
-        record_feature_success(feature_health_cache_file, "steam_session_token")
-        record_feature_success(feature_health_cache_file, "download_control")
+        with get_feature_health_store(feature_health_cache_file).batch():
+            record_feature_success(feature_health_cache_file, "steam_session_token")
+            record_feature_success(feature_health_cache_file, "download_control")
         logger.info("Download control worker finished for app %s action=%s", app_id, action)
         return 0
     except Exception as error:
         reason = classify_feature_error(error, "download_control")
-        if reason in {"token_not_found", "htmlcache_missing", "token_rejected", "token_expired", "auth_rejected"}:
-            record_feature_failure(feature_health_cache_file, "steam_session_token", error, reason=reason)
-            record_feature_failure(feature_health_cache_file, "download_control", error, reason="dependency_failed")
-        else:
-            record_feature_failure(feature_health_cache_file, "download_control", error, reason=reason)
+        with get_feature_health_store(feature_health_cache_file).batch():
+            if reason in {"token_not_found", "htmlcache_missing", "token_rejected", "token_expired", "auth_rejected"}:
+                record_feature_failure(feature_health_cache_file, "steam_session_token", error, reason=reason)
+                record_feature_failure(feature_health_cache_file, "download_control", error, reason="dependency_failed")
+            else:
+                record_feature_failure(feature_health_cache_file, "download_control", error, reason=reason)
         logger.exception("Download control worker failed for app %s action=%s", app_id, action)
         return 1
     finally:
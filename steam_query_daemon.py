@@ -0,0 +1,51 @@
+import logging
+import sys
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+plugindir = Path(__file__).parent.resolve()
+if str(plugindir) not in sys.path:
+    sys.path.insert(0, str(plugindir))
+lib_path = plugindir / "lib"
+if str(lib_path) not in sys.path:
+    sys.path.insert(0, str(lib_path))
+
+LOG_FILE = plugindir / "steam_query_daemon.log"
+
+
+try:
+    log_handler = RotatingFileHandler(
+        LOG_FILE,
+        maxBytes=512 * 1024,
+        backupCount=1,
+        encoding="utf-8",
+    )
+except Exception:
+    log_handler = logging.StreamHandler(sys.stderr)
+log_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+logger = logging.getLogger("steam_query_daemon")
+logger.handlers.clear()
+logger.addHandler(log_handler)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+try:
+    from steamflow import SteamPlugin
+    from steamflow.query_daemon import clear_query_daemon_start_lock, run_query_daemon
+except Exception:
+    logger.exception("Failed to import SteamFlow query daemon helpers")
+    raise
+
+
+def main():
+    try:
+        run_query_daemon(plugindir, SteamPlugin, logger=logger)
+    except Exception:
+        logger.exception("Query daemon stopped unexpectedly")
+        clear_query_daemon_start_lock(plugindir)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
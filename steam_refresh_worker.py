@@ -0,0 +1,152 @@
+import logging
+import os
+import sys
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+plugindir = Path(__file__).parent.resolve()
+if str(plugindir) not in sys.path:
+    sys.path.insert(0, str(plugindir))
+lib_path = plugindir / "lib"
+if str(lib_path) not in sys.path:
+    sys.path.insert(0, str(lib_path))
+
+LOG_FILE = plugindir / "steam_refresh_worker.log"
+LOCK_FILE = plugindir / "steam_refresh_worker.lock"
+JOBS_FILE = plugindir / "steam_refresh_jobs.json"
+TASK_WAIT_TIMEOUT_SECONDS = 30
+
+
+logger = logging.getLogger("steam_refresh_worker")
+
+
+def configure_logger(log_file=LOG_FILE):
+    try:
+        log_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=512 * 1024,
+            backupCount=1,
+            encoding="utf-8",
+        )
+    except Exception:
+        log_handler = logging.StreamHandler(sys.stderr)
+    log_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+    logger.handlers.clear()
+    logger.addHandler(log_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+try:
+    from steamflow.refresh_handoff import claim_refresh_jobs, run_refresh_jobs
+    from steamflow.tasks import get_task_scheduler
+except Exception:
+    logger.exception("Failed to import SteamFlow refresh helpers")
+    raise
+
+
+class FileLock:
+    def __init__(self, lock_file):
+        self.lock_file = Path(lock_file)
+        self.fd = None
+
+    def acquire(self, timeout=0):
+        start_time = time.time()
+        while True:
+            try:
+                self.fd = os.open(str(self.lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self.fd, str(os.getpid()).encode("ascii", errors="ignore"))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - self.lock_file.stat().st_mtime > 15 * 60:
+                        self.lock_file.unlink()
+                        continue
+                except OSError:
+                    pass
+
+                if timeout == 0 or (time.time() - start_time) >= timeout:
+                    return False
+                time.sleep(0.1)
+
+    def release(self):
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+        try:
+            self.lock_file.unlink()
+        except OSError:
+            pass
+
+
+def build_plugin(settings):
+    from steamflow import SteamPlugin
+
+    plugin = SteamPlugin()
+    plugin.bind_rpc_request({"method": "query", "parameters": [], "settings": settings or None})
+    plugin.ensure_startup_initialized()
+    return plugin
+
+
+def wait_for_scheduled_tasks(plugin, timeout=TASK_WAIT_TIMEOUT_SECONDS):
+    deadline = time.monotonic() + timeout
+    for task in get_task_scheduler(plugin).list_unfinished_tasks():
+        remaining_seconds = deadline - time.monotonic()
+        if remaining_seconds <= 0 or not task.join(remaining_seconds):
+            return False
+    return True
+
+
+def log_failed_job(pending_name, key):
+    logger.exception("Refresh job failed: %s %s", pending_name, key or "")
+
+
+def process_claimed_jobs(jobs_file=JOBS_FILE, plugin_factory=build_plugin):
+    processed_count = 0
+    while True:
+        claimed = claim_refresh_jobs(jobs_file)
+        if claimed is None:
+            return processed_count
+        settings, jobs = claimed
+        if not jobs:
+            continue
+        start_time = time.perf_counter()
+        plugin = plugin_factory(settings)
+        completed_count = run_refresh_jobs(plugin, jobs, on_error=log_failed_job)
+        if not wait_for_scheduled_tasks(plugin):
+            logger.warning("Timed out waiting for follow-up refresh tasks")
+        plugin.persist_runtime_caches()
+        processed_count += len(jobs)
+        logger.info(
+            "Refresh worker completed %s/%s jobs in %.1fms",
+            completed_count,
+            len(jobs),
+            (time.perf_counter() - start_time) * 1000,
+        )
+
+
+def main():
+    configure_logger()
+    while True:
+        lock = FileLock(LOCK_FILE)
+        if not lock.acquire(timeout=0):
+            logger.info("Refresh worker already running")
+            return 0
+        try:
+            process_claimed_jobs()
+        except Exception:
+            logger.exception("Refresh worker stopped unexpectedly")
+            return 1
+        finally:
+            lock.release()
+        if not JOBS_FILE.exists():
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
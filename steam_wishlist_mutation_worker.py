@@ -13,6 +13,7 @@ if str(LIB_PATH) not in sys.path:
 
 from steamflow.feature_health import (
     classify_feature_error,
+    get_feature_health_store,
     record_feature_failure,
     record_feature_success,
 )
@@ -50,17 +51,19 @@ def main():
     try:
         logger.info("Steam wishlist worker started for app %s action %s", app_id, action)
         perform_wishlist_mutation(secure_settings_dir, steamid64, app_id, action, logger=logger)
-        record_feature_success(feature_health_cache_file, "steam_session_token")
-        record_feature_success(feature_health_cache_file, "steam_wishlist")
+        with get_feature_health_store(feature_health_cache_file).batch():
+            record_feature_success(feature_health_cache_file, "steam_session_token")
+            record_feature_success(feature_health_cache_file, "steam_wishlist")
         logger.info("Steam wishlist worker completed for app %s action %s", app_id, action)
         return 0
     except Exception as error:
         reason = classify_feature_error(error, "steam_wishlist")
-        if reason in {"token_not_found", "htmlcache_missing", "token_rejected", "token_expired", "auth_rejected"}:
-            record_feature_failure(feature_health_cache_file, "steam_session_token", error, reason=reason)
-            record_feature_failure(feature_health_cache_file, "steam_wishlist", error, reason="dependency_failed")
-        else:
-            record_feature_failure(feature_health_cache_file, "steam_wishlist", error, reason=reason)
+        with get_feature_health_store(feature_health_cache_file).batch():
+            if reason in {"token_not_found", "htmlcache_missing", "token_rejected", "token_expired", "auth_rejected"}:
+                record_feature_failure(feature_health_cache_file, "steam_session_token", error, reason=reason)
+                record_feature_failure(feature_health_cache_file, "steam_wishlist", error, reason="dependency_failed")
+            else:
+                record_feature_failure(feature_health_cache_file, "steam_wishlist", error, reason=reason)
         logger.exception("Steam wishlist worker failed for app %s action %s", app_id, action)
         return 1
     finally:
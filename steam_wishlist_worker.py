@@ -35,7 +35,8 @@ logger.propagate = False
 try:
     from steamflow.app_details import (
         APP_DETAILS_CACHE_DIR_NAME,
-        AppDetailsFileCache,
+        AppDetailsStore,
+        app_details_entry_matches_language,
         fetch_app_details_metadata_with_urlopen,
         is_app_details_cache_entry_fresh,
         normalize_app_details_country_code,
@@ -99,8 +100,7 @@ def fetch_app_details(app_id, country_code, steam_language="english"):
 
 
 def entry_matches_language(entry, steam_language):
-    entry_language = (entry or {}).get("steam_language")
-    return entry_language == steam_language or (steam_language == "english" and entry_language is None)
+    return app_details_entry_matches_language(entry, steam_language)
 
 
 def main():
@@ -136,11 +136,12 @@ def main():
             force,
             ",".join(app_ids),
         )
-        app_details_cache = AppDetailsFileCache(APP_DETAILS_CACHE_DIR)
+        app_details_cache = AppDetailsStore(APP_DETAILS_CACHE_DIR)
+        cache_entries = app_details_cache.read_many(app_ids, country_code)
         cache_changed = False
 
         for app_id in app_ids:
-            cache_entry = app_details_cache.read_entry(app_id, country_code)
+            cache_entry = cache_entries.get(app_id)
             language_matches = entry_matches_language(cache_entry, steam_language)
             if is_cache_entry_fresh(cache_entry) and language_matches and not force:
                 if cache_entry and cache_entry.get("success"):
@@ -187,6 +188,7 @@ def main():
             logger.info("Wishlist worker updated appdetails cache")
         else:
             logger.info("Wishlist worker found nothing to update")
+        app_details_cache.close()
         return 0
     finally:
         lock.release()
@@ -4,6 +4,8 @@ from pathlib import Path
 import shutil
 import vdf
 
+from .vdf_reader import load_vdf_path
+
 
 STEAMID64_OFFSET = 76561197960265728
 
@@ -31,7 +33,8 @@ def normalize_loginusers_data(parsed):
 
 
 def load_loginusers_file(loginusers_path, vdf_loader=None):
-    vdf_loader = vdf_loader or vdf.load
+    if vdf_loader is None:
+        return normalize_loginusers_data(load_vdf_path(loginusers_path))
     with open(loginusers_path, "r", encoding="utf-8", errors="ignore") as file_obj:
         return normalize_loginusers_data(vdf_loader(file_obj))
 
@@ -89,7 +89,7 @@ class SteamPluginAccountsMixin:
                 return cached_data
 
             try:
-                parsed = load_loginusers_file(candidate_path, vdf_loader=vdf.load)
+                parsed = load_loginusers_file(candidate_path)
                 return self._store_loginusers_cache(candidate_path, current_mtime, parsed)
             except Exception:
                 parse_failed = True
@@ -1,9 +1,11 @@
-import os
+import json
+import sqlite3
+import threading
 import time
 import urllib.parse
 from pathlib import Path
 
-from .cache_utils import build_timestamped_cache_entry, is_timestamp_fresh, read_json_file, write_json_file
+from .cache_utils import build_timestamped_cache_entry, is_timestamp_fresh, read_json_file
 from .http_client import DEFAULT_HTTP_HEADERS, http_get_json, urllib_get_json
 from .util_currency import normalize_country_code
 
@@ -16,7 +18,47 @@ APP_DETAILS_FAILURE_CACHE_TTL_SECONDS = 6 * 60 * 60
 APP_DETAILS_FILE_MAX_AGE_SECONDS = 10 * 24 * 60 * 60
 APP_DETAILS_FILE_TOUCH_INTERVAL_SECONDS = 24 * 60 * 60
 APP_DETAILS_CLEANUP_INTERVAL_SECONDS = 24 * 60 * 60
-MAX_CACHE_FILES = 1067
+MAX_CACHE_ENTRIES = 1067
+APP_DETAILS_DATABASE_FILE_NAME = "app_details.sqlite3"
+APP_DETAILS_DATABASE_VERSION = 2
+APP_DETAILS_DATABASE_TIMEOUT_SECONDS = 5.0
+APP_DETAILS_QUERY_CHUNK_SIZE = 500
+APP_DETAILS_DATABASE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS app_details ("
+    "country_code TEXT NOT NULL, "
+    "app_id TEXT NOT NULL, "
+    "timestamp REAL NOT NULL, "
+    "success INTEGER NOT NULL, "
+    "steam_language TEXT, "
+    "metadata TEXT NOT NULL, "
+    "last_access REAL NOT NULL, "
+    "PRIMARY KEY (country_code, app_id))",
+    "CREATE INDEX IF NOT EXISTS app_details_last_access ON app_details (last_access)",
+    "CREATE TABLE IF NOT EXISTS app_details_state (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS app_search ("
+    "country_code TEXT NOT NULL, "
+    "app_id TEXT NOT NULL, "
+    "steam_language TEXT, "
+    "name TEXT NOT NULL, "
+    "type TEXT NOT NULL, "
+    "is_free INTEGER NOT NULL, "
+    "has_price INTEGER NOT NULL, "
+    "final_price INTEGER NOT NULL, "
+    "discount_percent INTEGER NOT NULL, "
+    "coming_soon INTEGER NOT NULL, "
+    "PRIMARY KEY (country_code, app_id))",
+)
+APP_DETAILS_UPSERT_SQL = (
+    "INSERT OR REPLACE INTO app_details "
+    "(country_code, app_id, timestamp, success, steam_language, metadata, last_access) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+APP_SEARCH_UPSERT_SQL = (
+    "INSERT OR REPLACE INTO app_search "
+    "(country_code, app_id, steam_language, name, type, is_free, has_price, final_price, discount_percent, coming_soon) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+APP_SEARCH_FIELDS = ("name", "type", "is_free", "has_price", "final_price", "discount_percent", "coming_soon")
 
 
 def normalize_app_id(app_id):
@@ -78,6 +120,77 @@ def parse_app_details_metadata(payload, app_id):
     return normalize_app_details_metadata(app_details.get("data", {}))
 
 
+def app_details_entry_matches_language(entry, steam_language):
+    entry_language = (entry or {}).get("steam_language")
+    return entry_language == steam_language or (steam_language == "english" and entry_language is None)
+
+
+def build_app_details_row(app_id, country_code, entry, last_access):
+    if not isinstance(entry, dict) or not isinstance(entry.get("metadata"), dict):
+        return None
+    try:
+        timestamp = float(entry.get("timestamp", 0) or 0)
+    except (TypeError, ValueError):
+        timestamp = 0.0
+    steam_language = entry.get("steam_language")
+    return (
+        normalize_app_details_country_code(country_code),
+        normalize_app_id(app_id),
+        timestamp,
+        1 if entry.get("success") else 0,
+        str(steam_language) if steam_language is not None else None,
+        json.dumps(entry["metadata"], ensure_ascii=False, separators=(",", ":")),
+        float(last_access),
+    )
+
+
+def normalize_app_search_name(name):
+    return str(name or "").strip().lower()
+
+
+def _coerce_price_int(value):
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def build_app_search_entry(metadata):
+    if not isinstance(metadata, dict):
+        return None
+    name = normalize_app_search_name(metadata.get("name"))
+    if not name:
+        return None
+    price = metadata.get("price") if isinstance(metadata.get("price"), dict) else {}
+    return {
+        "name": name,
+        "type": str(metadata.get("type", "") or "").strip().lower(),
+        "is_free": bool(metadata.get("is_free")),
+        "has_price": bool(metadata.get("has_price")),
+        "final_price": _coerce_price_int(price.get("final")),
+        "discount_percent": _coerce_price_int(price.get("discount_percent")),
+        "coming_soon": bool(metadata.get("coming_soon")),
+    }
+
+
+def build_app_search_row(app_id, country_code, steam_language, metadata):
+    search_entry = build_app_search_entry(metadata)
+    if search_entry is None:
+        return None
+    return (
+        normalize_app_details_country_code(country_code),
+        normalize_app_id(app_id),
+        str(steam_language) if steam_language is not None else None,
+        search_entry["name"],
+        search_entry["type"],
+        int(search_entry["is_free"]),
+        int(search_entry["has_price"]),
+        search_entry["final_price"],
+        search_entry["discount_percent"],
+        int(search_entry["coming_soon"]),
+    )
+
+
 def build_appdetails_url(app_id, country_code=None, language="en"):
     query = {
         "appids": str(app_id or "").strip(),
@@ -97,11 +210,12 @@ def fetch_app_details_metadata_with_http_get(http_get, app_id, country_code=None
         http_get,
         build_appdetails_url(app_id, country_code=country_code, language=language),
         timeout=timeout,
+        flight_key="appdetails",
     )
     return parse_app_details_metadata(payload, app_id)
 
 
-def fetch_app_details_metadata_with_urlopen(app_id, country_code=None, language="en", timeout=0.5):
+def fetch_app_details_metadata_with_urlopen(app_id, country_code=None, language="en", timeout=0.5, opener=None):
     app_id = str(app_id or "").strip()
     if not app_id:
         return None
@@ -109,39 +223,214 @@ def fetch_app_details_metadata_with_urlopen(app_id, country_code=None, language=
     payload = urllib_get_json(
         build_appdetails_url(app_id, country_code=country_code, language=language),
         timeout=timeout,
+        opener=opener,
     )
     return parse_app_details_metadata(payload, app_id)
 
 
-class AppDetailsFileCache:
+class AppDetailsStore:
     def __init__(self, cache_dir):
         self.cache_dir = Path(cache_dir)
-        self.cleanup_marker_file = self.cache_dir / ".last_cleanup.json"
+        self.database_file = self.cache_dir / APP_DETAILS_DATABASE_FILE_NAME
+        self.lock = threading.RLock()
+        self.connection = None
+        self.generation = 0
         self._recently_touched = {}
 
-    def entry_path(self, app_id, country_code="us"):
-        return self.cache_dir / normalize_app_details_country_code(country_code) / f"{normalize_app_id(app_id)}.json"
+    def connect(self):
+        with self.lock:
+            if self.connection is not None:
+                return self.connection
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.database_file),
+                timeout=APP_DETAILS_DATABASE_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    if connection.execute("PRAGMA user_version").fetchone()[0] < APP_DETAILS_DATABASE_VERSION:
+                        for statement in APP_DETAILS_DATABASE_SCHEMA:
+                            connection.execute(statement)
+                        self.migrate_directory_entries(connection)
+                        self.rebuild_search_entries(connection)
+                        connection.execute(f"PRAGMA user_version={APP_DETAILS_DATABASE_VERSION}")
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+            except BaseException:
+                connection.close()
+                raise
+            self.connection = connection
+            return connection
+
+    def close(self):
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def migrate_directory_entries(self, connection):
+        rows = []
+        legacy_files = []
+        for country_dir in self.cache_dir.iterdir():
+            if not country_dir.is_dir():
+                continue
+            for path in country_dir.glob("*.json"):
+                legacy_files.append(path)
+                try:
+                    last_access = path.stat().st_mtime
+                    row = build_app_details_row(
+                        path.stem,
+                        country_dir.name,
+                        read_json_file(path, default=None),
+                        last_access,
+                    )
+                except (OSError, ValueError):
+                    continue
+                if row:
+                    rows.append(row)
+        connection.executemany(APP_DETAILS_UPSERT_SQL, rows)
+        for path in [*legacy_files, self.cache_dir / ".last_cleanup.json"]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        for country_dir in {path.parent for path in legacy_files}:
+            try:
+                country_dir.rmdir()
+            except OSError:
+                pass
+
+    def rebuild_search_entries(self, connection):
+        rows = []
+        for country_code, app_id, steam_language, metadata in connection.execute(
+            "SELECT country_code, app_id, steam_language, metadata FROM app_details WHERE success = 1"
+        ):
+            try:
+                row = build_app_search_row(app_id, country_code, steam_language, json.loads(metadata))
+            except ValueError:
+                continue
+            if row:
+                rows.append(row)
+        connection.execute("DELETE FROM app_search")
+        connection.executemany(APP_SEARCH_UPSERT_SQL, rows)
+
+    def get_change_signature(self):
+        try:
+            with self.lock:
+                data_version = self.connect().execute("PRAGMA data_version").fetchone()[0]
+        except (OSError, sqlite3.Error):
+            return None
+        return (data_version, self.generation)
+
+    def read_search_entries(self, app_ids, country_code="us", steam_language="english"):
+        country_code = normalize_app_details_country_code(country_code)
+        normalized_app_ids = []
+        for app_id in app_ids or ():
+            try:
+                normalized_app_ids.append(normalize_app_id(app_id))
+            except ValueError:
+                continue
+        normalized_app_ids = list(dict.fromkeys(normalized_app_ids))
+        entries = {}
+        try:
+            with self.lock:
+                connection = self.connect()
+                for chunk_start in range(0, len(normalized_app_ids), APP_DETAILS_QUERY_CHUNK_SIZE):
+                    chunk = normalized_app_ids[chunk_start:chunk_start + APP_DETAILS_QUERY_CHUNK_SIZE]
+                    placeholders = ",".join("?" for _app_id in chunk)
+                    for app_id, entry_language, *values in connection.execute(
+                        f"SELECT app_id, steam_language, {', '.join(APP_SEARCH_FIELDS)} FROM app_search "
+                        f"WHERE country_code = ? AND app_id IN ({placeholders})",
+                        (country_code, *chunk),
+                    ):
+                        if not app_details_entry_matches_language({"steam_language": entry_language}, steam_language):
+                            continue
+                        entry = dict(zip(APP_SEARCH_FIELDS, values))
+                        for field_name in ("is_free", "has_price", "coming_soon"):
+                            entry[field_name] = bool(entry[field_name])
+                        entries[app_id] = entry
+        except (OSError, sqlite3.Error):
+            return {}
+        return entries
+
+    def read_many(self, app_ids, country_code="us", touch=True, now=None):
+        country_code = normalize_app_details_country_code(country_code)
+        normalized_app_ids = []
+        for app_id in app_ids or ():
+            try:
+                normalized_app_ids.append(normalize_app_id(app_id))
+            except ValueError:
+                continue
+        normalized_app_ids = list(dict.fromkeys(normalized_app_ids))
+        entries = {}
+        try:
+            with self.lock:
+                connection = self.connect()
+                for chunk_start in range(0, len(normalized_app_ids), APP_DETAILS_QUERY_CHUNK_SIZE):
+                    chunk = normalized_app_ids[chunk_start:chunk_start + APP_DETAILS_QUERY_CHUNK_SIZE]
+                    placeholders = ",".join("?" for _app_id in chunk)
+                    for app_id, timestamp, success, steam_language, metadata in connection.execute(
+                        "SELECT app_id, timestamp, success, steam_language, metadata FROM app_details "
+                        f"WHERE country_code = ? AND app_id IN ({placeholders})",
+                        (country_code, *chunk),
+                    ):
+                        try:
+                            metadata = json.loads(metadata)
+                        except ValueError:
+                            continue
+                        if isinstance(metadata, dict):
+                            entries[app_id] = {
+                                "timestamp": timestamp,
+                                "success": bool(success),
+                                "metadata": metadata,
+                                "steam_language": steam_language,
+                            }
+        except (OSError, sqlite3.Error):
+            return {}
+        if touch and entries:
+            self.touch_many(entries, country_code, now=now)
+        return entries
 
     def read_entry(self, app_id, country_code="us", touch=True, now=None):
         try:
-            path = self.entry_path(app_id, country_code)
-            entry = read_json_file(path, default=None)
-            if not isinstance(entry, dict) or not isinstance(entry.get("metadata"), dict):
-                return None
-            if touch:
-                self.touch_entry(app_id, country_code, now=now)
-            return entry
-        except (OSError, ValueError):
+            app_id = normalize_app_id(app_id)
+        except ValueError:
             return None
+        return self.read_many([app_id], country_code, touch=touch, now=now).get(app_id)
 
-    def touch_entry(self, app_id, country_code="us", now=None):
+    def touch_many(self, app_ids, country_code="us", now=None):
         now = time.time() if now is None else float(now)
-        path = self.entry_path(app_id, country_code)
-        if now - self._recently_touched.get(path, 0) < APP_DETAILS_FILE_TOUCH_INTERVAL_SECONDS:
+        country_code = normalize_app_details_country_code(country_code)
+        stale_keys = []
+        for app_id in app_ids:
+            try:
+                key = (country_code, normalize_app_id(app_id))
+            except ValueError:
+                continue
+            if now - self._recently_touched.get(key, 0) >= APP_DETAILS_FILE_TOUCH_INTERVAL_SECONDS:
+                stale_keys.append(key)
+        if not stale_keys:
+            return
+        try:
+            with self.lock:
+                self.connect().executemany(
+                    "UPDATE app_details SET last_access = ? WHERE country_code = ? AND app_id = ? AND last_access <= ?",
+                    [(now, cc, app_id, now - APP_DETAILS_FILE_TOUCH_INTERVAL_SECONDS) for cc, app_id in stale_keys],
+                )
+        except (OSError, sqlite3.Error):
             return
-        if now - path.stat().st_mtime >= APP_DETAILS_FILE_TOUCH_INTERVAL_SECONDS:
-            os.utime(path, (now, now))
-        self._recently_touched[path] = now
+        for key in stale_keys:
+            self._recently_touched[key] = now
+
+    def touch_entry(self, app_id, country_code="us", now=None):
+        self.touch_many([app_id], country_code, now=now)
 
     def get_metadata(self, app_id, country_code="us"):
         entry = self.read_entry(app_id, country_code)
@@ -149,16 +438,56 @@ class AppDetailsFileCache:
             return None
         return entry["metadata"]
 
+    def write_many(self, entries, country_code="us", timestamp=None, steam_language=None):
+        now = time.time()
+        country_code = normalize_app_details_country_code(country_code)
+        written_entries = {}
+        rows = []
+        search_rows = []
+        for app_id, (metadata, success) in (entries or {}).items():
+            app_id = normalize_app_id(app_id)
+            entry = build_timestamped_cache_entry(
+                {
+                    "success": bool(success),
+                    "metadata": dict(metadata or {}),
+                    "steam_language": str(steam_language or "en"),
+                },
+                now=timestamp,
+            )
+            row = build_app_details_row(app_id, country_code, entry, now)
+            if row:
+                rows.append(row)
+                written_entries[app_id] = entry
+                search_row = build_app_search_row(app_id, country_code, entry["steam_language"], entry["metadata"])
+                if search_row and entry["success"]:
+                    search_rows.append(search_row)
+        try:
+            with self.lock:
+                connection = self.connect()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    connection.executemany(APP_DETAILS_UPSERT_SQL, rows)
+                    connection.executemany(
+                        "DELETE FROM app_search WHERE country_code = ? AND app_id = ?",
+                        [(row[0], row[1]) for row in rows],
+                    )
+                    connection.executemany(APP_SEARCH_UPSERT_SQL, search_rows)
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+        except (OSError, sqlite3.Error):
+            return {}
+        return written_entries
+
     def write_entry(self, app_id, metadata, success, country_code="us", timestamp=None, steam_language=None):
-        entry = build_timestamped_cache_entry(
-            {
-                "success": bool(success),
-                "metadata": dict(metadata or {}),
-                "steam_language": str(steam_language or "en"),
-            },
-            now=timestamp,
-        )
-        return entry if write_json_file(self.entry_path(app_id, country_code), entry) else None
+        app_id = normalize_app_id(app_id)
+        return self.write_many(
+            {app_id: (metadata, success)},
+            country_code,
+            timestamp=timestamp,
+            steam_language=steam_language,
+        ).get(app_id)
 
     def migrate_legacy_entries(self, entries):
         if not isinstance(entries, dict):
@@ -181,49 +510,60 @@ class AppDetailsFileCache:
                 migration_complete = False
         return migration_complete
 
+    def count_entries(self):
+        try:
+            with self.lock:
+                return self.connect().execute("SELECT COUNT(*) FROM app_details").fetchone()[0]
+        except (OSError, sqlite3.Error):
+            return 0
+
     def cleanup(self, now=None, force=False):
         now = time.time() if now is None else float(now)
-        if not force:
-            try:
-                if now - self.cleanup_marker_file.stat().st_mtime < APP_DETAILS_CLEANUP_INTERVAL_SECONDS:
-                    return False
-            except OSError:
-                pass
-
-        changed = False
-        files = []
-        if self.cache_dir.is_dir():
-            try:
-                country_dirs = list(self.cache_dir.iterdir())
-            except OSError:
-                country_dirs = []
-            for country_dir in country_dirs:
-                if not country_dir.is_dir():
-                    continue
-                for path in country_dir.glob("*.json"):
-                    try:
-                        mtime = path.stat().st_mtime
-                        if now - mtime >= APP_DETAILS_FILE_MAX_AGE_SECONDS:
-                            path.unlink()
-                            changed = True
-                        else:
-                            files.append((mtime, path))
-                    except OSError:
-                        continue
-
-        for _mtime, path in sorted(files)[:max(0, len(files) - MAX_CACHE_FILES)]:
-            try:
-                path.unlink()
-                changed = True
-            except OSError:
-                continue
-
-        write_json_file(self.cleanup_marker_file, {"timestamp": now})
+        try:
+            with self.lock:
+                connection = self.connect()
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    last_cleanup = connection.execute(
+                        "SELECT value FROM app_details_state WHERE key = 'last_cleanup'"
+                    ).fetchone()
+                    if not force and last_cleanup and now - float(last_cleanup[0]) < APP_DETAILS_CLEANUP_INTERVAL_SECONDS:
+                        connection.execute("ROLLBACK")
+                        return False
+                    changed = connection.execute(
+                        "DELETE FROM app_details WHERE last_access <= ?",
+                        (now - APP_DETAILS_FILE_MAX_AGE_SECONDS,),
+                    ).rowcount > 0
+                    changed = connection.execute(
+                        "DELETE FROM app_details WHERE rowid IN ("
+                        "SELECT rowid FROM app_details ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                        (MAX_CACHE_ENTRIES,),
+                    ).rowcount > 0 or changed
+                    if changed:
+                        connection.execute(
+                            "DELETE FROM app_search WHERE NOT EXISTS ("
+                            "SELECT 1 FROM app_details WHERE app_details.country_code = app_search.country_code "
+                            "AND app_details.app_id = app_search.app_id)"
+                        )
+                    connection.execute(
+                        "INSERT OR REPLACE INTO app_details_state (key, value) VALUES ('last_cleanup', ?)",
+                        (str(now),),
+                    )
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+        except (OSError, sqlite3.Error, ValueError):
+            return False
+        if changed:
+            self._recently_touched.clear()
+            self.generation += 1
         return changed
 
 
-# Kept as a compatibility alias for callers that imported the old class name.
-MetricAppDetailsCache = AppDetailsFileCache
+# Kept as compatibility aliases for callers that imported the old class names.
+AppDetailsFileCache = AppDetailsStore
+MetricAppDetailsCache = AppDetailsStore
 
 
 class AppDetailsMetadataProvider:
@@ -0,0 +1,211 @@
+import time
+from pathlib import Path
+
+
+CACHE_BUDGET_INDEX_VERSION = 1
+CACHE_KIND_DIRECTORY = "directory"
+CACHE_KIND_FILES = "files"
+
+
+def get_path_size(path):
+    try:
+        return int(Path(path).stat().st_size)
+    except OSError:
+        return 0
+
+
+def format_cache_size(size_bytes):
+    size = max(0, int(size_bytes or 0))
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+class CacheSpec:
+    def __init__(
+        self,
+        name,
+        paths,
+        kind=CACHE_KIND_DIRECTORY,
+        ttl_seconds=None,
+        priority=0,
+        evictable=True,
+        pinned_names=(),
+    ):
+        self.name = str(name)
+        self.paths = [Path(path) for path in (paths if isinstance(paths, (list, tuple)) else [paths]) if path]
+        self.kind = kind
+        self.ttl_seconds = ttl_seconds
+        self.priority = int(priority)
+        self.evictable = bool(evictable) and kind == CACHE_KIND_DIRECTORY
+        self.pinned_names = frozenset(pinned_names)
+
+    @property
+    def root(self):
+        return self.paths[0] if self.paths else None
+
+
+class CacheBudgetRegistry:
+    def __init__(self, specs, budget_bytes, touch_interval_seconds=60 * 60, clock=time.time):
+        self.specs = {spec.name: spec for spec in specs}
+        self.budget_bytes = int(budget_bytes)
+        self.touch_interval_seconds = float(touch_interval_seconds)
+        self.clock = clock
+        self.entries = {name: {} for name, spec in self.specs.items() if spec.kind == CACHE_KIND_DIRECTORY}
+        self.indexed = set()
+        self.evicted = {name: set() for name in self.entries}
+        self.last_enforced = 0.0
+        self.dirty = False
+
+    def to_payload(self):
+        return {
+            "version": CACHE_BUDGET_INDEX_VERSION,
+            "last_enforced": self.last_enforced,
+            "caches": {
+                name: {
+                    "root": str(self.specs[name].root),
+                    "indexed": name in self.indexed,
+                    "entries": {entry_name: list(entry) for entry_name, entry in entries.items()},
+                }
+                for name, entries in self.entries.items()
+            },
+        }
+
+    def merge_payload(self, payload):
+        if not isinstance(payload, dict) or payload.get("version") != CACHE_BUDGET_INDEX_VERSION:
+            return
+        try:
+            self.last_enforced = max(self.last_enforced, float(payload.get("last_enforced") or 0))
+        except (TypeError, ValueError):
+            pass
+        caches = payload.get("caches")
+        for name, cache_data in (caches.items() if isinstance(caches, dict) else ()):
+            spec = self.specs.get(name)
+            if spec is None or spec.kind != CACHE_KIND_DIRECTORY or not isinstance(cache_data, dict):
+                continue
+            if cache_data.get("root") != str(spec.root):
+                continue
+            entries = cache_data.get("entries")
+            for entry_name, entry in (entries.items() if isinstance(entries, dict) else ()):
+                if entry_name in self.evicted[name] or not isinstance(entry, list) or len(entry) != 2:
+                    continue
+                try:
+                    last_access, size = float(entry[0]), int(entry[1])
+                except (TypeError, ValueError):
+                    continue
+                current_entry = self.entries[name].get(entry_name)
+                if current_entry is None or current_entry[0] < last_access:
+                    self.entries[name][entry_name] = [last_access, size]
+            if cache_data.get("indexed") is True:
+                self.indexed.add(name)
+
+    @classmethod
+    def from_payload(cls, payload, specs, budget_bytes, **kwargs):
+        registry = cls(specs, budget_bytes, **kwargs)
+        registry.merge_payload(payload)
+        return registry
+
+    def record_access(self, cache_name, entry_path, size=None):
+        entries = self.entries.get(cache_name)
+        if entries is None:
+            return False
+        entry_name = Path(entry_path).name
+        current_entry = entries.get(entry_name)
+        now = self.clock()
+        if current_entry is not None and (size is None or int(size) == current_entry[1]):
+            if (now - current_entry[0]) < self.touch_interval_seconds:
+                return False
+        if size is None:
+            size = current_entry[1] if current_entry else get_path_size(self.specs[cache_name].root / entry_name)
+        entries[entry_name] = [now, int(size)]
+        self.evicted[cache_name].discard(entry_name)
+        self.dirty = True
+        return True
+
+    def list_unindexed_caches(self):
+        return [name for name in self.entries if name not in self.indexed]
+
+    def index_directory(self, cache_name):
+        spec = self.specs[cache_name]
+        entries = {}
+        try:
+            for file_path in spec.root.iterdir():
+                if file_path.name in spec.pinned_names or not file_path.is_file():
+                    continue
+                stat_result = file_path.stat()
+                entries[file_path.name] = [float(stat_result.st_mtime), int(stat_result.st_size)]
+        except OSError:
+            pass
+        return entries
+
+    def apply_directory_index(self, cache_name, entries):
+        for entry_name, entry in entries.items():
+            current_entry = self.entries[cache_name].get(entry_name)
+            if current_entry is None or current_entry[0] < entry[0]:
+                self.entries[cache_name][entry_name] = entry
+        self.indexed.add(cache_name)
+        self.dirty = True
+
+    def get_footprint(self):
+        footprint = {}
+        for name, spec in self.specs.items():
+            if spec.kind == CACHE_KIND_DIRECTORY:
+                footprint[name] = sum(entry[1] for entry in self.entries[name].values())
+            else:
+                footprint[name] = sum(get_path_size(path) for path in spec.paths)
+        return footprint
+
+    def list_unreferenced_entries(self, cache_name, referenced_names, accessed_before):
+        return [
+            (cache_name, entry_name)
+            for entry_name, (last_access, _size) in self.entries.get(cache_name, {}).items()
+            if entry_name not in referenced_names and last_access < accessed_before
+        ]
+
+    def plan_evictions(self, now=None, unreferenced=()):
+        now = self.clock() if now is None else float(now)
+        unreferenced = set(unreferenced)
+        footprint = self.get_footprint()
+        total_bytes = sum(footprint.values())
+        victims = []
+        candidates = []
+        for name, entries in self.entries.items():
+            spec = self.specs[name]
+            if not spec.evictable:
+                continue
+            for entry_name, (last_access, size) in entries.items():
+                if (name, entry_name) in unreferenced or (
+                    spec.ttl_seconds is not None and (now - last_access) > spec.ttl_seconds
+                ):
+                    victims.append((name, entry_name, size))
+                    total_bytes -= size
+                else:
+                    candidates.append((spec.priority, last_access, name, entry_name, size))
+        for _priority, _last_access, name, entry_name, size in sorted(candidates):
+            if total_bytes <= self.budget_bytes:
+                break
+            victims.append((name, entry_name, size))
+            total_bytes -= size
+        return victims
+
+    def remove_entries(self, victims):
+        for name, entry_name, _size in victims:
+            self.entries[name].pop(entry_name, None)
+            self.evicted[name].add(entry_name)
+        if victims:
+            self.dirty = True
+
+
+def delete_cache_entries(registry, victims):
+    removed = []
+    for name, entry_name, size in victims:
+        try:
+            (registry.specs[name].root / entry_name).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            continue
+        removed.append((name, entry_name, size))
+    return removed
@@ -2,9 +2,13 @@ import json
 import os
 import tempfile
 import time
+from contextlib import contextmanager
 from pathlib import Path
 
 
+LOCK_FILE_STALE_SECONDS = 30.0
+
+
 def is_timestamp_fresh(timestamp, ttl_seconds):
     try:
         timestamp_value = float(timestamp or 0)
@@ -15,6 +19,47 @@ def is_timestamp_fresh(timestamp, ttl_seconds):
     return (time.time() - timestamp_value) < float(ttl_seconds or 0)
 
 
+def get_path_signature(path):
+    if not path:
+        return None
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+@contextmanager
+def exclusive_lock_file(lock_file, timeout=2.0, stale_seconds=LOCK_FILE_STALE_SECONDS, poll_interval=0.01):
+    lock_file = Path(lock_file)
+    deadline = time.monotonic() + float(timeout)
+    while True:
+        try:
+            fd = os.open(str(lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_file.stat().st_mtime > stale_seconds:
+                    lock_file.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            except OSError:
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for lock file {lock_file}")
+            time.sleep(poll_interval)
+    try:
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        yield lock_file
+    finally:
+        os.close(fd)
+        try:
+            lock_file.unlink()
+        except OSError:
+            pass
+
+
 def read_json_file(path, default=None, logger=None, error_message=None):
     try:
         with open(path, "r", encoding="utf-8") as file_obj:
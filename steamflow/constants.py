@@ -31,6 +31,7 @@ class SteamFlowIconConfig:
     wishlist_icon: str = "icons/wishlist.png"
     wishlist_add_icon: str = "icons/wl_add.png"
     wishlist_remove_icon: str = "icons/wl_remove.png"
+    thumbnail_size: int = 64
 
 
 @dataclass(frozen=True)
@@ -48,6 +49,9 @@ class SteamFlowCacheConfig:
     owned_games_retry_delay_seconds: int = 10 * 60
     owned_games_cache_ttl_seconds: int = 24 * 60 * 60
     search_ttl_seconds: int = 30
+    store_search_stale_ttl_seconds: int = 24 * 60 * 60
+    store_search_disk_max_entries: int = 200
+    store_search_provisional_wait_seconds: float = 0.25
     store_specials_ttl_seconds: int = 20 * 60
     store_top_sellers_ttl_seconds: int = 45 * 60
     store_collection_stale_ttl_seconds: int = 24 * 60 * 60
@@ -62,6 +66,16 @@ class SteamFlowCacheConfig:
     wishlist_ttl_seconds: int = 15 * 60
     cleanup_interval_seconds: int = 5 * 60
     metric_cache_save_interval_seconds: int = 10
+    metric_journal_compact_bytes: int = 256 * 1024
+    metric_cache_lock_timeout_seconds: float = 2.0
+    librarycache_icon_recheck_seconds: int = 30
+    game_icon_failure_ttl_seconds: int = 6 * 60 * 60
+    image_cache_ttl_seconds: int = 3 * 24 * 60 * 60
+    avatar_cache_ttl_seconds: int = 30 * 24 * 60 * 60
+    disk_budget_bytes: int = 128 * 1024 * 1024
+    budget_enforce_interval_seconds: int = 6 * 60 * 60
+    budget_touch_interval_seconds: int = 60 * 60
+    thumbnail_orphan_grace_seconds: int = 60 * 60
     profile_summary_ttl_seconds: int = 30
 
 
@@ -70,6 +84,13 @@ class SteamFlowPerformanceConfig:
     max_log_size_bytes: int = 10 * 1024
     query_log_threshold_ms: int = 250
     stage_log_threshold_ms: int = 100
+    library_scan_max_workers: int = 4
+    library_scan_batch_size: int = 64
+    task_scheduler_max_workers: int = 8
+    task_scheduler_max_background_workers: int = 4
+    task_scheduler_max_fanout_workers: int = 24
+    icon_download_max_workers: int = 4
+    drain_budget_ms: int = 300
 
 
 @dataclass(frozen=True)
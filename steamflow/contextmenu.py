@@ -5,13 +5,13 @@ from .actions import SteamPluginActionsMixin
 from .app_details import (
     APP_DETAILS_CACHE_DIR_NAME,
     AppDetailsMetadataProvider,
-    MetricAppDetailsCache,
+    AppDetailsStore,
     fetch_app_details_metadata_with_urlopen,
 )
 from .cart import SteamPluginCartMixin
 from .feature_health import feature_enabled
 from .hooks import get_secure_settings_dir
-from .localization import Localizer, plugin_tr, resolve_configured_locale
+from .localization import get_localizer, plugin_tr, resolve_configured_locale
 from .menu import (
     get_game_context_menu_entries,
     get_steam_client_context_menu_entries,
@@ -20,6 +20,7 @@ from .menu import (
 )
 from .os_integration import resolve_steam_install_path_from_registry
 from .pyflow_compat import SteamFlowPluginBase
+from .settings_snapshot import coerce_setting_bool
 from .wishlist_mutation_service import start_steam_wishlist_mutation_worker_process
 
 PACKAGE_ROOT = Path(__file__).resolve().parent.parent
@@ -29,7 +30,7 @@ UNSET = object()
 class SteamContextMenuPlugin(SteamPluginCartMixin, SteamPluginActionsMixin, SteamFlowPluginBase):
     @cached_property
     def app_details_cache_store(self):
-        return MetricAppDetailsCache(self.plugin_dir / APP_DETAILS_CACHE_DIR_NAME)
+        return AppDetailsStore(self.plugin_dir / APP_DETAILS_CACHE_DIR_NAME)
 
     @cached_property
     def app_details_provider(self):
@@ -154,15 +155,10 @@ class SteamContextMenuPlugin(SteamPluginCartMixin, SteamPluginActionsMixin, Stea
         return resolve_configured_locale(self.settings.get("language", "auto"))
 
     def tr(self, key, default=None, **values):
-        return Localizer(self.get_language()).tr(key, default=default, **values)
+        return get_localizer(self.get_language()).tr(key, default=default, **values)
 
     def get_setting_bool(self, name, default):
-        value = self.settings.get(name, default)
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.strip().lower() in {"1", "true", "yes", "on"}
-        return bool(value)
+        return coerce_setting_bool(self.settings.get(name, default))
 
     def start_steam_wishlist_mutation_worker(self, steamid64, app_id, action):
         start_steam_wishlist_mutation_worker_process(
@@ -2,18 +2,37 @@ import re
 import threading
 import time
 import traceback
+from pathlib import Path
 
 from . import util_currency, util_steam_date
+from .app_details import APP_DETAILS_DATABASE_FILE_NAME
+from .cache_budget import CACHE_KIND_FILES, CacheBudgetRegistry, CacheSpec, delete_cache_entries, format_cache_size
 from .cache_utils import (
     cleanup_timestamped_cache_entries,
     get_timestamped_cache_entry_state,
     is_timestamp_fresh,
+    read_json_file,
     update_timestamped_cache_entry,
+    write_json_file,
 )
 from .constants import STEAMFLOW_CONFIG
 from .http_client import http_get_json, http_pool_get, http_pool_request
-from .localization import Localizer, resolve_configured_locale
+from .icon_thumbnails import (
+    ICON_THUMBNAIL_MANIFEST_NAME,
+    IconThumbnailCache,
+    create_icon_thumbnail,
+    get_source_signature,
+)
+from .localization import get_localizer, resolve_configured_locale
+from .metric_journal import METRIC_CACHE_NAMES
 from .providers import get_plugin_providers
+from .refresh_handoff import (
+    build_refresh_job,
+    is_refresh_worker_running,
+    merge_refresh_jobs,
+    normalize_refresh_jobs,
+    start_refresh_worker_process,
+)
 from .secure_storage import (
     DATA_BLOB as SecureDataBlob,
     build_data_blob,
@@ -22,7 +41,18 @@ from .secure_storage import (
     unprotect_dpapi_bytes,
     write_protected_text,
 )
-from .tasks import get_background_task_manager
+from .settings_snapshot import (
+    build_settings_snapshot,
+    get_flow_launcher_settings_path,
+    get_settings_signature,
+    resolve_plugin_keyword,
+)
+from .tasks import get_background_task_manager, get_task_scheduler
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
 
 
 class SteamPluginCoreMixin:
@@ -54,8 +84,16 @@ class SteamPluginCoreMixin:
     def log_exception(self, message):
         self.logger.error("%s\n%s", message, traceback.format_exc(limit=3).strip())
 
-    def _http_get(self, url, timeout, headers=None):
-        return http_pool_get(self.http_pool, self.urllib3, url, timeout=timeout, headers=headers)
+    def _http_get(self, url, timeout, headers=None, flight_key=None):
+        return http_pool_get(
+            self.http_pool,
+            self.urllib3,
+            url,
+            timeout=timeout,
+            headers=headers,
+            single_flight=getattr(self, "http_single_flight", None),
+            flight_key=flight_key,
+        )
 
     def _prewarm_connections(self):
         start_time = time.perf_counter()
@@ -83,24 +121,7 @@ class SteamPluginCoreMixin:
         return {"method": method, "parameters": list(parameters)}
 
     def get_current_plugin_keyword(self):
-        try:
-            plugin_settings = self.app_settings.get("PluginSettings", {}).get("Plugins", {}).get(self.id, {})
-        except Exception:
-            plugin_settings = {}
-
-        for setting_name in ("UserKeywords", "ActionKeywords"):
-            keywords = plugin_settings.get(setting_name)
-            if isinstance(keywords, list):
-                for keyword in keywords:
-                    normalized = str(keyword or "").strip()
-                    if normalized:
-                        return normalized
-            else:
-                normalized = str(keywords or "").strip()
-                if normalized:
-                    return normalized
-
-        return str(getattr(self, "user_keyword", "") or getattr(self, "action_keyword", "") or "steam").strip()
+        return self.get_settings_snapshot().plugin_keyword
 
     def build_plugin_query(self, *parts):
         keyword = self.get_current_plugin_keyword()
@@ -127,14 +148,40 @@ class SteamPluginCoreMixin:
         result.update(extra_fields)
         return result
 
+    def get_settings_snapshot(self):
+        rpc_request = getattr(self, "rpc_request", None)
+        snapshot = getattr(self, "settings_snapshot", None)
+        if snapshot is not None and rpc_request is not None and self.settings_snapshot_request is rpc_request:
+            return snapshot
+
+        settings = self.settings
+        signature = get_settings_signature(settings, get_flow_launcher_settings_path(getattr(self, "appdata", None)))
+        if snapshot is None or snapshot.signature != signature:
+            language = resolve_configured_locale(settings.get("language", "auto"))
+            plugin_keyword = resolve_plugin_keyword(getattr(self, "app_settings", {}), getattr(self, "id", None)) or str(
+                getattr(self, "user_keyword", "") or getattr(self, "action_keyword", "") or "steam"
+            ).strip()
+            snapshot = build_settings_snapshot(
+                settings,
+                signature,
+                language,
+                get_localizer(language).steam_language,
+                plugin_keyword,
+                default_blacklisted_app_ids=self.CONFIG.default_blacklisted_app_ids,
+            )
+        self.settings_snapshot = snapshot
+        self.settings_snapshot_request = rpc_request
+        self.settings_blacklisted_app_ids = None
+        return snapshot
+
     def get_language(self):
-        return resolve_configured_locale(self.settings.get("language", "auto"))
+        return self.get_settings_snapshot().language
 
     def get_steam_language(self):
-        return Localizer(self.get_language()).steam_language
+        return self.get_settings_snapshot().steam_language
 
     def tr(self, key, default=None, **values):
-        return Localizer(self.get_language()).tr(key, default=default, **values)
+        return get_localizer(self.get_language()).tr(key, default=default, **values)
 
     def build_context_data(
         self,
@@ -187,74 +234,57 @@ class SteamPluginCoreMixin:
             data["steamid64"] = str(steamid64)
         return data
 
-    def get_setting_bool(self, name, default):
-        value = self.settings.get(name, default)
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.strip().lower() in {"1", "true", "yes", "on"}
-        return bool(value)
-
     def get_blacklisted_app_ids(self):
-        raw_value = self.settings.get(
-            "blacklisted_app_ids",
-            ",".join(sorted(self.CONFIG.default_blacklisted_app_ids)),
-        )
-        if isinstance(raw_value, list):
-            parts = raw_value
-        else:
-            parts = str(raw_value).replace("\n", ",").split(",")
-
-        blacklist = set(self.CONFIG.default_blacklisted_app_ids)
-        for part in parts:
-            app_id = str(part).strip()
-            if app_id:
-                blacklist.add(app_id)
-        if self.should_hide_hidden_games():
-            blacklist.update(self.load_hidden_app_ids())
-        return blacklist
+        snapshot = self.get_settings_snapshot()
+        if not self.should_hide_hidden_games():
+            return snapshot.blacklisted_app_ids
+        blacklisted_app_ids = getattr(self, "settings_blacklisted_app_ids", None)
+        if blacklisted_app_ids is None:
+            blacklisted_app_ids = snapshot.blacklisted_app_ids | frozenset(self.load_hidden_app_ids())
+            self.settings_blacklisted_app_ids = blacklisted_app_ids
+        return blacklisted_app_ids
 
     def should_show_platforms(self):
-        return self.get_setting_bool("show_platforms", False)
+        return self.get_settings_snapshot().show_platforms
 
     def should_show_player_count(self):
-        return self.get_setting_bool("show_player_count", True)
+        return self.get_settings_snapshot().show_player_count
 
     def should_show_positive_reviews(self):
-        return self.get_setting_bool("show_positive_reviews", True)
+        return self.get_settings_snapshot().show_positive_reviews
 
     def should_sort_local_by_recent(self):
-        return self.get_setting_bool("sort_local_by_recent", True)
+        return self.get_settings_snapshot().sort_local_by_recent
 
     def should_hide_hidden_games(self):
-        return self.get_setting_bool("hide_hidden_games", True)
+        return self.get_settings_snapshot().hide_hidden_games
 
     def should_show_prices(self):
-        return self.get_setting_bool("show_prices", True)
+        return self.get_settings_snapshot().show_prices
 
     def should_show_playtime(self):
-        return self.get_setting_bool("show_playtime", True)
+        return self.get_settings_snapshot().show_playtime
 
     def should_show_last_played(self):
-        return self.get_setting_bool("show_last_played", True)
+        return self.get_settings_snapshot().show_last_played
 
     def should_show_achievements(self):
-        return self.get_setting_bool("show_achievements", True)
+        return self.get_settings_snapshot().show_achievements
 
     def should_offer_refund_shortcut(self):
         return True
 
     def should_log_performance(self):
-        return self.get_setting_bool("enable_perf_logging", False)
+        return self.get_settings_snapshot().enable_perf_logging
 
     def should_detect_owned_games(self):
         return True
 
     def should_show_steamdb_context_menu(self):
-        return self.get_setting_bool("show_steamdb_context_menu", True)
+        return self.get_settings_snapshot().show_steamdb_context_menu
 
     def should_show_csrin_context_menu(self):
-        return self.get_setting_bool("show_csrin_context_menu", True)
+        return self.get_settings_snapshot().show_csrin_context_menu
 
     def normalize_steam_web_api_key(self, value):
         normalized = str(value or "").strip()
@@ -286,10 +316,110 @@ class SteamPluginCoreMixin:
             for stage_name, duration_ms in sorted(timings, key=lambda item: item[1], reverse=True)
         )
         query_label = search_term if search_term else "<empty>"
+        task_stats = get_background_task_manager(self).scheduler.get_stats()
         self.log(
             "info",
-            f"Perf query='{query_label}' total={total_ms:.1f}ms results={result_count}; {stage_summary}",
+            f"Perf query='{query_label}' total={total_ms:.1f}ms results={result_count}; {stage_summary}; "
+            f"tasks workers={task_stats['workers']} queued={sum(task_stats['queued'].values())} "
+            f"coalesced={task_stats['coalesced']} max_wait={task_stats['max_wait_ms']:.1f}ms; "
+            f"{self.format_http_single_flight_stats()}",
+        )
+
+    def format_http_single_flight_stats(self):
+        single_flight = getattr(self, "http_single_flight", None)
+        endpoint_stats = single_flight.get_stats() if single_flight is not None else {}
+        issued_count = sum(stats["issued"] for stats in endpoint_stats.values())
+        coalesced_count = sum(stats["coalesced"] for stats in endpoint_stats.values())
+        summary = f"http issued={issued_count} coalesced={coalesced_count}"
+        coalesced_endpoints = [
+            f"{endpoint}={stats['coalesced']}/{stats['issued']}"
+            for endpoint, stats in sorted(endpoint_stats.items())
+            if stats["coalesced"]
+        ]
+        if coalesced_endpoints:
+            summary += f" ({', '.join(coalesced_endpoints)})"
+        return summary
+
+    def list_pending_refresh_tasks(self):
+        return [task for task in get_task_scheduler(self).list_unfinished_tasks() if build_refresh_job(task.key)]
+
+    def finish_short_lived_request(self):
+        refresh_tasks = self.list_pending_refresh_tasks()
+        if not refresh_tasks:
+            return None
+        self.close_response_stream()
+        return self.drain_background_work(refresh_tasks)
+
+    def drain_background_work(self, refresh_tasks=None, budget_ms=None):
+        if refresh_tasks is None:
+            refresh_tasks = self.list_pending_refresh_tasks()
+        if budget_ms is None:
+            budget_ms = self.CONFIG.performance.drain_budget_ms
+        start_time = time.perf_counter()
+        deadline = start_time + max(0, budget_ms) / 1000
+        for task in refresh_tasks:
+            remaining_seconds = deadline - time.perf_counter()
+            if remaining_seconds <= 0:
+                break
+            task.join(remaining_seconds)
+        waited_ms = (time.perf_counter() - start_time) * 1000
+
+        completed_count = sum(1 for task in refresh_tasks if task.done())
+        persisted = self.persist_runtime_caches()
+        handed_off_count = self.hand_off_refresh_jobs(
+            [build_refresh_job(task.key) for task in refresh_tasks if not task.done()]
         )
+        drain_stats = {
+            "waited_ms": waited_ms,
+            "refreshes": len(refresh_tasks),
+            "completed": completed_count,
+            "persisted": persisted,
+            "handed_off": handed_off_count,
+        }
+        if self.should_log_performance():
+            self.log(
+                "info",
+                f"Perf drain waited={waited_ms:.1f}ms completed={completed_count}/{len(refresh_tasks)} "
+                f"persisted={','.join(persisted) or 'none'} handed_off={handed_off_count}",
+            )
+        return drain_stats
+
+    def persist_runtime_caches(self):
+        persisted = []
+        with self.state_lock:
+            metric_changes = bool(self.metric_cache_pending_records or self.metric_cache_compaction_pending)
+        if metric_changes:
+            self.save_metric_caches(force=True)
+            with self.state_lock:
+                if not self.metric_cache_pending_records:
+                    persisted.append("metrics")
+        for cache_name, save_method_name in (
+            ("store_search", "save_store_search_cache"),
+            ("icon_index", "save_librarycache_icon_index"),
+            ("game_icons", "save_game_icon_pipeline"),
+            ("thumbnails", "save_icon_thumbnail_manifest"),
+            ("cache_budget", "save_cache_budget_index"),
+            ("feature_health", "flush_feature_health"),
+        ):
+            save_method = getattr(self, save_method_name, None)
+            if callable(save_method) and save_method():
+                persisted.append(cache_name)
+        return persisted
+
+    def hand_off_refresh_jobs(self, jobs):
+        jobs = normalize_refresh_jobs(jobs)
+        jobs_file = getattr(self, "refresh_jobs_file", None)
+        if not jobs or not jobs_file:
+            return 0
+        if merge_refresh_jobs(jobs_file, jobs, settings=self.settings) is None:
+            self.log("warning", f"Failed to queue {len(jobs)} SteamFlow refresh jobs")
+            return 0
+        if not is_refresh_worker_running(getattr(self, "refresh_worker_lock_file", None)):
+            try:
+                start_refresh_worker_process(self.plugin_dir)
+            except Exception:
+                self.log_exception("Failed to start SteamFlow refresh worker")
+        return len(jobs)
 
     def is_timestamp_fresh(self, timestamp, ttl_seconds):
         return is_timestamp_fresh(timestamp, ttl_seconds)
@@ -355,6 +485,7 @@ class SteamPluginCoreMixin:
             self.owned_games_steamid64 = None
             self.owned_app_ids = set()
             self.owned_game_playtimes = {}
+            self.owned_games_validators = {}
             self.owned_games_cache_loaded = True
         self.core_providers.owned_api.save_owned_games_cache()
 
@@ -456,7 +587,14 @@ class SteamPluginCoreMixin:
         with self.state_lock:
             updated = update_timestamped_cache_entry(cache, key, payload)
             if updated:
-                self.metric_cache_dirty = True
+                cache_name = next(
+                    (cache_name for cache_name in METRIC_CACHE_NAMES if getattr(self, cache_name, None) is cache),
+                    None,
+                )
+                if cache_name:
+                    self.metric_cache_pending_records[(cache_name, str(key))] = cache[str(key)]
+                else:
+                    self.metric_cache_compaction_pending = True
         self.core_providers.runtime.save_metric_caches()
 
     def get_cache_entry_state(self, cache, key, ttl_seconds):
@@ -504,18 +642,226 @@ class SteamPluginCoreMixin:
             self.country_code = cc
         self._save_country_code_cache(cc)
 
-    def cleanup_image_cache(self):
-        if not self.cache_dir.is_dir():
-            return
+    def build_cache_specs(self):
+        cache_config = self.CONFIG.cache
+        app_details_dir = getattr(self, "app_details_cache_dir", None)
+        app_details_files = (
+            [app_details_dir / APP_DETAILS_DATABASE_FILE_NAME, app_details_dir / f"{APP_DETAILS_DATABASE_FILE_NAME}-wal"]
+            if app_details_dir
+            else []
+        )
+        specs = [
+            CacheSpec(
+                "thumbnails",
+                getattr(self, "icon_thumbnail_dir", None),
+                priority=0,
+                pinned_names=(ICON_THUMBNAIL_MANIFEST_NAME,),
+            ),
+            CacheSpec("images", getattr(self, "cache_dir", None), ttl_seconds=cache_config.image_cache_ttl_seconds, priority=1),
+            CacheSpec(
+                "avatars",
+                getattr(self, "avatar_cache_dir", None),
+                ttl_seconds=cache_config.avatar_cache_ttl_seconds,
+                priority=2,
+            ),
+            CacheSpec("app_details", app_details_files, kind=CACHE_KIND_FILES),
+        ]
+        for cache_name, attr_names in (
+            ("metrics", ("metric_cache_file", "metric_cache_journal_file")),
+            ("store", ("store_search_cache_file", "game_icon_pipeline_file")),
+            ("library", ("installed_games_cache_file", "localconfig_stats_cache_file", "librarycache_icon_index_file")),
+            ("account", ("owned_games_cache_file", "wishlist_cache_file", "profile_cache_file", "avatar_frame_cache_file")),
+        ):
+            specs.append(
+                CacheSpec(cache_name, [getattr(self, attr_name, None) for attr_name in attr_names], kind=CACHE_KIND_FILES)
+            )
+        return [spec for spec in specs if spec.root is not None]
+
+    def get_cache_budget_registry(self):
+        with self.state_lock:
+            registry = getattr(self, "cache_budget_registry", None)
+            if registry is not None:
+                return registry
+            index_file = getattr(self, "cache_budget_index_file", None)
+            registry = CacheBudgetRegistry.from_payload(
+                read_json_file(index_file, default={}) if index_file else {},
+                self.build_cache_specs(),
+                self.CONFIG.cache.disk_budget_bytes,
+                touch_interval_seconds=self.CONFIG.cache.budget_touch_interval_seconds,
+            )
+            self.cache_budget_registry = registry
+            return registry
 
+    def record_cache_access(self, cache_name, path, size=None):
+        registry = self.get_cache_budget_registry()
+        with self.state_lock:
+            return registry.record_access(cache_name, path, size=size)
+
+    def save_cache_budget_index(self):
+        index_file = getattr(self, "cache_budget_index_file", None)
+        with self.state_lock:
+            registry = getattr(self, "cache_budget_registry", None)
+            if registry is None or not registry.dirty or not index_file:
+                return False
+            registry.merge_payload(read_json_file(index_file, default={}))
+            payload = registry.to_payload()
+            registry.dirty = False
+        if write_json_file(index_file, payload):
+            return True
+        with self.state_lock:
+            registry.dirty = True
+        return False
+
+    def enforce_cache_budget(self, force=False):
+        registry = self.get_cache_budget_registry()
         now = time.time()
-        age_limit_seconds = 3 * 24 * 60 * 60
+        with self.state_lock:
+            if not force and (now - registry.last_enforced) < self.CONFIG.cache.budget_enforce_interval_seconds:
+                return None
+            registry.last_enforced = now
+            registry.dirty = True
+            unindexed_caches = registry.list_unindexed_caches()
+        start_time = time.perf_counter()
+        if self.prune_icon_thumbnail_manifest():
+            self.save_icon_thumbnail_manifest()
+        thumbnail_cache = self.get_icon_thumbnail_cache()
         try:
-            for file_path in self.cache_dir.iterdir():
-                if file_path.is_file() and (now - file_path.stat().st_mtime) > age_limit_seconds:
-                    file_path.unlink()
+            for cache_name in unindexed_caches:
+                entries = registry.index_directory(cache_name)
+                with self.state_lock:
+                    registry.apply_directory_index(cache_name, entries)
+            with self.state_lock:
+                unreferenced = (
+                    registry.list_unreferenced_entries(
+                        "thumbnails",
+                        thumbnail_cache.list_referenced_names(),
+                        now - self.CONFIG.cache.thumbnail_orphan_grace_seconds,
+                    )
+                    if thumbnail_cache is not None
+                    else []
+                )
+                victims = registry.plan_evictions(now, unreferenced=unreferenced)
+            removed = delete_cache_entries(registry, victims)
+            with self.state_lock:
+                registry.remove_entries(removed)
         except Exception:
-            self.log_exception("Failed to clean up image cache")
+            self.log_exception("Failed to enforce cache budget")
+            return None
+        freed_bytes = sum(size for _cache_name, _entry_name, size in removed)
+        self.save_cache_budget_index()
+        self.log_slow_call(
+            "enforce_cache_budget",
+            (time.perf_counter() - start_time) * 1000,
+            f"indexed={len(unindexed_caches)} evicted={len(removed)} freed={format_cache_size(freed_bytes)}",
+        )
+        return {"evicted": len(removed), "freed_bytes": freed_bytes}
+
+    def get_cache_footprint(self):
+        registry = self.get_cache_budget_registry()
+        with self.state_lock:
+            return {"budget_bytes": registry.budget_bytes, "caches": registry.get_footprint()}
+
+    def get_icon_thumbnail_cache(self):
+        thumbnail_dir = getattr(self, "icon_thumbnail_dir", None)
+        if Image is None or not thumbnail_dir:
+            return None
+        with self.state_lock:
+            thumbnail_cache = getattr(self, "icon_thumbnail_cache", None)
+            if thumbnail_cache is not None:
+                return thumbnail_cache
+            thumbnail_cache = IconThumbnailCache.from_payload(
+                read_json_file(Path(thumbnail_dir) / ICON_THUMBNAIL_MANIFEST_NAME, default={}),
+                thumbnail_dir,
+                size=self.CONFIG.icons.thumbnail_size,
+            )
+            self.icon_thumbnail_cache = thumbnail_cache
+            return thumbnail_cache
+
+    def save_icon_thumbnail_manifest(self):
+        with self.state_lock:
+            thumbnail_cache = getattr(self, "icon_thumbnail_cache", None)
+            if thumbnail_cache is None or not thumbnail_cache.dirty:
+                return False
+            payload = thumbnail_cache.to_payload()
+            thumbnail_cache.dirty = False
+        if write_json_file(thumbnail_cache.manifest_file, payload):
+            return True
+        with self.state_lock:
+            thumbnail_cache.dirty = True
+        return False
+
+    def get_icon_thumbnail(self, source_path):
+        thumbnail_cache = self.get_icon_thumbnail_cache()
+        if thumbnail_cache is None or not source_path:
+            return source_path
+        with self.state_lock:
+            thumbnail_path = thumbnail_cache.lookup(source_path)
+            should_schedule = thumbnail_path is None and thumbnail_cache.has_pending()
+        if should_schedule:
+            self.schedule_icon_thumbnail_builds()
+        if thumbnail_path:
+            self.record_cache_access("thumbnails", thumbnail_path)
+        return thumbnail_path or source_path
+
+    def schedule_icon_thumbnail_builds(self):
+        return get_background_task_manager(self).start_flagged_refresh(
+            self,
+            "pending_thumbnail_refresh",
+            self._refresh_icon_thumbnails_worker,
+        )
+
+    def build_pending_icon_thumbnails(self):
+        thumbnail_cache = self.get_icon_thumbnail_cache()
+        if thumbnail_cache is None:
+            return 0
+        start_time = time.perf_counter()
+        built_count = 0
+        failed_count = 0
+        while True:
+            with self.state_lock:
+                batch = thumbnail_cache.take_batch()
+            if not batch:
+                break
+            for source_path in batch:
+                signature = get_source_signature(source_path)
+                digest = None
+                if signature is not None:
+                    try:
+                        digest = create_icon_thumbnail(source_path, thumbnail_cache.root, thumbnail_cache.size, Image)
+                    except Exception:
+                        self.log_exception(f"Failed to create icon thumbnail for {source_path}")
+                with self.state_lock:
+                    thumbnail_cache.record_result(source_path, signature, digest)
+                if digest:
+                    self.record_cache_access("thumbnails", thumbnail_cache.get_thumbnail_path(digest))
+                    built_count += 1
+                else:
+                    failed_count += 1
+        if built_count or failed_count:
+            self.log_slow_call(
+                "build_icon_thumbnails",
+                (time.perf_counter() - start_time) * 1000,
+                f"built={built_count} failed={failed_count}",
+            )
+        return built_count
+
+    def _refresh_icon_thumbnails_worker(self):
+        try:
+            self.build_pending_icon_thumbnails()
+        finally:
+            get_background_task_manager(self).finish_flagged_refresh(self, "pending_thumbnail_refresh")
+        thumbnail_cache = self.get_icon_thumbnail_cache()
+        with self.state_lock:
+            has_pending = thumbnail_cache is not None and thumbnail_cache.has_pending()
+        if has_pending:
+            self.schedule_icon_thumbnail_builds()
+
+    def prune_icon_thumbnail_manifest(self):
+        thumbnail_cache = self.get_icon_thumbnail_cache()
+        if thumbnail_cache is None:
+            return 0
+        with self.state_lock:
+            return thumbnail_cache.prune_missing_sources()
 
     def cleanup_cache_entries(self, cache, ttl_seconds):
         return cleanup_timestamped_cache_entries(cache, ttl_seconds)
@@ -558,6 +904,6 @@ class SteamPluginCoreMixin:
                 or achievement_schema_cache_changed
                 or achievement_progress_cache_changed
             ):
-                self.metric_cache_dirty = True
+                self.metric_cache_compaction_pending = True
             self.last_cache_cleanup = time.time()
         self.core_providers.runtime.save_metric_caches()
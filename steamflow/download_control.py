@@ -12,7 +12,7 @@ from .hooks import (
 )
 from .os_integration import start_hidden_process
 from .providers import get_plugin_providers
-from .localization import Localizer, plugin_tr
+from .localization import get_localizer, plugin_tr
 from .session_token import (
     HTMLCACHE_REFRESH_TIMEOUT_SECONDS,
     STEAM_STORE_ORIGIN,
@@ -47,7 +47,7 @@ def _tr(translator, key, default=None, **values):
             return translator(key, **values)
         except TypeError:
             return translator(key, **values)
-    return Localizer("en").tr(key, **values)
+    return get_localizer("en").tr(key, **values)
 
 
 def build_download_control_subtitle(status_label, control_enabled=True, tr=None):
@@ -1,8 +1,10 @@
+import threading
 import time
 import urllib.error
+from contextlib import contextmanager
 from pathlib import Path
 
-from .cache_utils import read_json_file, write_json_file
+from .cache_utils import exclusive_lock_file, get_path_signature, read_json_file, write_json_file
 
 
 FEATURE_STEAM_SESSION_TOKEN = "steam_session_token"
@@ -115,37 +117,27 @@ def write_feature_health(cache_file, data):
     return write_json_file(cache_file, payload, indent=2)
 
 
-def get_feature_health_status(cache_file, name, now=None):
-    feature_name = normalize_feature_name(name)
-    if DEBUG_DISABLE_ALL_FRAGILE_FEATURES and feature_name in FEATURE_NAMES:
-        current_time = _now(now)
-        entry = _default_entry()
-        entry.update(
-            {
-                "state": STATE_DISABLED,
-                "failures": DEFAULT_FAILURE_THRESHOLD,
-                "last_error": "Debug override",
-                "last_reason": "debug_disabled",
-                "last_failure": current_time,
-                "disabled_until": current_time + DEFAULT_COOLDOWN_SECONDS,
-            }
-        )
-        return entry
-    data = read_feature_health(cache_file)
-    return normalize_feature_entry(data.get(feature_name), now=now)
+def get_debug_disabled_entry(now=None):
+    current_time = _now(now)
+    entry = _default_entry()
+    entry.update(
+        {
+            "state": STATE_DISABLED,
+            "failures": DEFAULT_FAILURE_THRESHOLD,
+            "last_error": "Debug override",
+            "last_reason": "debug_disabled",
+            "last_failure": current_time,
+            "disabled_until": current_time + DEFAULT_COOLDOWN_SECONDS,
+        }
+    )
+    return entry
 
 
-def feature_enabled(cache_file, name, now=None):
-    status = get_feature_health_status(cache_file, name, now=now)
-    return not (
-        status["state"] == STATE_DISABLED
-        and status["disabled_until"] > _now(now)
-    )
+def cooldown_seconds_for_reason(reason, default=DEFAULT_COOLDOWN_SECONDS):
+    return REASON_COOLDOWNS.get(str(reason or "").strip().lower(), default)
 
 
-def record_feature_success(cache_file, name, now=None):
-    feature_name = normalize_feature_name(name)
-    data = read_feature_health(cache_file)
+def apply_feature_success(data, feature_name, now):
     entry = normalize_feature_entry(data.get(feature_name), now=now)
     entry.update(
         {
@@ -153,61 +145,208 @@ def record_feature_success(cache_file, name, now=None):
             "failures": 0,
             "last_error": "",
             "last_reason": "",
-            "last_success": _now(now),
+            "last_success": now,
             "disabled_until": 0,
         }
     )
     data[feature_name] = entry
-    write_feature_health(cache_file, data)
     return entry
 
 
-def cooldown_seconds_for_reason(reason, default=DEFAULT_COOLDOWN_SECONDS):
-    return REASON_COOLDOWNS.get(str(reason or "").strip().lower(), default)
-
-
-def record_feature_failure(
-    cache_file,
-    name,
-    error=None,
-    reason="unknown",
-    now=None,
-    failure_threshold=DEFAULT_FAILURE_THRESHOLD,
-    cooldown_seconds=None,
-):
-    feature_name = normalize_feature_name(name)
-    current_time = _now(now)
-    data = read_feature_health(cache_file)
-    entry = normalize_feature_entry(data.get(feature_name), now=current_time)
+def apply_feature_failure(data, feature_name, now, error="", reason="unknown", failure_threshold=None, cooldown_seconds=None):
+    entry = normalize_feature_entry(data.get(feature_name), now=now)
     failures = int(entry.get("failures") or 0) + 1
-    reason = str(reason or "unknown").strip() or "unknown"
     entry.update(
         {
             "failures": failures,
-            "last_error": str(error or ""),
+            "last_error": error,
             "last_reason": reason,
-            "last_failure": current_time,
+            "last_failure": now,
         }
     )
     if failures >= int(failure_threshold or DEFAULT_FAILURE_THRESHOLD):
         entry["state"] = STATE_DISABLED
         cooldown = cooldown_seconds_for_reason(reason) if cooldown_seconds is None else float(cooldown_seconds)
-        entry["disabled_until"] = current_time + cooldown
+        entry["disabled_until"] = now + cooldown
     else:
         entry["state"] = STATE_SUSPECT
     data[feature_name] = entry
-    write_feature_health(cache_file, data)
     return entry
 
 
+def apply_feature_reset(data, feature_name=None):
+    for name in ([feature_name] if feature_name else FEATURE_NAMES):
+        data[name] = _default_entry()
+    return data
+
+
+FEATURE_UPDATE_HANDLERS = {
+    "success": apply_feature_success,
+    "failure": apply_feature_failure,
+    "reset": apply_feature_reset,
+}
+
+
+def apply_feature_update(data, update):
+    kind, args, kwargs = update
+    return FEATURE_UPDATE_HANDLERS[kind](data, *args, **kwargs)
+
+
+class FeatureHealthStore:
+    def __init__(self, cache_file, lock_timeout_seconds=2.0):
+        self.cache_file = Path(cache_file)
+        self.lock_file = self.cache_file.with_name(f"{self.cache_file.name}.lock")
+        self.lock_timeout_seconds = float(lock_timeout_seconds)
+        self.lock = threading.RLock()
+        self.entries = None
+        self.signature = None
+        self.pending_updates = []
+        self.batch_depth = 0
+        self.reloads = 0
+        self.lock_timeouts = 0
+
+    def refresh(self):
+        with self.lock:
+            signature = get_path_signature(self.cache_file)
+            if self.entries is not None and signature == self.signature:
+                return False
+            self.entries = read_feature_health(self.cache_file)
+            self.signature = signature
+            self.reloads += 1
+            for update in self.pending_updates:
+                apply_feature_update(self.entries, update)
+            return True
+
+    def get_status(self, name, now=None):
+        feature_name = normalize_feature_name(name)
+        if DEBUG_DISABLE_ALL_FRAGILE_FEATURES and feature_name in FEATURE_NAMES:
+            return get_debug_disabled_entry(now)
+        with self.lock:
+            self.refresh()
+            return normalize_feature_entry(self.entries.get(feature_name), now=now)
+
+    def enabled(self, name, now=None):
+        status = self.get_status(name, now=now)
+        return not (status["state"] == STATE_DISABLED and status["disabled_until"] > _now(now))
+
+    def snapshot(self):
+        with self.lock:
+            self.refresh()
+            return {name: dict(entry) for name, entry in self.entries.items()}
+
+    def update(self, kind, *args, **kwargs):
+        update = (kind, args, kwargs)
+        with self.lock:
+            self.refresh()
+            self.pending_updates.append(update)
+            result = apply_feature_update(self.entries, update)
+            result = dict(result) if isinstance(result, dict) and kind != "reset" else result
+            should_flush = self.batch_depth == 0
+        if should_flush:
+            self.flush()
+        return result
+
+    def record_success(self, name, now=None):
+        return self.update("success", normalize_feature_name(name), _now(now))
+
+    def record_failure(self, name, error=None, reason="unknown", now=None, failure_threshold=None, cooldown_seconds=None):
+        return self.update(
+            "failure",
+            normalize_feature_name(name),
+            _now(now),
+            error=str(error or ""),
+            reason=str(reason or "unknown").strip() or "unknown",
+            failure_threshold=failure_threshold,
+            cooldown_seconds=cooldown_seconds,
+        )
+
+    def reset(self, name=None):
+        self.update("reset", normalize_feature_name(name) if name else None)
+        return self.snapshot()
+
+    @contextmanager
+    def batch(self):
+        with self.lock:
+            self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.batch_depth -= 1
+                should_flush = self.batch_depth == 0
+            if should_flush:
+                self.flush()
+
+    def flush(self):
+        with self.lock:
+            if not self.pending_updates:
+                return True
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with exclusive_lock_file(self.lock_file, timeout=self.lock_timeout_seconds):
+                    data = read_feature_health(self.cache_file)
+                    for update in self.pending_updates:
+                        apply_feature_update(data, update)
+                    if not write_feature_health(self.cache_file, data):
+                        return False
+                    self.signature = get_path_signature(self.cache_file)
+            except TimeoutError:
+                self.lock_timeouts += 1
+                return False
+            except OSError:
+                return False
+            self.entries = {name: normalize_feature_entry(entry, expire_disabled=False) for name, entry in data.items()}
+            self.pending_updates = []
+            return True
+
+
+_FEATURE_HEALTH_STORES = {}
+_FEATURE_HEALTH_STORES_LOCK = threading.Lock()
+
+
+def get_feature_health_store(cache_file):
+    store_key = str(cache_file)
+    with _FEATURE_HEALTH_STORES_LOCK:
+        store = _FEATURE_HEALTH_STORES.get(store_key)
+        if store is None:
+            store = FeatureHealthStore(cache_file)
+            _FEATURE_HEALTH_STORES[store_key] = store
+        return store
+
+
+def get_feature_health_status(cache_file, name, now=None):
+    return get_feature_health_store(cache_file).get_status(name, now=now)
+
+
+def feature_enabled(cache_file, name, now=None):
+    return get_feature_health_store(cache_file).enabled(name, now=now)
+
+
+def record_feature_success(cache_file, name, now=None):
+    return get_feature_health_store(cache_file).record_success(name, now=now)
+
+
+def record_feature_failure(
+    cache_file,
+    name,
+    error=None,
+    reason="unknown",
+    now=None,
+    failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+    cooldown_seconds=None,
+):
+    return get_feature_health_store(cache_file).record_failure(
+        name,
+        error=error,
+        reason=reason,
+        now=now,
+        failure_threshold=failure_threshold,
+        cooldown_seconds=cooldown_seconds,
+    )
+
+
 def reset_feature_health(cache_file, name=None):
-    if name:
-        data = read_feature_health(cache_file)
-        data[normalize_feature_name(name)] = _default_entry()
-        write_feature_health(cache_file, data)
-        return data
-    write_feature_health(cache_file, {feature_name: _default_entry() for feature_name in FEATURE_NAMES})
-    return read_feature_health(cache_file)
+    return get_feature_health_store(cache_file).reset(name=name)
 
 
 def classify_feature_error(error, feature_name=None):
@@ -255,23 +394,27 @@ def classify_feature_error(error, feature_name=None):
 class SteamPluginFeatureHealthMixin:
     REQUIRED_PLUGIN_ATTRS = ("feature_health_cache_file",)
 
+    @property
+    def feature_health_store(self):
+        return get_feature_health_store(self.feature_health_cache_file)
+
     def feature_enabled(self, name, now=None):
-        return feature_enabled(self.feature_health_cache_file, name, now=now)
+        return self.feature_health_store.enabled(name, now=now)
 
     def record_feature_success(self, name, now=None):
-        return record_feature_success(self.feature_health_cache_file, name, now=now)
+        return self.feature_health_store.record_success(name, now=now)
 
     def record_feature_failure(self, name, error=None, reason="unknown", now=None):
-        return record_feature_failure(
-            self.feature_health_cache_file,
-            name,
-            error=error,
-            reason=reason,
-            now=now,
-        )
+        return self.feature_health_store.record_failure(name, error=error, reason=reason, now=now)
 
     def get_feature_health_status(self, name, now=None):
-        return get_feature_health_status(self.feature_health_cache_file, name, now=now)
+        return self.feature_health_store.get_status(name, now=now)
 
     def reset_feature_health(self, name=None):
-        return reset_feature_health(self.feature_health_cache_file, name=name)
+        return self.feature_health_store.reset(name=name)
+
+    def flush_feature_health(self):
+        store = self.feature_health_store
+        with store.lock:
+            has_pending = bool(store.pending_updates)
+        return has_pending and store.flush()
@@ -0,0 +1,131 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+GAME_ICON_PIPELINE_VERSION = 1
+GAME_ICON_PARTIAL_SUFFIX = ".part"
+
+
+def get_game_icon_path(cache_dir, app_id):
+    return Path(cache_dir) / f"{app_id}.png"
+
+
+def download_game_icon(download, app_id, image_url, cache_dir):
+    icon_path = get_game_icon_path(cache_dir, app_id)
+    partial_path = icon_path.with_name(f"{icon_path.name}.{os.getpid()}{GAME_ICON_PARTIAL_SUFFIX}")
+    try:
+        if not download(image_url, str(partial_path)):
+            return False
+        os.replace(partial_path, icon_path)
+        return True
+    except OSError:
+        return False
+    finally:
+        try:
+            partial_path.unlink()
+        except OSError:
+            pass
+
+
+class GameIconPipeline:
+    def __init__(self, cache_dir, failure_ttl_seconds=6 * 60 * 60, clock=time.time):
+        self.cache_dir = Path(cache_dir)
+        self.failure_ttl_seconds = float(failure_ttl_seconds)
+        self.clock = clock
+        self.pending = {}
+        self.in_flight = set()
+        self.failures = {}
+        self.hits = 0
+        self.queued = 0
+        self.skipped = 0
+        self.dirty = False
+
+    def to_payload(self):
+        now = self.clock()
+        return {
+            "version": GAME_ICON_PIPELINE_VERSION,
+            "pending": dict(self.pending),
+            "failures": {
+                image_url: failed_at
+                for image_url, failed_at in self.failures.items()
+                if (now - failed_at) < self.failure_ttl_seconds
+            },
+        }
+
+    @classmethod
+    def from_payload(cls, payload, cache_dir, **kwargs):
+        pipeline = cls(cache_dir, **kwargs)
+        if not isinstance(payload, dict) or payload.get("version") != GAME_ICON_PIPELINE_VERSION:
+            return pipeline
+        pending = payload.get("pending")
+        for app_id, image_url in (pending.items() if isinstance(pending, dict) else ()):
+            if str(app_id).strip() and isinstance(image_url, str) and image_url:
+                pipeline.pending[str(app_id).strip()] = image_url
+        failures = payload.get("failures")
+        for image_url, failed_at in (failures.items() if isinstance(failures, dict) else ()):
+            if isinstance(failed_at, (int, float)):
+                pipeline.failures[str(image_url)] = float(failed_at)
+        return pipeline
+
+    def get_stats(self):
+        return {
+            "pending": len(self.pending),
+            "failures": len(self.failures),
+            "hits": self.hits,
+            "queued": self.queued,
+            "skipped": self.skipped,
+        }
+
+    def is_failed(self, image_url):
+        failed_at = self.failures.get(image_url)
+        return failed_at is not None and (self.clock() - failed_at) < self.failure_ttl_seconds
+
+    def resolve(self, app_id, image_url, default_icon):
+        app_id = str(app_id or "").strip()
+        if not app_id or not image_url:
+            return default_icon
+        icon_path = get_game_icon_path(self.cache_dir, app_id)
+        if icon_path.exists():
+            self.hits += 1
+            return str(icon_path)
+        if self.is_failed(image_url):
+            self.skipped += 1
+            return default_icon
+        if self.pending.get(app_id) != image_url:
+            self.pending[app_id] = image_url
+            self.queued += 1
+            self.dirty = True
+        return default_icon
+
+    def has_pending(self):
+        return any(app_id not in self.in_flight for app_id in self.pending)
+
+    def take_batch(self):
+        batch = [(app_id, image_url) for app_id, image_url in self.pending.items() if app_id not in self.in_flight]
+        self.in_flight.update(app_id for app_id, _image_url in batch)
+        return batch
+
+    def record_result(self, app_id, image_url, success):
+        self.in_flight.discard(app_id)
+        if self.pending.get(app_id) == image_url:
+            del self.pending[app_id]
+        if success:
+            self.failures.pop(image_url, None)
+        else:
+            self.failures[image_url] = self.clock()
+        self.dirty = True
+
+
+def download_game_icon_batch(batch, download, cache_dir, max_workers=4):
+    if not batch:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(batch)))) as executor:
+        outcomes = list(
+            executor.map(
+                lambda entry: download_game_icon(download, entry[0], entry[1], cache_dir),
+                batch,
+            )
+        )
+    return [(app_id, image_url, success) for (app_id, image_url), success in zip(batch, outcomes)]
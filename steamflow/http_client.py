@@ -1,11 +1,16 @@
 import json
+import threading
 import urllib.parse
 import urllib.request
+import zlib
 
 
 USER_AGENT = "Mozilla/5.0"
-DEFAULT_HTTP_HEADERS = {"User-Agent": USER_AGENT}
+ACCEPT_ENCODING = "gzip, deflate"
+DEFAULT_HTTP_HEADERS = {"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING}
 FORM_CONTENT_TYPE = "application/x-www-form-urlencoded; charset=UTF-8"
+HTTP_NOT_MODIFIED = 304
+RESPONSE_READ_CHUNK_SIZE = 64 * 1024
 
 
 def build_headers(headers=None, include_user_agent=True):
@@ -24,15 +29,164 @@ def decode_response_json(response, encoding="utf-8"):
     return decode_json_bytes(response.data, encoding=encoding)
 
 
-def http_get_json(http_get, url, timeout, headers=None):
+def get_response_header(response, name):
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return ""
+    return str(headers.get(name) or "").strip()
+
+
+class StreamingContentDecoder:
+    def __init__(self, content_encoding):
+        # zlib auto-detects gzip and zlib framing; some servers send bare deflate streams instead.
+        self.allow_raw_deflate = content_encoding == "deflate"
+        self.decoder = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        self.started = False
+
+    def decompress(self, data):
+        if not self.started:
+            self.started = True
+            if self.allow_raw_deflate:
+                try:
+                    return self.decoder.decompress(data)
+                except zlib.error:
+                    self.decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self.decoder.decompress(data)
+
+    def flush(self):
+        return self.decoder.flush()
+
+
+def read_response_bytes(response, chunk_size=RESPONSE_READ_CHUNK_SIZE):
+    content_encoding = get_response_header(response, "Content-Encoding").lower()
+    if content_encoding not in {"gzip", "x-gzip", "deflate"}:
+        return response.read()
+    decoder = StreamingContentDecoder(content_encoding)
+    chunks = []
+    while True:
+        chunk = response.read(chunk_size)
+        if not chunk:
+            break
+        chunks.append(decoder.decompress(chunk))
+    chunks.append(decoder.flush())
+    return b"".join(chunks)
+
+
+def build_conditional_headers(validators=None):
+    validators = validators or {}
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = str(validators["etag"])
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = str(validators["last_modified"])
+    return headers
+
+
+def get_response_validators(response):
+    validators = {}
+    etag = get_response_header(response, "ETag")
+    if etag:
+        validators["etag"] = etag
+    last_modified = get_response_header(response, "Last-Modified")
+    if last_modified:
+        validators["last_modified"] = last_modified
+    return validators
+
+
+def normalize_http_validators(validators):
+    if not isinstance(validators, dict):
+        return {}
+    return {
+        name: str(validators[name])
+        for name in ("etag", "last_modified")
+        if isinstance(validators.get(name), str) and validators[name].strip()
+    }
+
+
+class SingleFlightCall:
+    def __init__(self):
+        self.finished = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlightGroup:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.endpoint_stats = {}
+
+    def count(self, endpoint, counter_name):
+        endpoint_stats = self.endpoint_stats.setdefault(endpoint, {"issued": 0, "coalesced": 0})
+        endpoint_stats[counter_name] += 1
+
+    def do(self, key, fetch, endpoint=None, wait_timeout=None):
+        endpoint = endpoint or str(key)
+        with self.lock:
+            call = self.calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = SingleFlightCall()
+                self.calls[key] = call
+            self.count(endpoint, "issued" if is_leader else "coalesced")
+
+        if not is_leader:
+            if not call.finished.wait(wait_timeout):
+                raise TimeoutError(f"Shared request for {endpoint} did not finish in time")
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fetch()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self.lock:
+                if self.calls.get(key) is call:
+                    del self.calls[key]
+            call.finished.set()
+        return call.value
+
+    def get_stats(self):
+        with self.lock:
+            return {endpoint: dict(endpoint_stats) for endpoint, endpoint_stats in self.endpoint_stats.items()}
+
+
+def http_get_json(http_get, url, timeout, headers=None, flight_key=None):
+    request_kwargs = {"flight_key": flight_key} if flight_key else {}
     response = http_get(
         url,
         timeout=timeout,
         headers=build_headers(headers),
+        **request_kwargs,
     )
     return decode_response_json(response)
 
 
+def http_get_json_conditional(http_get, url, timeout, validators=None, headers=None, flight_key=None):
+    validators = normalize_http_validators(validators)
+    request_kwargs = {"flight_key": flight_key} if flight_key else {}
+    response = http_get(
+        url,
+        timeout=timeout,
+        headers=build_headers({**build_conditional_headers(validators), **(headers or {})}),
+        **request_kwargs,
+    )
+    if getattr(response, "status", None) == HTTP_NOT_MODIFIED:
+        return {
+            "not_modified": True,
+            "payload": None,
+            "validators": {**validators, **get_response_validators(response)},
+        }
+    return {
+        "not_modified": False,
+        "payload": decode_response_json(response),
+        "validators": get_response_validators(response),
+    }
+
+
 def http_pool_request(http_pool, urllib3_module, method, url, timeout, headers=None):
     response = http_pool.request(
         str(method or "GET").upper(),
@@ -46,15 +200,23 @@ def http_pool_request(http_pool, urllib3_module, method, url, timeout, headers=N
     return response
 
 
-def http_pool_get(http_pool, urllib3_module, url, timeout, headers=None):
-    return http_pool_request(http_pool, urllib3_module, "GET", url, timeout=timeout, headers=headers)
+def http_pool_get(http_pool, urllib3_module, url, timeout, headers=None, single_flight=None, flight_key=None):
+    if single_flight is None or not flight_key:
+        return http_pool_request(http_pool, urllib3_module, "GET", url, timeout=timeout, headers=headers)
+    conditional_headers = headers or {}
+    return single_flight.do(
+        ("GET", url, conditional_headers.get("If-None-Match"), conditional_headers.get("If-Modified-Since")),
+        lambda: http_pool_request(http_pool, urllib3_module, "GET", url, timeout=timeout, headers=headers),
+        endpoint=flight_key,
+        wait_timeout=timeout,
+    )
 
 
 def urllib_get_json(url, timeout, headers=None, opener=None):
     opener = opener or urllib.request.urlopen
     request = urllib.request.Request(url, headers=build_headers(headers))
     with opener(request, timeout=timeout) as response:
-        return decode_json_bytes(response.read())
+        return decode_json_bytes(read_response_bytes(response))
 
 
 def build_form_headers(origin=None, referer=None, headers=None):
@@ -97,7 +259,7 @@ def urllib_json_request(url, method="GET", fields=None, timeout=3, headers=None,
         )
 
     with opener(request, timeout=timeout) as response:
-        return decode_json_bytes(response.read())
+        return decode_json_bytes(read_response_bytes(response))
 
 
 def urllib_form_request(url, fields=None, method="POST", timeout=4, headers=None, origin=None, referer=None, opener=None):
@@ -109,7 +271,7 @@ def urllib_form_request(url, fields=None, method="POST", timeout=4, headers=None
         method=str(method or "POST").upper(),
     )
     with opener(request, timeout=timeout) as response:
-        raw_data = response.read()
+        raw_data = read_response_bytes(response)
         content_type = response.headers.get("Content-Type", "")
     if "json" in content_type:
         return decode_json_bytes(raw_data), raw_data
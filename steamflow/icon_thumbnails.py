@@ -0,0 +1,152 @@
+import hashlib
+import io
+import os
+from pathlib import Path
+
+
+ICON_THUMBNAIL_MANIFEST_VERSION = 1
+ICON_THUMBNAIL_MANIFEST_NAME = "manifest.json"
+
+
+def get_source_signature(source_path):
+    try:
+        stat_result = Path(source_path).stat()
+    except OSError:
+        return None
+    return int(stat_result.st_mtime_ns), int(stat_result.st_size)
+
+
+def get_thumbnail_digest(source_bytes, size):
+    digest = hashlib.sha256(source_bytes)
+    digest.update(f":{int(size)}".encode("ascii"))
+    return digest.hexdigest()[:32]
+
+
+def create_icon_thumbnail(source_path, root, size, image_module):
+    source_bytes = Path(source_path).read_bytes()
+    digest = get_thumbnail_digest(source_bytes, size)
+    thumbnail_path = Path(root) / f"{digest}.png"
+    if thumbnail_path.exists():
+        return digest
+
+    with image_module.open(io.BytesIO(source_bytes)) as source_image:
+        thumbnail = source_image.convert("RGBA")
+        thumbnail.thumbnail((size, size), image_module.Resampling.LANCZOS)
+        canvas = image_module.new("RGBA", (size, size), (0, 0, 0, 0))
+        canvas.paste(thumbnail, ((size - thumbnail.width) // 2, (size - thumbnail.height) // 2))
+    thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_path = thumbnail_path.with_name(f"{thumbnail_path.name}.{os.getpid()}.part")
+    try:
+        canvas.save(partial_path, format="PNG", optimize=True)
+        os.replace(partial_path, thumbnail_path)
+    finally:
+        try:
+            partial_path.unlink()
+        except OSError:
+            pass
+    return digest
+
+
+class IconThumbnailCache:
+    def __init__(self, root, size=64):
+        self.root = Path(root)
+        self.size = int(size)
+        self.entries = {}
+        self.pending = set()
+        self.in_flight = set()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    @property
+    def manifest_file(self):
+        return self.root / ICON_THUMBNAIL_MANIFEST_NAME
+
+    def to_payload(self):
+        return {
+            "version": ICON_THUMBNAIL_MANIFEST_VERSION,
+            "size": self.size,
+            "entries": {source_path: dict(entry) for source_path, entry in self.entries.items()},
+            "pending": sorted(self.pending),
+        }
+
+    @classmethod
+    def from_payload(cls, payload, root, **kwargs):
+        cache = cls(root, **kwargs)
+        if not isinstance(payload, dict) or payload.get("version") != ICON_THUMBNAIL_MANIFEST_VERSION:
+            return cache
+        if payload.get("size") != cache.size:
+            return cache
+        entries = payload.get("entries")
+        for source_path, entry in (entries.items() if isinstance(entries, dict) else ()):
+            if not isinstance(entry, dict):
+                continue
+            mtime_ns = entry.get("mtime_ns")
+            source_size = entry.get("source_size")
+            digest = entry.get("digest")
+            if isinstance(mtime_ns, int) and isinstance(source_size, int) and isinstance(digest, str):
+                cache.entries[str(source_path)] = {
+                    "mtime_ns": mtime_ns,
+                    "source_size": source_size,
+                    "digest": digest,
+                }
+        pending = payload.get("pending")
+        cache.pending.update(str(source_path) for source_path in (pending if isinstance(pending, list) else ()))
+        return cache
+
+    def get_stats(self):
+        return {
+            "entries": len(self.entries),
+            "pending": len(self.pending),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def get_thumbnail_path(self, digest):
+        return self.root / f"{digest}.png"
+
+    def lookup(self, source_path):
+        source_path = str(source_path or "")
+        if not source_path:
+            return None
+        entry = self.entries.get(source_path)
+        if entry is not None and get_source_signature(source_path) == (entry["mtime_ns"], entry["source_size"]):
+            if not entry["digest"]:
+                return None
+            thumbnail_path = self.get_thumbnail_path(entry["digest"])
+            if thumbnail_path.exists():
+                self.hits += 1
+                return str(thumbnail_path)
+        self.misses += 1
+        if source_path not in self.pending:
+            self.pending.add(source_path)
+            self.dirty = True
+        return None
+
+    def has_pending(self):
+        return bool(self.pending - self.in_flight)
+
+    def take_batch(self):
+        batch = sorted(self.pending - self.in_flight)
+        self.in_flight.update(batch)
+        return batch
+
+    def record_result(self, source_path, signature, digest):
+        self.in_flight.discard(source_path)
+        self.pending.discard(source_path)
+        if signature is None:
+            self.entries.pop(source_path, None)
+        else:
+            self.entries[source_path] = {"mtime_ns": signature[0], "source_size": signature[1], "digest": digest or ""}
+        self.dirty = True
+
+    def list_referenced_names(self):
+        return {self.get_thumbnail_path(entry["digest"]).name for entry in self.entries.values() if entry["digest"]}
+
+    def prune_missing_sources(self):
+        missing_sources = [source_path for source_path in self.entries if get_source_signature(source_path) is None]
+        for source_path in missing_sources:
+            del self.entries[source_path]
+        if missing_sources:
+            self.dirty = True
+        return len(missing_sources)
@@ -0,0 +1,145 @@
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+
+LIBRARYCACHE_ICON_INDEX_VERSION = 1
+LIBRARYCACHE_ICON_EXCLUDED_PREFIXES = ("header", "library", "logo")
+
+
+def get_directory_mtime_ns(path):
+    try:
+        stat_result = Path(path).stat()
+    except OSError:
+        return None
+    return int(stat_result.st_mtime_ns)
+
+
+def is_librarycache_icon_candidate(file_name):
+    file_name = str(file_name or "").lower()
+    return file_name.endswith(".jpg") and not file_name.startswith(LIBRARYCACHE_ICON_EXCLUDED_PREFIXES)
+
+
+def choose_librarycache_icon(icon_dir):
+    candidates = []
+    for file_path in Path(icon_dir).iterdir():
+        if not is_librarycache_icon_candidate(file_path.name):
+            continue
+        try:
+            stat_result = file_path.stat()
+        except OSError:
+            continue
+        if not file_path.is_file():
+            continue
+        candidates.append((-int(stat_result.st_size), file_path.name, file_path))
+    if not candidates:
+        return ""
+    return str(min(candidates)[2])
+
+
+class LibraryCacheIconIndex:
+    def __init__(self, root, entries=None, root_mtime_ns=None, recheck_seconds=30, clock=time.monotonic):
+        self.root = Path(root)
+        self.entries = dict(entries or {})
+        self.root_mtime_ns = root_mtime_ns
+        self.recheck_seconds = float(recheck_seconds)
+        self.clock = clock
+        self.validated_app_ids = set()
+        self.validated_at = None
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    def to_payload(self):
+        return {
+            "version": LIBRARYCACHE_ICON_INDEX_VERSION,
+            "root": str(self.root),
+            "root_mtime_ns": self.root_mtime_ns,
+            "entries": dict(self.entries),
+        }
+
+    @classmethod
+    def from_payload(cls, payload, root, **kwargs):
+        index = cls(root, **kwargs)
+        if not isinstance(payload, dict) or payload.get("version") != LIBRARYCACHE_ICON_INDEX_VERSION:
+            return index
+        if payload.get("root") != str(index.root):
+            return index
+        entries = payload.get("entries")
+        for app_id, entry in (entries.items() if isinstance(entries, dict) else ()):
+            if not isinstance(entry, dict):
+                continue
+            mtime_ns = entry.get("mtime_ns")
+            index.entries[str(app_id)] = {
+                "mtime_ns": int(mtime_ns) if isinstance(mtime_ns, int) else None,
+                "icon": str(entry.get("icon") or ""),
+            }
+        root_mtime_ns = payload.get("root_mtime_ns")
+        index.root_mtime_ns = int(root_mtime_ns) if isinstance(root_mtime_ns, int) else None
+        return index
+
+    def get_stats(self):
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+    def is_revalidation_due(self):
+        return self.validated_at is None or (self.clock() - self.validated_at) >= self.recheck_seconds
+
+    def apply_root_mtime(self, root_mtime_ns):
+        self.validated_at = self.clock()
+        self.validated_app_ids = set()
+        if root_mtime_ns == self.root_mtime_ns:
+            return
+        self.entries = {app_id: entry for app_id, entry in self.entries.items() if entry.get("mtime_ns") is not None}
+        self.root_mtime_ns = root_mtime_ns
+        self.dirty = True
+
+    def revalidate_if_due(self):
+        if self.is_revalidation_due():
+            self.apply_root_mtime(get_directory_mtime_ns(self.root))
+
+    def get_cached_icon(self, app_id):
+        entry = self.entries.get(app_id)
+        if entry is not None and (app_id in self.validated_app_ids or entry["mtime_ns"] is None):
+            self.hits += 1
+            return entry["icon"]
+        return None
+
+    def record_scan(self, app_id, mtime_ns, icon_path):
+        entry = self.entries.get(app_id)
+        if icon_path is None:
+            if entry is None or entry["mtime_ns"] != mtime_ns:
+                return entry["icon"] if entry is not None else ""
+            self.validated_app_ids.add(app_id)
+            self.hits += 1
+            return entry["icon"]
+
+        self.validated_app_ids.add(app_id)
+        self.misses += 1
+        icon_path = icon_path or ""
+        self.entries[app_id] = {"mtime_ns": mtime_ns, "icon": icon_path}
+        self.dirty = True
+        return icon_path
+
+    def lookup(self, app_id, lock=None):
+        # Disk checks run outside the caller's lock; it only guards reads and updates of the index.
+        app_id = str(app_id)
+        lock = lock if lock is not None else nullcontext()
+        with lock:
+            revalidation_due = self.is_revalidation_due()
+        if revalidation_due:
+            root_mtime_ns = get_directory_mtime_ns(self.root)
+            with lock:
+                self.apply_root_mtime(root_mtime_ns)
+        with lock:
+            icon_path = self.get_cached_icon(app_id)
+            entry = self.entries.get(app_id)
+        if icon_path is not None:
+            return icon_path
+
+        icon_dir = self.root / app_id
+        mtime_ns = get_directory_mtime_ns(icon_dir)
+        icon_path = None
+        if entry is None or entry["mtime_ns"] != mtime_ns:
+            icon_path = choose_librarycache_icon(icon_dir) if mtime_ns is not None and icon_dir.is_dir() else ""
+        with lock:
+            return self.record_scan(app_id, mtime_ns, icon_path)
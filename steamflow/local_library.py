@@ -1,16 +1,22 @@
 import time
+from pathlib import Path
 
 from .cache_utils import read_json_file, write_json_file
 from .constants import STEAMFLOW_CONFIG
 from .download_status_cache import set_download_control_status_hint as save_download_control_status_hint
+from .librarycache_icons import LibraryCacheIconIndex
 from .local_library_service import (
+    build_installed_games_cache_payload,
     collect_installed_games_snapshot,
     cleanup_cache_keys,
+    LocalGameView,
     get_file_signature,
     load_appmanifest_file,
+    normalize_installed_games_cache_payload,
     parse_manifest_int,
     parse_state_flags,
 )
+from .local_search import LocalSearchIndex, build_local_search_index_key
 from .providers import get_plugin_providers
 from .tasks import get_background_task_manager
 
@@ -27,6 +33,56 @@ class SteamPluginLocalLibraryMixin:
         with self.state_lock:
             return list(self.installed_games.items())
 
+    def get_local_search_index(self):
+        with self.state_lock:
+            search_index = getattr(self, "local_search_index", None)
+            if search_index is None:
+                search_index = LocalSearchIndex.build(self.installed_games)
+                self.local_search_index = search_index
+            return search_index
+
+    def search_local_games(self, search_term, limit=None):
+        search_index = self.get_local_search_index()
+        with self.state_lock:
+            last_played_timestamps = getattr(self, "last_played_timestamps", {})
+        return search_index.search(search_term, limit=limit, last_played_timestamps=last_played_timestamps)
+
+    def build_local_search_index(self, installed_games):
+        with self.state_lock:
+            search_index = getattr(self, "local_search_index", None)
+        if search_index is not None and search_index.key == build_local_search_index_key(installed_games):
+            return search_index
+        search_index = LocalSearchIndex.build(installed_games)
+        with self.state_lock:
+            self.appmanifest_cache_dirty = True
+        return search_index
+
+    def get_local_game_view(self, app_id):
+        app_id = str(app_id)
+        with self.state_lock:
+            game_views = self.local_game_views
+            game_view = game_views.get(app_id)
+            if game_view is not None:
+                return game_view
+            install_path = self.installed_game_paths.get(app_id)
+            status_label = self.installed_game_statuses.get(app_id, "")
+            playtime_minutes = self.playtime_minutes.get(app_id)
+            last_played_timestamp = self.last_played_timestamps.get(app_id)
+
+        game_view = LocalGameView(
+            app_id,
+            install_path=install_path,
+            status_label=status_label,
+            playtime_minutes=playtime_minutes,
+            last_played_timestamp=last_played_timestamp,
+            icon_path=self.get_local_game_icon(app_id),
+            has_current_account_data=self.has_current_account_local_data(app_id),
+        )
+        with self.state_lock:
+            if self.local_game_views is game_views:
+                game_views[app_id] = game_view
+        return game_view
+
     def get_install_path(self, app_id):
         with self.state_lock:
             return self.installed_game_paths.get(str(app_id))
@@ -57,6 +113,11 @@ class SteamPluginLocalLibraryMixin:
         if not app_id or not self.steam_path:
             return None
 
+        with self.state_lock:
+            snapshot_manifest_path = getattr(self, "installed_game_manifests", {}).get(app_id)
+        if snapshot_manifest_path and Path(snapshot_manifest_path).exists():
+            return Path(snapshot_manifest_path)
+
         manifest_name = f"appmanifest_{app_id}.acf"
         for steamapps_path in self.get_all_steam_library_paths():
             candidate = steamapps_path / manifest_name
@@ -75,6 +136,7 @@ class SteamPluginLocalLibraryMixin:
                 "signature": signature,
                 "data": dict(normalized_data),
             }
+            self.appmanifest_cache_dirty = True
         return normalized_data
 
     def load_appmanifest_data(self, manifest_path):
@@ -92,7 +154,52 @@ class SteamPluginLocalLibraryMixin:
 
     def cleanup_appmanifest_cache(self, manifest_keys_in_use):
         with self.state_lock:
-            cleanup_cache_keys(self.appmanifest_cache, manifest_keys_in_use)
+            if cleanup_cache_keys(self.appmanifest_cache, manifest_keys_in_use):
+                self.appmanifest_cache_dirty = True
+
+    def load_installed_games_cache(self):
+        if getattr(self, "appmanifest_cache_loaded", False):
+            return
+
+        cache_file = getattr(self, "installed_games_cache_file", None)
+        payload = read_json_file(cache_file, default={}) if cache_file else {}
+        snapshot, appmanifest_cache = normalize_installed_games_cache_payload(payload)
+        search_index = LocalSearchIndex.from_payload(payload.get("search_index"), snapshot.installed_games)
+        with self.state_lock:
+            for manifest_key, cache_entry in appmanifest_cache.items():
+                self.appmanifest_cache.setdefault(manifest_key, cache_entry)
+            if not self.installed_games and snapshot.installed_games:
+                self.installed_games = snapshot.installed_games
+                self.installed_game_paths = snapshot.installed_game_paths
+                self.installed_game_statuses = snapshot.installed_game_statuses
+                self.installed_game_manifests = snapshot.installed_game_manifests
+                self.local_search_index = search_index
+                self.local_game_views = {}
+            elif search_index is not None and getattr(self, "local_search_index", None) is None:
+                if search_index.key == build_local_search_index_key(self.installed_games):
+                    self.local_search_index = search_index
+            self.appmanifest_cache_loaded = True
+
+    def save_installed_games_cache(self, snapshot, search_index=None):
+        cache_file = getattr(self, "installed_games_cache_file", None)
+        if not cache_file:
+            return False
+
+        with self.state_lock:
+            if not getattr(self, "appmanifest_cache_dirty", False):
+                return False
+            payload = build_installed_games_cache_payload(
+                snapshot,
+                self.appmanifest_cache,
+                saved_at=time.time(),
+                search_index=search_index.to_payload() if search_index is not None else None,
+            )
+            self.appmanifest_cache_dirty = False
+        if write_json_file(cache_file, payload):
+            return True
+        with self.state_lock:
+            self.appmanifest_cache_dirty = True
+        return False
 
     def parse_manifest_int(self, raw_value, default=0):
         return parse_manifest_int(raw_value, default=default)
@@ -213,13 +320,31 @@ class SteamPluginLocalLibraryMixin:
 
         return self.CONFIG.download.status_updating
 
+    def live_game_status_needs_recheck(self, manifest_path, snapshot_status):
+        if snapshot_status in (
+            self.CONFIG.download.status_updating,
+            self.CONFIG.download.status_update_paused,
+            self.CONFIG.download.status_update_queued,
+        ):
+            return True
+        signature = self.get_appmanifest_signature(manifest_path)
+        with self.state_lock:
+            cache_entry = self.appmanifest_cache.get(str(manifest_path))
+        return not isinstance(cache_entry, dict) or cache_entry.get("signature") != signature
+
     def get_live_local_game_status(self, app_id, fallback_status=""):
         app_id = str(app_id or "").strip()
         fallback_status = str(fallback_status or "")
         if not app_id:
             return fallback_status
 
-        manifest_path = self.get_appmanifest_path_for_app_id(app_id)
+        with self.state_lock:
+            manifest_path = getattr(self, "installed_game_manifests", {}).get(app_id)
+        if manifest_path:
+            if not self.live_game_status_needs_recheck(manifest_path, fallback_status):
+                return fallback_status
+        else:
+            manifest_path = self.get_appmanifest_path_for_app_id(app_id)
         if not manifest_path:
             return fallback_status
 
@@ -235,6 +360,7 @@ class SteamPluginLocalLibraryMixin:
         with self.state_lock:
             self.last_update = 0
             if reset_user_paths:
+                self.local_game_views = {}
                 self.active_steam_user_id_snapshot = None
                 self.localconfig_path = None
                 self.hidden_collections_path = None
@@ -282,6 +408,8 @@ class SteamPluginLocalLibraryMixin:
         installed_games = {}
         installed_game_paths = {}
         installed_game_statuses = {}
+        installed_game_manifests = {}
+        search_index = None
         playtime_minutes = {}
         last_played_timestamps = {}
         manifest_keys_in_use = set()
@@ -292,6 +420,7 @@ class SteamPluginLocalLibraryMixin:
                 return
 
             self.refresh_local_steam_user_paths()
+            self.load_installed_games_cache()
             settings_provider = self.local_library_providers.settings
             blacklist = settings_provider.blacklisted_app_ids()
             if (
@@ -308,13 +437,19 @@ class SteamPluginLocalLibraryMixin:
                 self.derive_appmanifest_status_label,
                 blacklist=blacklist,
                 log_exception=self.log_exception,
+                log_library_timing=self.log_library_scan_timing,
+                max_workers=self.CONFIG.performance.library_scan_max_workers,
+                batch_size=self.CONFIG.performance.library_scan_batch_size,
             )
             installed_games = snapshot.installed_games
             installed_game_paths = snapshot.installed_game_paths
             installed_game_statuses = snapshot.installed_game_statuses
+            installed_game_manifests = snapshot.installed_game_manifests
             manifest_keys_in_use = snapshot.manifest_keys_in_use
 
+            search_index = self.build_local_search_index(installed_games)
             self.cleanup_appmanifest_cache(manifest_keys_in_use)
+            self.save_installed_games_cache(snapshot, search_index=search_index)
             self.cleanup_local_achievement_cache(installed_games.keys())
             update_completed = True
         finally:
@@ -323,11 +458,19 @@ class SteamPluginLocalLibraryMixin:
                     self.installed_games = installed_games
                     self.installed_game_paths = installed_game_paths
                     self.installed_game_statuses = installed_game_statuses
+                    self.installed_game_manifests = installed_game_manifests
+                    self.local_search_index = search_index
+                    self.local_game_views = {}
                     self.playtime_minutes = playtime_minutes
                     self.last_played_timestamps = last_played_timestamps
                     self.last_update = time.time()
                 self.installed_games_update_in_progress = False
 
+    def log_library_scan_timing(self, steamapps_path, duration_ms, manifest_count):
+        log_slow_call = getattr(self, "log_slow_call", None)
+        if callable(log_slow_call):
+            log_slow_call("scan_steam_library", duration_ms, f"path={steamapps_path} manifests={manifest_count}")
+
     def update_installed_games(self, force=False, allow_background=True):
         if not force and self.has_installed_games_snapshot() and self.active_local_user_state_is_stale():
             self.refresh_user_scoped_local_state()
@@ -351,28 +494,53 @@ class SteamPluginLocalLibraryMixin:
     def parse_state_flags(self, raw_state_flags):
         return parse_state_flags(raw_state_flags, config=self.CONFIG)
 
-    def get_local_game_icon(self, app_id):
-        if not self.steam_icon_cache or not self.steam_icon_cache.exists():
-            return self.DEFAULT_ICON
+    def get_librarycache_icon_index(self):
+        if not self.steam_icon_cache:
+            return None
+        with self.state_lock:
+            icon_index = getattr(self, "librarycache_icon_index", None)
+            if icon_index is not None and icon_index.root == self.steam_icon_cache:
+                return icon_index
+            cache_file = getattr(self, "librarycache_icon_index_file", None)
+            payload = read_json_file(cache_file, default={}) if cache_file else {}
+            icon_index = LibraryCacheIconIndex.from_payload(
+                payload,
+                self.steam_icon_cache,
+                recheck_seconds=self.CONFIG.cache.librarycache_icon_recheck_seconds,
+            )
+            self.librarycache_icon_index = icon_index
+            return icon_index
+
+    def save_librarycache_icon_index(self):
+        cache_file = getattr(self, "librarycache_icon_index_file", None)
+        with self.state_lock:
+            icon_index = getattr(self, "librarycache_icon_index", None)
+            if not cache_file or icon_index is None or not icon_index.dirty:
+                return False
+            payload = icon_index.to_payload()
+            icon_index.dirty = False
+        if write_json_file(cache_file, payload):
+            return True
+        with self.state_lock:
+            icon_index.dirty = True
+        return False
 
-        icon_cache_path = self.steam_icon_cache / str(app_id)
-        if not icon_cache_path.is_dir():
+    def get_librarycache_icon_index_stats(self):
+        with self.state_lock:
+            icon_index = getattr(self, "librarycache_icon_index", None)
+            return icon_index.get_stats() if icon_index is not None else {"entries": 0, "hits": 0, "misses": 0}
+
+    def get_local_game_icon(self, app_id):
+        icon_index = self.get_librarycache_icon_index()
+        if icon_index is None:
             return self.DEFAULT_ICON
 
         try:
-            files = [file_path for file_path in icon_cache_path.iterdir() if file_path.suffix.lower() == ".jpg" and file_path.is_file()]
-            filtered_files = [
-                file_path
-                for file_path in files
-                if not (
-                    file_path.name.lower().startswith("header")
-                    or file_path.name.lower().startswith("library")
-                    or file_path.name.lower().startswith("logo")
-                )
-            ]
-            if filtered_files:
-                return str(filtered_files[0])
+            icon_path = icon_index.lookup(app_id, lock=self.state_lock)
         except Exception:
             self.log_exception(f"Failed to resolve local icon for app {app_id}")
-
-        return self.DEFAULT_ICON
+            return self.DEFAULT_ICON
+        if not icon_path:
+            return self.DEFAULT_ICON
+        get_icon_thumbnail = getattr(self, "get_icon_thumbnail", None)
+        return get_icon_thumbnail(icon_path) if callable(get_icon_thumbnail) else icon_path
@@ -1,21 +1,64 @@
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import vdf
-
 from .constants import STEAMFLOW_CONFIG
+from .vdf_reader import load_vdf_path, parse_vdf_bytes
+
 
+INSTALLED_GAMES_CACHE_VERSION = 1
+LOCALCONFIG_STATS_CACHE_VERSION = 1
+APPMANIFEST_KEY_PATH = (
+    "AppState/{appid,name,installdir,StateFlags,BytesToDownload,BytesDownloaded,BytesToStage,BytesStaged}"
+)
+LIBRARYFOLDERS_KEY_PATH = "libraryfolders/*/path"
+LOCALCONFIG_APP_STATS_KEY_PATH = "UserLocalConfigStore/Software/Valve/Steam/{apps,Apps}/*/{Playtime,LastPlayed}"
 
 @dataclass
 class InstalledGamesSnapshot:
     installed_games: dict = field(default_factory=dict)
     installed_game_paths: dict = field(default_factory=dict)
     installed_game_statuses: dict = field(default_factory=dict)
+    installed_game_manifests: dict = field(default_factory=dict)
     manifest_keys_in_use: set = field(default_factory=set)
 
 
+class LocalGameView:
+    __slots__ = (
+        "app_id",
+        "install_path",
+        "status_label",
+        "playtime_minutes",
+        "last_played_timestamp",
+        "icon_path",
+        "has_current_account_data",
+    )
+
+    def __init__(
+        self,
+        app_id,
+        install_path=None,
+        status_label="",
+        playtime_minutes=None,
+        last_played_timestamp=None,
+        icon_path=None,
+        has_current_account_data=False,
+    ):
+        object.__setattr__(self, "app_id", str(app_id))
+        object.__setattr__(self, "install_path", install_path)
+        object.__setattr__(self, "status_label", str(status_label or ""))
+        object.__setattr__(self, "playtime_minutes", playtime_minutes)
+        object.__setattr__(self, "last_played_timestamp", last_played_timestamp)
+        object.__setattr__(self, "icon_path", icon_path)
+        object.__setattr__(self, "has_current_account_data", bool(has_current_account_data))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+
 def get_file_signature(path):
     try:
         stat_result = Path(path).stat()
@@ -24,6 +67,15 @@ def get_file_signature(path):
         return None
 
 
+def normalize_file_signature(raw_signature):
+    if not isinstance(raw_signature, (list, tuple)) or len(raw_signature) != 2:
+        return None
+    try:
+        return (int(raw_signature[0]), int(raw_signature[1]))
+    except (TypeError, ValueError):
+        return None
+
+
 def get_file_modified_time(path):
     try:
         return float(Path(path).stat().st_mtime)
@@ -89,9 +141,11 @@ def normalize_appmanifest_state(acf_data, config=STEAMFLOW_CONFIG):
 
 
 def load_appmanifest_file(manifest_path, config=STEAMFLOW_CONFIG, vdf_loader=None):
-    vdf_loader = vdf_loader or vdf.load
-    with open(manifest_path, "r", encoding="utf-8", errors="ignore") as file_obj:
-        acf_data = vdf_loader(file_obj).get("AppState", {})
+    if vdf_loader is None:
+        acf_data = load_vdf_path(manifest_path, key_path=APPMANIFEST_KEY_PATH).get("AppState", {})
+    else:
+        with open(manifest_path, "r", encoding="utf-8", errors="ignore") as file_obj:
+            acf_data = vdf_loader(file_obj).get("AppState", {})
     manifest_data = normalize_appmanifest_state(acf_data, config=config)
     manifest_data["modified_at"] = get_file_modified_time(manifest_path)
     return manifest_data
@@ -138,9 +192,11 @@ def load_steam_library_paths(steam_path, vdf_loader=None):
     if not library_folders_vdf_path.exists():
         return library_paths
 
-    vdf_loader = vdf_loader or vdf.load
-    with open(library_folders_vdf_path, "r", encoding="utf-8") as file_obj:
-        data = vdf_loader(file_obj)
+    if vdf_loader is None:
+        data = load_vdf_path(library_folders_vdf_path, key_path=LIBRARYFOLDERS_KEY_PATH)
+    else:
+        with open(library_folders_vdf_path, "r", encoding="utf-8") as file_obj:
+            data = vdf_loader(file_obj)
     return parse_libraryfolders_steamapps_paths(data, existing_paths=library_paths)
 
 
@@ -197,7 +253,8 @@ def resolve_hidden_collections_path(steam_path, active_user_id=None, localconfig
 
 
 def load_vdf_file(path, vdf_loader=None):
-    vdf_loader = vdf_loader or vdf.load
+    if vdf_loader is None:
+        return load_vdf_path(path)
     with open(path, "r", encoding="utf-8", errors="ignore") as file_obj:
         data = vdf_loader(file_obj)
     return data if isinstance(data, dict) else {}
@@ -294,6 +351,43 @@ def extract_localconfig_app_stats(steam_data):
     return playtimes, last_played_timestamps
 
 
+def extract_localconfig_app_stats_from_bytes(localconfig_data):
+    localconfig_root = parse_vdf_bytes(localconfig_data, key_path=LOCALCONFIG_APP_STATS_KEY_PATH)
+    return extract_localconfig_app_stats(get_localconfig_steam_data(localconfig_root))
+
+
+def load_localconfig_app_stats_file(localconfig_path):
+    return extract_localconfig_app_stats_from_bytes(Path(localconfig_path).read_bytes())
+
+
+def build_localconfig_stats_cache_entry(signature, playtimes, last_played_timestamps):
+    return {
+        "signature": list(signature),
+        "playtimes": dict(playtimes),
+        "last_played": dict(last_played_timestamps),
+    }
+
+
+def read_localconfig_stats_cache_entry(payload, localconfig_path, signature):
+    if not isinstance(payload, dict) or payload.get("version") != LOCALCONFIG_STATS_CACHE_VERSION:
+        return None
+    entries = payload.get("entries")
+    cache_entry = entries.get(str(localconfig_path)) if isinstance(entries, dict) else None
+    if not isinstance(cache_entry, dict) or normalize_file_signature(cache_entry.get("signature")) != signature:
+        return None
+
+    stats = []
+    for field_name in ("playtimes", "last_played"):
+        values = cache_entry.get(field_name)
+        if not isinstance(values, dict):
+            return None
+        try:
+            stats.append({str(app_id): int(value) for app_id, value in values.items()})
+        except (TypeError, ValueError):
+            return None
+    return tuple(stats)
+
+
 def build_installed_game_record(steamapps_path, manifest_data, status_label="", blacklist=None):
     blacklist = {str(app_id) for app_id in (blacklist or set())}
     manifest_data = manifest_data if isinstance(manifest_data, dict) else {}
@@ -318,47 +412,164 @@ def build_installed_game_record(steamapps_path, manifest_data, status_label="",
     return record
 
 
+def list_library_manifest_paths(steamapps_path):
+    steamapps_path = Path(steamapps_path)
+    if not steamapps_path.exists():
+        return []
+    return sorted(steamapps_path.glob("appmanifest_*.acf"))
+
+
+def load_manifest_batch(manifest_paths, load_manifest_data):
+    results = []
+    for acf_file in manifest_paths:
+        try:
+            results.append((acf_file, load_manifest_data(acf_file), None))
+        except Exception as error:
+            results.append((acf_file, None, error))
+    return results, time.perf_counter()
+
+
 def collect_installed_games_snapshot(
     steamapps_paths,
     load_manifest_data,
     derive_status_label,
     blacklist=None,
     log_exception=None,
+    log_library_timing=None,
+    max_workers=STEAMFLOW_CONFIG.performance.library_scan_max_workers,
+    batch_size=STEAMFLOW_CONFIG.performance.library_scan_batch_size,
+    executor_factory=ThreadPoolExecutor,
 ):
     snapshot = InstalledGamesSnapshot()
     blacklist = {str(app_id) for app_id in (blacklist or set())}
-
-    for steamapps_path in steamapps_paths:
-        steamapps_path = Path(steamapps_path)
-        try:
-            if not steamapps_path.exists():
+    steamapps_paths = [Path(steamapps_path) for steamapps_path in steamapps_paths]
+    if not steamapps_paths:
+        return snapshot
+
+    batch_size = max(1, int(batch_size or 1))
+    with executor_factory(max_workers=max(1, int(max_workers or 1))) as executor:
+        start_times = []
+        listing_futures = {}
+        for library_index, steamapps_path in enumerate(steamapps_paths):
+            start_times.append(time.perf_counter())
+            listing_futures[executor.submit(list_library_manifest_paths, steamapps_path)] = library_index
+
+        # Parse batches go out as soon as each listing lands, so a slow drive does not hold back the others.
+        library_batches = [None] * len(steamapps_paths)
+        for listing_future in as_completed(listing_futures):
+            library_index = listing_futures[listing_future]
+            steamapps_path = steamapps_paths[library_index]
+            try:
+                manifest_paths = listing_future.result()
+            except Exception:
+                if log_exception:
+                    log_exception(f"Failed to scan Steam library: {steamapps_path}")
+                continue
+            batch_futures = [
+                executor.submit(load_manifest_batch, manifest_paths[index:index + batch_size], load_manifest_data)
+                for index in range(0, len(manifest_paths), batch_size)
+            ]
+            library_batches[library_index] = (steamapps_path, start_times[library_index], len(manifest_paths), batch_futures)
+
+        for library_batch in library_batches:
+            if library_batch is None:
                 continue
-            for acf_file in steamapps_path.glob("appmanifest_*.acf"):
-                snapshot.manifest_keys_in_use.add(str(acf_file))
-                try:
-                    manifest_data = load_manifest_data(acf_file)
-                    if not manifest_data:
-                        continue
-                    state_flags = manifest_data.get("state_flags") or {}
-                    app_id = str(manifest_data.get("app_id", "") or "").strip()
-                    status_label = derive_status_label(app_id, state_flags, manifest_data)
-                    record = build_installed_game_record(
-                        steamapps_path,
-                        manifest_data,
-                        status_label=status_label,
-                        blacklist=blacklist,
-                    )
-                    if not record:
-                        continue
-                    snapshot.installed_games[record["app_id"]] = record["name"]
-                    snapshot.installed_game_statuses[record["app_id"]] = record["status"]
-                    if record["install_path"]:
-                        snapshot.installed_game_paths[record["app_id"]] = record["install_path"]
-                except Exception:
-                    if log_exception:
-                        log_exception(f"Failed to process manifest: {acf_file}")
-        except Exception:
-            if log_exception:
-                log_exception(f"Failed to scan Steam library: {steamapps_path}")
+            steamapps_path, start_time, manifest_count, batch_futures = library_batch
+            finished_at = start_time
+            for batch_future in batch_futures:
+                batch_results, batch_finished_at = batch_future.result()
+                finished_at = max(finished_at, batch_finished_at)
+                for acf_file, manifest_data, error in batch_results:
+                    snapshot.manifest_keys_in_use.add(str(acf_file))
+                    try:
+                        if error is not None:
+                            raise error
+                        if not manifest_data:
+                            continue
+                        state_flags = manifest_data.get("state_flags") or {}
+                        app_id = str(manifest_data.get("app_id", "") or "").strip()
+                        status_label = derive_status_label(app_id, state_flags, manifest_data)
+                        record = build_installed_game_record(
+                            steamapps_path,
+                            manifest_data,
+                            status_label=status_label,
+                            blacklist=blacklist,
+                        )
+                        if not record:
+                            continue
+                        snapshot.installed_games[record["app_id"]] = record["name"]
+                        snapshot.installed_game_statuses[record["app_id"]] = record["status"]
+                        snapshot.installed_game_manifests[record["app_id"]] = str(acf_file)
+                        if record["install_path"]:
+                            snapshot.installed_game_paths[record["app_id"]] = record["install_path"]
+                    except Exception:
+                        if log_exception:
+                            log_exception(f"Failed to process manifest: {acf_file}")
+            if log_library_timing:
+                if not batch_futures:
+                    finished_at = time.perf_counter()
+                log_library_timing(steamapps_path, (finished_at - start_time) * 1000, manifest_count)
 
     return snapshot
+
+
+def build_installed_games_cache_payload(snapshot, appmanifest_cache, saved_at=0, search_index=None):
+    manifests = {}
+    for manifest_key in sorted(snapshot.manifest_keys_in_use):
+        cache_entry = appmanifest_cache.get(manifest_key)
+        if not isinstance(cache_entry, dict) or not isinstance(cache_entry.get("data"), dict):
+            continue
+        signature = normalize_file_signature(cache_entry.get("signature"))
+        if signature is None:
+            continue
+        manifests[manifest_key] = {
+            "signature": list(signature),
+            "data": cache_entry["data"],
+        }
+    payload = {
+        "version": INSTALLED_GAMES_CACHE_VERSION,
+        "saved_at": float(saved_at or 0),
+        "installed_games": dict(snapshot.installed_games),
+        "installed_game_paths": dict(snapshot.installed_game_paths),
+        "installed_game_statuses": dict(snapshot.installed_game_statuses),
+        "installed_game_manifests": dict(snapshot.installed_game_manifests),
+        "manifests": manifests,
+    }
+    if search_index is not None:
+        payload["search_index"] = search_index
+    return payload
+
+
+def normalize_installed_games_cache_payload(payload):
+    snapshot = InstalledGamesSnapshot()
+    appmanifest_cache = {}
+    if not isinstance(payload, dict) or payload.get("version") != INSTALLED_GAMES_CACHE_VERSION:
+        return snapshot, appmanifest_cache
+
+    manifests = payload.get("manifests")
+    for manifest_key, cache_entry in (manifests.items() if isinstance(manifests, dict) else ()):
+        if not isinstance(cache_entry, dict) or not isinstance(cache_entry.get("data"), dict):
+            continue
+        signature = normalize_file_signature(cache_entry.get("signature"))
+        if signature is None:
+            continue
+        appmanifest_cache[str(manifest_key)] = {
+            "signature": signature,
+            "data": cache_entry["data"],
+        }
+        snapshot.manifest_keys_in_use.add(str(manifest_key))
+
+    for field_name in (
+        "installed_games",
+        "installed_game_paths",
+        "installed_game_statuses",
+        "installed_game_manifests",
+    ):
+        values = payload.get(field_name)
+        if isinstance(values, dict):
+            setattr(
+                snapshot,
+                field_name,
+                {str(app_id): str(value or "") for app_id, value in values.items()},
+            )
+    return snapshot, appmanifest_cache
@@ -1,4 +1,3 @@
-import copy
 from pathlib import Path
 
 from .local_library_service import (
@@ -127,13 +126,13 @@ class SteamPluginLocalPresenceMixin:
             and localconfig_path == cache_path
             and current_mtime <= cache_mtime
         ):
-            return copy.deepcopy(cache_data)
+            return cache_data
 
         normalized_data = load_vdf_file(localconfig_path)
         with self.state_lock:
             self.localconfig_data_cache_path = localconfig_path
             self.localconfig_data_cache_mtime = current_mtime
-            self.localconfig_data_cache = copy.deepcopy(normalized_data)
+            self.localconfig_data_cache = normalized_data
         return normalized_data
 
     def get_local_persona_state_label(self, persona_state):
@@ -0,0 +1,213 @@
+import hashlib
+import json
+import re
+import time
+import unicodedata
+
+
+LOCAL_SEARCH_INDEX_VERSION = 1
+LOCAL_SEARCH_WORD_PATTERN = re.compile(r"[^\W_]+")
+LOCAL_SEARCH_MIN_TRIGRAM_QUERY_LENGTH = 3
+LOCAL_SEARCH_MIN_TRIGRAM_COVERAGE = 0.5
+
+# Match tiers, highest first. A game scores the best tier it reaches, minus a
+# small penalty for where the match starts and how long the name is, plus a
+# recency bonus that decays with the days since it was last played:
+#   exact name          1000    acronym exact        750
+#   name prefix          800    acronym prefix       600
+#   word prefixes        650    substring (word)     550
+#   substring            400    trigram (typos)      300 * coverage
+LOCAL_SEARCH_SCORE_EXACT = 1000
+LOCAL_SEARCH_SCORE_PREFIX = 800
+LOCAL_SEARCH_SCORE_ACRONYM = 750
+LOCAL_SEARCH_SCORE_WORD_PREFIX = 650
+LOCAL_SEARCH_SCORE_ACRONYM_PREFIX = 600
+LOCAL_SEARCH_SCORE_WORD_SUBSTRING = 550
+LOCAL_SEARCH_SCORE_SUBSTRING = 400
+LOCAL_SEARCH_SCORE_TRIGRAM = 300
+LOCAL_SEARCH_RECENCY_BONUS = 60
+LOCAL_SEARCH_RECENCY_HALF_LIFE_DAYS = 30
+
+
+def fold_search_text(text):
+    decomposed = unicodedata.normalize("NFKD", str(text or ""))
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def split_search_words(text):
+    return LOCAL_SEARCH_WORD_PATTERN.findall(fold_search_text(text))
+
+
+def normalize_search_text(text):
+    return " ".join(split_search_words(text))
+
+
+def build_search_acronym(words):
+    return "".join(word if word.isdigit() else word[0] for word in words if word)
+
+
+def build_search_trigrams(words):
+    trigrams = set()
+    for word in words:
+        padded = f" {word} "
+        for index in range(len(padded) - 2):
+            trigrams.add(padded[index:index + 3])
+    return trigrams
+
+
+def build_word_offsets(words):
+    offsets = []
+    offset = 0
+    for word in words:
+        offsets.append(offset)
+        offset += len(word) + 1
+    return tuple(offsets)
+
+
+def build_local_search_index_key(installed_games):
+    items = sorted((str(app_id), str(name)) for app_id, name in (installed_games or {}).items())
+    return hashlib.sha1(json.dumps(items, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def get_recency_bonus(last_played_timestamp, now):
+    try:
+        last_played_timestamp = float(last_played_timestamp or 0)
+    except (TypeError, ValueError):
+        return 0.0
+    if last_played_timestamp <= 0:
+        return 0.0
+    age_days = max(0.0, (now - last_played_timestamp) / 86400)
+    return LOCAL_SEARCH_RECENCY_BONUS * (0.5 ** (age_days / LOCAL_SEARCH_RECENCY_HALF_LIFE_DAYS))
+
+
+class LocalSearchEntry:
+    __slots__ = ("app_id", "name", "normalized", "words", "word_offsets", "acronym")
+
+    def __init__(self, app_id, name, normalized, words, word_offsets, acronym):
+        self.app_id = app_id
+        self.name = name
+        self.normalized = normalized
+        self.words = words
+        self.word_offsets = word_offsets
+        self.acronym = acronym
+
+    @classmethod
+    def build(cls, app_id, name, normalized=None, acronym=None):
+        words = tuple(normalized.split()) if normalized is not None else tuple(split_search_words(name))
+        if acronym is None:
+            acronym = build_search_acronym(words)
+        return cls(str(app_id), str(name), " ".join(words), words, build_word_offsets(words), acronym)
+
+    def to_payload(self):
+        return [self.app_id, self.name, self.normalized, self.acronym]
+
+    def match_tier(self, query, query_words):
+        normalized = self.normalized
+        if normalized == query:
+            return LOCAL_SEARCH_SCORE_EXACT, 0
+        if normalized.startswith(query):
+            return LOCAL_SEARCH_SCORE_PREFIX, 0
+        compact_query = query.replace(" ", "")
+        if self.acronym == compact_query:
+            return LOCAL_SEARCH_SCORE_ACRONYM, 0
+        if self.matches_word_prefixes(query_words):
+            return LOCAL_SEARCH_SCORE_WORD_PREFIX, 0
+        if len(compact_query) > 1 and self.acronym.startswith(compact_query):
+            return LOCAL_SEARCH_SCORE_ACRONYM_PREFIX, 0
+        position = normalized.find(query)
+        if position >= 0:
+            if position in self.word_offsets:
+                return LOCAL_SEARCH_SCORE_WORD_SUBSTRING, position
+            return LOCAL_SEARCH_SCORE_SUBSTRING, position
+        return 0, 0
+
+    def matches_word_prefixes(self, query_words):
+        word_index = 0
+        for query_word in query_words:
+            while word_index < len(self.words) and not self.words[word_index].startswith(query_word):
+                word_index += 1
+            if word_index >= len(self.words):
+                return False
+            word_index += 1
+        return bool(query_words)
+
+
+class LocalSearchIndex:
+    def __init__(self, entries, key=""):
+        self.entries = list(entries)
+        self.key = str(key or "")
+        self.trigram_postings = {}
+        for entry_index, entry in enumerate(self.entries):
+            for trigram in build_search_trigrams(entry.words):
+                self.trigram_postings.setdefault(trigram, []).append(entry_index)
+
+    def __len__(self):
+        return len(self.entries)
+
+    @classmethod
+    def build(cls, installed_games):
+        installed_games = dict(installed_games or {})
+        entries = [LocalSearchEntry.build(app_id, name) for app_id, name in installed_games.items()]
+        return cls(entries, key=build_local_search_index_key(installed_games))
+
+    def to_payload(self):
+        return {
+            "version": LOCAL_SEARCH_INDEX_VERSION,
+            "key": self.key,
+            "entries": [entry.to_payload() for entry in self.entries],
+        }
+
+    @classmethod
+    def from_payload(cls, payload, installed_games):
+        if not isinstance(payload, dict) or payload.get("version") != LOCAL_SEARCH_INDEX_VERSION:
+            return None
+        if payload.get("key") != build_local_search_index_key(installed_games):
+            return None
+        entries = []
+        for raw_entry in payload.get("entries") or []:
+            if not isinstance(raw_entry, list) or len(raw_entry) != 4:
+                return None
+            app_id, name, normalized, acronym = (str(value) for value in raw_entry)
+            entries.append(LocalSearchEntry.build(app_id, name, normalized=normalized, acronym=acronym))
+        return cls(entries, key=payload["key"])
+
+    def get_trigram_coverage(self, query_words):
+        query_trigrams = build_search_trigrams(query_words)
+        if not query_trigrams:
+            return {}
+        hits = {}
+        for trigram in query_trigrams:
+            for entry_index in self.trigram_postings.get(trigram, ()):
+                hits[entry_index] = hits.get(entry_index, 0) + 1
+        return {entry_index: count / len(query_trigrams) for entry_index, count in hits.items()}
+
+    def search(self, search_term, limit=None, last_played_timestamps=None, now=None):
+        query_words = split_search_words(search_term)
+        query = " ".join(query_words)
+        if not query:
+            return []
+
+        now = time.time() if now is None else now
+        last_played_timestamps = last_played_timestamps or {}
+        scored = {}
+        for entry_index, entry in enumerate(self.entries):
+            tier_score, position = entry.match_tier(query, query_words)
+            if tier_score:
+                scored[entry_index] = tier_score - min(position, 50) - len(entry.normalized) / 100
+
+        if len(query.replace(" ", "")) >= LOCAL_SEARCH_MIN_TRIGRAM_QUERY_LENGTH:
+            for entry_index, coverage in self.get_trigram_coverage(query_words).items():
+                if entry_index in scored or coverage < LOCAL_SEARCH_MIN_TRIGRAM_COVERAGE:
+                    continue
+                entry = self.entries[entry_index]
+                scored[entry_index] = LOCAL_SEARCH_SCORE_TRIGRAM * coverage - len(entry.normalized) / 100
+
+        ranked = []
+        for entry_index, score in scored.items():
+            entry = self.entries[entry_index]
+            score += get_recency_bonus(last_played_timestamps.get(entry.app_id), now)
+            ranked.append((-score, entry.normalized, entry.app_id, entry.name))
+        ranked.sort()
+        if limit is not None:
+            ranked = ranked[: max(0, int(limit))]
+        return [(app_id, name) for _score, _normalized, app_id, name in ranked]
@@ -1,6 +1,13 @@
 import struct
 
-from .local_library_service import extract_localconfig_app_stats
+from .cache_utils import read_json_file, write_json_file
+from .local_library_service import (
+    LOCALCONFIG_STATS_CACHE_VERSION,
+    build_localconfig_stats_cache_entry,
+    get_file_signature,
+    load_localconfig_app_stats_file,
+    read_localconfig_stats_cache_entry,
+)
 from .providers import get_plugin_providers
 
 
@@ -136,6 +143,7 @@ class SteamPluginLocalStatsMixin:
         with self.state_lock:
             self.playtime_minutes = playtime_minutes
             self.last_played_timestamps = last_played_timestamps
+            self.local_game_views = {}
             self.achievement_progress = {}
             self.achievement_progress_signatures = {}
 
@@ -297,9 +305,20 @@ class SteamPluginLocalStatsMixin:
                 ):
                     return dict(self.playtime_minutes), dict(self.last_played_timestamps)
 
-            playtimes, last_played_timestamps = extract_localconfig_app_stats(
-                self.load_localconfig_steam_data(self.localconfig_path)
-            )
+            signature = get_file_signature(self.localconfig_path)
+            cache_file = getattr(self, "localconfig_stats_cache_file", None)
+            cache_payload = read_json_file(cache_file, default={}) if cache_file else {}
+            cached_stats = read_localconfig_stats_cache_entry(cache_payload, self.localconfig_path, signature)
+            if cached_stats is not None:
+                playtimes, last_played_timestamps = cached_stats
+            else:
+                playtimes, last_played_timestamps = load_localconfig_app_stats_file(self.localconfig_path)
+                if cache_file and signature:
+                    self.save_localconfig_stats_cache(
+                        cache_file,
+                        cache_payload,
+                        build_localconfig_stats_cache_entry(signature, playtimes, last_played_timestamps),
+                    )
 
             with self.state_lock:
                 self.localconfig_mtime = current_mtime
@@ -307,3 +326,18 @@ class SteamPluginLocalStatsMixin:
         except Exception:
             self.log_exception("Failed to load playtime data from localconfig.vdf")
             return {}, {}
+
+    def save_localconfig_stats_cache(self, cache_file, cache_payload, cache_entry):
+        entries = cache_payload.get("entries") if isinstance(cache_payload, dict) else None
+        if not isinstance(entries, dict) or cache_payload.get("version") != LOCALCONFIG_STATS_CACHE_VERSION:
+            entries = {}
+        entries = {
+            localconfig_key: entry
+            for localconfig_key, entry in entries.items()
+            if get_file_signature(localconfig_key) is not None
+        }
+        entries[str(self.localconfig_path)] = cache_entry
+        return write_json_file(
+            cache_file,
+            {"version": LOCALCONFIG_STATS_CACHE_VERSION, "entries": entries},
+        )
@@ -1,7 +1,11 @@
 import ctypes
 import json
 import locale
+import marshal
+import os
+import string
 import sys
+import tempfile
 from functools import lru_cache
 from pathlib import Path
 
@@ -23,6 +27,8 @@ STEAM_LANGUAGE_BY_LOCALE = {
 }
 
 _LOCALES_DIR = Path(__file__).resolve().parent / "locales"
+LOCALE_CATALOG_VERSION = 1
+LOCALE_CATALOG_CACHE_FILE = _LOCALES_DIR / "__pycache__" / "catalog.marshal"
 _ZH_HANS_REGIONS = {"cn", "sg"}
 _ZH_HANT_REGIONS = {"tw", "hk", "mo"}
 
@@ -131,6 +137,7 @@ def detect_windows_preferred_ui_locale():
         return ""
 
 
+@lru_cache(maxsize=1)
 def detect_system_locale():
     windows_locale = detect_windows_preferred_ui_locale()
     if windows_locale:
@@ -170,27 +177,131 @@ def _format_message(template, values):
         return template
 
 
+def compile_message_template(template):
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return None
+    parts = []
+    for literal, field_name, format_spec, conversion in parsed:
+        if field_name is not None and (not field_name.isidentifier() or format_spec or conversion):
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
+def format_compiled_message(template, parts, values):
+    if not values:
+        return template
+    if parts is None:
+        return _format_message(template, values)
+    try:
+        return "".join(
+            literal if field_name is None else literal + format(values[field_name])
+            for literal, field_name in parts
+        )
+    except Exception:
+        return template
+
+
+def get_locale_source_signatures(locale_name):
+    signatures = []
+    for source_locale in dict.fromkeys((DEFAULT_LOCALE, locale_name)):
+        try:
+            stat_result = (_LOCALES_DIR / f"{source_locale}.json").stat()
+        except OSError:
+            signatures.append((source_locale, None))
+            continue
+        signatures.append((source_locale, (stat_result.st_mtime_ns, stat_result.st_size)))
+    return tuple(signatures)
+
+
+def build_locale_catalog(locale_name):
+    flattened = {}
+    for source_locale in (DEFAULT_LOCALE, locale_name):
+        flattened.update(
+            (str(key), str(template))
+            for key, template in load_locale_messages(source_locale).items()
+            if template is not None
+        )
+    return {key: (template, compile_message_template(template)) for key, template in flattened.items()}
+
+
+def read_locale_catalog_cache(cache_file):
+    try:
+        with open(cache_file, "rb") as file_obj:
+            payload = marshal.load(file_obj)
+    except Exception:
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != LOCALE_CATALOG_VERSION:
+        return {}
+    catalogs = payload.get("catalogs")
+    return catalogs if isinstance(catalogs, dict) else {}
+
+
+def write_locale_catalog_cache(cache_file, catalogs):
+    cache_file = Path(cache_file)
+    temp_path = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=cache_file.parent, delete=False) as file_obj:
+            temp_path = file_obj.name
+            marshal.dump({"version": LOCALE_CATALOG_VERSION, "catalogs": catalogs}, file_obj)
+        os.replace(temp_path, cache_file)
+        return True
+    except Exception:
+        if temp_path:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+        return False
+
+
+def load_compiled_catalog(locale_name, cache_file=LOCALE_CATALOG_CACHE_FILE):
+    normalized = normalize_locale(locale_name)
+    sources = get_locale_source_signatures(normalized)
+    catalogs = read_locale_catalog_cache(cache_file) if cache_file else {}
+    cached_catalog = catalogs.get(normalized)
+    if isinstance(cached_catalog, dict) and cached_catalog.get("sources") == sources:
+        messages = cached_catalog.get("messages")
+        if isinstance(messages, dict):
+            return messages
+    messages = build_locale_catalog(normalized)
+    if cache_file:
+        catalogs[normalized] = {"sources": sources, "messages": messages}
+        write_locale_catalog_cache(cache_file, catalogs)
+    return messages
+
+
+@lru_cache(maxsize=16)
+def get_compiled_catalog(locale_name):
+    return load_compiled_catalog(locale_name)
+
+
 class Localizer:
     def __init__(self, locale_name=DEFAULT_LOCALE):
         self.locale = normalize_locale(locale_name)
-        self.messages = load_locale_messages(self.locale)
-        self.fallback_messages = load_locale_messages(DEFAULT_LOCALE)
+        self.catalog = get_compiled_catalog(self.locale)
 
     @property
     def steam_language(self):
         return STEAM_LANGUAGE_BY_LOCALE.get(self.locale, STEAM_LANGUAGE_BY_LOCALE[DEFAULT_LOCALE])
 
     def tr(self, key, default=None, **values):
-        template = self.messages.get(key)
-        if template is None:
-            template = self.fallback_messages.get(key)
-        if template is None:
-            template = default if default is not None else key
-        return _format_message(str(template), values)
+        entry = self.catalog.get(key)
+        if entry is None:
+            return _format_message(str(default if default is not None else key), values)
+        return format_compiled_message(entry[0], entry[1], values)
+
+
+@lru_cache(maxsize=16)
+def get_localizer(locale_name=DEFAULT_LOCALE):
+    return Localizer(locale_name)
 
 
 def plugin_tr(plugin, key, default=None, **values):
     translator = getattr(plugin, "tr", None)
     if callable(translator):
         return translator(key, default=default, **values)
-    return Localizer(DEFAULT_LOCALE).tr(key, default=default, **values)
+    return get_localizer(DEFAULT_LOCALE).tr(key, default=default, **values)
@@ -1,4 +1,4 @@
-from .localization import Localizer
+from .localization import get_localizer
 
 
 STORE_ACTION_RESULT_SOURCES = frozenset({"store", "specials", "top_sellers", "store_collection"})
@@ -11,7 +11,7 @@ def _tr(translator, key, default=None, **values):
             return translator(key, **values)
         except TypeError:
             return translator(key, **values)
-    return Localizer("en").tr(key, **values)
+    return get_localizer("en").tr(key, **values)
 
 
 def get_refund_menu_copy(refund_state, name, tr=None):
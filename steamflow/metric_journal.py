@@ -0,0 +1,126 @@
+import json
+import os
+from pathlib import Path
+
+
+METRIC_CACHE_NAMES = (
+    "player_count_cache",
+    "review_score_cache",
+    "achievement_schema_cache",
+    "achievement_progress_cache",
+)
+METRIC_JOURNAL_SEALED_SUFFIX = ".compacting"
+
+
+def encode_metric_journal_records(records):
+    lines = []
+    for cache_name, key, entry in records:
+        lines.append(json.dumps([cache_name, str(key), entry], ensure_ascii=False, separators=(",", ":")))
+    return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+
+def decode_metric_journal_records(data):
+    records = []
+    for line in data.splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if (
+            isinstance(record, list)
+            and len(record) == 3
+            and record[0] in METRIC_CACHE_NAMES
+            and isinstance(record[2], dict)
+        ):
+            records.append((record[0], str(record[1]), record[2]))
+    return records
+
+
+def get_metric_entry_timestamp(entry):
+    try:
+        return float((entry or {}).get("timestamp", 0) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def iter_metric_cache_records(caches):
+    for cache_name, cache in caches.items():
+        for key, entry in cache.items():
+            yield cache_name, key, entry
+
+
+def apply_metric_journal_records(caches, records):
+    applied_count = 0
+    for cache_name, key, entry in records:
+        cache = caches.get(cache_name)
+        if cache is None:
+            continue
+        current_entry = cache.get(key)
+        if current_entry is not None and get_metric_entry_timestamp(current_entry) > get_metric_entry_timestamp(entry):
+            continue
+        cache[key] = entry
+        applied_count += 1
+    return applied_count
+
+
+class MetricCacheJournal:
+    def __init__(self, journal_file):
+        self.journal_file = Path(journal_file)
+
+    def size(self):
+        try:
+            return self.journal_file.stat().st_size
+        except OSError:
+            return 0
+
+    def append(self, records):
+        data = encode_metric_journal_records(records)
+        if not data:
+            return True
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        file_descriptor = os.open(str(self.journal_file), flags, 0o644)
+        try:
+            written = os.write(file_descriptor, data)
+        finally:
+            os.close(file_descriptor)
+        return written == len(data)
+
+    def list_sealed_files(self):
+        pattern = f"{self.journal_file.name}.*{METRIC_JOURNAL_SEALED_SUFFIX}"
+        try:
+            return sorted(self.journal_file.parent.glob(pattern))
+        except OSError:
+            return []
+
+    def seal(self):
+        sealed_file = self.journal_file.with_name(
+            f"{self.journal_file.name}.{os.getpid()}.{os.urandom(4).hex()}{METRIC_JOURNAL_SEALED_SUFFIX}"
+        )
+        try:
+            os.replace(self.journal_file, sealed_file)
+        except FileNotFoundError:
+            return None
+        return sealed_file
+
+    def read_records(self, paths):
+        records = []
+        for path in paths:
+            try:
+                records.extend(decode_metric_journal_records(Path(path).read_bytes()))
+            except OSError:
+                continue
+        return records
+
+    def replay(self, caches):
+        return apply_metric_journal_records(
+            caches,
+            self.read_records([*self.list_sealed_files(), self.journal_file]),
+        )
+
+    def discard(self, paths):
+        for path in paths:
+            try:
+                Path(path).unlink()
+            except OSError:
+                pass
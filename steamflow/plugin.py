@@ -21,6 +21,7 @@ from .constants import STEAMFLOW_CONFIG
 from .core import SteamPluginCoreMixin
 from .download_control import SteamPluginDownloadControlMixin
 from .feature_health import SteamPluginFeatureHealthMixin
+from .http_client import SingleFlightGroup
 from .local import SteamPluginLocalMixin
 from .mixin_contracts import validate_declared_mixin_contracts
 from .profile import SteamPluginProfileMixin
@@ -37,7 +38,7 @@ from .state import (
 from .storage import SteamPluginStorageMixin
 from .store import SteamPluginStoreMixin
 from .store_metrics import SteamPluginStoreMetricsMixin
-from .tasks import BackgroundTaskManager
+from .tasks import BackgroundTaskManager, TaskScheduler
 from .ui_commands import SteamPluginUICommandsMixin
 from .ui import SteamPluginUIMixin
 from .ui_query import SteamPluginUIQueryMixin
@@ -91,7 +92,13 @@ class SteamPlugin(
         object.__setattr__(self, "local_state", SteamPluginLocalState())
         object.__setattr__(self, "runtime_state", SteamPluginRuntimeState())
         self.plugin_dir = PACKAGE_ROOT
-        self.background_task_manager = BackgroundTaskManager()
+        self.background_task_manager = BackgroundTaskManager(
+            scheduler=TaskScheduler(
+                max_workers=self.CONFIG.performance.task_scheduler_max_workers,
+                max_background_workers=self.CONFIG.performance.task_scheduler_max_background_workers,
+            ),
+            fanout_scheduler=TaskScheduler(max_workers=self.CONFIG.performance.task_scheduler_max_fanout_workers),
+        )
         self.providers = SteamPluginProviders(self)
         self._initialize_paths()
         self._initialize_minimal_state()
@@ -136,7 +143,17 @@ class SteamPlugin(
         self.feature_health_cache_file = self.plugin_dir / "cache_feature_health.json"
         self.app_details_cache_dir = self.plugin_dir / APP_DETAILS_CACHE_DIR_NAME
         self.metric_cache_file = self.plugin_dir / "cache_metric.json"
+        self.metric_cache_journal_file = self.plugin_dir / "cache_metric.journal"
+        self.installed_games_cache_file = self.plugin_dir / "cache_installed_games.json"
+        self.localconfig_stats_cache_file = self.plugin_dir / "cache_localconfig_stats.json"
+        self.librarycache_icon_index_file = self.plugin_dir / "cache_librarycache_icons.json"
+        self.game_icon_pipeline_file = self.plugin_dir / "cache_game_icons.json"
+        self.icon_thumbnail_dir = self.plugin_dir / "cache_thumbnails"
+        self.cache_budget_index_file = self.plugin_dir / "cache_budget.json"
+        self.store_search_cache_file = self.plugin_dir / "cache_store_search.json"
         self.wishlist_worker_lock_file = self.plugin_dir / "steam_wishlist_worker.lock"
+        self.refresh_jobs_file = self.plugin_dir / "steam_refresh_jobs.json"
+        self.refresh_worker_lock_file = self.plugin_dir / "steam_refresh_worker.lock"
         self.owned_games_cache_file = self.plugin_dir / "cache_owned_games.json"
         self.wishlist_cache_file = self.plugin_dir / "cache_wishlist.json"
         self.secure_settings_dir = Path(self.settings_path).parent
@@ -158,9 +175,21 @@ class SteamPlugin(
         if self.runtime_initialized:
             return
         self.http_pool = urllib3.PoolManager(maxsize=8, retries=False, ca_certs=_CA_CERTS_PATH)
+        self.http_single_flight = SingleFlightGroup()
+        self.game_icon_pipeline = None
+        self.pending_icon_refresh = False
+        self.icon_thumbnail_cache = None
+        self.pending_thumbnail_refresh = False
+        self.cache_budget_registry = None
+        self.settings_snapshot = None
+        self.settings_snapshot_request = None
+        self.settings_blacklisted_app_ids = None
         self.installed_games = {}
         self.installed_game_paths = {}
         self.installed_game_statuses = {}
+        self.installed_game_manifests = {}
+        self.local_search_index = None
+        self.local_game_views = {}
         self.playtime_minutes = {}
         self.last_played_timestamps = {}
         self.achievement_progress = {}
@@ -169,8 +198,10 @@ class SteamPlugin(
         self.installed_games_update_in_progress = False
         self.last_cache_cleanup = 0
         self.last_metric_cache_save = 0
-        self.metric_cache_dirty = False
+        self.metric_cache_pending_records = {}
+        self.metric_cache_compaction_pending = False
         self.search_cache = {}
+        self.store_search_refreshes_in_progress = set()
         self.store_collection_cache = {}
         self.store_user_preferences_cache = {}
         self.player_count_cache = {}
@@ -192,6 +223,7 @@ class SteamPlugin(
         self.owned_games_steamid64 = None
         self.owned_app_ids = set()
         self.owned_game_playtimes = {}
+        self.owned_games_validators = {}
         self.pending_owned_games_refresh = False
         self.active_profile_summary = {}
         self.active_profile_summary_loaded = False
@@ -221,7 +253,7 @@ class SteamPlugin(
 
     def _start_background_tasks(self):
         self.start_daemon_task(self._prewarm_connections)
-        self.start_daemon_task(self.cleanup_image_cache)
+        self.start_daemon_task(self.enforce_cache_budget)
         self.schedule_owned_games_refresh()
         self.schedule_active_profile_summary_refresh()
 
@@ -1,5 +1,6 @@
 import time
 
+from .cache_budget import get_path_size
 from .cache_utils import is_timestamp_fresh, read_json_file, write_json_file
 from .constants import STEAMFLOW_CONFIG
 from .profile_service import (
@@ -10,6 +11,7 @@ from .profile_service import (
     fetch_avatar_frame_data,
     fetch_owned_app_ids,
     fetch_owned_games_refresh_result,
+    fetch_owned_games_update,
     fetch_player_summary,
     build_owned_games_refresh_log_details,
     get_cached_avatar_frame_state,
@@ -187,6 +189,16 @@ class SteamPluginProfileMixin:
             timeout=timeout,
         )
 
+    def fetch_owned_games_update_from_api(self, api_key, steamid64, timeout=3, validators=None):
+        return fetch_owned_games_update(
+            api_key,
+            steamid64,
+            self._http_get,
+            normalize_api_key=self.profile_providers.owned_api.normalize_key,
+            timeout=timeout,
+            validators=validators,
+        )
+
     def should_detect_owned_games_for_profile(self):
         return self.profile_providers.settings.should_detect_owned_games()
 
@@ -198,6 +210,7 @@ class SteamPluginProfileMixin:
         frame_path = self.get_active_steam_avatar_frame_path()
         if not frame_path:
             return str(source_path)
+        self.record_avatar_cache_access(frame_path)
 
         composite_path = self.avatar_cache_dir / f"avatar_{source_path.stem}_framed.png"
         try:
@@ -206,14 +219,21 @@ class SteamPluginProfileMixin:
                 and composite_path.stat().st_mtime >= source_path.stat().st_mtime
                 and composite_path.stat().st_mtime >= frame_path.stat().st_mtime
             ):
+                self.record_avatar_cache_access(composite_path)
                 return str(composite_path)
         except OSError:
             return str(source_path)
 
         if self.create_framed_avatar_icon(source_path, frame_path, composite_path):
+            self.record_avatar_cache_access(composite_path, size=get_path_size(composite_path))
             return str(composite_path)
         return str(source_path)
 
+    def record_avatar_cache_access(self, path, size=None):
+        record_cache_access = getattr(self, "record_cache_access", None)
+        if callable(record_cache_access):
+            record_cache_access("avatars", path, size=size)
+
     def get_active_steam_avatar_path(self):
         if not self.steam_path:
             return None
@@ -360,24 +380,35 @@ class SteamPluginProfileMixin:
             return
 
         start_time = time.perf_counter()
+        with self.state_lock:
+            validators = (
+                dict(getattr(self, "owned_games_validators", None) or {})
+                if self.owned_games_cache_loaded and self.owned_games_steamid64 == steamid64
+                else {}
+            )
         refresh_result = fetch_owned_games_refresh_result(
-            self.fetch_owned_app_ids_from_api,
+            self.fetch_owned_games_update_from_api,
             api_key,
             steamid64,
             self.urllib3,
             timeout=3,
+            validators=validators,
         )
         if refresh_result["should_log_error"]:
             self.log_exception("Failed to refresh owned Steam games")
 
+        owned_app_ids = refresh_result["owned_app_ids"]
         if refresh_result["success"]:
             with self.state_lock:
                 self.owned_games_last_sync = time.time()
                 self.owned_games_public_profile = True
                 self.owned_games_steamid64 = steamid64
-                self.owned_app_ids = refresh_result["owned_app_ids"]
-                self.owned_game_playtimes = refresh_result["owned_game_playtimes"]
+                if not refresh_result["not_modified"]:
+                    self.owned_app_ids = refresh_result["owned_app_ids"]
+                    self.owned_game_playtimes = refresh_result["owned_game_playtimes"]
+                self.owned_games_validators = refresh_result["validators"]
                 self.owned_games_cache_loaded = True
+                owned_app_ids = self.owned_app_ids
             self.profile_providers.owned_api.save_owned_games_cache()
         else:
             with self.state_lock:
@@ -389,7 +420,7 @@ class SteamPluginProfileMixin:
             (time.perf_counter() - start_time) * 1000,
             build_owned_games_refresh_log_details(
                 steamid64,
-                refresh_result["owned_app_ids"],
+                owned_app_ids,
                 refresh_result["success"],
             ),
         )
@@ -1,6 +1,11 @@
 import time
 
-from .http_client import download_http_get_to_file, http_get_json
+from .http_client import (
+    download_http_get_to_file,
+    http_get_json,
+    http_get_json_conditional,
+    normalize_http_validators,
+)
 
 
 COMMUNITY_ASSETS_BASE_URL = "https://shared.fastly.steamstatic.com/community_assets/images/"
@@ -54,6 +59,7 @@ def fetch_player_summary(api_key, steamid64, http_get, timeout=1.2, now=None):
         http_get,
         build_player_summaries_url(api_key, steamid64),
         timeout=timeout,
+        flight_key="player_summaries",
     )
     return parse_player_summary_payload(payload, steamid64, now=now)
 
@@ -145,6 +151,7 @@ def normalize_owned_games_cache_payload(cache_data):
             for app_id, playtime_minutes in owned_game_playtimes.items()
             if str(app_id).strip()
         },
+        "validators": normalize_http_validators(cache_data.get("validators")),
     }
 
 
@@ -155,6 +162,7 @@ def build_owned_games_cache_payload(
     steamid64,
     owned_app_ids,
     owned_game_playtimes,
+    validators=None,
 ):
     return {
         "last_attempt": last_attempt,
@@ -163,6 +171,7 @@ def build_owned_games_cache_payload(
         "steamid64": steamid64,
         "owned_app_ids": sorted(owned_app_ids),
         "owned_game_playtimes": dict(owned_game_playtimes),
+        "validators": normalize_http_validators(validators),
     }
 
 
@@ -206,21 +215,32 @@ def is_expected_owned_games_refresh_error(error, urllib3_module):
     return isinstance(error, expected_error_types)
 
 
-def fetch_owned_games_refresh_result(fetch_owned_app_ids_from_api, api_key, steamid64, urllib3_module, timeout=3):
+def fetch_owned_games_refresh_result(
+    fetch_owned_games_update_from_api,
+    api_key,
+    steamid64,
+    urllib3_module,
+    timeout=3,
+    validators=None,
+):
     try:
-        owned_app_ids, owned_game_playtimes = fetch_owned_app_ids_from_api(api_key, steamid64, timeout=timeout)
+        update = fetch_owned_games_update_from_api(api_key, steamid64, timeout=timeout, validators=validators)
         return {
             "success": True,
-            "owned_app_ids": owned_app_ids,
-            "owned_game_playtimes": owned_game_playtimes,
+            "not_modified": update["not_modified"],
+            "owned_app_ids": update["owned_app_ids"],
+            "owned_game_playtimes": update["owned_game_playtimes"],
+            "validators": update["validators"],
             "error": None,
             "should_log_error": False,
         }
     except Exception as error:
         return {
             "success": False,
+            "not_modified": False,
             "owned_app_ids": set(),
             "owned_game_playtimes": {},
+            "validators": {},
             "error": error,
             "should_log_error": not is_expected_owned_games_refresh_error(error, urllib3_module),
         }
@@ -230,18 +250,40 @@ def build_owned_games_refresh_log_details(steamid64, owned_app_ids, success):
     return f"steamid64={steamid64} count={len(owned_app_ids)} success={success}"
 
 
-def fetch_owned_app_ids(api_key, steamid64, http_get, normalize_api_key=None, timeout=3):
+def fetch_owned_games_update(api_key, steamid64, http_get, normalize_api_key=None, timeout=3, validators=None):
     normalized_key = normalize_api_key(api_key) if normalize_api_key else str(api_key or "").strip()
     normalized_steamid64 = str(steamid64 or "").strip()
     if not normalized_key or not normalized_steamid64:
         raise ValueError("Missing Steam API credentials")
 
-    payload = http_get_json(
+    response = http_get_json_conditional(
         http_get,
         build_owned_games_url(normalized_key, normalized_steamid64),
         timeout=timeout,
+        validators=validators,
+        flight_key="owned_games",
+    )
+    if response["not_modified"]:
+        owned_app_ids, owned_game_playtimes = set(), {}
+    else:
+        owned_app_ids, owned_game_playtimes = parse_owned_games_payload(response["payload"])
+    return {
+        "not_modified": response["not_modified"],
+        "owned_app_ids": owned_app_ids,
+        "owned_game_playtimes": owned_game_playtimes,
+        "validators": response["validators"],
+    }
+
+
+def fetch_owned_app_ids(api_key, steamid64, http_get, normalize_api_key=None, timeout=3):
+    update = fetch_owned_games_update(
+        api_key,
+        steamid64,
+        http_get,
+        normalize_api_key=normalize_api_key,
+        timeout=timeout,
     )
-    return parse_owned_games_payload(payload)
+    return update["owned_app_ids"], update["owned_game_playtimes"]
 
 
 def build_avatar_frame_url(api_key, steamid64):
@@ -318,6 +360,7 @@ def fetch_avatar_frame_data(api_key, steamid64, http_get, timeout=1.2):
         http_get,
         build_avatar_frame_url(api_key, steamid64),
         timeout=timeout,
+        flight_key="avatar_frame",
     )
     return parse_avatar_frame_payload(payload)
 
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from functools import cached_property
 
+from .local_library_service import LocalGameView
 from .localization import plugin_tr
 
 
@@ -55,6 +56,36 @@ class StoreProvider:
             fetch_timeout=fetch_timeout,
         )
 
+    def preload_app_details(self, app_ids):
+        preload_app_details_entries = getattr(self.plugin, "preload_app_details_entries", None)
+        if callable(preload_app_details_entries):
+            return preload_app_details_entries(app_ids)
+        return 0
+
+    def app_search_entries(self, app_ids):
+        read_app_search_entries = getattr(self.plugin, "read_app_search_entries", None)
+        if callable(read_app_search_entries):
+            return read_app_search_entries(app_ids)
+        return {}
+
+    def app_search_signature(self):
+        get_app_search_signature = getattr(self.plugin, "get_app_search_signature", None)
+        if callable(get_app_search_signature):
+            return get_app_search_signature()
+        return None
+
+    def save_search_cache(self):
+        save_search_cache = getattr(self.plugin, "save_store_search_cache", None)
+        if callable(save_search_cache):
+            return save_search_cache()
+        return False
+
+    def schedule_icon_downloads(self):
+        schedule_icon_downloads = getattr(self.plugin, "schedule_game_icon_downloads", None)
+        if callable(schedule_icon_downloads):
+            return schedule_icon_downloads()
+        return False
+
     def refund_state_for_local_game(self, app_id, allow_network_on_miss=False):
         return self.plugin.get_refund_state_for_local_game(
             app_id,
@@ -167,6 +198,9 @@ class ResultProvider:
 class SettingsProvider:
     plugin: object
 
+    def snapshot(self):
+        return self.plugin.get_settings_snapshot()
+
     def country_code(self):
         return self.plugin.get_country_code()
 
@@ -237,9 +271,26 @@ class LocalProvider:
     def installed_games_items(self):
         return self.plugin.get_installed_games_items()
 
+    def search_games(self, search_term, limit=None):
+        return self.plugin.search_local_games(search_term, limit=limit)
+
     def installed_game_status(self, app_id):
         return self.plugin.get_installed_game_status(app_id)
 
+    def game_view(self, app_id):
+        get_game_view = getattr(self.plugin, "get_local_game_view", None)
+        if callable(get_game_view):
+            return get_game_view(app_id)
+        return LocalGameView(
+            app_id,
+            install_path=self.install_path(app_id),
+            status_label=self.installed_game_status(app_id),
+            playtime_minutes=self.playtime_minutes(app_id),
+            last_played_timestamp=self.last_played_timestamp(app_id),
+            icon_path=self.game_icon(app_id),
+            has_current_account_data=self.has_current_account_data(app_id),
+        )
+
     def live_game_status(self, app_id, fallback_status=""):
         get_live_status = getattr(self.plugin, "get_live_local_game_status", None)
         if callable(get_live_status):
@@ -261,6 +312,12 @@ class LocalProvider:
     def game_icon(self, app_id):
         return self.plugin.get_local_game_icon(app_id)
 
+    def save_icon_index(self):
+        save_icon_index = getattr(self.plugin, "save_librarycache_icon_index", None)
+        if callable(save_icon_index):
+            return save_icon_index()
+        return False
+
     def has_current_account_data(self, app_id):
         return self.plugin.has_current_account_local_data(app_id)
 
@@ -329,6 +386,10 @@ class RuntimeProvider:
     def cleanup_caches_if_needed(self):
         return self.plugin.cleanup_caches_if_needed()
 
+    def cache_footprint(self):
+        get_cache_footprint = getattr(self.plugin, "get_cache_footprint", None)
+        return get_cache_footprint() if callable(get_cache_footprint) else None
+
     def start_metric_refresh(self, pending_set_name, key, refresh_method):
         return self.plugin.start_metric_refresh(pending_set_name, key, refresh_method)
 
@@ -1,6 +1,8 @@
 import json
 import logging
 import logging.handlers
+import os
+import sys
 from functools import cached_property
 from pathlib import Path
 
@@ -122,12 +124,37 @@ class SteamFlowPluginBase(Plugin):
         self._results.append(item)
         return item
 
+    def bind_rpc_request(self, rpc_request, client=None):
+        if client is not None:
+            self._client = client
+        self._results = []
+        self.rpc_request = rpc_request if isinstance(rpc_request, dict) else {}
+        self._settings = self.rpc_request.get("settings")
+
     def change_query(self, query, requery=False):
         self._client.send(api.change_query(query, requery))
 
     def show_msg(self, title, subtitle, ico_path=""):
         self._client.send(api.show_msg(title, subtitle, ico_path))
 
+    def close_response_stream(self):
+        # Flow Launcher reads the plugin pipes until EOF, so detach them before any post-response work.
+        try:
+            devnull_fd = os.open(os.devnull, os.O_WRONLY)
+        except OSError:
+            return False
+        closed = True
+        try:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                    os.dup2(devnull_fd, stream.fileno())
+                except (AttributeError, OSError, ValueError):
+                    closed = False
+        finally:
+            os.close(devnull_fd)
+        return closed
+
     def run(self):
         request_method = self.rpc_request.get("method") or self.rpc_request.get("Method") or "query"
         parameters = self.rpc_request.get("parameters")
@@ -0,0 +1,339 @@
+import json
+import os
+import secrets
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from .cache_utils import get_path_signature, read_json_file, write_json_file
+from .settings_snapshot import get_settings_signature
+
+
+QUERY_DAEMON_SETTING_NAME = "enable_query_daemon"
+QUERY_DAEMON_SCRIPT_NAME = "steam_query_daemon.py"
+QUERY_DAEMON_STATE_FILE_NAME = "steam_query_daemon.json"
+QUERY_DAEMON_START_LOCK_FILE_NAME = "steam_query_daemon.lock"
+QUERY_DAEMON_ERROR_LOG_FILE_NAME = "steam_query_daemon_error.log"
+QUERY_DAEMON_FORWARDED_METHODS = frozenset({"query"})
+QUERY_DAEMON_IDLE_TIMEOUT_SECONDS = 15 * 60
+QUERY_DAEMON_RESPONSE_TIMEOUT_SECONDS = 10.0
+QUERY_DAEMON_START_LOCK_STALE_SECONDS = 15.0
+QUERY_DAEMON_WATCHDOG_INTERVAL_SECONDS = 5.0
+QUERY_DAEMON_WATCHED_PATH_ATTRS = (
+    "owned_api_key_file",
+    "owned_api_key_meta_file",
+    "owned_games_cache_file",
+    "wishlist_cache_file",
+)
+
+
+def is_query_daemon_enabled(rpc_request):
+    settings = rpc_request.get("settings") if isinstance(rpc_request, dict) else None
+    if not isinstance(settings, dict):
+        return False
+    value = settings.get(QUERY_DAEMON_SETTING_NAME, False)
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+def get_rpc_request_method(rpc_request):
+    if not isinstance(rpc_request, dict):
+        return ""
+    return str(rpc_request.get("method") or rpc_request.get("Method") or "")
+
+
+def should_forward_rpc_request(rpc_request):
+    return get_rpc_request_method(rpc_request) in QUERY_DAEMON_FORWARDED_METHODS and is_query_daemon_enabled(rpc_request)
+
+
+def read_plugin_version(plugin_dir):
+    manifest = read_json_file(Path(plugin_dir) / "plugin.json", default={})
+    if not isinstance(manifest, dict):
+        return ""
+    return str(manifest.get("Version") or "")
+
+
+def build_query_daemon_address(platform=sys.platform, token=None, temp_dir=None):
+    token = token or secrets.token_hex(8)
+    if platform == "win32":
+        return rf"\\.\pipe\steamflow-query-{token}"
+    return str(Path(temp_dir or tempfile.gettempdir()) / f"steamflow-query-{token}.sock")
+
+
+def read_query_daemon_state(state_file):
+    state = read_json_file(state_file, default=None)
+    if not isinstance(state, dict):
+        return None
+    if not state.get("address") or not state.get("authkey"):
+        return None
+    return state
+
+
+def query_daemon_state_matches(state_file, address):
+    state = read_query_daemon_state(state_file)
+    return bool(state) and state.get("address") == address
+
+
+def forward_query_daemon_request(
+    plugin_dir,
+    rpc_request,
+    *,
+    version=None,
+    client_factory=None,
+    timeout=QUERY_DAEMON_RESPONSE_TIMEOUT_SECONDS,
+):
+    plugin_dir = Path(plugin_dir)
+    state = read_query_daemon_state(plugin_dir / QUERY_DAEMON_STATE_FILE_NAME)
+    if not state:
+        return None
+    expected_version = read_plugin_version(plugin_dir) if version is None else str(version or "")
+    if str(state.get("version") or "") != expected_version:
+        return None
+    if client_factory is None:
+        # imported lazily so launches with the daemon disabled don't pay for multiprocessing
+        from multiprocessing.connection import Client as client_factory
+    try:
+        address = state["address"]
+        if isinstance(address, list):
+            address = tuple(address)
+        authkey = bytes.fromhex(str(state["authkey"]))
+        with client_factory(address, authkey=authkey) as connection:
+            connection.send_bytes(json.dumps({"request": rpc_request}).encode("utf-8"))
+            if not connection.poll(timeout):
+                return None
+            response = json.loads(connection.recv_bytes().decode("utf-8"))
+    except Exception:
+        return None
+    payloads = response.get("payloads") if isinstance(response, dict) else None
+    if not isinstance(payloads, list):
+        return None
+    return [str(payload) for payload in payloads]
+
+
+def is_query_daemon_starting(lock_file, now=None):
+    try:
+        lock_mtime = Path(lock_file).stat().st_mtime
+    except OSError:
+        return False
+    current_time = time.time() if now is None else now
+    return (current_time - lock_mtime) < QUERY_DAEMON_START_LOCK_STALE_SECONDS
+
+
+def clear_query_daemon_start_lock(plugin_dir):
+    try:
+        (Path(plugin_dir) / QUERY_DAEMON_START_LOCK_FILE_NAME).unlink()
+    except OSError:
+        pass
+
+
+def start_query_daemon_process(
+    plugin_dir,
+    python_executable=sys.executable,
+    popen=None,
+    platform=sys.platform,
+    subprocess_module=None,
+    now=None,
+):
+    plugin_dir = Path(plugin_dir)
+    daemon_script = plugin_dir / QUERY_DAEMON_SCRIPT_NAME
+    if not daemon_script.exists():
+        return None
+    lock_file = plugin_dir / QUERY_DAEMON_START_LOCK_FILE_NAME
+    if is_query_daemon_starting(lock_file, now=now):
+        return None
+    try:
+        lock_file.write_text(str(os.getpid()), encoding="ascii")
+    except OSError:
+        return None
+
+    import subprocess
+
+    from .os_integration import start_hidden_process
+
+    error_log = plugin_dir / QUERY_DAEMON_ERROR_LOG_FILE_NAME
+    with error_log.open("ab") as error_stream:
+        return start_hidden_process(
+            [python_executable, str(daemon_script)],
+            popen=popen,
+            platform=platform,
+            subprocess_module=subprocess_module or subprocess,
+            cwd=str(plugin_dir),
+            stderr=error_stream,
+        )
+
+
+class QueryDaemonCapturingClient:
+    def __init__(self, rpc_request):
+        self.rpc_request = rpc_request
+        self.payloads = []
+
+    def recieve(self):
+        return self.rpc_request
+
+    def send(self, data):
+        self.payloads.append(json.dumps(data, default=str))
+
+
+class QueryDaemonServer:
+    def __init__(
+        self,
+        plugin_factory,
+        *,
+        idle_timeout_seconds=QUERY_DAEMON_IDLE_TIMEOUT_SECONDS,
+        watched_path_attrs=QUERY_DAEMON_WATCHED_PATH_ATTRS,
+        clock=time.time,
+        logger=None,
+    ):
+        self.plugin_factory = plugin_factory
+        self.idle_timeout_seconds = float(idle_timeout_seconds)
+        self.watched_path_attrs = tuple(watched_path_attrs)
+        self.clock = clock
+        self.logger = logger
+        self.plugin = None
+        self.watched_signatures = None
+        self.request_lock = threading.Lock()
+        self.last_activity = clock()
+        self.requests_handled = 0
+        self.plugin_builds = 0
+        self.stopped = False
+
+    def get_watched_signatures(self, plugin, rpc_request=None):
+        settings = rpc_request.get("settings") if isinstance(rpc_request, dict) else None
+        return (
+            get_settings_signature(settings if isinstance(settings, dict) else {}, getattr(plugin, "settings_path", None)),
+            *(get_path_signature(getattr(plugin, attr_name, None)) for attr_name in self.watched_path_attrs),
+        )
+
+    def get_plugin(self, rpc_request=None):
+        plugin = self.plugin
+        if plugin is not None and self.get_watched_signatures(plugin, rpc_request) == self.watched_signatures:
+            return plugin
+        if plugin is not None and self.logger:
+            self.logger.info("Watched SteamFlow state changed; rebuilding plugin")
+        plugin = self.plugin_factory()
+        self.plugin = plugin
+        self.plugin_builds += 1
+        self.watched_signatures = self.get_watched_signatures(plugin, rpc_request)
+        return plugin
+
+    def handle_request(self, rpc_request):
+        with self.request_lock:
+            self.last_activity = self.clock()
+            client = QueryDaemonCapturingClient(rpc_request)
+            try:
+                plugin = self.get_plugin(rpc_request)
+                plugin.bind_rpc_request(rpc_request, client=client)
+                plugin.run()
+                self.watched_signatures = self.get_watched_signatures(plugin, rpc_request)
+            except Exception:
+                self.plugin = None
+                raise
+            finally:
+                self.last_activity = self.clock()
+            self.requests_handled += 1
+            return client.payloads
+
+    def handle_connection(self, connection):
+        try:
+            message = json.loads(connection.recv_bytes().decode("utf-8"))
+            rpc_request = message.get("request") if isinstance(message, dict) else None
+            if isinstance(rpc_request, dict):
+                response = {"payloads": self.handle_request(rpc_request)}
+            else:
+                response = {"error": "invalid request"}
+        except Exception as error:
+            if self.logger:
+                self.logger.exception("Query daemon request failed")
+            response = {"error": str(error) or "request failed"}
+        try:
+            connection.send_bytes(json.dumps(response).encode("utf-8"))
+        except Exception:
+            pass
+
+    def is_idle(self, now=None):
+        current_time = self.clock() if now is None else now
+        return (current_time - self.last_activity) >= self.idle_timeout_seconds
+
+    def serve_forever(self, listener):
+        while not self.stopped:
+            try:
+                connection = listener.accept()
+            except Exception:
+                if self.stopped:
+                    return
+                continue
+            with connection:
+                self.handle_connection(connection)
+
+
+def run_query_daemon(
+    plugin_dir,
+    plugin_factory,
+    *,
+    version=None,
+    logger=None,
+    listener_factory=None,
+    idle_timeout_seconds=QUERY_DAEMON_IDLE_TIMEOUT_SECONDS,
+    watchdog_interval_seconds=QUERY_DAEMON_WATCHDOG_INTERVAL_SECONDS,
+    sleeper=time.sleep,
+    exit_process=os._exit,
+):
+    if listener_factory is None:
+        from multiprocessing.connection import Listener as listener_factory
+
+    plugin_dir = Path(plugin_dir)
+    state_file = plugin_dir / QUERY_DAEMON_STATE_FILE_NAME
+    authkey = secrets.token_bytes(32)
+    address = build_query_daemon_address()
+    listener = listener_factory(address, authkey=authkey)
+    state = {
+        "address": address,
+        "authkey": authkey.hex(),
+        "pid": os.getpid(),
+        "version": read_plugin_version(plugin_dir) if version is None else str(version or ""),
+        "started_at": time.time(),
+    }
+    if not write_json_file(state_file, state):
+        listener.close()
+        raise OSError(f"Failed to write query daemon state to {state_file}")
+    clear_query_daemon_start_lock(plugin_dir)
+
+    server = QueryDaemonServer(plugin_factory, idle_timeout_seconds=idle_timeout_seconds, logger=logger)
+
+    def shutdown(reason):
+        if logger:
+            logger.info("Query daemon exiting (%s) after %s requests", reason, server.requests_handled)
+        server.stopped = True
+        if query_daemon_state_matches(state_file, address):
+            try:
+                state_file.unlink()
+            except OSError:
+                pass
+        try:
+            listener.close()
+        except Exception:
+            pass
+        exit_process(0)
+
+    def watchdog():
+        while not server.stopped:
+            sleeper(watchdog_interval_seconds)
+            if not query_daemon_state_matches(state_file, address):
+                reason = "replaced"
+            elif server.is_idle():
+                reason = "idle"
+            else:
+                continue
+            if not server.request_lock.acquire(blocking=False):
+                continue
+            shutdown(reason)
+            return
+
+    threading.Thread(target=watchdog, name="steamflow-query-daemon-watchdog", daemon=True).start()
+    if logger:
+        logger.info("Query daemon listening on %s (pid %s)", address, state["pid"])
+    server.serve_forever(listener)
+    return server
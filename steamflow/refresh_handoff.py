@@ -0,0 +1,145 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .cache_utils import exclusive_lock_file, read_json_file, write_json_file
+from .os_integration import start_hidden_process
+
+
+REFRESH_WORKER_SCRIPT_NAME = "steam_refresh_worker.py"
+REFRESH_WORKER_STALE_SECONDS = 15 * 60
+REFRESH_JOBS_VERSION = 1
+REFRESH_JOB_METHODS = {
+    "pending_app_details_refresh": "_refresh_app_details_worker",
+    "pending_player_count_refresh": "_refresh_player_count_worker",
+    "pending_review_score_refresh": "_refresh_review_score_worker",
+    "pending_owned_games_refresh": "_refresh_owned_games_worker",
+    "pending_wishlist_refresh": "_refresh_wishlist_worker",
+    "pending_profile_summary_refresh": "_refresh_active_profile_summary_worker",
+    "pending_icon_refresh": "_refresh_game_icons_worker",
+    "pending_thumbnail_refresh": "_refresh_icon_thumbnails_worker",
+}
+
+
+def build_refresh_job(task_key):
+    if isinstance(task_key, tuple) and len(task_key) == 2 and task_key[0] in REFRESH_JOB_METHODS:
+        return [task_key[0], str(task_key[1])]
+    if isinstance(task_key, str) and task_key in REFRESH_JOB_METHODS:
+        return [task_key, None]
+    return None
+
+
+def normalize_refresh_jobs(jobs):
+    normalized_jobs = []
+    seen_jobs = set()
+    for job in jobs or []:
+        if not isinstance(job, (list, tuple)) or len(job) != 2 or job[0] not in REFRESH_JOB_METHODS:
+            continue
+        job_key = (job[0], None if job[1] is None else str(job[1]))
+        if job_key in seen_jobs:
+            continue
+        seen_jobs.add(job_key)
+        normalized_jobs.append(list(job_key))
+    return normalized_jobs
+
+
+def read_refresh_jobs_payload(jobs_file):
+    payload = read_json_file(jobs_file, default={})
+    if not isinstance(payload, dict) or payload.get("version") != REFRESH_JOBS_VERSION:
+        return {}, []
+    settings = payload.get("settings")
+    return settings if isinstance(settings, dict) else {}, normalize_refresh_jobs(payload.get("jobs"))
+
+
+def get_refresh_jobs_lock_file(jobs_file):
+    jobs_file = Path(jobs_file)
+    return jobs_file.with_name(f"{jobs_file.name}.lock")
+
+
+def merge_refresh_jobs(jobs_file, jobs, settings=None):
+    try:
+        with exclusive_lock_file(get_refresh_jobs_lock_file(jobs_file)):
+            _existing_settings, existing_jobs = read_refresh_jobs_payload(jobs_file)
+            merged_jobs = normalize_refresh_jobs([*existing_jobs, *(jobs or [])])
+            payload = {
+                "version": REFRESH_JOBS_VERSION,
+                "saved_at": time.time(),
+                "settings": dict(settings or {}),
+                "jobs": merged_jobs,
+            }
+            if not write_json_file(jobs_file, payload):
+                return None
+    except (OSError, TimeoutError):
+        return None
+    return merged_jobs
+
+
+def claim_refresh_jobs(jobs_file):
+    jobs_file = Path(jobs_file)
+    claimed_file = jobs_file.with_name(f"{jobs_file.name}.{os.getpid()}.claimed")
+    try:
+        with exclusive_lock_file(get_refresh_jobs_lock_file(jobs_file)):
+            os.replace(jobs_file, claimed_file)
+    except (OSError, TimeoutError):
+        return None
+    try:
+        return read_refresh_jobs_payload(claimed_file)
+    finally:
+        try:
+            claimed_file.unlink()
+        except OSError:
+            pass
+
+
+def run_refresh_jobs(plugin, jobs, on_error=None):
+    completed_count = 0
+    for pending_name, key in normalize_refresh_jobs(jobs):
+        refresh_method = getattr(plugin, REFRESH_JOB_METHODS[pending_name], None)
+        if not callable(refresh_method):
+            continue
+        try:
+            if key is None:
+                refresh_method()
+            else:
+                refresh_method(key)
+        except Exception:
+            if on_error is not None:
+                on_error(pending_name, key)
+            continue
+        completed_count += 1
+    return completed_count
+
+
+def is_refresh_worker_running(lock_file, now=None, stale_seconds=REFRESH_WORKER_STALE_SECONDS):
+    if not lock_file or not Path(lock_file).exists():
+        return False
+    try:
+        return ((time.time() if now is None else float(now)) - Path(lock_file).stat().st_mtime) < stale_seconds
+    except OSError:
+        return False
+
+
+def start_refresh_worker_process(
+    plugin_dir,
+    python_executable=sys.executable,
+    popen=subprocess.Popen,
+    platform=sys.platform,
+    subprocess_module=subprocess,
+):
+    plugin_dir = Path(plugin_dir)
+    worker_script = plugin_dir / REFRESH_WORKER_SCRIPT_NAME
+    if not worker_script.exists():
+        return None
+
+    error_log = plugin_dir / "steam_refresh_worker_error.log"
+    with error_log.open("ab") as error_stream:
+        return start_hidden_process(
+            [python_executable, str(worker_script)],
+            popen=popen,
+            platform=platform,
+            subprocess_module=subprocess_module,
+            cwd=str(plugin_dir),
+            stderr=error_stream,
+        )
@@ -1,6 +1,7 @@
 import base64
 import ctypes
 import json
+import mmap
 import msvcrt
 import os
 import re
@@ -32,6 +33,19 @@ WEBAPI_TOKEN_PATTERN = re.compile(rb'"webapi_token"\s*:\s*"([^"]+)"')
 HTML_ESCAPED_WEBAPI_TOKEN_PATTERN = re.compile(rb'&quot;webapi_token&quot;\s*:\s*&quot;([^&"]+)&quot;')
 LOYALTY_WEBAPI_TOKEN_PATTERN = re.compile(rb'"loyalty_webapi_token"\s*:\s*"([^"]+)"')
 ACCESS_TOKEN_QUERY_PATTERN = re.compile(rb'access_token=([A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+)')
+HTMLCACHE_TOKEN_PATTERN = re.compile(
+    rb"|".join(
+        pattern.pattern
+        for pattern in (
+            WEBAPI_TOKEN_PATTERN,
+            HTML_ESCAPED_WEBAPI_TOKEN_PATTERN,
+            LOYALTY_WEBAPI_TOKEN_PATTERN,
+            ACCESS_TOKEN_QUERY_PATTERN,
+        )
+    )
+)
+HTMLCACHE_TOKEN_INDEX_FILE_NAME = "htmlcache_index.bin"
+HTMLCACHE_TOKEN_INDEX_VERSION = 1
 CACHE_SCAN_CHUNK_SIZE = 1024 * 1024
 CACHE_SCAN_OVERLAP_SIZE = 8192
 HTMLCACHE_REFRESH_TIMEOUT_SECONDS = 4.0
@@ -134,44 +148,113 @@ def token_is_expired(payload, now=None):
 def extract_webapi_tokens_from_bytes(data):
     if not data:
         return []
-    matches = []
-    matches.extend(WEBAPI_TOKEN_PATTERN.findall(data))
-    matches.extend(HTML_ESCAPED_WEBAPI_TOKEN_PATTERN.findall(data))
-    matches.extend(LOYALTY_WEBAPI_TOKEN_PATTERN.findall(data))
-    matches.extend(ACCESS_TOKEN_QUERY_PATTERN.findall(data))
     tokens = []
     seen_tokens = set()
-    for match in matches:
-        token = match.decode("utf-8", errors="ignore").strip()
+    for match in HTMLCACHE_TOKEN_PATTERN.finditer(data):
+        token = match.group(match.lastindex).decode("utf-8", errors="ignore").strip()
         if token and token not in seen_tokens:
             seen_tokens.add(token)
             tokens.append(token)
     return tokens
 
 
-def scan_cache_file_for_webapi_tokens(cache_file_path):
-    cache_file_path = Path(cache_file_path)
-    if not cache_file_path.exists():
-        return []
-
+def _scan_cache_file_in_chunks(file_obj):
     found_tokens = []
     seen_tokens = set()
     overlap = b""
+    while True:
+        chunk = file_obj.read(CACHE_SCAN_CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer = overlap + chunk
+        for token in extract_webapi_tokens_from_bytes(buffer):
+            if token not in seen_tokens:
+                seen_tokens.add(token)
+                found_tokens.append(token)
+        overlap = buffer[-CACHE_SCAN_OVERLAP_SIZE:]
+    return found_tokens
+
+
+def _scan_cache_file(cache_file_path):
     try:
         with _open_file_shared_read(cache_file_path) as file_obj:
-            while True:
-                chunk = file_obj.read(CACHE_SCAN_CHUNK_SIZE)
-                if not chunk:
-                    break
-                buffer = overlap + chunk
-                for token in extract_webapi_tokens_from_bytes(buffer):
-                    if token not in seen_tokens:
-                        seen_tokens.add(token)
-                        found_tokens.append(token)
-                overlap = buffer[-CACHE_SCAN_OVERLAP_SIZE:]
+            try:
+                mapped = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return []
+            except OSError:
+                return _scan_cache_file_in_chunks(file_obj)
+            with mapped:
+                return extract_webapi_tokens_from_bytes(mapped)
     except OSError:
+        return None
+
+
+def scan_cache_file_for_webapi_tokens(cache_file_path):
+    cache_file_path = Path(cache_file_path)
+    if not cache_file_path.exists():
         return []
-    return found_tokens
+    return _scan_cache_file(cache_file_path) or []
+
+
+class HtmlcacheTokenIndex:
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+        self.dirty = False
+
+    def get_tokens(self, cache_file_path, signature):
+        entry = self.entries.get(str(cache_file_path))
+        if not isinstance(entry, dict) or tuple(entry.get("signature") or ()) != tuple(signature):
+            return None
+        return list(entry.get("tokens") or [])
+
+    def store_tokens(self, cache_file_path, signature, tokens):
+        self.entries[str(cache_file_path)] = {"signature": list(signature), "tokens": list(tokens)}
+        self.dirty = True
+
+    def prune(self, cache_file_paths):
+        keep_keys = {str(path) for path in cache_file_paths}
+        stale_keys = [key for key in self.entries if key not in keep_keys]
+        for key in stale_keys:
+            self.entries.pop(key, None)
+        if stale_keys:
+            self.dirty = True
+
+    def to_payload(self):
+        return {"version": HTMLCACHE_TOKEN_INDEX_VERSION, "entries": dict(self.entries)}
+
+    @classmethod
+    def from_payload(cls, payload):
+        if not isinstance(payload, dict) or payload.get("version") != HTMLCACHE_TOKEN_INDEX_VERSION:
+            return cls()
+        entries = payload.get("entries")
+        return cls(entries if isinstance(entries, dict) else {})
+
+
+def load_htmlcache_token_index(index_path, unprotect_bytes=None):
+    try:
+        payload_text = read_protected_text(
+            index_path,
+            STEAM_SESSION_TOKEN_DPAPI_ENTROPY,
+            unprotect_bytes=unprotect_bytes or unprotect_dpapi_bytes,
+        )
+        return HtmlcacheTokenIndex.from_payload(json.loads(payload_text) if payload_text else {})
+    except Exception:
+        return HtmlcacheTokenIndex()
+
+
+def save_htmlcache_token_index(index_path, token_index, protect_bytes=None):
+    try:
+        write_protected_text(
+            index_path,
+            json.dumps(token_index.to_payload()),
+            STEAM_SESSION_TOKEN_DPAPI_ENTROPY,
+            protect_bytes=protect_bytes or protect_dpapi_bytes,
+        )
+    except Exception:
+        return False
+    token_index.dirty = False
+    return True
 
 
 def get_htmlcache_cache_data_dir(localappdata=None):
@@ -182,7 +265,7 @@ def get_htmlcache_cache_data_dir(localappdata=None):
     return cache_dir if cache_dir.exists() else None
 
 
-def get_htmlcache_cache_data_files(localappdata=None, min_mtime=0):
+def list_htmlcache_cache_data_entries(localappdata=None, min_mtime=0):
     cache_dir = get_htmlcache_cache_data_dir(localappdata=localappdata)
     if not cache_dir:
         return []
@@ -196,20 +279,37 @@ def get_htmlcache_cache_data_files(localappdata=None, min_mtime=0):
                 continue
             if min_mtime and stat_result.st_mtime < float(min_mtime):
                 continue
-            candidates.append((stat_result.st_mtime, path))
+            candidates.append((stat_result.st_mtime, path, (stat_result.st_mtime_ns, stat_result.st_size)))
 
     candidates.sort(key=lambda item: item[0], reverse=True)
-    return [path for _mtime, path in candidates]
+    return [(path, signature) for _mtime, path, signature in candidates]
+
+
+def get_htmlcache_cache_data_files(localappdata=None, min_mtime=0):
+    return [path for path, _signature in list_htmlcache_cache_data_entries(localappdata=localappdata, min_mtime=min_mtime)]
+
 
+def collect_htmlcache_webapi_tokens(localappdata=None, min_mtime=0, steamid64=None, token_index=None, now=None):
+    cache_entries = list_htmlcache_cache_data_entries(localappdata=localappdata, min_mtime=min_mtime)
+    if token_index is not None and not min_mtime:
+        token_index.prune(path for path, _signature in cache_entries)
 
-def collect_htmlcache_webapi_tokens(localappdata=None, min_mtime=0):
     found_tokens = []
     seen_tokens = set()
-    for cache_file_path in get_htmlcache_cache_data_files(localappdata=localappdata, min_mtime=min_mtime):
-        for token in scan_cache_file_for_webapi_tokens(cache_file_path):
-            if token not in seen_tokens:
-                seen_tokens.add(token)
-                found_tokens.append(token)
+    for cache_file_path, signature in cache_entries:
+        tokens = token_index.get_tokens(cache_file_path, signature) if token_index is not None else None
+        if tokens is None:
+            tokens = _scan_cache_file(cache_file_path)
+            if tokens is None:
+                continue
+            if token_index is not None:
+                token_index.store_tokens(cache_file_path, signature, tokens)
+
+        new_tokens = [token for token in tokens if token not in seen_tokens]
+        seen_tokens.update(new_tokens)
+        found_tokens.extend(new_tokens)
+        if steamid64 and new_tokens and select_best_webapi_token(found_tokens, steamid64, now=now):
+            break
     return found_tokens
 
 
@@ -339,6 +439,7 @@ class SteamSessionTokenProvider:
         self.validate_token = validate_token
         self.open_uri = open_uri or open_os_uri
         self.sleep = sleep or time.sleep
+        self.htmlcache_token_index = None
 
     def _is_valid_for_consumer(self, token):
         if not token:
@@ -360,8 +461,20 @@ class SteamSessionTokenProvider:
     def delete_saved_token(self):
         delete_saved_steam_session_token(self.secure_settings_dir, self.steamid64)
 
+    def get_htmlcache_token_index_path(self):
+        return self.secure_settings_dir / STEAM_SESSION_TOKEN_DIR_NAME / HTMLCACHE_TOKEN_INDEX_FILE_NAME
+
     def select_htmlcache_token(self, min_mtime=0):
-        tokens = collect_htmlcache_webapi_tokens(min_mtime=min_mtime)
+        index_path = self.get_htmlcache_token_index_path()
+        if self.htmlcache_token_index is None:
+            self.htmlcache_token_index = load_htmlcache_token_index(index_path)
+        tokens = collect_htmlcache_webapi_tokens(
+            min_mtime=min_mtime,
+            steamid64=self.steamid64,
+            token_index=self.htmlcache_token_index,
+        )
+        if self.htmlcache_token_index.dirty:
+            save_htmlcache_token_index(index_path, self.htmlcache_token_index)
         return select_best_webapi_token(tokens, self.steamid64)
 
     def _use_token_if_valid(self, token, source):
@@ -0,0 +1,126 @@
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .cache_utils import get_path_signature
+
+
+SETTINGS_SNAPSHOT_BOOL_DEFAULTS = {
+    "show_platforms": False,
+    "show_player_count": True,
+    "show_positive_reviews": True,
+    "sort_local_by_recent": True,
+    "hide_hidden_games": True,
+    "show_prices": True,
+    "show_playtime": True,
+    "show_last_played": True,
+    "show_achievements": True,
+    "enable_perf_logging": False,
+    "show_steamdb_context_menu": True,
+    "show_csrin_context_menu": True,
+}
+FLOW_LAUNCHER_SETTINGS_FILE_NAME = "Settings.json"
+
+
+def coerce_setting_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+def parse_blacklisted_app_ids(raw_value, default_app_ids):
+    if isinstance(raw_value, list):
+        parts = raw_value
+    else:
+        parts = str(raw_value).replace("\n", ",").split(",")
+
+    blacklist = set(default_app_ids)
+    for part in parts:
+        app_id = str(part).strip()
+        if app_id:
+            blacklist.add(app_id)
+    return frozenset(blacklist)
+
+
+def resolve_plugin_keyword(app_settings, plugin_id):
+    try:
+        plugin_settings = app_settings.get("PluginSettings", {}).get("Plugins", {}).get(plugin_id, {})
+    except Exception:
+        plugin_settings = {}
+
+    for setting_name in ("UserKeywords", "ActionKeywords"):
+        keywords = plugin_settings.get(setting_name)
+        if isinstance(keywords, list):
+            for keyword in keywords:
+                normalized = str(keyword or "").strip()
+                if normalized:
+                    return normalized
+        else:
+            normalized = str(keywords or "").strip()
+            if normalized:
+                return normalized
+    return ""
+
+
+def get_flow_launcher_settings_path(appdata):
+    return Path(appdata) / "Settings" / FLOW_LAUNCHER_SETTINGS_FILE_NAME if appdata else None
+
+
+def get_settings_signature(settings, app_settings_path=None):
+    try:
+        settings_text = json.dumps(dict(settings or {}), sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        settings_text = repr(sorted((str(key), repr(value)) for key, value in dict(settings or {}).items()))
+    return (
+        hashlib.sha1(settings_text.encode("utf-8")).hexdigest(),
+        get_path_signature(app_settings_path),
+    )
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    signature: tuple = ()
+    language: str = "en"
+    steam_language: str = "english"
+    plugin_keyword: str = "steam"
+    blacklisted_app_ids: frozenset = field(default_factory=frozenset)
+    show_platforms: bool = False
+    show_player_count: bool = True
+    show_positive_reviews: bool = True
+    sort_local_by_recent: bool = True
+    hide_hidden_games: bool = True
+    show_prices: bool = True
+    show_playtime: bool = True
+    show_last_played: bool = True
+    show_achievements: bool = True
+    enable_perf_logging: bool = False
+    show_steamdb_context_menu: bool = True
+    show_csrin_context_menu: bool = True
+
+
+def build_settings_snapshot(
+    settings,
+    signature,
+    language,
+    steam_language,
+    plugin_keyword,
+    default_blacklisted_app_ids=frozenset(),
+):
+    settings = settings or {}
+    return SettingsSnapshot(
+        signature=signature,
+        language=language,
+        steam_language=steam_language,
+        plugin_keyword=plugin_keyword,
+        blacklisted_app_ids=parse_blacklisted_app_ids(
+            settings.get("blacklisted_app_ids", ""),
+            default_blacklisted_app_ids,
+        ),
+        **{
+            setting_name: coerce_setting_bool(settings.get(setting_name, default))
+            for setting_name, default in SETTINGS_SNAPSHOT_BOOL_DEFAULTS.items()
+        },
+    )
@@ -9,7 +9,17 @@ class SteamPluginPathState:
     feature_health_cache_file: object = None
     app_details_cache_dir: object = None
     metric_cache_file: object = None
+    metric_cache_journal_file: object = None
+    installed_games_cache_file: object = None
+    localconfig_stats_cache_file: object = None
+    librarycache_icon_index_file: object = None
+    game_icon_pipeline_file: object = None
+    icon_thumbnail_dir: object = None
+    cache_budget_index_file: object = None
+    store_search_cache_file: object = None
     wishlist_worker_lock_file: object = None
+    refresh_jobs_file: object = None
+    refresh_worker_lock_file: object = None
     owned_games_cache_file: object = None
     wishlist_cache_file: object = None
     secure_settings_dir: object = None
@@ -36,6 +46,8 @@ class SteamPluginLocalState:
     library_folders_cache_mtime: float = 0
     library_paths_cache: object = None
     appmanifest_cache: dict = field(default_factory=dict)
+    appmanifest_cache_loaded: bool = False
+    appmanifest_cache_dirty: bool = False
     app_download_progress_cache: dict = field(default_factory=dict)
     app_download_progress_cache_loaded: bool = False
     steam_path: object = None
@@ -47,6 +59,7 @@ class SteamPluginLocalState:
     localconfig_mtime: float = 0
     hidden_games_mtime: float = 0
     steam_icon_cache: object = None
+    librarycache_icon_index: object = None
     hidden_app_ids: set = field(default_factory=set)
     hidden_games_cache_loaded: bool = False
     localconfig_data_cache_path: object = None
@@ -58,6 +71,9 @@ class SteamPluginLocalState:
     installed_games: dict = field(default_factory=dict)
     installed_game_paths: dict = field(default_factory=dict)
     installed_game_statuses: dict = field(default_factory=dict)
+    installed_game_manifests: dict = field(default_factory=dict)
+    local_search_index: object = None
+    local_game_views: dict = field(default_factory=dict)
     playtime_minutes: dict = field(default_factory=dict)
     last_played_timestamps: dict = field(default_factory=dict)
     achievement_progress: dict = field(default_factory=dict)
@@ -69,10 +85,21 @@ class SteamPluginLocalState:
 @dataclass
 class SteamPluginRuntimeState:
     http_pool: object = None
+    http_single_flight: object = None
+    game_icon_pipeline: object = None
+    pending_icon_refresh: bool = False
+    icon_thumbnail_cache: object = None
+    pending_thumbnail_refresh: bool = False
+    cache_budget_registry: object = None
+    settings_snapshot: object = None
+    settings_snapshot_request: object = None
+    settings_blacklisted_app_ids: object = None
     last_cache_cleanup: float = 0
     last_metric_cache_save: float = 0
-    metric_cache_dirty: bool = False
+    metric_cache_pending_records: dict = field(default_factory=dict)
+    metric_cache_compaction_pending: bool = False
     search_cache: dict = field(default_factory=dict)
+    store_search_refreshes_in_progress: set = field(default_factory=set)
     store_collection_cache: dict = field(default_factory=dict)
     store_user_preferences_cache: dict = field(default_factory=dict)
     player_count_cache: dict = field(default_factory=dict)
@@ -94,6 +121,7 @@ class SteamPluginRuntimeState:
     owned_games_steamid64: object = None
     owned_app_ids: set = field(default_factory=set)
     owned_game_playtimes: dict = field(default_factory=dict)
+    owned_games_validators: dict = field(default_factory=dict)
     pending_owned_games_refresh: bool = False
     active_profile_summary: dict = field(default_factory=dict)
     active_profile_summary_loaded: bool = False
@@ -102,10 +130,12 @@ class SteamPluginRuntimeState:
     pending_review_score_refresh: set = field(default_factory=set)
     pending_app_details_refresh: set = field(default_factory=set)
     wishlist_cache_loaded: bool = False
-    wishlist_items: list = field(default_factory=list)
+    wishlist_index: object = None
+    wishlist_search_index: object = None
     wishlist_last_attempt: float = 0
     wishlist_last_sync: float = 0
     wishlist_steamid64: object = None
+    wishlist_validators: dict = field(default_factory=dict)
     pending_wishlist_refresh: bool = False
 
 
@@ -117,7 +147,17 @@ STATE_ATTR_GROUPS = {
         "feature_health_cache_file",
         "app_details_cache_dir",
         "metric_cache_file",
+        "metric_cache_journal_file",
+        "installed_games_cache_file",
+        "localconfig_stats_cache_file",
+        "librarycache_icon_index_file",
+        "game_icon_pipeline_file",
+        "icon_thumbnail_dir",
+        "cache_budget_index_file",
+        "store_search_cache_file",
         "wishlist_worker_lock_file",
+        "refresh_jobs_file",
+        "refresh_worker_lock_file",
         "owned_games_cache_file",
         "wishlist_cache_file",
         "secure_settings_dir",
@@ -140,6 +180,8 @@ STATE_ATTR_GROUPS = {
         "library_folders_cache_mtime",
         "library_paths_cache",
         "appmanifest_cache",
+        "appmanifest_cache_loaded",
+        "appmanifest_cache_dirty",
         "app_download_progress_cache",
         "app_download_progress_cache_loaded",
         "steam_path",
@@ -151,6 +193,7 @@ STATE_ATTR_GROUPS = {
         "localconfig_mtime",
         "hidden_games_mtime",
         "steam_icon_cache",
+        "librarycache_icon_index",
         "hidden_app_ids",
         "hidden_games_cache_loaded",
         "localconfig_data_cache_path",
@@ -162,6 +205,9 @@ STATE_ATTR_GROUPS = {
         "installed_games",
         "installed_game_paths",
         "installed_game_statuses",
+        "installed_game_manifests",
+        "local_search_index",
+        "local_game_views",
         "playtime_minutes",
         "last_played_timestamps",
         "achievement_progress",
@@ -171,10 +217,21 @@ STATE_ATTR_GROUPS = {
     ),
     "runtime_state": (
         "http_pool",
+        "http_single_flight",
+        "game_icon_pipeline",
+        "pending_icon_refresh",
+        "icon_thumbnail_cache",
+        "pending_thumbnail_refresh",
+        "cache_budget_registry",
+        "settings_snapshot",
+        "settings_snapshot_request",
+        "settings_blacklisted_app_ids",
         "last_cache_cleanup",
         "last_metric_cache_save",
-        "metric_cache_dirty",
+        "metric_cache_pending_records",
+        "metric_cache_compaction_pending",
         "search_cache",
+        "store_search_refreshes_in_progress",
         "store_collection_cache",
         "store_user_preferences_cache",
         "player_count_cache",
@@ -196,6 +253,7 @@ STATE_ATTR_GROUPS = {
         "owned_games_steamid64",
         "owned_app_ids",
         "owned_game_playtimes",
+        "owned_games_validators",
         "pending_owned_games_refresh",
         "active_profile_summary",
         "active_profile_summary_loaded",
@@ -204,10 +262,12 @@ STATE_ATTR_GROUPS = {
         "pending_review_score_refresh",
         "pending_app_details_refresh",
         "wishlist_cache_loaded",
-        "wishlist_items",
+        "wishlist_index",
+        "wishlist_search_index",
         "wishlist_last_attempt",
         "wishlist_last_sync",
         "wishlist_steamid64",
+        "wishlist_validators",
         "pending_wishlist_refresh",
     ),
 }
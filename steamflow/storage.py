@@ -1,12 +1,25 @@
 import time
+from functools import cached_property
 
 from . import util_currency
-from .cache_utils import is_timestamp_fresh, read_json_file, write_json_file
+from .cache_utils import (
+    cleanup_timestamped_cache_entries,
+    exclusive_lock_file,
+    is_timestamp_fresh,
+    read_json_file,
+    write_json_file,
+)
 from .constants import STEAMFLOW_CONFIG
+from .metric_journal import (
+    METRIC_CACHE_NAMES,
+    MetricCacheJournal,
+    apply_metric_journal_records,
+    iter_metric_cache_records,
+)
 from .providers import get_plugin_providers
 from .profile_service import build_owned_games_cache_payload, normalize_owned_games_cache_payload
 from .tasks import get_background_task_manager
-from .wishlist_service import build_wishlist_cache_payload, normalize_wishlist_cache_payload
+from .wishlist_service import WishlistIndex, build_wishlist_cache_payload, normalize_wishlist_cache_payload
 
 
 class SteamPluginStorageMixin:
@@ -15,6 +28,7 @@ class SteamPluginStorageMixin:
         "app_details_cache_dir",
         "country_cache_file",
         "metric_cache_file",
+        "metric_cache_journal_file",
         "owned_api_key_meta_file",
         "owned_games_cache_file",
         "state_lock",
@@ -42,35 +56,47 @@ class SteamPluginStorageMixin:
             indent=indent,
         )
 
-    def load_metric_caches(self):
-        if not self.metric_cache_file.exists():
-            return
+    @cached_property
+    def metric_cache_journal(self):
+        return MetricCacheJournal(self.metric_cache_journal_file)
+
+    def get_metric_cache_lock_file(self):
+        return self.metric_cache_file.with_name(f"{self.metric_cache_file.name}.lock")
+
+    def get_metric_cache_ttl_seconds(self):
+        cache_config = self.CONFIG.cache
+        return {
+            "player_count_cache": cache_config.player_count_ttl_seconds,
+            "review_score_cache": cache_config.review_score_ttl_seconds,
+            "achievement_schema_cache": cache_config.achievement_schema_ttl_seconds,
+            "achievement_progress_cache": cache_config.achievement_progress_ttl_seconds,
+        }
+
+    def read_metric_cache_file(self):
+        cache_data = {}
+        if self.metric_cache_file.exists():
+            cache_data = self._read_json_file(self.metric_cache_file, "Failed to load metric cache")
+            if not isinstance(cache_data, dict):
+                cache_data = {}
+        return cache_data
 
-        cache_data = self._read_json_file(self.metric_cache_file, "Failed to load metric cache")
-        if not isinstance(cache_data, dict):
-            return
+    def load_metric_caches(self):
+        cache_data = self.read_metric_cache_file()
 
-        player_count_cache = cache_data.get("player_count_cache", {})
-        review_score_cache = cache_data.get("review_score_cache", {})
-        achievement_schema_cache = cache_data.get("achievement_schema_cache", {})
-        achievement_progress_cache = cache_data.get("achievement_progress_cache", {})
+        caches = {}
+        for cache_name in METRIC_CACHE_NAMES:
+            cache = cache_data.get(cache_name, {})
+            caches[cache_name] = cache if isinstance(cache, dict) else {}
         legacy_app_details_cache = cache_data.get("app_details_cache", {})
-        if not isinstance(player_count_cache, dict):
-            player_count_cache = {}
-        if not isinstance(review_score_cache, dict):
-            review_score_cache = {}
-        if not isinstance(achievement_schema_cache, dict):
-            achievement_schema_cache = {}
-        if not isinstance(achievement_progress_cache, dict):
-            achievement_progress_cache = {}
         if not isinstance(legacy_app_details_cache, dict):
             legacy_app_details_cache = {}
+        self.metric_cache_journal.replay(caches)
 
         with self.state_lock:
-            self.player_count_cache = player_count_cache
-            self.review_score_cache = review_score_cache
-            self.achievement_schema_cache = achievement_schema_cache
-            self.achievement_progress_cache = achievement_progress_cache
+            self.player_count_cache = caches["player_count_cache"]
+            self.review_score_cache = caches["review_score_cache"]
+            self.achievement_schema_cache = caches["achievement_schema_cache"]
+            self.achievement_progress_cache = caches["achievement_progress_cache"]
             self.app_details_cache = {}
 
         if "app_details_cache" in cache_data:
@@ -94,6 +120,7 @@ class SteamPluginStorageMixin:
             self.owned_games_steamid64 = normalized_cache["steamid64"]
             self.owned_app_ids = normalized_cache["owned_app_ids"]
             self.owned_game_playtimes = normalized_cache["owned_game_playtimes"]
+            self.owned_games_validators = normalized_cache["validators"]
             self.owned_games_cache_loaded = True
 
     def save_owned_games_cache(self):
@@ -105,6 +132,7 @@ class SteamPluginStorageMixin:
                 self.owned_games_steamid64,
                 self.owned_app_ids,
                 self.owned_game_playtimes,
+                validators=getattr(self, "owned_games_validators", None),
             )
 
         self._write_json_file(self.owned_games_cache_file, cache_data, "Failed to save owned games cache")
@@ -149,7 +177,8 @@ class SteamPluginStorageMixin:
             self.wishlist_last_attempt = normalized_cache["last_attempt"]
             self.wishlist_last_sync = normalized_cache["last_sync"]
             self.wishlist_steamid64 = normalized_cache["steamid64"]
-            self.wishlist_items = normalized_cache["items"]
+            self.wishlist_index = normalized_cache["index"]
+            self.wishlist_validators = normalized_cache["validators"]
             self.wishlist_cache_loaded = True
 
     def save_wishlist_cache(self):
@@ -158,30 +187,86 @@ class SteamPluginStorageMixin:
                 self.wishlist_last_attempt,
                 self.wishlist_last_sync,
                 self.wishlist_steamid64,
-                self.wishlist_items,
+                getattr(self, "wishlist_index", None) or WishlistIndex(),
+                validators=getattr(self, "wishlist_validators", None),
             )
 
         self._write_json_file(self.wishlist_cache_file, cache_data, "Failed to save wishlist cache")
 
+    def compact_metric_caches(self):
+        try:
+            self.metric_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with exclusive_lock_file(
+                self.get_metric_cache_lock_file(),
+                timeout=self.CONFIG.cache.metric_cache_lock_timeout_seconds,
+            ):
+                return self._compact_metric_caches_locked()
+        except TimeoutError:
+            return False
+        except OSError:
+            self.log_exception("Failed to lock metric cache for compaction")
+            return False
+
+    def _compact_metric_caches_locked(self):
+        journal = self.metric_cache_journal
+        try:
+            journal.seal()
+        except OSError:
+            self.log_exception("Failed to seal metric cache journal")
+            return False
+        sealed_files = journal.list_sealed_files()
+        records = journal.read_records(sealed_files)
+        cache_data = self.read_metric_cache_file()
+        ttl_seconds_by_cache = self.get_metric_cache_ttl_seconds()
+        disk_caches = {}
+        for cache_name in METRIC_CACHE_NAMES:
+            cache = cache_data.get(cache_name, {})
+            disk_caches[cache_name] = dict(cache) if isinstance(cache, dict) else {}
+            cleanup_timestamped_cache_entries(disk_caches[cache_name], ttl_seconds_by_cache[cache_name])
+
+        with self.state_lock:
+            caches = {cache_name: getattr(self, cache_name) for cache_name in METRIC_CACHE_NAMES}
+            apply_metric_journal_records(caches, iter_metric_cache_records(disk_caches))
+            apply_metric_journal_records(caches, records)
+            cache_data = {cache_name: dict(cache) for cache_name, cache in caches.items()}
+
+        if not self._write_json_file(self.metric_cache_file, cache_data, "Failed to save metric cache"):
+            return False
+        journal.discard(sealed_files)
+        return True
+
     def save_metric_caches(self, force=False):
         with self.state_lock:
-            if not self.metric_cache_dirty:
+            pending_records = self.metric_cache_pending_records
+            compaction_pending = self.metric_cache_compaction_pending
+            if not pending_records and not compaction_pending:
                 return
             if not force and (
                 time.time() - self.last_metric_cache_save
             ) < self.CONFIG.cache.metric_cache_save_interval_seconds:
                 return
-            cache_data = {
-                "player_count_cache": dict(self.player_count_cache),
-                "review_score_cache": dict(self.review_score_cache),
-                "achievement_schema_cache": dict(self.achievement_schema_cache),
-                "achievement_progress_cache": dict(self.achievement_progress_cache),
-            }
+            self.metric_cache_pending_records = {}
+            self.metric_cache_compaction_pending = False
+
+        journal = self.metric_cache_journal
+        if compaction_pending or journal.size() >= self.CONFIG.cache.metric_journal_compact_bytes:
+            saved = self.compact_metric_caches()
+        else:
+            try:
+                saved = journal.append(
+                    [(cache_name, key, entry) for (cache_name, key), entry in pending_records.items()]
+                )
+            except OSError:
+                self.log_exception("Failed to append metric cache journal")
+                saved = False
 
-        if self._write_json_file(self.metric_cache_file, cache_data, "Failed to save metric cache"):
-            with self.state_lock:
-                self.metric_cache_dirty = False
+        with self.state_lock:
+            if saved:
                 self.last_metric_cache_save = time.time()
+                return
+            for record_key, entry in pending_records.items():
+                self.metric_cache_pending_records.setdefault(record_key, entry)
+            self.metric_cache_compaction_pending = self.metric_cache_compaction_pending or compaction_pending
 
     def load_cached_country_code(self):
         if not self.storage_providers.settings.should_show_prices():
@@ -1,7 +1,12 @@
 import time
 from functools import cached_property
 
-from .app_details import AppDetailsFileCache, fetch_app_details_metadata_with_http_get
+from .app_details import (
+    AppDetailsStore,
+    app_details_entry_matches_language,
+    build_app_search_entry,
+    fetch_app_details_metadata_with_http_get,
+)
 from .cache_utils import build_timestamped_cache_entry, is_timestamp_fresh
 from .constants import STEAMFLOW_CONFIG
 from .localization import plugin_tr
@@ -14,6 +19,8 @@ from .store_collections import (
     normalize_store_collection_name,
 )
 from .store_search import fetch_store_search_games
+from .store_search_cache import StoreSearchDiskCache, build_store_search_cache_key, filter_store_search_games
+from .tasks import get_background_task_manager
 
 
 class SteamPluginStoreMixin:
@@ -45,7 +52,17 @@ class SteamPluginStoreMixin:
 
     @cached_property
     def app_details_file_cache(self):
-        return AppDetailsFileCache(self.app_details_cache_dir)
+        return AppDetailsStore(self.app_details_cache_dir)
+
+    @cached_property
+    def store_search_disk_cache(self):
+        return StoreSearchDiskCache(
+            getattr(self, "store_search_cache_file", None),
+            max_entries=self.CONFIG.cache.store_search_disk_max_entries,
+        )
+
+    def save_store_search_cache(self):
+        return self.store_search_disk_cache.save()
 
     def update_app_details_cache(self, app_id, metadata, success, country_code=None, steam_language=None):
         if not app_id:
@@ -69,6 +86,31 @@ class SteamPluginStoreMixin:
                     "country_code": country_code,
                     "steam_language": steam_language,
                 }
+            update_wishlist_search_entry = getattr(self, "update_wishlist_search_entry", None)
+            if callable(update_wishlist_search_entry):
+                update_wishlist_search_entry(
+                    app_id,
+                    build_app_search_entry(metadata) if success else None,
+                    (country_code, steam_language),
+                )
+
+    def read_app_search_entries(self, app_ids):
+        settings_provider = self.store_providers.settings
+        country_code = settings_provider.country_code() if settings_provider.should_show_prices() else "us"
+        return self.app_details_file_cache.read_search_entries(
+            app_ids,
+            country_code,
+            settings_provider.steam_language(),
+        )
+
+    def get_app_search_signature(self):
+        settings_provider = self.store_providers.settings
+        country_code = settings_provider.country_code() if settings_provider.should_show_prices() else "us"
+        return (
+            country_code,
+            settings_provider.steam_language(),
+            self.app_details_file_cache.get_change_signature(),
+        )
 
     def fetch_app_details_metadata(self, app_id, timeout=1.5):
         start_time = time.perf_counter()
@@ -101,6 +143,33 @@ class SteamPluginStoreMixin:
         finally:
             self.store_providers.runtime.finish_metric_refresh("pending_app_details_refresh", app_id)
 
+    def preload_app_details_entries(self, app_ids):
+        settings_provider = self.store_providers.settings
+        country_code = settings_provider.country_code() if settings_provider.should_show_prices() else "us"
+        steam_language = settings_provider.steam_language()
+        missing_app_ids = []
+        with self.state_lock:
+            for app_id in app_ids or ():
+                app_id = str(app_id or "")
+                cached_entry = self.app_details_cache.get(app_id)
+                if app_id and not (
+                    cached_entry
+                    and cached_entry.get("country_code") == country_code
+                    and app_details_entry_matches_language(cached_entry, steam_language)
+                ):
+                    missing_app_ids.append(app_id)
+        if not missing_app_ids:
+            return 0
+        entries = self.app_details_file_cache.read_many(missing_app_ids, country_code)
+        loaded_entries = {
+            app_id: {**entry, "country_code": country_code, "steam_language": steam_language}
+            for app_id, entry in entries.items()
+            if app_details_entry_matches_language(entry, steam_language)
+        }
+        with self.state_lock:
+            self.app_details_cache.update(loaded_entries)
+        return len(loaded_entries)
+
     def get_app_details_metadata(self, app_id, allow_network_on_miss=True, fetch_timeout=1.5):
         if not app_id:
             return None
@@ -112,8 +181,7 @@ class SteamPluginStoreMixin:
         with self.state_lock:
             cached_entry = self.app_details_cache.get(app_id)
         def entry_matches_language(entry):
-            entry_language = entry.get("steam_language")
-            return entry_language == steam_language or (steam_language == "english" and entry_language is None)
+            return app_details_entry_matches_language(entry, steam_language)
 
         if not cached_entry or cached_entry.get("country_code") != country_code or not entry_matches_language(cached_entry):
             cached_entry = self.app_details_file_cache.read_entry(app_id, country_code)
@@ -172,6 +240,52 @@ class SteamPluginStoreMixin:
             return plugin_tr(self, "store.search_http_error")
         return plugin_tr(self, "store.search_failed")
 
+    def fetch_and_cache_store_search(self, search_term, cache_key, disk_key, country_code, steam_language):
+        games = fetch_store_search_games(
+            self._http_get,
+            search_term,
+            country_code=country_code,
+            language=steam_language,
+            blacklist=self.store_providers.settings.blacklisted_app_ids(),
+            max_results=self.CONFIG.query.max_results,
+            timeout=0.7,
+        )
+        with self.state_lock:
+            self.search_cache[cache_key] = build_timestamped_cache_entry({"games": games})
+        self.store_search_disk_cache.put(disk_key, games)
+        return games
+
+    def start_store_search_refresh(self, search_term, cache_key, disk_key, country_code, steam_language):
+        with self.state_lock:
+            pending_refreshes = getattr(self, "store_search_refreshes_in_progress", None)
+            if pending_refreshes is None:
+                pending_refreshes = self.store_search_refreshes_in_progress = set()
+            if disk_key in pending_refreshes:
+                return None
+            pending_refreshes.add(disk_key)
+
+        def refresh_worker():
+            try:
+                self.fetch_and_cache_store_search(search_term, cache_key, disk_key, country_code, steam_language)
+                self.store_search_disk_cache.save()
+            except Exception:
+                self.log_exception(f"Background Steam search refresh failed for query: {search_term}")
+            finally:
+                with self.state_lock:
+                    pending_refreshes.discard(disk_key)
+
+        return get_background_task_manager(self).start(refresh_worker)
+
+    def get_fresh_search_cache_games(self, cache_key):
+        with self.state_lock:
+            cached_entry = self.search_cache.get(cache_key)
+        if cached_entry and is_timestamp_fresh(
+            cached_entry.get("timestamp", 0),
+            self.CONFIG.cache.search_ttl_seconds,
+        ):
+            return cached_entry["games"]
+        return None
+
     def search_steam_api(self, search_term):
         providers = self.store_providers
         providers.runtime.cleanup_caches_if_needed()
@@ -189,26 +303,52 @@ class SteamPluginStoreMixin:
                 if steam_language == "english"
                 else (search_term.lower(), country_code, steam_language)
             )
-            with self.state_lock:
-                cached_entry = self.search_cache.get(cache_key)
-            if cached_entry and is_timestamp_fresh(
-                cached_entry.get("timestamp", 0),
-                self.CONFIG.cache.search_ttl_seconds,
+            cached_games = self.get_fresh_search_cache_games(cache_key)
+            if cached_games is not None:
+                return {"games": cached_games, "error": None}
+
+            disk_key = build_store_search_cache_key(search_term, country_code, steam_language)
+            disk_entry = self.store_search_disk_cache.get(disk_key)
+            if disk_entry and is_timestamp_fresh(disk_entry.get("timestamp", 0), self.CONFIG.cache.search_ttl_seconds):
+                with self.state_lock:
+                    self.search_cache[cache_key] = disk_entry
+                return {"games": disk_entry["games"], "error": None}
+            if disk_entry and is_timestamp_fresh(
+                disk_entry.get("timestamp", 0),
+                self.CONFIG.cache.store_search_stale_ttl_seconds,
             ):
-                return {"games": cached_entry["games"], "error": None}
+                self.start_store_search_refresh(search_term, cache_key, disk_key, country_code, steam_language)
+                return {"games": disk_entry["games"], "error": None, "stale": True}
 
-            games = fetch_store_search_games(
-                self._http_get,
+            prefix_match = self.store_search_disk_cache.find_prefix_entry(
                 search_term,
-                country_code=country_code,
-                language=steam_language,
-                blacklist=settings_provider.blacklisted_app_ids(),
-                max_results=self.CONFIG.query.max_results,
-                timeout=0.7,
+                country_code,
+                steam_language,
+                max_age_seconds=self.CONFIG.cache.store_search_stale_ttl_seconds,
             )
+            if prefix_match:
+                _prefix, prefix_entry = prefix_match
+                refresh_thread = self.start_store_search_refresh(
+                    search_term,
+                    cache_key,
+                    disk_key,
+                    country_code,
+                    steam_language,
+                )
+                join_refresh = getattr(refresh_thread, "join", None)
+                if callable(join_refresh):
+                    join_refresh(self.CONFIG.cache.store_search_provisional_wait_seconds)
+                cached_games = self.get_fresh_search_cache_games(cache_key)
+                if cached_games is not None:
+                    self.log_slow_call("search_steam_api", (time.perf_counter() - start_time) * 1000, f"query='{search_term}'")
+                    return {"games": cached_games, "error": None}
+                return {
+                    "games": filter_store_search_games(prefix_entry["games"], search_term),
+                    "error": None,
+                    "provisional": True,
+                }
 
-            with self.state_lock:
-                self.search_cache[cache_key] = build_timestamped_cache_entry({"games": games})
+            games = self.fetch_and_cache_store_search(search_term, cache_key, disk_key, country_code, steam_language)
             self.log_slow_call("search_steam_api", (time.perf_counter() - start_time) * 1000, f"query='{search_term}'")
             return {"games": games, "error": None}
         except Exception as error:
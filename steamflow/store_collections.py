@@ -130,6 +130,7 @@ def fetch_featured_collection_games(
         http_get,
         build_featured_categories_url(country_code=country_code, language=language),
         timeout=timeout,
+        flight_key="featuredcategories",
     )
     return parse_featured_collection_games(
         payload,
@@ -154,6 +155,7 @@ def fetch_featured_collections_games(
         http_get,
         build_featured_categories_url(country_code=country_code, language=language),
         timeout=timeout,
+        flight_key="featuredcategories",
     )
     games_by_collection = {}
     for collection_name in collection_names or STORE_COLLECTIONS:
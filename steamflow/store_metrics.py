@@ -1,8 +1,10 @@
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from .cache_budget import get_path_size
+from .cache_utils import read_json_file, write_json_file
 from .constants import STEAMFLOW_CONFIG
+from .game_icons import GameIconPipeline, download_game_icon_batch, get_game_icon_path
 from .http_client import download_http_get_to_file
 from .providers import get_plugin_providers
 from .store_metrics_service import (
@@ -24,6 +26,7 @@ from .store_metrics_service import (
     should_show_release_date_text,
     supports_live_metrics,
 )
+from .tasks import get_background_task_manager
 
 
 class SteamPluginStoreMetricsMixin:
@@ -307,15 +310,112 @@ class SteamPluginStoreMetricsMixin:
     def should_fetch_player_count(self, game_data):
         return self._supports_live_metrics(game_data)
 
+    def get_game_icon_pipeline(self):
+        cache_dir = getattr(self, "cache_dir", None)
+        if not cache_dir:
+            return None
+        with self.state_lock:
+            pipeline = getattr(self, "game_icon_pipeline", None)
+            if pipeline is not None:
+                return pipeline
+            cache_file = getattr(self, "game_icon_pipeline_file", None)
+            payload = read_json_file(cache_file, default={}) if cache_file else {}
+            pipeline = GameIconPipeline.from_payload(
+                payload,
+                cache_dir,
+                failure_ttl_seconds=self.CONFIG.cache.game_icon_failure_ttl_seconds,
+            )
+            self.game_icon_pipeline = pipeline
+            return pipeline
+
+    def save_game_icon_pipeline(self):
+        cache_file = getattr(self, "game_icon_pipeline_file", None)
+        with self.state_lock:
+            pipeline = getattr(self, "game_icon_pipeline", None)
+            if not cache_file or pipeline is None or not pipeline.dirty:
+                return False
+            payload = pipeline.to_payload()
+            pipeline.dirty = False
+        if write_json_file(cache_file, payload):
+            return True
+        with self.state_lock:
+            pipeline.dirty = True
+        return False
+
     def _resolve_game_icon(self, app_id, image_url):
-        if not image_url or not app_id:
+        pipeline = self.get_game_icon_pipeline()
+        if pipeline is None:
             return self.DEFAULT_ICON
-        cached_icon_path = self.cache_dir / f"{app_id}.png"
-        if cached_icon_path.exists():
-            return str(cached_icon_path)
-        if self.download_icon(image_url, str(cached_icon_path)):
-            return str(cached_icon_path)
-        return self.DEFAULT_ICON
+        with self.state_lock:
+            icon_path = pipeline.resolve(app_id, image_url, self.DEFAULT_ICON)
+        if icon_path == self.DEFAULT_ICON:
+            return icon_path
+        record_cache_access = getattr(self, "record_cache_access", None)
+        if callable(record_cache_access):
+            record_cache_access("images", icon_path)
+        get_icon_thumbnail = getattr(self, "get_icon_thumbnail", None)
+        return get_icon_thumbnail(icon_path) if callable(get_icon_thumbnail) else icon_path
+
+    def schedule_game_icon_downloads(self):
+        pipeline = self.get_game_icon_pipeline()
+        if pipeline is None:
+            return False
+        with self.state_lock:
+            if not pipeline.has_pending():
+                return False
+        return get_background_task_manager(self).start_flagged_refresh(
+            self,
+            "pending_icon_refresh",
+            self._refresh_game_icons_worker,
+        )
+
+    def download_pending_game_icons(self):
+        pipeline = self.get_game_icon_pipeline()
+        if pipeline is None:
+            return 0
+        start_time = time.perf_counter()
+        downloaded_count = 0
+        failed_count = 0
+        while True:
+            with self.state_lock:
+                batch = pipeline.take_batch()
+            if not batch:
+                break
+            outcomes = download_game_icon_batch(
+                batch,
+                self.download_icon,
+                pipeline.cache_dir,
+                max_workers=self.CONFIG.performance.icon_download_max_workers,
+            )
+            with self.state_lock:
+                for app_id, image_url, success in outcomes:
+                    pipeline.record_result(app_id, image_url, success)
+            record_cache_access = getattr(self, "record_cache_access", None)
+            get_icon_thumbnail = getattr(self, "get_icon_thumbnail", None)
+            for app_id, _image_url, success in outcomes:
+                if not success:
+                    continue
+                icon_path = get_game_icon_path(pipeline.cache_dir, app_id)
+                if callable(record_cache_access):
+                    record_cache_access("images", icon_path, size=get_path_size(icon_path))
+                if callable(get_icon_thumbnail):
+                    get_icon_thumbnail(str(icon_path))
+            downloaded_count += sum(1 for _app_id, _image_url, success in outcomes if success)
+            failed_count += sum(1 for _app_id, _image_url, success in outcomes if not success)
+        if downloaded_count or failed_count:
+            self.log_slow_call(
+                "download_game_icons",
+                (time.perf_counter() - start_time) * 1000,
+                f"downloaded={downloaded_count} failed={failed_count}",
+            )
+        return downloaded_count
+
+    def _refresh_game_icons_worker(self):
+        try:
+            self.download_pending_game_icons()
+        finally:
+            get_background_task_manager(self).finish_flagged_refresh(self, "pending_icon_refresh")
+        self.schedule_game_icon_downloads()
 
     def schedule_wishlist_refresh_for_store_results(self):
         schedule_refresh = getattr(self, "schedule_wishlist_refresh", None)
@@ -363,6 +463,7 @@ class SteamPluginStoreMetricsMixin:
             review_resolver=self.get_review_score if should_fetch_review else None,
             player_count_resolver=self.get_current_players if should_fetch_players else None,
             achievement_resolver=self.get_owned_store_achievement_progress if should_fetch_achievements else None,
+            submit=get_background_task_manager(self).submit_fanout,
         )
         result_spec = build_store_game_result_spec(
             game_data,
@@ -434,34 +535,30 @@ class SteamPluginStoreMetricsMixin:
         if cold_metric_fetch_limit is None:
             cold_metric_fetch_limit = self.CONFIG.query.store_cold_metric_fetch_limit
 
-        max_workers = min(
-            len(filtered_results),
-            max(self.CONFIG.query.max_results, self.CONFIG.query.max_store_collection_results),
-        )
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_index = {
-                executor.submit(
-                    self.process_game_data,
-                    game_data,
-                    bool(allow_cold_metric_fetch)
-                    and index < int(cold_metric_fetch_limit or 0),
-                    allow_cold_appdetails_fetch=(
-                        allow_cold_appdetails_fetch
-                        if allow_cold_appdetails_fetch is not None
-                        else None
-                    ),
-                    appdetails_timeout=appdetails_timeout,
-                    require_appdetails=require_appdetails,
-                    hide_hardware=hide_hardware,
-                ): index
-                for index, game_data in enumerate(filtered_results)
-            }
-            processed_results = [None] * len(filtered_results)
-
-            for future in as_completed(future_to_index):
-                try:
-                    processed_results[future_to_index[future]] = future.result()
-                except Exception:
-                    self.log_exception("Failed to process Steam store result")
+        task_manager = get_background_task_manager(self)
+        tasks = [
+            task_manager.submit_interactive(
+                self.process_game_data,
+                game_data,
+                bool(allow_cold_metric_fetch)
+                and index < int(cold_metric_fetch_limit or 0),
+                allow_cold_appdetails_fetch=(
+                    allow_cold_appdetails_fetch
+                    if allow_cold_appdetails_fetch is not None
+                    else None
+                ),
+                appdetails_timeout=appdetails_timeout,
+                require_appdetails=require_appdetails,
+                hide_hardware=hide_hardware,
+            )
+            for index, game_data in enumerate(filtered_results)
+        ]
+        processed_results = [None] * len(filtered_results)
+        for index, task in enumerate(tasks):
+            try:
+                processed_results[index] = task.result()
+            except Exception:
+                self.log_exception("Failed to process Steam store result")
+        self.schedule_game_icon_downloads()
 
         return [result for result in processed_results if result]
@@ -3,7 +3,7 @@ from urllib.parse import urlencode
 
 from . import util_currency
 from .http_client import http_get_json
-from .localization import Localizer
+from .localization import get_localizer
 
 
 RELEASE_DATE_PLACEHOLDER_VALUES = frozenset(
@@ -22,7 +22,7 @@ def _normalize_release_placeholder(value):
 
 def _label(labels, name, key):
     labels = labels or {}
-    return labels.get(name) or Localizer("en").tr(key)
+    return labels.get(name) or get_localizer("en").tr(key)
 
 
 def normalize_store_game_data(game_data, metadata=None):
@@ -216,31 +216,40 @@ def resolve_store_metric_bundle(
     review_resolver=None,
     player_count_resolver=None,
     achievement_resolver=None,
+    submit=None,
 ):
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        icon_future = executor.submit(icon_resolver, app_id, image_url)
-        review_future = (
-            executor.submit(review_resolver, app_id, allow_cold_metric_fetch)
-            if review_resolver
-            else None
-        )
-        player_count_future = (
-            executor.submit(player_count_resolver, app_id, allow_cold_metric_fetch)
-            if player_count_resolver
-            else None
-        )
-        achievement_future = (
-            executor.submit(achievement_resolver, app_id, allow_cold_metric_fetch)
-            if achievement_resolver
-            else None
-        )
+    if submit is None:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return resolve_store_metric_bundle(
+                app_id,
+                image_url,
+                allow_cold_metric_fetch,
+                icon_resolver,
+                review_resolver=review_resolver,
+                player_count_resolver=player_count_resolver,
+                achievement_resolver=achievement_resolver,
+                submit=executor.submit,
+            )
+
+    icon_future = submit(icon_resolver, app_id, image_url)
+    review_future = submit(review_resolver, app_id, allow_cold_metric_fetch) if review_resolver else None
+    player_count_future = (
+        submit(player_count_resolver, app_id, allow_cold_metric_fetch)
+        if player_count_resolver
+        else None
+    )
+    achievement_future = (
+        submit(achievement_resolver, app_id, allow_cold_metric_fetch)
+        if achievement_resolver
+        else None
+    )
 
-        return {
-            "icon_path": icon_future.result(),
-            "review_summary": review_future.result() if review_future else None,
-            "player_count": player_count_future.result() if player_count_future else None,
-            "achievement_progress": achievement_future.result() if achievement_future else None,
-        }
+    return {
+        "icon_path": icon_future.result(),
+        "review_summary": review_future.result() if review_future else None,
+        "player_count": player_count_future.result() if player_count_future else None,
+        "achievement_progress": achievement_future.result() if achievement_future else None,
+    }
 
 
 def build_store_game_result_spec(
@@ -312,7 +321,13 @@ def build_current_players_url(app_id):
 
 
 def fetch_current_players_with_http_get(http_get, app_id, timeout=1):
-    data = http_get_json(http_get, build_current_players_url(str(app_id)), timeout=timeout, headers=None)
+    data = http_get_json(
+        http_get,
+        build_current_players_url(str(app_id)),
+        timeout=timeout,
+        headers=None,
+        flight_key="current_players",
+    )
     if data.get("response", {}).get("result") == 1:
         return data["response"].get("player_count")
     return None
@@ -330,7 +345,12 @@ def build_review_score_url(app_id, steam_language="english"):
 
 
 def fetch_review_score_with_http_get(http_get, app_id, timeout=1, steam_language="english"):
-    data = http_get_json(http_get, build_review_score_url(str(app_id), steam_language=steam_language), timeout=timeout)
+    data = http_get_json(
+        http_get,
+        build_review_score_url(str(app_id), steam_language=steam_language),
+        timeout=timeout,
+        flight_key="appreviews",
+    )
     return data.get("query_summary", data)
 
 
@@ -342,7 +362,12 @@ def build_achievement_schema_url(api_key, app_id):
 
 
 def fetch_achievement_schema_total_with_http_get(http_get, api_key, app_id, timeout=1.2):
-    data = http_get_json(http_get, build_achievement_schema_url(api_key, str(app_id)), timeout=timeout)
+    data = http_get_json(
+        http_get,
+        build_achievement_schema_url(api_key, str(app_id)),
+        timeout=timeout,
+        flight_key="achievement_schema",
+    )
     achievements = (
         data.get("game", {})
         .get("availableGameStats", {})
@@ -365,6 +390,7 @@ def fetch_player_achievement_progress_with_http_get(http_get, api_key, steamid64
         http_get,
         build_player_achievements_url(api_key, steamid64, str(app_id)),
         timeout=timeout,
+        flight_key="player_achievements",
     )
     achievements = data.get("playerstats", {}).get("achievements", [])
     if isinstance(achievements, list):
@@ -53,5 +53,6 @@ def fetch_store_search_games(http_get, search_term, country_code="us", language=
         http_get,
         build_store_search_url(search_term, country_code=country_code, language=language),
         timeout=timeout,
+        flight_key="storesearch",
     )
     return parse_store_search_games(payload, blacklist=blacklist, max_results=max_results)
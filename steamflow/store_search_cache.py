@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import OrderedDict
+
+from .cache_utils import build_timestamped_cache_entry, is_timestamp_fresh, read_json_file, write_json_file
+from .local_search import split_search_words
+
+
+STORE_SEARCH_CACHE_VERSION = 1
+
+
+def build_store_search_cache_key(search_term, country_code="us", language="english"):
+    return "|".join(
+        (
+            str(country_code or "us").strip().lower(),
+            str(language or "english").strip().lower(),
+            " ".join(str(search_term or "").lower().split()),
+        )
+    )
+
+
+def filter_store_search_games(games, search_term):
+    query_words = split_search_words(search_term)
+    if not query_words:
+        return []
+    matches = []
+    for game in games or []:
+        name_words = split_search_words(game.get("name", "") if isinstance(game, dict) else "")
+        if all(any(word.startswith(query_word) for word in name_words) for query_word in query_words):
+            matches.append(game)
+    return matches
+
+
+class StoreSearchDiskCache:
+    def __init__(self, cache_file, max_entries=200):
+        self.cache_file = cache_file
+        self.max_entries = max(1, int(max_entries or 1))
+        self.entries = OrderedDict()
+        self.lock = threading.RLock()
+        self.loaded = False
+        self.dirty = False
+
+    def load(self):
+        with self.lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            if not self.cache_file:
+                return
+            payload = read_json_file(self.cache_file, default={})
+            if not isinstance(payload, dict) or payload.get("version") != STORE_SEARCH_CACHE_VERSION:
+                return
+            entries = payload.get("entries")
+            for raw_entry in entries if isinstance(entries, list) else []:
+                if not isinstance(raw_entry, list) or len(raw_entry) != 2:
+                    continue
+                key, entry = raw_entry
+                if isinstance(entry, dict) and isinstance(entry.get("games"), list):
+                    self.entries[str(key)] = entry
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get(self, key):
+        self.load()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if next(reversed(self.entries)) != key:
+                self.entries.move_to_end(key)
+                self.dirty = True
+            return entry
+
+    def put(self, key, games, now=None):
+        self.load()
+        entry = build_timestamped_cache_entry({"games": list(games or [])}, now=now)
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self.dirty = True
+        return entry
+
+    def find_prefix_entry(self, search_term, country_code="us", language="english", max_age_seconds=None):
+        search_term = " ".join(str(search_term or "").lower().split())
+        for prefix_length in range(len(search_term) - 1, 0, -1):
+            prefix = search_term[:prefix_length].rstrip()
+            if not prefix or prefix_length != len(prefix):
+                continue
+            entry = self.get(build_store_search_cache_key(prefix, country_code, language))
+            if entry is None:
+                continue
+            if max_age_seconds is not None and not is_timestamp_fresh(entry.get("timestamp", 0), max_age_seconds):
+                continue
+            return prefix, entry
+        return None
+
+    def save(self):
+        with self.lock:
+            if not self.cache_file or not self.dirty:
+                return False
+            payload = {
+                "version": STORE_SEARCH_CACHE_VERSION,
+                "saved_at": time.time(),
+                "entries": [[key, entry] for key, entry in self.entries.items()],
+            }
+            self.dirty = False
+        if write_json_file(self.cache_file, payload):
+            return True
+        with self.lock:
+            self.dirty = True
+        return False
@@ -1,22 +1,236 @@
+import heapq
+import itertools
 import threading
 import time
 
 
+TASK_PRIORITY_INTERACTIVE = 0
+TASK_PRIORITY_BACKGROUND = 1
+TASK_PRIORITY_NAMES = {
+    TASK_PRIORITY_INTERACTIVE: "interactive",
+    TASK_PRIORITY_BACKGROUND: "background",
+}
+TASK_SCHEDULER_MAX_WORKERS = 8
+TASK_SCHEDULER_MAX_BACKGROUND_WORKERS = 4
+TASK_SCHEDULER_MAX_FANOUT_WORKERS = 24
+TASK_SCHEDULER_IDLE_TIMEOUT_SECONDS = 2.0
+
+
+class ScheduledTask:
+    def __init__(self, scheduler, target, args, kwargs, priority, key):
+        self.scheduler = scheduler
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.key = key
+        self.submitted_at = scheduler.clock()
+        self.state = "queued"
+        self.finished = threading.Event()
+        self.value = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.value = self.target(*self.args, **self.kwargs)
+        except BaseException as error:
+            self.error = error
+        finally:
+            self.scheduler.finish_task(self)
+
+    def done(self):
+        return self.finished.is_set()
+
+    def join(self, timeout=None):
+        return self.finished.wait(timeout)
+
+    def result(self, timeout=None):
+        if self.scheduler.claim_task(self):
+            self.run()
+        if not self.finished.wait(timeout):
+            raise TimeoutError("Scheduled task did not finish in time")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class TaskScheduler:
+    def __init__(
+        self,
+        max_workers=TASK_SCHEDULER_MAX_WORKERS,
+        max_background_workers=TASK_SCHEDULER_MAX_BACKGROUND_WORKERS,
+        thread_factory=threading.Thread,
+        idle_timeout_seconds=TASK_SCHEDULER_IDLE_TIMEOUT_SECONDS,
+        clock=time.monotonic,
+    ):
+        self.max_workers = max(1, int(max_workers))
+        self.max_background_workers = max(1, min(self.max_workers, int(max_background_workers)))
+        self.thread_factory = thread_factory
+        self.idle_timeout_seconds = float(idle_timeout_seconds)
+        self.clock = clock
+        self.condition = threading.Condition()
+        self.queue = []
+        self.sequence = itertools.count()
+        self.tasks_by_key = {}
+        self.unfinished_tasks = set()
+        self.worker_count = 0
+        self.idle_worker_count = 0
+        self.running_counts = dict.fromkeys(TASK_PRIORITY_NAMES, 0)
+        self.queued_counts = dict.fromkeys(TASK_PRIORITY_NAMES, 0)
+        self.submitted_count = 0
+        self.coalesced_count = 0
+        self.completed_count = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def submit(self, target, *args, priority=TASK_PRIORITY_BACKGROUND, key=None, **kwargs):
+        priority = TASK_PRIORITY_INTERACTIVE if priority == TASK_PRIORITY_INTERACTIVE else TASK_PRIORITY_BACKGROUND
+        start_worker = False
+        with self.condition:
+            existing_task = self.tasks_by_key.get(key) if key is not None else None
+            if existing_task is not None:
+                self.coalesced_count += 1
+                if existing_task.state == "queued" and priority < existing_task.priority:
+                    self.queued_counts[existing_task.priority] -= 1
+                    self.queued_counts[priority] += 1
+                    existing_task.priority = priority
+                    heapq.heappush(self.queue, (priority, next(self.sequence), existing_task))
+                    self.condition.notify()
+                return existing_task
+
+            task = ScheduledTask(self, target, args, kwargs, priority, key)
+            self.unfinished_tasks.add(task)
+            if key is not None:
+                self.tasks_by_key[key] = task
+            heapq.heappush(self.queue, (priority, next(self.sequence), task))
+            self.queued_counts[priority] += 1
+            self.submitted_count += 1
+            if self.idle_worker_count:
+                self.condition.notify()
+            elif self.worker_count < self.max_workers:
+                self.worker_count += 1
+                start_worker = True
+
+        if start_worker:
+            try:
+                self.thread_factory(target=self.worker_loop, daemon=True).start()
+            except BaseException:
+                with self.condition:
+                    self.worker_count -= 1
+                raise
+        return task
+
+    def claim_task(self, task):
+        with self.condition:
+            if task.state != "queued":
+                return False
+            self.mark_task_started(task)
+            return True
+
+    def mark_task_started(self, task):
+        task.state = "running"
+        self.queued_counts[task.priority] -= 1
+        self.running_counts[task.priority] += 1
+        wait_seconds = max(0.0, self.clock() - task.submitted_at)
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def finish_task(self, task):
+        with self.condition:
+            task.state = "finished"
+            self.running_counts[task.priority] -= 1
+            self.completed_count += 1
+            self.unfinished_tasks.discard(task)
+            if task.key is not None and self.tasks_by_key.get(task.key) is task:
+                del self.tasks_by_key[task.key]
+            self.condition.notify()
+        task.finished.set()
+
+    def list_unfinished_tasks(self):
+        with self.condition:
+            return sorted(self.unfinished_tasks, key=lambda task: task.submitted_at)
+
+    def take_next_task(self):
+        deferred_entries = []
+        next_task = None
+        while self.queue:
+            entry = heapq.heappop(self.queue)
+            task = entry[2]
+            if task.state != "queued" or entry[0] != task.priority:
+                continue
+            if (
+                task.priority == TASK_PRIORITY_BACKGROUND
+                and self.running_counts[TASK_PRIORITY_BACKGROUND] >= self.max_background_workers
+            ):
+                deferred_entries.append(entry)
+                continue
+            next_task = task
+            break
+        for entry in deferred_entries:
+            heapq.heappush(self.queue, entry)
+        if next_task is not None:
+            self.mark_task_started(next_task)
+        return next_task
+
+    def worker_loop(self):
+        while True:
+            with self.condition:
+                task = self.take_next_task()
+                while task is None:
+                    if self.idle_timeout_seconds <= 0:
+                        self.worker_count -= 1
+                        return
+                    self.idle_worker_count += 1
+                    notified = self.condition.wait(self.idle_timeout_seconds)
+                    self.idle_worker_count -= 1
+                    task = self.take_next_task()
+                    if task is None and not notified:
+                        self.worker_count -= 1
+                        return
+            task.run()
+
+    def get_stats(self):
+        with self.condition:
+            started_count = self.completed_count + sum(self.running_counts.values())
+            return {
+                "workers": self.worker_count,
+                "queued": {TASK_PRIORITY_NAMES[priority]: count for priority, count in self.queued_counts.items()},
+                "running": {TASK_PRIORITY_NAMES[priority]: count for priority, count in self.running_counts.items()},
+                "submitted": self.submitted_count,
+                "coalesced": self.coalesced_count,
+                "completed": self.completed_count,
+                "avg_wait_ms": (self.total_wait_seconds / started_count * 1000) if started_count else 0.0,
+                "max_wait_ms": self.max_wait_seconds * 1000,
+            }
+
+
 class BackgroundTaskManager:
-    def __init__(self, thread_factory=threading.Thread, sleeper=time.sleep):
+    def __init__(self, thread_factory=threading.Thread, sleeper=time.sleep, scheduler=None, fanout_scheduler=None):
         self.thread_factory = thread_factory
         self.sleeper = sleeper
+        # Injected thread factories may run workers synchronously, so they cannot park idle.
+        idle_timeout_seconds = TASK_SCHEDULER_IDLE_TIMEOUT_SECONDS if thread_factory is threading.Thread else 0
+        if scheduler is None:
+            scheduler = TaskScheduler(thread_factory=thread_factory, idle_timeout_seconds=idle_timeout_seconds)
+        if fanout_scheduler is None:
+            fanout_scheduler = TaskScheduler(
+                max_workers=TASK_SCHEDULER_MAX_FANOUT_WORKERS,
+                thread_factory=thread_factory,
+                idle_timeout_seconds=idle_timeout_seconds,
+            )
+        self.scheduler = scheduler
+        # Subtasks awaited by a running task get their own workers; queued behind
+        # their parents they would be claimed inline and run one after another.
+        self.fanout_scheduler = fanout_scheduler
 
-    def start(self, target, *args, **kwargs):
-        if args or kwargs:
-            def thread_target():
-                target(*args, **kwargs)
-        else:
-            thread_target = target
+    def start(self, target, *args, key=None, **kwargs):
+        return self.scheduler.submit(target, *args, priority=TASK_PRIORITY_BACKGROUND, key=key, **kwargs)
 
-        thread = self.thread_factory(target=thread_target, daemon=True)
-        thread.start()
-        return thread
+    def submit_interactive(self, target, *args, key=None, **kwargs):
+        return self.scheduler.submit(target, *args, priority=TASK_PRIORITY_INTERACTIVE, key=key, **kwargs)
+
+    def submit_fanout(self, target, *args, key=None, **kwargs):
+        return self.fanout_scheduler.submit(target, *args, priority=TASK_PRIORITY_INTERACTIVE, key=key, **kwargs)
 
     def start_delayed(self, delay_seconds, target, *args, **kwargs):
         def worker():
@@ -31,7 +245,7 @@ class BackgroundTaskManager:
             if getattr(plugin, pending_flag_name):
                 return False
             setattr(plugin, pending_flag_name, True)
-        self.start(refresh_method)
+        self.start(refresh_method, key=pending_flag_name)
         return True
 
     def finish_flagged_refresh(self, plugin, pending_flag_name):
@@ -45,7 +259,7 @@ class BackgroundTaskManager:
             if key in pending_refreshes:
                 return False
             pending_refreshes.add(key)
-        self.start(refresh_method, key)
+        self.start(refresh_method, key, key=(pending_set_name, key))
         return True
 
     def finish_keyed_refresh(self, plugin, pending_set_name, key):
@@ -64,6 +278,10 @@ def get_background_task_manager(plugin=None):
     return DEFAULT_BACKGROUND_TASK_MANAGER
 
 
+def get_task_scheduler(plugin=None):
+    return get_background_task_manager(plugin).scheduler
+
+
 def start_daemon_task(target, *args, **kwargs):
     return DEFAULT_BACKGROUND_TASK_MANAGER.start(target, *args, **kwargs)
 
@@ -86,7 +86,7 @@ class SteamPluginUIMixin:
             return ""
         return f" | {plugin_tr(self, 'ui.last_played', date=played_on)}"
 
-    def format_achievement_progress(self, app_id):
+    def format_achievement_progress(self, app_id, has_current_account_data=None):
         if not self.ui_providers.settings.should_show_achievements():
             return ""
         achievement_progress = self.ui_providers.local.achievement_progress(app_id)
@@ -95,7 +95,9 @@ class SteamPluginUIMixin:
         unlocked_count, total_count = achievement_progress
         if total_count <= 0:
             return ""
-        if unlocked_count <= 0 and not self.ui_providers.local.has_current_account_data(app_id):
+        if has_current_account_data is None:
+            has_current_account_data = self.ui_providers.local.has_current_account_data(app_id)
+        if unlocked_count <= 0 and not has_current_account_data:
             return ""
         return f" | {unlocked_count}/{total_count}"
 
@@ -163,7 +165,7 @@ class SteamPluginUIMixin:
         return self.ui_providers.settings.tr(translation_key)
 
     def should_prefetch_refund_state(self, app_id):
-        playtime_minutes = self.ui_providers.local.playtime_minutes(app_id)
+        playtime_minutes = self.ui_providers.local.game_view(app_id).playtime_minutes
         return playtime_minutes is None or playtime_minutes < 120
 
     def build_local_result(
@@ -180,16 +182,16 @@ class SteamPluginUIMixin:
         metrics_provider = self.ui_providers.metrics
         store_provider = self.ui_providers.store
         result_provider = self.ui_providers.results
-        status_label = local_provider.installed_game_status(app_id)
-        status_label = local_provider.live_game_status(app_id, status_label)
+        game_view = local_provider.game_view(app_id)
+        status_label = local_provider.live_game_status(app_id, game_view.status_label)
         display_status_label = self.format_local_game_status_label(status_label)
         display_name = f"{name} [{display_status_label}]" if display_status_label else name
         subtitle = self.get_local_game_subtitle(app_id, status_label)
         if settings_provider.should_show_playtime():
-            subtitle += self.format_playtime(local_provider.playtime_minutes(app_id))
-        subtitle += self.format_achievement_progress(app_id)
+            subtitle += self.format_playtime(game_view.playtime_minutes)
+        subtitle += self.format_achievement_progress(app_id, game_view.has_current_account_data)
         if settings_provider.should_show_last_played():
-            subtitle += self.format_last_played(local_provider.last_played_timestamp(app_id))
+            subtitle += self.format_last_played(game_view.last_played_timestamp)
         subtitle += local_provider.game_account_notice(app_id)
         if include_player_count and settings_provider.should_show_player_count():
             if player_count_loaded:
@@ -200,20 +202,18 @@ class SteamPluginUIMixin:
             store_provider.app_details_metadata(app_id, allow_network_on_miss=False)
         if refund_state is None:
             refund_state = store_provider.refund_state_for_local_game(app_id, allow_network_on_miss=False)
-        playtime_minutes = local_provider.playtime_minutes(app_id)
-        has_current_account_local_data = local_provider.has_current_account_data(app_id)
 
         return result_provider.build_result(
             title=f"\U0001F3AE {display_name}",
             subtitle=subtitle,
-            icon_path=local_provider.game_icon(app_id),
+            icon_path=game_view.icon_path,
             context_data=result_provider.build_context_data(
                 app_id=app_id,
                 name=name,
-                install_path=local_provider.install_path(app_id),
+                install_path=game_view.install_path,
                 refund_state=refund_state,
-                playtime_minutes=playtime_minutes,
-                has_current_account_local_data=has_current_account_local_data,
+                playtime_minutes=game_view.playtime_minutes,
+                has_current_account_local_data=game_view.has_current_account_data,
             ),
             action=self.get_local_game_primary_action(app_id, status_label),
         )
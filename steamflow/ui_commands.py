@@ -1,5 +1,6 @@
 import time
 
+from .cache_budget import format_cache_size
 from .clipboard import get_clipboard_text
 from .constants import STEAMFLOW_CONFIG
 from .hooks import show_message_if_supported
@@ -206,8 +207,9 @@ class SteamPluginUICommandsMixin:
         result_provider = self.ui_command_providers.results
         status_query = result_provider.build_plugin_query("status")
         steamid64 = account_provider.active_steamid64()
+        cache_usage_result = self.build_cache_usage_result(result_provider, status_query)
         if not steamid64:
-            return [
+            results = [
                 result_provider.build_result(
                     title=plugin_tr(self, "status.no_active_account.title"),
                     subtitle=plugin_tr(self, "status.no_active_account.subtitle"),
@@ -216,6 +218,9 @@ class SteamPluginUICommandsMixin:
                     Score=self.STATUS_CURRENT_RESULT_SCORE,
                 )
             ]
+            if cache_usage_result is not None:
+                results.append(cache_usage_result)
+            return results
 
         user_details = account_provider.user_details(steamid64)
         account_label = (
@@ -260,8 +265,32 @@ class SteamPluginUICommandsMixin:
                 )
             )
 
+        if cache_usage_result is not None:
+            results.append(cache_usage_result)
         return results
 
+    def build_cache_usage_result(self, result_provider, status_query):
+        footprint = self.ui_command_providers.runtime.cache_footprint()
+        if not footprint:
+            return None
+        cache_sizes = sorted(
+            ((cache_name, size) for cache_name, size in footprint["caches"].items() if size > 0),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return result_provider.build_result(
+            title=plugin_tr(
+                self,
+                "status.cache_usage",
+                used=format_cache_size(sum(size for _cache_name, size in cache_sizes)),
+                budget=format_cache_size(footprint["budget_bytes"]),
+            ),
+            subtitle=" | ".join(f"{cache_name} {format_cache_size(size)}" for cache_name, size in cache_sizes),
+            icon_path=self.DEFAULT_ICON,
+            action=result_provider.build_change_query_action(status_query),
+            Score=self.STATUS_OPTION_BASE_SCORE - len(self.STEAM_STATUS_OPTIONS) - 1,
+        )
+
     def build_owned_api_results(self):
         account_provider = self.ui_command_providers.account
         owned_api_provider = self.ui_command_providers.owned_api
@@ -424,6 +453,7 @@ class SteamPluginUICommandsMixin:
             self.owned_games_steamid64 = steamid64
             self.owned_app_ids = set(owned_app_ids)
             self.owned_game_playtimes = dict(owned_game_playtimes)
+            self.owned_games_validators = {}
             self.owned_games_cache_loaded = True
         providers.owned_api.save_owned_games_cache()
         message = plugin_tr(
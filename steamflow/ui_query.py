@@ -1,9 +1,9 @@
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .constants import STEAMFLOW_CONFIG
 from .localization import plugin_tr
 from .providers import get_plugin_providers
+from .tasks import get_background_task_manager
 from .util_steam_date import format_relative_minutes_ago
 
 
@@ -24,13 +24,7 @@ class SteamPluginUIQueryMixin:
         return get_plugin_providers(self)
 
     def collect_local_matches(self, search_term):
-        search_lower = search_term.lower()
-        matches = []
-        for app_id, name in self.ui_query_providers.local.installed_games_items():
-            if search_lower in name.lower():
-                matches.append((app_id, name))
-        matches.sort(key=lambda item: (item[1].lower().find(search_lower), len(item[1])))
-        return matches[: self.CONFIG.query.max_results]
+        return self.ui_query_providers.local.search_games(search_term, limit=self.CONFIG.query.max_results)
 
     def get_empty_query_local_games(self):
         local_provider = self.ui_query_providers.local
@@ -53,19 +47,16 @@ class SteamPluginUIQueryMixin:
         if not include_player_count:
             return [self.build_local_result(app_id, name) for app_id, name in local_matches]
 
-        with ThreadPoolExecutor(max_workers=min(len(local_matches), self.CONFIG.query.max_results)) as executor:
-            future_to_index = {}
-            if self.ui_query_providers.settings.should_show_player_count():
-                future_to_index = {
-                    executor.submit(self.ui_query_providers.metrics.current_players, app_id): index
-                    for index, (app_id, _name) in enumerate(local_matches)
-                }
-            player_counts = [None] * len(local_matches)
-
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
+        player_counts = [None] * len(local_matches)
+        if self.ui_query_providers.settings.should_show_player_count():
+            task_manager = get_background_task_manager(self)
+            tasks = [
+                task_manager.submit_interactive(self.ui_query_providers.metrics.current_players, app_id)
+                for app_id, _name in local_matches
+            ]
+            for index, task in enumerate(tasks):
                 try:
-                    player_counts[index] = future.result()
+                    player_counts[index] = task.result()
                 except Exception:
                     self.ui_query_providers.runtime.log_exception("Failed to process local player count")
 
@@ -254,6 +245,8 @@ class SteamPluginUIQueryMixin:
             providers.results.add_result(result)
         providers.runtime.mark_timing(timings, "add_results", stage_start_time)
         providers.runtime.save_metric_caches(force=True)
+        providers.local.save_icon_index()
+        providers.store.save_search_cache()
 
         providers.runtime.log_query_profile(
             search_term,
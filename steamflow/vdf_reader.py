@@ -0,0 +1,196 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+
+VDF_TOKEN_PATTERN = re.compile(rb'"((?:[^"\\]|\\.)*)"|([{}])|//[^\n]*|\[[^\]\n]*\]|([^\s"{}]+)')
+VDF_SKIP_PATTERN = re.compile(rb'(?:[^"{}/]+|"(?:[^"\\]|\\.)*"|//[^\n]*|/)*')
+VDF_ESCAPE_PATTERN = re.compile(r"\\[ntvbrfa\\?\"']")
+VDF_UNESCAPE_MAP = {
+    r"\n": "\n",
+    r"\t": "\t",
+    r"\v": "\v",
+    r"\b": "\b",
+    r"\r": "\r",
+    r"\f": "\f",
+    r"\a": "\a",
+    r"\\": "\\",
+    r"\?": "?",
+    r"\"": '"',
+    r"\'": "'",
+}
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+@dataclass(frozen=True)
+class VdfKeySegment:
+    names: frozenset = frozenset()
+    prefixes: tuple = ()
+
+    @property
+    def is_exact(self):
+        return not self.prefixes
+
+    def matches(self, raw_key):
+        if raw_key in self.names:
+            return True
+        return any(raw_key.startswith(prefix) for prefix in self.prefixes)
+
+
+def split_vdf_key_path(key_path):
+    parts = []
+    current = []
+    brace_depth = 0
+    for char in str(key_path or ""):
+        if char == "{":
+            brace_depth += 1
+        elif char == "}":
+            brace_depth = max(0, brace_depth - 1)
+        if char == "/" and brace_depth == 0:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def compile_vdf_key_segment(raw_segment):
+    raw_segment = str(raw_segment or "").strip()
+    if raw_segment.startswith("{") and raw_segment.endswith("}"):
+        raw_names = raw_segment[1:-1].split(",")
+    else:
+        raw_names = [raw_segment]
+
+    names = set()
+    prefixes = []
+    for raw_name in raw_names:
+        name = raw_name.strip()
+        if not name:
+            continue
+        if name.endswith("*"):
+            prefixes.append(name[:-1].encode("utf-8"))
+        else:
+            names.add(name.encode("utf-8"))
+    return VdfKeySegment(names=frozenset(names), prefixes=tuple(prefixes))
+
+
+@lru_cache(maxsize=32)
+def compile_vdf_key_path_text(key_path):
+    return tuple(compile_vdf_key_segment(segment) for segment in split_vdf_key_path(key_path))
+
+
+def compile_vdf_key_path(key_path):
+    if key_path is None:
+        return None
+    if isinstance(key_path, tuple):
+        return key_path
+    return compile_vdf_key_path_text(str(key_path))
+
+
+def decode_vdf_token(raw_token):
+    text = raw_token.decode("utf-8", errors="ignore")
+    if "\\" in text:
+        text = VDF_ESCAPE_PATTERN.sub(lambda match: VDF_UNESCAPE_MAP[match.group()], text)
+    return text
+
+
+def get_vdf_key_path_stop_depth(segments):
+    stop_depth = 0
+    for segment in segments[:-1]:
+        if not segment.is_exact or len(segment.names) != 1:
+            break
+        stop_depth += 1
+    return stop_depth
+
+
+def skip_vdf_block(data, position):
+    depth = 1
+    data_length = len(data)
+    while depth:
+        position = VDF_SKIP_PATTERN.match(data, position).end()
+        if position >= data_length:
+            return position
+        char = data[position]
+        if char == 0x7B:
+            depth += 1
+        elif char == 0x7D:
+            depth -= 1
+        position += 1
+    return position
+
+
+def parse_vdf_bytes(data, key_path=None):
+    segments = compile_vdf_key_path(key_path)
+    if data.startswith(UTF8_BOM):
+        data = data[len(UTF8_BOM):]
+
+    root = {}
+    if segments is not None and not segments:
+        return root
+
+    last_depth = len(segments) if segments else 0
+    stop_depth = get_vdf_key_path_stop_depth(segments) if segments else 0
+    remaining_keys = None
+    if segments and segments[-1].is_exact and stop_depth == last_depth - 1:
+        remaining_keys = set(segments[-1].names)
+    frames = [(root, 0, None)]
+    pending_key = None
+    position = 0
+    search = VDF_TOKEN_PATTERN.search
+
+    while True:
+        match = search(data, position)
+        if match is None:
+            break
+        position = match.end()
+        quoted_token, brace_token, bare_token = match.group(1, 2, 3)
+        token = quoted_token if quoted_token is not None else bare_token
+        if token is not None:
+            if pending_key is None:
+                pending_key = token
+                continue
+            target, depth, _frame_key = frames[-1]
+            if target is not None and (
+                segments is None
+                or depth >= last_depth
+                or (depth == last_depth - 1 and segments[depth].matches(pending_key))
+            ):
+                target[decode_vdf_token(pending_key)] = decode_vdf_token(token)
+                if remaining_keys is not None and depth == last_depth - 1:
+                    remaining_keys.discard(pending_key)
+                    if not remaining_keys:
+                        break
+            pending_key = None
+        elif brace_token == b"{":
+            target, depth, _frame_key = frames[-1]
+            block_key = pending_key or b""
+            pending_key = None
+            if target is None or (segments is not None and depth < last_depth and not segments[depth].matches(block_key)):
+                position = skip_vdf_block(data, position)
+                continue
+            block_name = decode_vdf_token(block_key)
+            child = target.get(block_name)
+            if not isinstance(child, dict):
+                child = target[block_name] = {}
+            frames.append((child, depth + 1, block_key))
+        elif brace_token == b"}":
+            pending_key = None
+            if len(frames) == 1:
+                continue
+            target, depth, block_key = frames.pop()
+            if segments is None:
+                continue
+            if remaining_keys is not None and depth == last_depth:
+                remaining_keys.discard(block_key)
+                if not remaining_keys:
+                    break
+            if stop_depth and depth == stop_depth:
+                break
+
+    return root
+
+
+def load_vdf_path(path, key_path=None):
+    return parse_vdf_bytes(Path(path).read_bytes(), key_path=key_path)
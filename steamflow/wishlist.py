@@ -9,19 +9,17 @@ from .localization import plugin_tr
 from .tasks import get_background_task_manager
 from .wishlist_mutation_service import start_steam_wishlist_mutation_worker_process
 from .wishlist_service import (
-    add_wishlist_cache_item,
-    fetch_wishlist_items,
+    WishlistIndex,
+    WishlistSearchIndex,
     fetch_wishlist_result,
+    fetch_wishlist_update,
     get_wishlist_fetch_error_message,
     is_wishlist_cache_fresh,
     is_wishlist_worker_running,
     build_wishlist_results_plan,
     normalize_wishlist_items,
-    remove_wishlist_cache_item,
     select_wishlist_prewarm_items,
-    sort_wishlist_items,
     start_wishlist_hydration_worker_process,
-    wishlist_contains_app_id,
 )
 
 
@@ -68,6 +66,12 @@ class SteamPluginWishlistMixin:
     def normalize_wishlist_items(self, items):
         return normalize_wishlist_items(items)
 
+    def get_wishlist_index(self):
+        with self.state_lock:
+            if getattr(self, "wishlist_index", None) is None:
+                self.wishlist_index = WishlistIndex()
+            return self.wishlist_index
+
     def is_wishlisted_app(self, app_id):
         app_id = str(app_id or "").strip()
         if not app_id:
@@ -82,14 +86,15 @@ class SteamPluginWishlistMixin:
         with self.state_lock:
             if str(self.wishlist_steamid64 or "") != str(steamid64 or ""):
                 return False
-            return wishlist_contains_app_id(self.wishlist_items, app_id)
+            return app_id in self.get_wishlist_index()
 
     def clear_wishlist_cache(self):
         with self.state_lock:
             self.wishlist_last_attempt = 0
             self.wishlist_last_sync = 0
             self.wishlist_steamid64 = None
-            self.wishlist_items = []
+            self.wishlist_index = WishlistIndex()
+            self.wishlist_validators = {}
             self.wishlist_cache_loaded = True
         self.wishlist_providers.wishlist.save_cache()
 
@@ -101,15 +106,17 @@ class SteamPluginWishlistMixin:
 
         self.ensure_wishlist_cache_loaded()
         with self.state_lock:
+            action = str(action or "").strip().lower()
+            if action not in {"add", "remove"}:
+                return
             if self.wishlist_steamid64 and str(self.wishlist_steamid64) != str(steamid64):
-                self.wishlist_items = []
-            if str(action or "").strip().lower() == "add":
-                self.wishlist_items = add_wishlist_cache_item(self.wishlist_items, app_id)
-            elif str(action or "").strip().lower() == "remove":
-                self.wishlist_items = remove_wishlist_cache_item(self.wishlist_items, app_id)
+                self.wishlist_index = WishlistIndex()
+            if action == "add":
+                self.get_wishlist_index().add(app_id)
             else:
-                return
+                self.get_wishlist_index().remove(app_id)
             self.wishlist_steamid64 = steamid64
+            self.wishlist_validators = {}
             self.wishlist_last_sync = time.time()
             self.wishlist_last_attempt = self.wishlist_last_sync
             self.wishlist_cache_loaded = True
@@ -175,13 +182,14 @@ class SteamPluginWishlistMixin:
             is_timestamp_fresh,
         )
 
-    def fetch_wishlist_items_from_api(self, api_key, steamid64, timeout=3):
-        return fetch_wishlist_items(
+    def fetch_wishlist_update_from_api(self, api_key, steamid64, timeout=3, validators=None):
+        return fetch_wishlist_update(
             api_key,
             steamid64,
             self._http_get,
             normalize_api_key=self.wishlist_providers.owned_api.normalize_key,
             timeout=timeout,
+            validators=validators,
         )
 
     def _refresh_wishlist_worker(self):
@@ -226,14 +234,32 @@ class SteamPluginWishlistMixin:
             self.log_exception("Failed to start Steam wishlist worker")
             return False
 
+    def get_wishlist_search_entries(self, wishlist_items):
+        store_provider = self.wishlist_providers.store
+        signature = store_provider.app_search_signature()
+        with self.state_lock:
+            search_index = getattr(self, "wishlist_search_index", None)
+            if search_index is None or search_index.signature != signature:
+                search_index = WishlistSearchIndex(signature)
+                self.wishlist_search_index = search_index
+            unloaded_app_ids = search_index.list_unloaded_app_ids(item["appid"] for item in wishlist_items or [])
+        if unloaded_app_ids:
+            search_entries = store_provider.app_search_entries(unloaded_app_ids)
+            with self.state_lock:
+                search_index.update(unloaded_app_ids, search_entries)
+        return search_index.entries
+
+    def update_wishlist_search_entry(self, app_id, search_entry, scope):
+        with self.state_lock:
+            search_index = getattr(self, "wishlist_search_index", None)
+            if search_index is not None and search_index.matches_scope(scope):
+                search_index.set_entry(app_id, search_entry)
+
     def get_wishlist_missing_appdetails_items(self, wishlist_items):
         plan = build_wishlist_results_plan(
-            wishlist_items,
+            wishlist_items or [],
             "",
-            lambda app_id: self.wishlist_providers.store.app_details_metadata(
-                app_id,
-                allow_network_on_miss=False,
-            ),
+            self.get_wishlist_search_entries(wishlist_items),
             len(wishlist_items or []),
         )
         return plan["missing_items"]
@@ -287,14 +313,27 @@ class SteamPluginWishlistMixin:
 
         with self.state_lock:
             self.wishlist_last_attempt = time.time()
-        fetch_result = fetch_wishlist_result(self.fetch_wishlist_items_from_api, api_key, steamid64, timeout=3)
+            validators = (
+                dict(getattr(self, "wishlist_validators", None) or {})
+                if self.wishlist_steamid64 == steamid64
+                else {}
+            )
+        fetch_result = fetch_wishlist_result(
+            self.fetch_wishlist_update_from_api,
+            api_key,
+            steamid64,
+            timeout=3,
+            validators=validators,
+        )
         if not fetch_result["success"]:
             self.log_exception("Failed to fetch Steam wishlist")
             self.wishlist_providers.wishlist.save_cache()
             return
 
         with self.state_lock:
-            self.wishlist_items = fetch_result["items"]
+            if not fetch_result["not_modified"]:
+                self.wishlist_index = WishlistIndex(fetch_result["items"])
+            self.wishlist_validators = fetch_result["validators"]
             self.wishlist_steamid64 = steamid64
             self.wishlist_last_sync = time.time()
             self.wishlist_last_attempt = self.wishlist_last_sync
@@ -315,7 +354,7 @@ class SteamPluginWishlistMixin:
             return [], reasons.no_active_account
 
         with self.state_lock:
-            cached_items = list(self.wishlist_items)
+            cached_items = self.get_wishlist_index().by_date
             cached_steamid64 = self.wishlist_steamid64
 
         if cached_steamid64 == steamid64 and cached_items:
@@ -326,21 +365,23 @@ class SteamPluginWishlistMixin:
         api_key = account_provider.owned_api_key()
         with self.state_lock:
             self.wishlist_last_attempt = time.time()
-        fetch_result = fetch_wishlist_result(self.fetch_wishlist_items_from_api, api_key, steamid64, timeout=3)
+        fetch_result = fetch_wishlist_result(self.fetch_wishlist_update_from_api, api_key, steamid64, timeout=3)
         if not fetch_result["success"]:
             self.log_exception("Failed to fetch Steam wishlist")
             if cached_steamid64 == steamid64 and cached_items:
                 return cached_items, None
             return [], get_wishlist_fetch_error_message(fetch_result["error"])
 
+        wishlist_index = WishlistIndex(fetch_result["items"])
         with self.state_lock:
-            self.wishlist_items = fetch_result["items"]
+            self.wishlist_index = wishlist_index
+            self.wishlist_validators = fetch_result["validators"]
             self.wishlist_steamid64 = steamid64
             self.wishlist_last_sync = time.time()
             self.wishlist_last_attempt = self.wishlist_last_sync
             self.wishlist_cache_loaded = True
         self.wishlist_providers.wishlist.save_cache()
-        return fetch_result["items"], None
+        return wishlist_index.by_date, None
 
     def format_wishlist_added(self, date_added):
         formatted_age = util_steam_date.format_wishlisted_date(date_added, tr=getattr(self, "tr", None))
@@ -435,25 +476,25 @@ class SteamPluginWishlistMixin:
                 )
             ]
 
-        sorted_items = sort_wishlist_items(wishlist_items)
+        store_provider = self.wishlist_providers.store
+        search_entries = self.get_wishlist_search_entries(wishlist_items)
         for wishlist_item in select_wishlist_prewarm_items(
-            sorted_items,
+            wishlist_items,
             self.CONFIG.query.wishlist_cold_detail_fetch_limit,
         ):
-            self.wishlist_providers.store.app_details_metadata(
-                wishlist_item["appid"],
-                allow_network_on_miss=True,
-            )
+            if wishlist_item["appid"] not in search_entries:
+                store_provider.app_details_metadata(
+                    wishlist_item["appid"],
+                    allow_network_on_miss=True,
+                )
 
         plan = build_wishlist_results_plan(
             wishlist_items,
             search_term,
-            lambda app_id: self.wishlist_providers.store.app_details_metadata(
-                app_id,
-                allow_network_on_miss=False,
-            ),
+            search_entries,
             self.CONFIG.query.max_wishlist_results,
         )
+        store_provider.preload_app_details(item["appid"] for item in plan["visible_items"])
         sorted_items = plan["sorted_items"]
         missing_items = plan["missing_items"]
         visible_results = [
@@ -464,6 +505,7 @@ class SteamPluginWishlistMixin:
             )
             if result
         ]
+        store_provider.schedule_icon_downloads()
 
         if missing_items:
             self.start_wishlist_hydration_worker(missing_items)
@@ -1,12 +1,14 @@
+import bisect
 import subprocess
 import sys
 import time
 from pathlib import Path
 
-from .http_client import http_get_json
+from .http_client import http_get_json_conditional, normalize_http_validators
 from .os_integration import build_hidden_process_kwargs, start_hidden_process
 
 WISHLIST_WORKER_STALE_SECONDS = 15 * 60
+WISHLIST_CACHE_VERSION = 2
 
 
 def _coerce_float(value, default=0.0):
@@ -44,6 +46,74 @@ def normalize_wishlist_items(items):
     return normalized_items
 
 
+def get_wishlist_date_sort_key(item):
+    return (-item["date_added"], item["appid"])
+
+
+class WishlistIndex:
+    def __init__(self, items=()):
+        self.items_by_app_id = {}
+        for item in items:
+            self.items_by_app_id.setdefault(item["appid"], item)
+        self.by_date = sorted(self.items_by_app_id.values(), key=get_wishlist_date_sort_key)
+        self.date_keys = [get_wishlist_date_sort_key(item) for item in self.by_date]
+
+    def __len__(self):
+        return len(self.items_by_app_id)
+
+    def __contains__(self, app_id):
+        return str(app_id or "").strip() in self.items_by_app_id
+
+    @classmethod
+    def from_items(cls, items):
+        return cls(normalize_wishlist_items(items))
+
+    def app_ids(self):
+        return [item["appid"] for item in self.by_date]
+
+    def add(self, app_id, date_added=None, priority=0):
+        normalized_app_id = str(app_id or "").strip()
+        if not normalized_app_id or normalized_app_id in self.items_by_app_id:
+            return False
+        item = {
+            "appid": normalized_app_id,
+            "date_added": int(time.time() if date_added is None else date_added),
+            "priority": _coerce_int(priority),
+        }
+        self.items_by_app_id[normalized_app_id] = item
+        self.by_date, self.date_keys = _insert_sorted(
+            self.by_date, self.date_keys, item, get_wishlist_date_sort_key(item)
+        )
+        return True
+
+    def remove(self, app_id):
+        item = self.items_by_app_id.pop(str(app_id or "").strip(), None)
+        if item is None:
+            return False
+        self.by_date, self.date_keys = _remove_sorted(self.by_date, self.date_keys, get_wishlist_date_sort_key(item))
+        return True
+
+    def to_payload(self):
+        return {"items": list(self.by_date)}
+
+    @classmethod
+    def from_payload(cls, payload):
+        payload = payload if isinstance(payload, dict) else {}
+        return cls.from_items(payload.get("items", []))
+
+
+def _insert_sorted(items, keys, item, key):
+    position = bisect.bisect_left(keys, key)
+    return items[:position] + [item] + items[position:], keys[:position] + [key] + keys[position:]
+
+
+def _remove_sorted(items, keys, key):
+    position = bisect.bisect_left(keys, key)
+    if position >= len(keys) or keys[position] != key:
+        return items, keys
+    return items[:position] + items[position + 1 :], keys[:position] + keys[position + 1 :]
+
+
 def build_wishlist_url(api_key, steamid64):
     return f"https://api.steampowered.com/IWishlistService/GetWishlist/v1/?key={api_key}&steamid={steamid64}"
 
@@ -55,31 +125,52 @@ def parse_wishlist_payload(payload):
     return normalize_wishlist_items(items)
 
 
-def fetch_wishlist_items(api_key, steamid64, http_get, normalize_api_key=None, timeout=3):
+def fetch_wishlist_update(api_key, steamid64, http_get, normalize_api_key=None, timeout=3, validators=None):
     normalized_key = normalize_api_key(api_key) if normalize_api_key else str(api_key or "").strip()
     normalized_steamid64 = str(steamid64 or "").strip()
     if not normalized_key or not normalized_steamid64:
         raise ValueError("Missing Steam API credentials")
 
-    payload = http_get_json(
+    response = http_get_json_conditional(
         http_get,
         build_wishlist_url(normalized_key, normalized_steamid64),
         timeout=timeout,
+        validators=validators,
+        flight_key="wishlist",
     )
-    return parse_wishlist_payload(payload)
+    return {
+        "not_modified": response["not_modified"],
+        "items": [] if response["not_modified"] else parse_wishlist_payload(response["payload"]),
+        "validators": response["validators"],
+    }
+
+
+def fetch_wishlist_items(api_key, steamid64, http_get, normalize_api_key=None, timeout=3):
+    return fetch_wishlist_update(
+        api_key,
+        steamid64,
+        http_get,
+        normalize_api_key=normalize_api_key,
+        timeout=timeout,
+    )["items"]
 
 
-def fetch_wishlist_result(fetch_wishlist_items_from_api, api_key, steamid64, timeout=3):
+def fetch_wishlist_result(fetch_wishlist_update_from_api, api_key, steamid64, timeout=3, validators=None):
     try:
+        update = fetch_wishlist_update_from_api(api_key, steamid64, timeout=timeout, validators=validators)
         return {
             "success": True,
-            "items": fetch_wishlist_items_from_api(api_key, steamid64, timeout=timeout),
+            "not_modified": update["not_modified"],
+            "items": update["items"],
+            "validators": update["validators"],
             "error": None,
         }
     except Exception as error:
         return {
             "success": False,
+            "not_modified": False,
             "items": [],
+            "validators": {},
             "error": error,
         }
 
@@ -96,16 +187,19 @@ def normalize_wishlist_cache_payload(cache_data):
         "last_attempt": _coerce_float(cache_data.get("last_attempt", 0)),
         "last_sync": _coerce_float(cache_data.get("timestamp", 0)),
         "steamid64": str(cache_data.get("steamid64", "") or "") or None,
-        "items": normalize_wishlist_items(cache_data.get("items", [])),
+        "index": WishlistIndex.from_payload(cache_data),
+        "validators": normalize_http_validators(cache_data.get("validators")),
     }
 
 
-def build_wishlist_cache_payload(last_attempt, last_sync, steamid64, items):
+def build_wishlist_cache_payload(last_attempt, last_sync, steamid64, index, validators=None):
     return {
+        "version": WISHLIST_CACHE_VERSION,
         "last_attempt": last_attempt,
         "timestamp": last_sync,
         "steamid64": steamid64,
-        "items": list(items),
+        **index.to_payload(),
+        "validators": normalize_http_validators(validators),
     }
 
 
@@ -137,43 +231,6 @@ def collect_unique_wishlist_app_ids(wishlist_items):
     return app_ids
 
 
-def wishlist_contains_app_id(wishlist_items, app_id):
-    normalized_app_id = str(app_id or "").strip()
-    if not normalized_app_id:
-        return False
-    return normalized_app_id in set(collect_unique_wishlist_app_ids(wishlist_items))
-
-
-def add_wishlist_cache_item(wishlist_items, app_id, now=None):
-    normalized_app_id = str(app_id or "").strip()
-    if not normalized_app_id:
-        return normalize_wishlist_items(wishlist_items)
-
-    normalized_items = normalize_wishlist_items(wishlist_items)
-    if wishlist_contains_app_id(normalized_items, normalized_app_id):
-        return normalized_items
-
-    normalized_items.append(
-        {
-            "appid": normalized_app_id,
-            "date_added": int(time.time() if now is None else now),
-            "priority": 0,
-        }
-    )
-    return normalized_items
-
-
-def remove_wishlist_cache_item(wishlist_items, app_id):
-    normalized_app_id = str(app_id or "").strip()
-    if not normalized_app_id:
-        return normalize_wishlist_items(wishlist_items)
-    return [
-        item
-        for item in normalize_wishlist_items(wishlist_items)
-        if str(item.get("appid", "")).strip() != normalized_app_id
-    ]
-
-
 def build_hidden_worker_kwargs(platform=sys.platform, subprocess_module=subprocess):
     return build_hidden_process_kwargs(
         platform=platform,
@@ -224,13 +281,6 @@ def start_wishlist_hydration_worker_process(
         )
 
 
-def sort_wishlist_items(items):
-    return sorted(
-        items,
-        key=lambda item: (-_coerce_int(item.get("date_added", 0)), item["appid"]),
-    )
-
-
 def normalize_wishlist_search(search_term):
     return str(search_term or "").strip().lower()
 
@@ -245,9 +295,36 @@ def select_wishlist_prewarm_items(sorted_items, limit):
     return list(sorted_items[:limit])
 
 
-def build_wishlist_results_plan(wishlist_items, search_term, metadata_resolver, max_results):
+class WishlistSearchIndex:
+    def __init__(self, signature=None):
+        self.signature = signature
+        self.entries = {}
+        self.loaded_app_ids = set()
+
+    def matches_scope(self, scope):
+        return isinstance(self.signature, tuple) and self.signature[: len(scope)] == tuple(scope)
+
+    def list_unloaded_app_ids(self, app_ids):
+        return [app_id for app_id in dict.fromkeys(app_ids) if app_id not in self.loaded_app_ids]
+
+    def update(self, app_ids, entries):
+        entries = entries or {}
+        for app_id in app_ids:
+            self.set_entry(app_id, entries.get(app_id))
+
+    def set_entry(self, app_id, search_entry):
+        app_id = str(app_id or "").strip()
+        if not app_id:
+            return
+        self.loaded_app_ids.add(app_id)
+        if search_entry:
+            self.entries[app_id] = search_entry
+        else:
+            self.entries.pop(app_id, None)
+
+
+def build_wishlist_results_plan(sorted_items, search_term, search_entries, max_results):
     normalized_search = normalize_wishlist_search(search_term)
-    sorted_items = sort_wishlist_items(wishlist_items)
     loaded_count = 0
     missing_items = []
     visible_items = []
@@ -259,11 +336,10 @@ def build_wishlist_results_plan(wishlist_items, search_term, metadata_resolver,
         max_results = 0
 
     for wishlist_item in sorted_items:
-        metadata = metadata_resolver(wishlist_item["appid"])
-        if metadata and metadata.get("name"):
+        search_entry = search_entries.get(wishlist_item["appid"])
+        if search_entry:
             loaded_count += 1
-            name_matches = not normalized_search or normalized_search in str(metadata["name"]).lower()
-            if name_matches:
+            if not normalized_search or normalized_search in search_entry["name"]:
                 matching_loaded_count += 1
                 if len(visible_items) < max_results:
                     visible_items.append(wishlist_item)
@@ -6,7 +6,6 @@ import time
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import patch
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 LIB_PATH = PROJECT_ROOT / "lib"
@@ -17,16 +16,48 @@ if str(LIB_PATH) not in sys.path:
 
 from steamflow.app_details import (
     APP_DETAILS_FILE_MAX_AGE_SECONDS,
-    MAX_CACHE_FILES,
-    AppDetailsFileCache,
+    MAX_CACHE_ENTRIES,
     AppDetailsMetadataProvider,
+    AppDetailsStore,
     MetricAppDetailsCache,
+    fetch_app_details_metadata_with_urlopen,
     normalize_app_details_metadata,
     parse_app_details_metadata,
 )
 
 
+class ResponseContext:
+    def __init__(self, raw_data):
+        self.raw_data = raw_data
+        self.headers = {"Content-Type": "application/json"}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        return False
+
+    def read(self):
+        return self.raw_data
+
+
 class AppDetailsMetadataTests(unittest.TestCase):
+    def test_fetch_app_details_metadata_with_urlopen_reads_through_opener(self):
+        requests = []
+        payload = {"570": {"success": True, "data": {"type": "game", "name": "Dota 2", "is_free": True}}}
+
+        def opener(request, timeout):
+            requests.append((request, timeout))
+            return ResponseContext(json.dumps(payload).encode("utf-8"))
+
+        metadata = fetch_app_details_metadata_with_urlopen("570", country_code="us", timeout=0.75, opener=opener)
+
+        self.assertEqual(metadata["type"], "game")
+        self.assertTrue(metadata["is_free"])
+        self.assertIn("appids=570", requests[0][0].full_url)
+        self.assertIn("cc=us", requests[0][0].full_url)
+        self.assertEqual(requests[0][1], 0.75)
+
     def test_parse_app_details_metadata_normalizes_shared_fields(self):
         metadata = parse_app_details_metadata(
             {
@@ -56,38 +87,60 @@ class AppDetailsMetadataTests(unittest.TestCase):
         self.assertIsNone(normalize_app_details_metadata(None))
 
 
-class AppDetailsFileCacheTests(unittest.TestCase):
-    def test_cache_path_includes_normalized_country_and_app_id(self):
-        with TemporaryDirectory() as temp_dir:
-            cache = AppDetailsFileCache(Path(temp_dir) / "cache_app_details")
+class AppDetailsStoreTests(unittest.TestCase):
+    def set_last_access(self, cache, app_id, last_access, country_code="us"):
+        cache.connect().execute(
+            "UPDATE app_details SET last_access = ? WHERE country_code = ? AND app_id = ?",
+            (last_access, country_code, app_id),
+        )
 
-            path = cache.entry_path("1451940", "KZ")
+    def get_last_access(self, cache, app_id, country_code="us"):
+        return cache.connect().execute(
+            "SELECT last_access FROM app_details WHERE country_code = ? AND app_id = ?",
+            (country_code, app_id),
+        ).fetchone()[0]
 
-        self.assertEqual(path.parts[-2:], ("kz", "1451940.json"))
+    def test_entries_are_stored_in_single_database_file(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir) / "cache_app_details"
+            cache = AppDetailsStore(cache_dir)
+            cache.write_entry("1451940", {"type": "game"}, success=True, country_code="KZ")
+            cache.close()
+
+            self.assertEqual(sorted(path.name for path in cache_dir.iterdir() if path.suffix == ".sqlite3"), ["app_details.sqlite3"])
+            self.assertEqual(list(cache_dir.rglob("*.json")), [])
 
     def test_cache_hit_reads_expected_region_only(self):
         with TemporaryDirectory() as temp_dir:
-            cache = AppDetailsFileCache(Path(temp_dir) / "cache_app_details")
+            cache = AppDetailsStore(Path(temp_dir) / "cache_app_details")
             cache.write_entry("1451940", {"name": "US"}, success=True, country_code="us")
             cache.write_entry("1451940", {"name": "KZ"}, success=True, country_code="kz")
 
             self.assertEqual(cache.get_metadata("1451940", "kz"), {"name": "KZ"})
+            cache.close()
 
-    def test_cache_write_uses_atomic_replace(self):
+    def test_read_many_returns_only_cached_apps_for_region(self):
         with TemporaryDirectory() as temp_dir:
-            cache = AppDetailsFileCache(Path(temp_dir) / "cache_app_details")
-            cache.write_entry("1451940", {"type": "game"}, success=True)
+            cache = AppDetailsStore(Path(temp_dir) / "cache_app_details")
+            written = cache.write_many(
+                {"570": ({"name": "Dota 2"}, True), "400": (None, False)},
+                country_code="kz",
+                steam_language="english",
+            )
+            cache.write_entry("730", {"name": "CS2"}, success=True, country_code="us")
 
-            cache_path = cache.entry_path("1451940")
-            cache_data = json.loads(cache_path.read_text(encoding="utf-8"))
-            temp_files = list(cache_path.parent.glob("*.tmp"))
+            entries = cache.read_many(["570", "400", "730", "bad"], "KZ")
+            cache.close()
 
-        self.assertEqual(cache_data["metadata"]["type"], "game")
-        self.assertEqual(temp_files, [])
+        self.assertEqual(sorted(written), ["400", "570"])
+        self.assertEqual(sorted(entries), ["400", "570"])
+        self.assertEqual(entries["570"]["metadata"], {"name": "Dota 2"})
+        self.assertEqual(entries["570"]["steam_language"], "english")
+        self.assertFalse(entries["400"]["success"])
 
     def test_concurrent_writes_for_different_apps_preserve_both_entries(self):
         with TemporaryDirectory() as temp_dir:
-            cache = AppDetailsFileCache(Path(temp_dir) / "cache_app_details")
+            cache = AppDetailsStore(Path(temp_dir) / "cache_app_details")
             threads = [
                 threading.Thread(target=cache.write_entry, args=(app_id, {"name": app_id}, True))
                 for app_id in ("570", "400")
@@ -99,52 +152,153 @@ class AppDetailsFileCacheTests(unittest.TestCase):
 
             self.assertEqual(cache.get_metadata("570"), {"name": "570"})
             self.assertEqual(cache.get_metadata("400"), {"name": "400"})
+            cache.close()
+
+    def test_entries_are_shared_between_store_instances(self):
+        with TemporaryDirectory() as temp_dir:
+            first = AppDetailsStore(Path(temp_dir) / "cache_app_details")
+            second = AppDetailsStore(Path(temp_dir) / "cache_app_details")
+            first.read_entry("570")
+            second.write_entry("570", {"name": "Dota 2"}, success=True)
+
+            self.assertEqual(first.get_metadata("570"), {"name": "Dota 2"})
+            first.close()
+            second.close()
 
     def test_cleanup_removes_old_entries_and_retains_recent_entries(self):
         with TemporaryDirectory() as temp_dir:
-            cache = AppDetailsFileCache(Path(temp_dir) / "cache_app_details")
+            cache = AppDetailsStore(Path(temp_dir) / "cache_app_details")
             cache.write_entry("570", {"name": "old"}, success=True)
             cache.write_entry("400", {"name": "recent"}, success=True)
             now = time.time()
-            old_path = cache.entry_path("570")
-            os.utime(old_path, (now - APP_DETAILS_FILE_MAX_AGE_SECONDS - 1,) * 2)
+            self.set_last_access(cache, "570", now - APP_DETAILS_FILE_MAX_AGE_SECONDS - 1)
 
-            cache.cleanup(now=now, force=True)
+            self.assertTrue(cache.cleanup(now=now, force=True))
 
-            self.assertFalse(old_path.exists())
-            self.assertTrue(cache.entry_path("400").exists())
+            self.assertIsNone(cache.read_entry("570", touch=False))
+            self.assertIsNotNone(cache.read_entry("400", touch=False))
+            self.assertFalse(cache.cleanup(now=now + 1))
+            cache.close()
 
-    def test_cleanup_enforces_file_cap_by_removing_oldest_entries(self):
+    def test_cleanup_enforces_entry_cap_by_evicting_least_recently_used(self):
         with TemporaryDirectory() as temp_dir:
-            cache = AppDetailsFileCache(Path(temp_dir) / "cache_app_details")
+            cache = AppDetailsStore(Path(temp_dir) / "cache_app_details")
             now = time.time()
-            for app_id in range(1, MAX_CACHE_FILES + 2):
-                cache.write_entry(str(app_id), {"name": str(app_id)}, success=True)
-                path = cache.entry_path(str(app_id))
-                os.utime(path, (now + app_id,) * 2)
+            app_ids = [str(app_id) for app_id in range(1, MAX_CACHE_ENTRIES + 2)]
+            cache.write_many({app_id: ({"name": app_id}, True) for app_id in app_ids})
+            cache.connect().executemany(
+                "UPDATE app_details SET last_access = ? WHERE app_id = ?",
+                [(now + int(app_id), app_id) for app_id in app_ids],
+            )
+            self.set_last_access(cache, "1", now + MAX_CACHE_ENTRIES + 10)
 
-            cache.cleanup(now=now + MAX_CACHE_FILES + 2, force=True)
+            cache.cleanup(now=now + MAX_CACHE_ENTRIES + 20, force=True)
 
-            self.assertFalse(cache.entry_path("1").exists())
-            self.assertTrue(cache.entry_path(str(MAX_CACHE_FILES + 1)).exists())
+            self.assertEqual(cache.count_entries(), MAX_CACHE_ENTRIES)
+            self.assertIsNotNone(cache.read_entry("1", touch=False))
+            self.assertIsNone(cache.read_entry("2", touch=False))
+            cache.close()
 
-    def test_cache_hit_touches_file_no_more_than_once_per_day(self):
+    def test_cache_hit_touches_entry_no_more_than_once_per_day(self):
         with TemporaryDirectory() as temp_dir:
-            cache = AppDetailsFileCache(Path(temp_dir) / "cache_app_details")
+            cache = AppDetailsStore(Path(temp_dir) / "cache_app_details")
             cache.write_entry("570", {"name": "Dota 2"}, success=True)
-            path = cache.entry_path("570")
-            old_mtime = path.stat().st_mtime - 2 * 24 * 60 * 60
-            os.utime(path, (old_mtime, old_mtime))
+            now = time.time()
+            old_access = now - 2 * 24 * 60 * 60
+            self.set_last_access(cache, "570", old_access)
+
+            cache.read_entry("570", now=now)
+            self.assertEqual(self.get_last_access(cache, "570"), now)
+            self.set_last_access(cache, "570", old_access)
+            cache.read_entry("570", now=now + 60)
+
+            self.assertEqual(self.get_last_access(cache, "570"), old_access)
+            cache.close()
 
-            with patch("steamflow.app_details.os.utime") as mocked_utime:
-                cache.get_metadata("570")
-                cache.get_metadata("570")
+    def test_search_entries_follow_writes_language_and_cleanup(self):
+        with TemporaryDirectory() as temp_dir:
+            cache = AppDetailsStore(Path(temp_dir) / "cache_app_details")
+            cache.write_many(
+                {
+                    "570": ({"name": " Dota 2 ", "type": "Game", "price": {"final": 0, "discount_percent": 0}}, True),
+                    "400": ({"name": "Portal", "has_price": True, "price": {"final": 199, "discount_percent": 90}}, True),
+                },
+                steam_language="english",
+            )
+            cache.write_entry("730", {"name": "CS2"}, success=True, steam_language="german")
+            cache.write_entry("570", None, success=False, steam_language="english")
+            entries = cache.read_search_entries(["570", "400", "730"], "us", "english")
+            now = time.time()
+            self.set_last_access(cache, "400", now - APP_DETAILS_FILE_MAX_AGE_SECONDS - 1)
+            signature = cache.get_change_signature()
+            cache.cleanup(now=now, force=True)
+            cleaned_entries = cache.read_search_entries(["400"], "us", "english")
+            cleaned_signature = cache.get_change_signature()
+            cache.close()
 
-        mocked_utime.assert_called_once()
+        self.assertEqual(list(entries), ["400"])
+        self.assertEqual(
+            entries["400"],
+            {
+                "name": "portal",
+                "type": "",
+                "is_free": False,
+                "has_price": True,
+                "final_price": 199,
+                "discount_percent": 90,
+                "coming_soon": False,
+            },
+        )
+        self.assertEqual(cleaned_entries, {})
+        self.assertNotEqual(cleaned_signature, signature)
+
+    def test_change_signature_tracks_writes_from_other_connections(self):
+        with TemporaryDirectory() as temp_dir:
+            reader = AppDetailsStore(Path(temp_dir) / "cache_app_details")
+            writer = AppDetailsStore(Path(temp_dir) / "cache_app_details")
+            signature = reader.get_change_signature()
+            unchanged = reader.get_change_signature()
+            writer.write_entry("570", {"name": "Dota 2"}, success=True, steam_language="english")
+            changed = reader.get_change_signature()
+            entries = reader.read_search_entries(["570"], "us", "english")
+            reader.close()
+            writer.close()
+
+        self.assertEqual(unchanged, signature)
+        self.assertNotEqual(changed, signature)
+        self.assertEqual(entries["570"]["name"], "dota 2")
+
+    def test_directory_layout_is_migrated_into_database(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_dir = Path(temp_dir) / "cache_app_details"
+            country_dir = cache_dir / "kz"
+            country_dir.mkdir(parents=True)
+            legacy_path = country_dir / "570.json"
+            legacy_path.write_text(
+                json.dumps({"timestamp": 123, "success": True, "metadata": {"name": "Dota 2"}}),
+                encoding="utf-8",
+            )
+            os.utime(legacy_path, (456, 456))
+            (cache_dir / ".last_cleanup.json").write_text("{}", encoding="utf-8")
+
+            cache = AppDetailsStore(cache_dir)
+            entry = cache.read_entry("570", "kz", touch=False)
+            last_access = self.get_last_access(cache, "570", "kz")
+            search_entries = cache.read_search_entries(["570"], "kz", "english")
+            cache.close()
+
+            self.assertFalse(country_dir.exists())
+            self.assertFalse((cache_dir / ".last_cleanup.json").exists())
+
+        self.assertEqual(entry["timestamp"], 123)
+        self.assertEqual(entry["metadata"], {"name": "Dota 2"})
+        self.assertIsNone(entry["steam_language"])
+        self.assertEqual(last_access, 456)
+        self.assertEqual(search_entries["570"]["name"], "dota 2")
 
-    def test_legacy_cache_migration_writes_region_file(self):
+    def test_legacy_cache_migration_writes_region_entry(self):
         with TemporaryDirectory() as temp_dir:
-            cache = AppDetailsFileCache(Path(temp_dir) / "cache_app_details")
+            cache = AppDetailsStore(Path(temp_dir) / "cache_app_details")
 
             cache.migrate_legacy_entries(
                 {
@@ -158,6 +312,7 @@ class AppDetailsFileCacheTests(unittest.TestCase):
             )
 
             entry = cache.read_entry("1451940", "kz", touch=False)
+            cache.close()
 
         self.assertEqual(entry["timestamp"], 123)
         self.assertEqual(entry["metadata"], {"type": "game"})
@@ -174,6 +329,7 @@ class AppDetailsFileCacheTests(unittest.TestCase):
             )
 
             metadata = provider.get_metadata("1451940")
+            cache.close()
 
         self.assertEqual(metadata, {"type": "game", "is_free": False})
         self.assertEqual(fetch_calls, [])
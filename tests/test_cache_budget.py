@@ -0,0 +1,187 @@
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow.cache_budget import (
+    CACHE_KIND_FILES,
+    CacheBudgetRegistry,
+    CacheSpec,
+    delete_cache_entries,
+    format_cache_size,
+)
+from steamflow.core import SteamPluginCoreMixin
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 10_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CacheBudgetHarness(SteamPluginCoreMixin):
+    def __init__(self, temp_dir):
+        self.cache_dir = Path(temp_dir) / "cache_img"
+        self.avatar_cache_dir = Path(temp_dir) / "cache_avatar"
+        self.metric_cache_file = Path(temp_dir) / "cache_metric.json"
+        self.cache_budget_index_file = Path(temp_dir) / "cache_budget.json"
+        self.state_lock = threading.RLock()
+        self.slow_calls = []
+
+    def log_slow_call(self, name, elapsed_ms, details=""):
+        self.slow_calls.append((name, details))
+
+
+def write_cache_file(path, size, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class CacheBudgetRegistryTests(unittest.TestCase):
+    def build_registry(self, root, budget_bytes, clock):
+        return CacheBudgetRegistry(
+            [
+                CacheSpec("thumbnails", Path(root) / "thumbs", priority=0, pinned_names=("manifest.json",)),
+                CacheSpec("images", Path(root) / "images", ttl_seconds=100, priority=1),
+                CacheSpec("metrics", [Path(root) / "cache_metric.json"], kind=CACHE_KIND_FILES),
+            ],
+            budget_bytes,
+            touch_interval_seconds=10,
+            clock=clock,
+        )
+
+    def test_evictions_drop_expired_entries_then_lowest_priority_least_recent(self):
+        clock = FakeClock()
+        registry = self.build_registry("/cache", budget_bytes=250, clock=clock)
+        registry.entries["images"] = {"old.png": [clock.now - 500, 100], "new.png": [clock.now, 100]}
+        registry.entries["thumbnails"] = {"a.png": [clock.now - 5, 100], "b.png": [clock.now - 1, 100]}
+
+        victims = registry.plan_evictions()
+
+        self.assertEqual(
+            victims,
+            [("images", "old.png", 100), ("thumbnails", "a.png", 100)],
+        )
+
+    def test_unreferenced_entries_are_evicted_even_under_budget(self):
+        clock = FakeClock()
+        registry = self.build_registry("/cache", budget_bytes=1000, clock=clock)
+        registry.entries["thumbnails"] = {
+            "kept.png": [clock.now - 50, 10],
+            "orphan.png": [clock.now - 50, 10],
+            "new.png": [clock.now, 10],
+        }
+
+        unreferenced = registry.list_unreferenced_entries("thumbnails", {"kept.png"}, clock.now - 10)
+        victims = registry.plan_evictions(unreferenced=unreferenced)
+
+        self.assertEqual(unreferenced, [("thumbnails", "orphan.png")])
+        self.assertEqual(victims, [("thumbnails", "orphan.png", 10)])
+
+    def test_record_access_skips_rewrites_inside_touch_interval(self):
+        clock = FakeClock()
+        registry = self.build_registry("/cache", budget_bytes=1000, clock=clock)
+
+        self.assertTrue(registry.record_access("images", "/cache/images/570.png", size=10))
+        registry.dirty = False
+        clock.now += 5
+        self.assertFalse(registry.record_access("images", "/cache/images/570.png"))
+        self.assertTrue(registry.record_access("images", "/cache/images/570.png", size=20))
+        self.assertFalse(registry.record_access("metrics", "/cache/cache_metric.json"))
+
+        self.assertEqual(registry.entries["images"]["570.png"], [clock.now, 20])
+        self.assertTrue(registry.dirty)
+
+    def test_merge_keeps_newest_access_and_skips_evicted_entries(self):
+        clock = FakeClock()
+        registry = self.build_registry("/cache", budget_bytes=1000, clock=clock)
+        other = self.build_registry("/cache", budget_bytes=1000, clock=clock)
+        registry.entries["images"] = {"570.png": [5.0, 10], "400.png": [5.0, 10]}
+        other.entries["images"] = {"570.png": [9.0, 10], "400.png": [9.0, 10], "730.png": [1.0, 10]}
+        other.indexed.add("images")
+        registry.remove_entries([("images", "400.png", 10)])
+
+        registry.merge_payload(json.loads(json.dumps(other.to_payload())))
+        moved = self.build_registry("/elsewhere", budget_bytes=1000, clock=clock)
+        moved.merge_payload(other.to_payload())
+
+        self.assertEqual(registry.entries["images"], {"570.png": [9.0, 10], "730.png": [1.0, 10]})
+        self.assertEqual(registry.list_unindexed_caches(), ["thumbnails"])
+        self.assertEqual(moved.entries["images"], {})
+
+    def test_delete_cache_entries_treats_missing_files_as_removed(self):
+        with TemporaryDirectory() as temp_dir:
+            registry = self.build_registry(temp_dir, budget_bytes=0, clock=FakeClock())
+            icon_path = write_cache_file(Path(temp_dir) / "images" / "570.png", 10, 1)
+
+            removed = delete_cache_entries(registry, [("images", "570.png", 10), ("images", "gone.png", 5)])
+
+            self.assertFalse(icon_path.exists())
+
+        self.assertEqual(removed, [("images", "570.png", 10), ("images", "gone.png", 5)])
+
+    def test_format_cache_size_uses_readable_units(self):
+        self.assertEqual(
+            [format_cache_size(size) for size in (512, 2048, 3 * 1024 * 1024)],
+            ["512 B", "2.0 KB", "3.0 MB"],
+        )
+
+
+class CacheBudgetPluginTests(unittest.TestCase):
+    def test_enforce_indexes_directories_once_and_evicts_over_budget(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = CacheBudgetHarness(temp_dir)
+            now = time.time()
+            write_cache_file(plugin.metric_cache_file, 10, now)
+            write_cache_file(plugin.cache_dir / "expired.png", 10, now - 4 * 24 * 60 * 60)
+            write_cache_file(plugin.cache_dir / "old.png", 10, now - 60)
+            write_cache_file(plugin.cache_dir / "recent.png", 10, now - 30)
+            write_cache_file(plugin.avatar_cache_dir / "frame.png", 10, now - 120)
+            registry = plugin.get_cache_budget_registry()
+            registry.budget_bytes = 30
+
+            first = plugin.enforce_cache_budget(force=True)
+            write_cache_file(plugin.cache_dir / "unindexed.png", 10, now)
+            second = plugin.enforce_cache_budget()
+            remaining = sorted(path.name for path in plugin.cache_dir.iterdir())
+            payload = json.loads(plugin.cache_budget_index_file.read_text(encoding="utf-8"))
+
+        self.assertEqual(first, {"evicted": 2, "freed_bytes": 20})
+        self.assertIsNone(second)
+        self.assertEqual(remaining, ["recent.png", "unindexed.png"])
+        self.assertEqual(list(payload["caches"]["images"]["entries"]), ["recent.png"])
+        self.assertTrue(payload["caches"]["avatars"]["indexed"])
+
+    def test_footprint_includes_single_file_caches_and_survives_restart(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = CacheBudgetHarness(temp_dir)
+            write_cache_file(plugin.metric_cache_file, 40, 1)
+            icon_path = write_cache_file(plugin.cache_dir / "570.png", 25, 1)
+            plugin.record_cache_access("images", icon_path)
+            self.assertTrue(plugin.save_cache_budget_index())
+
+            footprint = CacheBudgetHarness(temp_dir).get_cache_footprint()
+
+        self.assertEqual(footprint["budget_bytes"], SteamPluginCoreMixin.CONFIG.cache.disk_budget_bytes)
+        self.assertEqual(footprint["caches"]["images"], 25)
+        self.assertEqual(footprint["caches"]["metrics"], 40)
+        self.assertEqual(footprint["caches"]["avatars"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
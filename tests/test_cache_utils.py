@@ -1,6 +1,8 @@
+import os
 import sys
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 LIB_PATH = PROJECT_ROOT / "lib"
@@ -12,11 +14,44 @@ if str(LIB_PATH) not in sys.path:
 from steamflow.cache_utils import (
     cleanup_app_details_cache_entries,
     cleanup_timestamped_cache_entries,
+    exclusive_lock_file,
+    get_path_signature,
     get_timestamped_cache_entry_state,
     update_timestamped_cache_entry,
 )
 
 
+class PathSignatureTests(unittest.TestCase):
+    def test_get_path_signature_tracks_size_and_missing_files(self):
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "settings.json"
+            missing = get_path_signature(path)
+            path.write_text("{}", encoding="utf-8")
+            signature = get_path_signature(path)
+
+        self.assertIsNone(missing)
+        self.assertIsNone(get_path_signature(None))
+        self.assertEqual(signature[1], 2)
+
+
+class ExclusiveLockFileTests(unittest.TestCase):
+    def test_lock_times_out_while_held_and_breaks_stale_locks(self):
+        with TemporaryDirectory() as temp_dir:
+            lock_file = Path(temp_dir) / "jobs.json.lock"
+            with exclusive_lock_file(lock_file):
+                with self.assertRaises(TimeoutError):
+                    with exclusive_lock_file(lock_file, timeout=0.05):
+                        pass
+            released = lock_file.exists()
+            lock_file.write_text("123", encoding="ascii")
+            os.utime(lock_file, (1, 1))
+            with exclusive_lock_file(lock_file, timeout=0):
+                reacquired = lock_file.read_text(encoding="ascii")
+
+        self.assertFalse(released)
+        self.assertEqual(reacquired, str(os.getpid()))
+
+
 class TimestampedCacheTests(unittest.TestCase):
     def test_update_timestamped_cache_entry_normalizes_key_and_payload(self):
         cache = {}
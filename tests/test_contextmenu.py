@@ -16,6 +16,7 @@ from tests._pyflowlauncher_stub import install_pyflowlauncher_stub
 
 install_pyflowlauncher_stub()
 
+from steamflow.app_details import AppDetailsStore
 from steamflow.contextmenu import SteamContextMenuPlugin
 from steamflow.feature_health import record_feature_failure
 import main
@@ -135,7 +136,10 @@ class ContextMenuRefundTests(unittest.TestCase):
 
             self.assertEqual(refund_state, "likely")
             self.assertEqual(plugin.fetch_calls, ["1451940"])
-            cache_data = json.loads((Path(temp_dir) / "cache_app_details" / "us" / "1451940.json").read_text(encoding="utf-8"))
+            cache = AppDetailsStore(Path(temp_dir) / "cache_app_details")
+            cache_data = cache.read_entry("1451940", touch=False)
+            cache.close()
+            plugin.app_details_cache_store.close()
             self.assertTrue(cache_data["success"])
 
     def test_store_context_menu_adds_cart_entry(self):
@@ -21,7 +21,9 @@ from steamflow.download_control import (
 from steamflow.os_integration import STEAM_GAMES_URI
 from steamflow.session_token import (
     STEAM_ACCOUNT_PREFERENCES_URI,
+    HtmlcacheTokenIndex,
     SteamSessionTokenProvider,
+    collect_htmlcache_webapi_tokens,
     extract_webapi_tokens_from_bytes,
     get_htmlcache_cache_data_files,
     scan_cache_file_for_webapi_tokens,
@@ -216,6 +218,57 @@ class DownloadControlUtilityTests(unittest.TestCase):
 
         self.assertEqual(cache_files, [fragment_file])
 
+    def test_extract_webapi_tokens_from_bytes_keeps_file_order_across_token_formats(self):
+        first_token = make_test_jwt({"sub": "1", "exp": 4102444800})
+        second_token = make_test_jwt({"sub": "2", "exp": 4102444800})
+        blob = (
+            f"access_token={first_token}&x=1".encode("utf-8")
+            + b"\x00"
+            + f'"loyalty_webapi_token":"{second_token}"'.encode("utf-8")
+            + f'"webapi_token":"{first_token}"'.encode("utf-8")
+        )
+
+        self.assertEqual(extract_webapi_tokens_from_bytes(blob), [first_token, second_token])
+
+    def test_collect_htmlcache_tokens_reuses_index_and_stops_at_matching_token(self):
+        matching_token = make_test_jwt({"sub": "76561198000000000", "exp": 4102444800})
+        older_token = make_test_jwt({"sub": "76561198000000000", "exp": 4102444700})
+        with TemporaryDirectory() as temp_dir:
+            cache_data_dir = Path(temp_dir) / "Steam" / "htmlcache" / "Default" / "Cache" / "Cache_Data"
+            cache_data_dir.mkdir(parents=True)
+            newest_file = cache_data_dir / "f_000002"
+            empty_file = cache_data_dir / "data_1"
+            oldest_file = cache_data_dir / "data_0"
+            newest_file.write_bytes(f'"webapi_token":"{matching_token}"'.encode("utf-8"))
+            empty_file.write_bytes(b"\x00" * 32)
+            oldest_file.write_bytes(f'"webapi_token":"{older_token}"'.encode("utf-8"))
+            os.utime(oldest_file, (1700000000, 1700000000))
+            os.utime(empty_file, (1700000010, 1700000010))
+            os.utime(newest_file, (1700000020, 1700000020))
+            token_index = HtmlcacheTokenIndex()
+            scanned_files = []
+
+            def open_for_test(path):
+                scanned_files.append(Path(path).name)
+                return open(path, "rb")
+
+            with patch("steamflow.session_token._open_file_shared_read", side_effect=open_for_test):
+                all_tokens = collect_htmlcache_webapi_tokens(localappdata=temp_dir, token_index=token_index)
+                first_scan = list(scanned_files)
+                indexed_tokens = collect_htmlcache_webapi_tokens(localappdata=temp_dir, token_index=token_index)
+                early_tokens = collect_htmlcache_webapi_tokens(
+                    localappdata=temp_dir,
+                    steamid64="76561198000000000",
+                    now=1700000000,
+                )
+
+        self.assertEqual(all_tokens, [matching_token, older_token])
+        self.assertEqual(first_scan, ["f_000002", "data_1", "data_0"])
+        self.assertEqual(indexed_tokens, all_tokens)
+        self.assertEqual(scanned_files, first_scan + ["f_000002"])
+        self.assertEqual(early_tokens, [matching_token])
+        self.assertEqual(token_index.get_tokens(empty_file, (1700000010 * 10**9, 32)), [])
+
     def test_select_best_webapi_token_prefers_matching_steamid_and_latest_expiry(self):
         stale_token = make_test_jwt({"sub": "76561198000000000", "exp": 4102444700, "iat": 100})
         fresh_token = make_test_jwt({"sub": "76561198000000000", "exp": 4102444800, "iat": 200})
@@ -8,7 +8,9 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from steamflow.cache_utils import exclusive_lock_file
 from steamflow.feature_health import (
+    FeatureHealthStore,
     feature_enabled,
     get_feature_health_status,
     record_feature_failure,
@@ -142,5 +144,75 @@ class FeatureHealthTests(unittest.TestCase):
         self.assertEqual(status["last_reason"], "debug_disabled")
 
 
+class FeatureHealthStoreTests(unittest.TestCase):
+    def test_reads_reuse_loaded_state_until_file_changes(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "cache_feature_health.json"
+            store = FeatureHealthStore(cache_file)
+
+            for _ in range(5):
+                self.assertTrue(store.enabled("steam_cart", now=100))
+            other = FeatureHealthStore(cache_file)
+            for offset in range(3):
+                other.record_failure("steam_cart", "HTTP 403", reason="cart_rejected", now=100 + offset)
+
+            enabled_after_external_write = store.enabled("steam_cart", now=110)
+
+        self.assertFalse(enabled_after_external_write)
+        self.assertEqual(store.reloads, 2)
+
+    def test_concurrent_writers_merge_instead_of_clobbering(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "cache_feature_health.json"
+            first = FeatureHealthStore(cache_file)
+            second = FeatureHealthStore(cache_file)
+            first.get_status("download_control")
+            second.get_status("download_control")
+
+            first.record_failure("download_control", "boom", reason="timeout", now=100)
+            second.record_success("steam_cart", now=101)
+            second.record_failure("download_control", "boom", reason="timeout", now=102)
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+
+        self.assertEqual(data["download_control"]["failures"], 2)
+        self.assertEqual(data["steam_cart"]["last_success"], 101)
+
+    def test_flush_waits_for_lock_and_keeps_updates_until_written(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "cache_feature_health.json"
+            store = FeatureHealthStore(cache_file, lock_timeout_seconds=0.05)
+
+            with exclusive_lock_file(store.lock_file):
+                store.record_failure("steam_cart", "HTTP 403", reason="cart_rejected", now=100)
+                blocked_pending = list(store.pending_updates)
+                written_while_locked = cache_file.exists()
+            flushed = store.flush()
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+
+        self.assertEqual(len(blocked_pending), 1)
+        self.assertFalse(written_while_locked)
+        self.assertTrue(flushed)
+        self.assertEqual(store.lock_timeouts, 1)
+        self.assertEqual(data["steam_cart"]["failures"], 1)
+        self.assertFalse(store.lock_file.exists())
+
+    def test_batch_applies_updates_in_one_write(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "cache_feature_health.json"
+            store = FeatureHealthStore(cache_file)
+
+            with store.batch():
+                store.record_failure("steam_session_token", "missing", reason="token_not_found", now=100)
+                store.record_failure("steam_wishlist", "missing", reason="dependency_failed", now=100)
+                self.assertFalse(cache_file.exists())
+                self.assertEqual(store.get_status("steam_wishlist", now=100)["state"], "suspect")
+
+            data = json.loads(cache_file.read_text(encoding="utf-8"))
+
+        self.assertEqual(data["steam_session_token"]["last_reason"], "token_not_found")
+        self.assertEqual(data["steam_wishlist"]["failures"], 1)
+        self.assertEqual(store.pending_updates, [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -16,8 +16,33 @@ if str(LIB_PATH) not in sys.path:
 if "vdf" not in sys.modules:
     sys.modules["vdf"] = SimpleNamespace(load=lambda *_args, **_kwargs: {}, dump=lambda *_args, **_kwargs: None)
 
+import steamflow.local_stats as local_stats_module
 from steamflow.accounts import SteamPluginAccountsMixin
 from steamflow.local import SteamPluginLocalMixin
+from steamflow.local_library_service import InstalledGamesSnapshot
+
+LOCALCONFIG_APPS_TEXT = (
+    '"UserLocalConfigStore"\n'
+    "{\n"
+    '\t"Software"\n'
+    "\t{\n"
+    '\t\t"Valve"\n'
+    "\t\t{\n"
+    '\t\t\t"Steam"\n'
+    "\t\t\t{\n"
+    '\t\t\t\t"Apps"\n'
+    "\t\t\t\t{\n"
+    '\t\t\t\t\t"570"\n'
+    "\t\t\t\t\t{\n"
+    '\t\t\t\t\t\t"Playtime"\t\t"11290"\n'
+    '\t\t\t\t\t\t"LastPlayed"\t\t"1776516641"\n'
+    "\t\t\t\t\t}\n"
+    "\t\t\t\t}\n"
+    "\t\t\t}\n"
+    "\t\t}\n"
+    "\t}\n"
+    "}\n"
+)
 
 
 class LoginusersCacheHarness(SteamPluginAccountsMixin):
@@ -40,9 +65,13 @@ class AppManifestCacheHarness(SteamPluginLocalMixin):
     STATE_FLAG_UPDATE_PAUSED = 512
     STATE_FLAG_UPDATE_STARTED = 1024
 
-    def __init__(self):
+    def __init__(self, installed_games_cache_file=None):
         self.state_lock = threading.RLock()
         self.appmanifest_cache = {}
+        self.installed_games_cache_file = installed_games_cache_file
+        self.installed_games = {}
+        self.installed_game_paths = {}
+        self.installed_game_statuses = {}
         self.logged_exceptions = []
 
     def log_exception(self, message):
@@ -50,9 +79,10 @@ class AppManifestCacheHarness(SteamPluginLocalMixin):
 
 
 class LocalconfigStatsHarness(SteamPluginLocalMixin):
-    def __init__(self, localconfig_path):
+    def __init__(self, localconfig_path, localconfig_stats_cache_file=None):
         self.state_lock = threading.RLock()
         self.localconfig_path = Path(localconfig_path)
+        self.localconfig_stats_cache_file = localconfig_stats_cache_file
         self.localconfig_mtime = 0
         self.playtime_minutes = {}
         self.last_played_timestamps = {}
@@ -75,11 +105,11 @@ class LoginusersCacheTests(unittest.TestCase):
             plugin = LoginusersCacheHarness(steam_path)
             load_calls = []
 
-            def fake_load(_file_obj):
+            def fake_load(_path, key_path=None):
                 load_calls.append("load")
                 return {"users": {"76561198000000000": {"AccountName": "alpha"}}}
 
-            with patch("steamflow.accounts.vdf.load", side_effect=fake_load):
+            with patch("steamflow.account_service.load_vdf_path", side_effect=fake_load):
                 first = plugin.load_loginusers_data()
                 second = plugin.load_loginusers_data()
                 time.sleep(0.01)
@@ -91,6 +121,51 @@ class LoginusersCacheTests(unittest.TestCase):
             self.assertEqual(third["users"]["76561198000000000"]["AccountName"], "alpha")
             self.assertEqual(load_calls, ["load", "load"])
 
+    def test_live_status_skips_unchanged_snapshot_manifests(self):
+        with TemporaryDirectory() as temp_dir:
+            manifest_path = Path(temp_dir) / "appmanifest_570.acf"
+            manifest_path.write_text('"AppState"\n{\n}\n', encoding="utf-8")
+            plugin = AppManifestCacheHarness()
+            plugin.installed_game_manifests = {"570": str(manifest_path)}
+            derive_calls = []
+            plugin.derive_appmanifest_status_label = lambda app_id, _flags, _data: derive_calls.append(app_id) or "Updating"
+            plugin.get_appmanifest_path_for_app_id = lambda _app_id: self.fail("snapshot manifest path should be reused")
+
+            def fake_load(_path, key_path=None):
+                return {"AppState": {"appid": "570", "name": "Dota 2", "StateFlags": "4"}}
+
+            with patch("steamflow.local_library_service.load_vdf_path", side_effect=fake_load):
+                plugin.load_appmanifest_data(manifest_path)
+                unchanged = plugin.get_live_local_game_status("570", "")
+                updating = plugin.get_live_local_game_status("570", "Update Paused")
+                time.sleep(0.01)
+                manifest_path.write_text('"AppState"\n{\n\t"extra"\t"1"\n}\n', encoding="utf-8")
+                changed = plugin.get_live_local_game_status("570", "")
+
+        self.assertEqual(unchanged, "")
+        self.assertEqual(updating, "Updating")
+        self.assertEqual(changed, "Updating")
+        self.assertEqual(derive_calls, ["570", "570"])
+
+    def test_installed_games_cache_restores_search_index(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "cache_installed_games.json"
+            installed_games = {"1174180": "Red Dead Redemption 2", "1145360": "Hades"}
+            snapshot = InstalledGamesSnapshot(installed_games=installed_games)
+            first_plugin = AppManifestCacheHarness(cache_file)
+            search_index = first_plugin.build_local_search_index(installed_games)
+            saved = first_plugin.save_installed_games_cache(snapshot, search_index=search_index)
+
+            next_plugin = AppManifestCacheHarness(cache_file)
+            next_plugin.load_installed_games_cache()
+            restored_index = next_plugin.local_search_index
+            reused_index = next_plugin.build_local_search_index(dict(installed_games))
+
+        self.assertTrue(saved)
+        self.assertIsNotNone(restored_index)
+        self.assertIs(reused_index, restored_index)
+        self.assertEqual(next_plugin.search_local_games("rdr2"), [("1174180", "Red Dead Redemption 2")])
+
 
 class AppManifestCacheTests(unittest.TestCase):
     def test_load_appmanifest_data_reuses_cache_until_signature_changes(self):
@@ -100,7 +175,7 @@ class AppManifestCacheTests(unittest.TestCase):
             plugin = AppManifestCacheHarness()
             load_calls = []
 
-            def fake_load(_file_obj):
+            def fake_load(_path, key_path=None):
                 load_calls.append("load")
                 return {
                     "AppState": {
@@ -111,7 +186,7 @@ class AppManifestCacheTests(unittest.TestCase):
                     }
                 }
 
-            with patch("steamflow.local.vdf.load", side_effect=fake_load):
+            with patch("steamflow.local_library_service.load_vdf_path", side_effect=fake_load):
                 first = plugin.load_appmanifest_data(manifest_path)
                 second = plugin.load_appmanifest_data(manifest_path)
                 time.sleep(0.01)
@@ -135,38 +210,82 @@ class AppManifestCacheTests(unittest.TestCase):
         self.assertIn("keep", plugin.appmanifest_cache)
         self.assertNotIn("drop", plugin.appmanifest_cache)
 
+    def test_installed_games_cache_skips_unchanged_manifests_in_next_process(self):
+        with TemporaryDirectory() as temp_dir:
+            manifest_path = Path(temp_dir) / "appmanifest_1451940.acf"
+            manifest_path.write_text('"AppState"\n{\n}\n', encoding="utf-8")
+            cache_file = Path(temp_dir) / "cache_installed_games.json"
+            load_calls = []
+
+            def fake_load(_path, key_path=None):
+                load_calls.append("load")
+                return {"AppState": {"appid": "1451940", "name": "NEEDY GIRL OVERDOSE", "StateFlags": "4"}}
+
+            with patch("steamflow.local_library_service.load_vdf_path", side_effect=fake_load):
+                first_plugin = AppManifestCacheHarness(cache_file)
+                first_plugin.load_appmanifest_data(manifest_path)
+                snapshot = InstalledGamesSnapshot(
+                    installed_games={"1451940": "NEEDY GIRL OVERDOSE"},
+                    manifest_keys_in_use={str(manifest_path)},
+                )
+                saved = first_plugin.save_installed_games_cache(snapshot)
+                saved_again = first_plugin.save_installed_games_cache(snapshot)
+
+                next_plugin = AppManifestCacheHarness(cache_file)
+                next_plugin.load_installed_games_cache()
+                cached = next_plugin.load_appmanifest_data(manifest_path)
+                time.sleep(0.01)
+                manifest_path.write_text('"AppState"\n{\n\t"extra"\t"1"\n}\n', encoding="utf-8")
+                next_plugin.load_appmanifest_data(manifest_path)
+
+            self.assertTrue(saved)
+            self.assertFalse(saved_again)
+            self.assertEqual(cached["name"], "NEEDY GIRL OVERDOSE")
+            self.assertEqual(next_plugin.installed_games, {"1451940": "NEEDY GIRL OVERDOSE"})
+            self.assertEqual(load_calls, ["load", "load"])
+
 
 class LocalconfigStatsTests(unittest.TestCase):
     def test_load_localconfig_stats_reads_uppercase_apps_section(self):
         with TemporaryDirectory() as temp_dir:
             localconfig_path = Path(temp_dir) / "localconfig.vdf"
-            localconfig_path.write_text("", encoding="utf-8")
+            localconfig_path.write_text(LOCALCONFIG_APPS_TEXT, encoding="utf-8")
             plugin = LocalconfigStatsHarness(localconfig_path)
 
-            with patch(
-                "steamflow.local.vdf.load",
-                return_value={
-                    "UserLocalConfigStore": {
-                        "Software": {
-                            "Valve": {
-                                "Steam": {
-                                    "Apps": {
-                                        "570": {
-                                            "Playtime": "11290",
-                                            "LastPlayed": "1776516641",
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                },
-            ):
-                playtimes, last_played = plugin.load_localconfig_stats()
+            playtimes, last_played = plugin.load_localconfig_stats()
 
         self.assertEqual(playtimes["570"], 11290)
         self.assertEqual(last_played["570"], 1776516641)
 
+    def test_load_localconfig_stats_reuses_index_until_signature_changes(self):
+        with TemporaryDirectory() as temp_dir:
+            localconfig_path = Path(temp_dir) / "localconfig.vdf"
+            localconfig_path.write_text(LOCALCONFIG_APPS_TEXT, encoding="utf-8")
+            cache_file = Path(temp_dir) / "cache_localconfig_stats.json"
+            parse_calls = []
+            original_loader = local_stats_module.load_localconfig_app_stats_file
+
+            def counting_loader(path):
+                parse_calls.append(path)
+                return original_loader(path)
+
+            with patch.object(local_stats_module, "load_localconfig_app_stats_file", side_effect=counting_loader):
+                LocalconfigStatsHarness(localconfig_path, cache_file).load_localconfig_stats()
+                cached_playtimes, _cached_last_played = LocalconfigStatsHarness(
+                    localconfig_path,
+                    cache_file,
+                ).load_localconfig_stats()
+                time.sleep(0.01)
+                localconfig_path.write_text(LOCALCONFIG_APPS_TEXT.replace("11290", "11300"), encoding="utf-8")
+                changed_playtimes, _changed_last_played = LocalconfigStatsHarness(
+                    localconfig_path,
+                    cache_file,
+                ).load_localconfig_stats()
+
+        self.assertEqual(len(parse_calls), 2)
+        self.assertEqual(cached_playtimes["570"], 11290)
+        self.assertEqual(changed_playtimes["570"], 11300)
+
     def test_get_active_local_persona_state_reads_friend_store_local_prefs(self):
         with TemporaryDirectory() as temp_dir:
             localconfig_path = Path(temp_dir) / "localconfig.vdf"
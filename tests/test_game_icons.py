@@ -0,0 +1,177 @@
+import json
+import sys
+import threading
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow.game_icons import GameIconPipeline, download_game_icon_batch
+from steamflow.store_metrics import SteamPluginStoreMetricsMixin
+from steamflow.tasks import BackgroundTaskManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class InlineThread:
+    def __init__(self, target=None, daemon=None):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+class IconHarness(SteamPluginStoreMetricsMixin):
+    DEFAULT_ICON = "default.png"
+
+    def __init__(self, temp_dir):
+        self.cache_dir = Path(temp_dir) / "cache_img"
+        self.cache_dir.mkdir(exist_ok=True)
+        self.game_icon_pipeline_file = Path(temp_dir) / "cache_game_icons.json"
+        self.state_lock = threading.RLock()
+        self.background_task_manager = BackgroundTaskManager(thread_factory=InlineThread)
+        self.pending_icon_refresh = False
+        self.broken_urls = set()
+        self.downloaded_urls = []
+        self.slow_calls = []
+
+    def download_icon(self, image_url, save_path):
+        self.downloaded_urls.append(image_url)
+        if image_url in self.broken_urls:
+            return False
+        Path(save_path).write_bytes(b"png")
+        return True
+
+    def log_slow_call(self, name, elapsed_ms, details=""):
+        self.slow_calls.append((name, details))
+
+
+class GameIconPipelineTests(unittest.TestCase):
+    def test_resolve_returns_placeholder_and_queues_missing_icons_once(self):
+        with TemporaryDirectory() as temp_dir:
+            pipeline = GameIconPipeline(temp_dir)
+            (Path(temp_dir) / "400.png").write_bytes(b"png")
+
+            first = pipeline.resolve("570", "https://cdn.test/570.jpg", "default.png")
+            second = pipeline.resolve(570, "https://cdn.test/570.jpg", "default.png")
+            cached = pipeline.resolve("400", "https://cdn.test/400.jpg", "default.png")
+
+            self.assertEqual(cached, str(Path(temp_dir) / "400.png"))
+
+        self.assertEqual((first, second), ("default.png", "default.png"))
+        self.assertEqual(pipeline.pending, {"570": "https://cdn.test/570.jpg"})
+        self.assertEqual(pipeline.resolve("", "https://cdn.test/x.jpg", "default.png"), "default.png")
+        self.assertEqual(pipeline.get_stats()["queued"], 1)
+
+    def test_failed_urls_are_skipped_until_ttl_expires(self):
+        clock = FakeClock()
+        pipeline = GameIconPipeline("/missing", failure_ttl_seconds=60, clock=clock)
+        pipeline.resolve("570", "https://cdn.test/broken.jpg", "default.png")
+        batch = pipeline.take_batch()
+
+        pipeline.record_result("570", "https://cdn.test/broken.jpg", False)
+        pipeline.resolve("570", "https://cdn.test/broken.jpg", "default.png")
+        skipped_pending = dict(pipeline.pending)
+        clock.now += 61
+        pipeline.resolve("570", "https://cdn.test/broken.jpg", "default.png")
+
+        self.assertEqual(batch, [("570", "https://cdn.test/broken.jpg")])
+        self.assertEqual(skipped_pending, {})
+        self.assertEqual(pipeline.pending, {"570": "https://cdn.test/broken.jpg"})
+        self.assertEqual(pipeline.to_payload()["failures"], {})
+
+    def test_payload_round_trip_keeps_in_flight_icons_pending(self):
+        clock = FakeClock()
+        pipeline = GameIconPipeline("/missing", clock=clock)
+        pipeline.resolve("570", "https://cdn.test/570.jpg", "default.png")
+        pipeline.take_batch()
+        pipeline.failures["https://cdn.test/broken.jpg"] = clock.now
+
+        restored = GameIconPipeline.from_payload(
+            json.loads(json.dumps(pipeline.to_payload())),
+            "/missing",
+            clock=clock,
+        )
+
+        self.assertFalse(pipeline.has_pending())
+        self.assertTrue(restored.has_pending())
+        self.assertEqual(restored.pending, {"570": "https://cdn.test/570.jpg"})
+        self.assertTrue(restored.is_failed("https://cdn.test/broken.jpg"))
+        self.assertEqual(GameIconPipeline.from_payload({"version": 0}, "/missing").pending, {})
+
+    def test_batch_download_writes_complete_files_only(self):
+        with TemporaryDirectory() as temp_dir:
+
+            def download(image_url, save_path):
+                Path(save_path).write_bytes(b"partial")
+                return "broken" not in image_url
+
+            outcomes = download_game_icon_batch(
+                [("570", "https://cdn.test/570.jpg"), ("400", "https://cdn.test/broken.jpg")],
+                download,
+                temp_dir,
+            )
+
+            self.assertEqual(sorted(path.name for path in Path(temp_dir).iterdir()), ["570.png"])
+
+        self.assertEqual(
+            outcomes,
+            [("570", "https://cdn.test/570.jpg", True), ("400", "https://cdn.test/broken.jpg", False)],
+        )
+
+
+class StoreIconPipelineTests(unittest.TestCase):
+    def test_missing_icons_download_in_background_and_resolve_next_time(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = IconHarness(temp_dir)
+            plugin.broken_urls.add("https://cdn.test/broken.jpg")
+
+            first = plugin._resolve_game_icon("570", "https://cdn.test/570.jpg")
+            plugin._resolve_game_icon("400", "https://cdn.test/broken.jpg")
+            self.assertEqual(plugin.downloaded_urls, [])
+
+            self.assertTrue(plugin.schedule_game_icon_downloads())
+            second = plugin._resolve_game_icon("570", "https://cdn.test/570.jpg")
+            broken = plugin._resolve_game_icon("400", "https://cdn.test/broken.jpg")
+            self.assertFalse(plugin.schedule_game_icon_downloads())
+            self.assertTrue(plugin.save_game_icon_pipeline())
+            payload = json.loads(plugin.game_icon_pipeline_file.read_text(encoding="utf-8"))
+
+            self.assertEqual(second, str(plugin.cache_dir / "570.png"))
+
+        self.assertEqual(first, "default.png")
+        self.assertEqual(broken, "default.png")
+        self.assertEqual(sorted(plugin.downloaded_urls), ["https://cdn.test/570.jpg", "https://cdn.test/broken.jpg"])
+        self.assertFalse(plugin.pending_icon_refresh)
+        self.assertEqual(payload["pending"], {})
+        self.assertEqual(list(payload["failures"]), ["https://cdn.test/broken.jpg"])
+        self.assertEqual(plugin.slow_calls, [("download_game_icons", "downloaded=1 failed=1")])
+
+    def test_persisted_pending_icons_are_picked_up_by_a_new_process(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = IconHarness(temp_dir)
+            plugin._resolve_game_icon("570", "https://cdn.test/570.jpg")
+            plugin.save_game_icon_pipeline()
+
+            worker_plugin = IconHarness(temp_dir)
+            worker_plugin._refresh_game_icons_worker()
+
+            self.assertTrue((plugin.cache_dir / "570.png").exists())
+
+        self.assertEqual(worker_plugin.downloaded_urls, ["https://cdn.test/570.jpg"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,13 @@
+import gzip
 import json
 import sys
+import threading
+import time
 import unittest
+import urllib.error
+import urllib.request
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -12,14 +19,18 @@ if str(LIB_PATH) not in sys.path:
     sys.path.insert(0, str(LIB_PATH))
 
 from steamflow.http_client import (
+    SingleFlightGroup,
     build_form_body,
     build_headers,
     build_url_with_query,
     decode_json_bytes,
     http_get_json,
+    http_get_json_conditional,
     http_pool_get,
     http_pool_request,
+    read_response_bytes,
     urllib_form_request,
+    urllib_get_json,
     urllib_json_request,
 )
 
@@ -39,11 +50,62 @@ class ResponseContext:
         return self.raw_data
 
 
+class ChunkedResponse:
+    def __init__(self, raw_data, headers=None):
+        self.raw_data = raw_data
+        self.headers = headers or {}
+        self.read_sizes = []
+
+    def read(self, size=-1):
+        self.read_sizes.append(size)
+        if size is None or size < 0:
+            data, self.raw_data = self.raw_data, b""
+        else:
+            data, self.raw_data = self.raw_data[:size], self.raw_data[size:]
+        return data
+
+
+class ConditionalJsonHandler(BaseHTTPRequestHandler):
+    payload = json.dumps({"items": list(range(200))}).encode("utf-8")
+    etag = '"v1"'
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        body = self.payload
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", self.etag)
+        if "gzip" in str(self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+def urllib_http_get(url, timeout, headers=None):
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return SimpleNamespace(status=response.status, headers=response.headers, data=read_response_bytes(response))
+    except urllib.error.HTTPError as error:
+        return SimpleNamespace(status=error.code, headers=error.headers, data=b"")
+
+
 class HttpClientTests(unittest.TestCase):
     def test_build_headers_adds_user_agent_and_preserves_overrides(self):
         self.assertEqual(
             build_headers({"Accept": "application/json"}),
-            {"User-Agent": "Mozilla/5.0", "Accept": "application/json"},
+            {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate", "Accept": "application/json"},
         )
 
     def test_decode_json_bytes_and_http_get_json(self):
@@ -126,6 +188,132 @@ class HttpClientTests(unittest.TestCase):
         self.assertEqual(request.data, b"alpha=1")
         self.assertEqual(request.headers["Origin"], "https://store.steampowered.com")
 
+    def test_http_get_json_forwards_flight_key_only_when_given(self):
+        calls = []
+
+        def http_get(url, **kwargs):
+            calls.append(kwargs)
+            return SimpleNamespace(data=b"{}")
+
+        http_get_json(http_get, "https://example.test", timeout=3)
+        http_get_json(http_get, "https://example.test", timeout=3, flight_key="appdetails")
+
+        self.assertNotIn("flight_key", calls[0])
+        self.assertEqual(calls[1]["flight_key"], "appdetails")
+
+    def test_single_flight_shares_one_in_flight_request(self):
+        single_flight = SingleFlightGroup()
+        release = threading.Event()
+        request_started = threading.Event()
+        calls = []
+        results = []
+
+        def request(*args, **kwargs):
+            calls.append(args)
+            request_started.set()
+            release.wait(2)
+            return SimpleNamespace(status=200, data=b"{}")
+
+        http_pool = SimpleNamespace(request=request)
+
+        def fetch():
+            results.append(
+                http_pool_get(
+                    http_pool,
+                    None,
+                    "https://example.test/appdetails?appids=570",
+                    timeout=2,
+                    single_flight=single_flight,
+                    flight_key="appdetails",
+                )
+            )
+
+        leader = threading.Thread(target=fetch)
+        leader.start()
+        request_started.wait(2)
+        follower = threading.Thread(target=fetch)
+        follower.start()
+        while single_flight.get_stats()["appdetails"]["coalesced"] == 0:
+            time.sleep(0.01)
+        release.set()
+        leader.join(2)
+        follower.join(2)
+
+        self.assertEqual(len(calls), 1)
+        self.assertIs(results[0], results[1])
+        self.assertEqual(single_flight.get_stats(), {"appdetails": {"issued": 1, "coalesced": 1}})
+
+    def test_single_flight_releases_key_after_errors(self):
+        single_flight = SingleFlightGroup()
+
+        def fail():
+            raise RuntimeError("offline")
+
+        with self.assertRaisesRegex(RuntimeError, "offline"):
+            single_flight.do(("GET", "https://example.test"), fail, endpoint="players")
+        self.assertEqual(single_flight.do(("GET", "https://example.test"), lambda: 42, endpoint="players"), 42)
+        self.assertEqual(single_flight.get_stats()["players"], {"issued": 2, "coalesced": 0})
+
+    def test_read_response_bytes_streams_gzip_and_deflate_bodies(self):
+        payload = json.dumps({"items": list(range(500))}).encode("utf-8")
+        raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        raw_deflate_body = raw_deflate.compress(payload) + raw_deflate.flush()
+        gzip_response = ChunkedResponse(gzip.compress(payload), {"Content-Encoding": "gzip"})
+
+        self.assertEqual(read_response_bytes(gzip_response, chunk_size=64), payload)
+        self.assertGreater(len(gzip_response.read_sizes), 2)
+        self.assertEqual(read_response_bytes(ChunkedResponse(zlib.compress(payload), {"Content-Encoding": "deflate"})), payload)
+        self.assertEqual(read_response_bytes(ChunkedResponse(raw_deflate_body, {"Content-Encoding": "deflate"})), payload)
+        self.assertEqual(read_response_bytes(ChunkedResponse(payload)), payload)
+
+    def test_http_get_json_conditional_sends_validators_and_handles_not_modified(self):
+        calls = []
+
+        def http_get(url, timeout, headers=None):
+            calls.append(headers)
+            return SimpleNamespace(status=304, headers={"ETag": '"v2"'}, data=b"")
+
+        result = http_get_json_conditional(
+            http_get,
+            "https://example.test",
+            timeout=2,
+            validators={"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT", "other": "x"},
+        )
+
+        self.assertTrue(result["not_modified"])
+        self.assertIsNone(result["payload"])
+        self.assertEqual(
+            result["validators"],
+            {"etag": '"v2"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+        self.assertEqual(calls[0]["If-None-Match"], '"v1"')
+        self.assertEqual(calls[0]["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+
+    def test_conditional_requests_against_local_server(self):
+        ConditionalJsonHandler.requests = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), ConditionalJsonHandler)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/wishlist"
+
+            first = http_get_json_conditional(urllib_http_get, url, timeout=2)
+            second = http_get_json_conditional(urllib_http_get, url, timeout=2, validators=first["validators"])
+            payload = urllib_get_json(url, timeout=2)
+        finally:
+            server.shutdown()
+            server.server_close()
+            server_thread.join(2)
+
+        self.assertFalse(first["not_modified"])
+        self.assertEqual(first["payload"]["items"][-1], 199)
+        self.assertEqual(first["validators"], {"etag": '"v1"'})
+        self.assertTrue(second["not_modified"])
+        self.assertEqual(second["validators"], {"etag": '"v1"'})
+        self.assertEqual(payload["items"][0], 0)
+        self.assertEqual(ConditionalJsonHandler.requests[0]["Accept-Encoding"], "gzip, deflate")
+        self.assertEqual(ConditionalJsonHandler.requests[1]["If-None-Match"], '"v1"')
+
     def test_build_form_body_and_url_query_support_doseq(self):
         self.assertEqual(build_form_body({"a": ["1", "2"]}), b"a=1&a=2")
         self.assertEqual(build_url_with_query("https://example.test?a=1", {"b": "2"}), "https://example.test?a=1&b=2")
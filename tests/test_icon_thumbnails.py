@@ -0,0 +1,233 @@
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow import core as core_module
+from steamflow.core import SteamPluginCoreMixin
+from steamflow.icon_thumbnails import IconThumbnailCache, create_icon_thumbnail, get_source_signature
+from steamflow.tasks import BackgroundTaskManager
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+class FakeImage:
+    def __init__(self, size, source=b""):
+        self.width, self.height = size
+        self.source = source
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        return False
+
+    def convert(self, mode):
+        return self
+
+    def thumbnail(self, size, resample=None):
+        scale = min(size[0] / self.width, size[1] / self.height, 1)
+        self.width, self.height = int(self.width * scale), int(self.height * scale)
+
+    def paste(self, image, offset):
+        self.source = image.source
+
+    def save(self, path, format=None, optimize=False):
+        Path(path).write_bytes(b"thumb:" + self.source)
+
+
+class FakeImageModule:
+    Resampling = SimpleNamespace(LANCZOS=1)
+
+    def __init__(self):
+        self.opened = 0
+
+    def open(self, file_obj):
+        self.opened += 1
+        source = file_obj.read()
+        if source.startswith(b"bad"):
+            raise OSError("cannot identify image file")
+        return FakeImage((460, 215), source)
+
+    def new(self, mode, size, color=None):
+        return FakeImage(size)
+
+
+class InlineThread:
+    def __init__(self, target=None, daemon=None):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+
+class ThumbnailHarness(SteamPluginCoreMixin):
+    def __init__(self, temp_dir, thread_factory=InlineThread):
+        self.icon_thumbnail_dir = Path(temp_dir) / "cache_thumbnails"
+        self.state_lock = threading.RLock()
+        self.background_task_manager = BackgroundTaskManager(thread_factory=thread_factory)
+        self.pending_thumbnail_refresh = False
+        self.logged_exceptions = []
+        self.slow_calls = []
+
+    def log_exception(self, message):
+        self.logged_exceptions.append(message)
+
+    def log_slow_call(self, name, elapsed_ms, details=""):
+        self.slow_calls.append((name, details))
+
+
+class IconThumbnailCacheTests(unittest.TestCase):
+    def test_identical_sources_share_one_content_addressed_thumbnail(self):
+        image_module = FakeImageModule()
+        with TemporaryDirectory() as temp_dir:
+            first_source = Path(temp_dir) / "570.png"
+            second_source = Path(temp_dir) / "library_570.jpg"
+            first_source.write_bytes(b"jpeg-bytes")
+            second_source.write_bytes(b"jpeg-bytes")
+            root = Path(temp_dir) / "thumbs"
+
+            first_digest = create_icon_thumbnail(first_source, root, 64, image_module)
+            second_digest = create_icon_thumbnail(second_source, root, 64, image_module)
+
+            self.assertEqual([path.name for path in root.iterdir()], [f"{first_digest}.png"])
+
+        self.assertEqual(first_digest, second_digest)
+        self.assertEqual(image_module.opened, 1)
+
+    def test_lookup_queues_misses_and_invalidates_changed_sources(self):
+        with TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "icon.jpg"
+            source.write_bytes(b"v1")
+            cache = IconThumbnailCache(Path(temp_dir) / "thumbs", size=64)
+            (cache.root).mkdir()
+            cache.get_thumbnail_path("abc").write_bytes(b"thumb")
+
+            miss = cache.lookup(source)
+            batch = cache.take_batch()
+            cache.record_result(str(source), get_source_signature(source), "abc")
+            hit = cache.lookup(source)
+            source.write_bytes(b"version-2")
+            os.utime(source, ns=(1, 1))
+            changed = cache.lookup(source)
+
+        self.assertIsNone(miss)
+        self.assertEqual(batch, [str(source)])
+        self.assertEqual(hit, str(cache.get_thumbnail_path("abc")))
+        self.assertIsNone(changed)
+        self.assertEqual(cache.pending, {str(source)})
+        self.assertEqual(cache.get_stats()["hits"], 1)
+
+    def test_manifest_round_trip_drops_other_sizes_and_keeps_failures(self):
+        cache = IconThumbnailCache("/thumbs", size=64)
+        cache.entries["/icons/ok.jpg"] = {"mtime_ns": 1, "source_size": 2, "digest": "abc"}
+        cache.entries["/icons/broken.jpg"] = {"mtime_ns": 3, "source_size": 4, "digest": ""}
+        cache.pending.add("/icons/new.jpg")
+        payload = json.loads(json.dumps(cache.to_payload()))
+
+        restored = IconThumbnailCache.from_payload(payload, "/thumbs", size=64)
+        resized = IconThumbnailCache.from_payload(payload, "/thumbs", size=32)
+
+        self.assertEqual(restored.entries, cache.entries)
+        self.assertEqual(restored.pending, {"/icons/new.jpg"})
+        self.assertEqual(resized.entries, {})
+
+
+class IconThumbnailPluginTests(unittest.TestCase):
+    def test_thumbnails_are_built_in_background_and_used_on_next_lookup(self):
+        image_module = FakeImageModule()
+        with TemporaryDirectory() as temp_dir, patch.object(core_module, "Image", image_module):
+            plugin = ThumbnailHarness(temp_dir)
+            good_source = Path(temp_dir) / "570.png"
+            bad_source = Path(temp_dir) / "400.png"
+            good_source.write_bytes(b"jpeg")
+            bad_source.write_bytes(b"bad-jpeg")
+
+            first = plugin.get_icon_thumbnail(str(good_source))
+            plugin.get_icon_thumbnail(str(bad_source))
+            second = plugin.get_icon_thumbnail(str(good_source))
+            failed = plugin.get_icon_thumbnail(str(bad_source))
+            self.assertTrue(plugin.save_icon_thumbnail_manifest())
+            manifest = json.loads((plugin.icon_thumbnail_dir / "manifest.json").read_text(encoding="utf-8"))
+
+            self.assertEqual(Path(second).read_bytes(), b"thumb:jpeg")
+
+        self.assertEqual(first, str(good_source))
+        self.assertEqual(Path(second).parent, plugin.icon_thumbnail_dir)
+        self.assertEqual(failed, str(bad_source))
+        self.assertEqual(manifest["entries"][str(bad_source)]["digest"], "")
+        self.assertEqual(manifest["pending"], [])
+        self.assertEqual(plugin.logged_exceptions, [f"Failed to create icon thumbnail for {bad_source}"])
+        self.assertFalse(plugin.pending_thumbnail_refresh)
+
+    def test_thumbnails_are_disabled_without_pillow(self):
+        with TemporaryDirectory() as temp_dir, patch.object(core_module, "Image", None):
+            plugin = ThumbnailHarness(temp_dir)
+
+            self.assertEqual(plugin.get_icon_thumbnail("C:/icons/570.jpg"), "C:/icons/570.jpg")
+            self.assertFalse(plugin.save_icon_thumbnail_manifest())
+
+    def test_prune_drops_manifest_entries_for_missing_sources(self):
+        with TemporaryDirectory() as temp_dir, patch.object(core_module, "Image", FakeImageModule()):
+            plugin = ThumbnailHarness(temp_dir)
+            thumbnail_cache = plugin.get_icon_thumbnail_cache()
+            source = Path(temp_dir) / "icon.jpg"
+            source.write_bytes(b"jpeg")
+            thumbnail_cache.record_result(str(source), get_source_signature(source), "kept")
+            thumbnail_cache.entries["/missing.jpg"] = {"mtime_ns": 1, "source_size": 1, "digest": "missing"}
+
+            pruned_count = plugin.prune_icon_thumbnail_manifest()
+
+        self.assertEqual(pruned_count, 1)
+        self.assertEqual(list(thumbnail_cache.entries), [str(source)])
+
+    def test_enforce_cache_budget_evicts_thumbnails_the_manifest_no_longer_references(self):
+        with TemporaryDirectory() as temp_dir, patch.object(core_module, "Image", FakeImageModule()):
+            plugin = ThumbnailHarness(temp_dir)
+            thumbnail_cache = plugin.get_icon_thumbnail_cache()
+            source = Path(temp_dir) / "icon.jpg"
+            source.write_bytes(b"jpeg")
+            thumbnail_cache.record_result(str(source), get_source_signature(source), "kept")
+            old_mtime = time.time() - 2 * plugin.CONFIG.cache.thumbnail_orphan_grace_seconds
+            plugin.icon_thumbnail_dir.mkdir(parents=True)
+            for name in ("kept.png", "replaced.png", "just_built.png"):
+                (plugin.icon_thumbnail_dir / name).write_bytes(b"thumb")
+            for name in ("kept.png", "replaced.png"):
+                os.utime(plugin.icon_thumbnail_dir / name, (old_mtime, old_mtime))
+
+            result = plugin.enforce_cache_budget(force=True)
+            remaining = sorted(path.name for path in plugin.icon_thumbnail_dir.iterdir())
+
+        self.assertEqual(result["evicted"], 1)
+        self.assertEqual(remaining, ["just_built.png", "kept.png"])
+
+    @unittest.skipUnless(Image, "Pillow is not installed")
+    def test_pillow_thumbnail_is_square_png(self):
+        with TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / "capsule.jpg"
+            Image.new("RGB", (231, 87), (200, 10, 10)).save(source, format="JPEG")
+
+            digest = create_icon_thumbnail(source, temp_dir, 64, Image)
+
+            with Image.open(Path(temp_dir) / f"{digest}.png") as thumbnail:
+                self.assertEqual((thumbnail.format, thumbnail.size), ("PNG", (64, 64)))
+
+
+if __name__ == "__main__":
+    unittest.main()
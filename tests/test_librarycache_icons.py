@@ -0,0 +1,126 @@
+import json
+import sys
+import threading
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow import librarycache_icons
+from steamflow.librarycache_icons import LibraryCacheIconIndex, choose_librarycache_icon
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class LibraryCacheIconIndexTests(unittest.TestCase):
+    def make_icon_dir(self, root, app_id, files):
+        icon_dir = Path(root) / app_id
+        icon_dir.mkdir(parents=True)
+        for file_name, size in files.items():
+            (icon_dir / file_name).write_bytes(b"x" * size)
+        return icon_dir
+
+    def test_choose_icon_skips_artwork_and_prefers_largest_jpg(self):
+        with TemporaryDirectory() as temp_dir:
+            icon_dir = self.make_icon_dir(
+                temp_dir,
+                "570",
+                {"header.jpg": 900, "library_600x900.jpg": 800, "logo.png": 700, "small.jpg": 10, "large.jpg": 40},
+            )
+
+            self.assertEqual(choose_librarycache_icon(icon_dir), str(icon_dir / "large.jpg"))
+
+    def test_lookup_reuses_entries_until_directory_changes(self):
+        with TemporaryDirectory() as temp_dir:
+            icon_dir = self.make_icon_dir(temp_dir, "570", {"icon.jpg": 10})
+            clock = FakeClock()
+            index = LibraryCacheIconIndex(temp_dir, recheck_seconds=30, clock=clock)
+
+            first = index.lookup("570")
+            second = index.lookup(570)
+            (icon_dir / "bigger.jpg").write_bytes(b"x" * 50)
+            stale = index.lookup("570")
+            clock.now = 31
+            refreshed = index.lookup("570")
+
+        self.assertEqual(first, str(icon_dir / "icon.jpg"))
+        self.assertEqual(second, first)
+        self.assertEqual(stale, first)
+        self.assertEqual(refreshed, str(icon_dir / "bigger.jpg"))
+        self.assertEqual(index.get_stats(), {"entries": 1, "hits": 2, "misses": 2})
+
+    def test_missing_directories_are_remembered_until_root_changes(self):
+        with TemporaryDirectory() as temp_dir:
+            clock = FakeClock()
+            index = LibraryCacheIconIndex(temp_dir, recheck_seconds=30, clock=clock)
+
+            missing = index.lookup("620")
+            missing_again = index.lookup("620")
+            icon_dir = self.make_icon_dir(temp_dir, "620", {"icon.jpg": 10})
+            clock.now = 31
+            found = index.lookup("620")
+
+        self.assertEqual(missing, "")
+        self.assertEqual(missing_again, "")
+        self.assertEqual(found, str(icon_dir / "icon.jpg"))
+        self.assertEqual(index.misses, 2)
+
+    def test_lookup_checks_disk_outside_the_callers_lock(self):
+        with TemporaryDirectory() as temp_dir:
+            icon_dir = self.make_icon_dir(temp_dir, "570", {"icon.jpg": 10})
+            index = LibraryCacheIconIndex(temp_dir)
+            lock = threading.Lock()
+            disk_calls = []
+            get_mtime = librarycache_icons.get_directory_mtime_ns
+            choose_icon = librarycache_icons.choose_librarycache_icon
+
+            def checked_get_mtime(path):
+                disk_calls.append(lock.locked())
+                return get_mtime(path)
+
+            def checked_choose_icon(path):
+                disk_calls.append(lock.locked())
+                return choose_icon(path)
+
+            with patch.object(librarycache_icons, "get_directory_mtime_ns", checked_get_mtime), patch.object(
+                librarycache_icons,
+                "choose_librarycache_icon",
+                checked_choose_icon,
+            ):
+                icon_path = index.lookup("570", lock=lock)
+
+        self.assertEqual(icon_path, str(icon_dir / "icon.jpg"))
+        self.assertEqual(disk_calls, [False, False, False])
+        self.assertEqual(index.get_stats(), {"entries": 1, "hits": 0, "misses": 1})
+
+    def test_payload_round_trip_keeps_entries_for_same_root(self):
+        with TemporaryDirectory() as temp_dir:
+            icon_dir = self.make_icon_dir(temp_dir, "570", {"icon.jpg": 10})
+            index = LibraryCacheIconIndex(temp_dir)
+            index.lookup("570")
+            payload = json.loads(json.dumps(index.to_payload()))
+
+            restored = LibraryCacheIconIndex.from_payload(payload, temp_dir)
+            cached = restored.lookup("570")
+            other_root = LibraryCacheIconIndex.from_payload(payload, Path(temp_dir) / "other")
+
+        self.assertEqual(cached, str(icon_dir / "icon.jpg"))
+        self.assertEqual(restored.get_stats(), {"entries": 1, "hits": 1, "misses": 0})
+        self.assertEqual(other_root.entries, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
 import sys
 import json
+import threading
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from types import SimpleNamespace
+from unittest.mock import patch
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 LIB_PATH = PROJECT_ROOT / "lib"
@@ -14,13 +16,18 @@ if str(LIB_PATH) not in sys.path:
 if "vdf" not in sys.modules:
     sys.modules["vdf"] = SimpleNamespace(load=lambda *_args, **_kwargs: {}, dump=lambda *_args, **_kwargs: None)
 
+from steamflow import local_library_service
 from steamflow.local_library_service import (
+    InstalledGamesSnapshot,
     build_installed_game_record,
+    build_installed_games_cache_payload,
     collect_installed_games_snapshot,
     cleanup_cache_keys,
     extract_localconfig_app_stats,
+    extract_localconfig_app_stats_from_bytes,
     load_steam_library_paths,
     normalize_appmanifest_state,
+    normalize_installed_games_cache_payload,
     parse_active_persona_state,
     parse_hidden_app_ids_data,
     parse_libraryfolders_steamapps_paths,
@@ -156,6 +163,26 @@ class LocalLibraryServiceTests(unittest.TestCase):
         self.assertEqual(playtimes, {"570": 11290})
         self.assertEqual(last_played, {"570": 1776516641, "10": 1})
 
+    def test_extract_localconfig_app_stats_from_bytes_reads_only_steam_apps_subtree(self):
+        localconfig_text = (
+            '"UserLocalConfigStore"\n{\n'
+            '\t"friends"\n\t{\n\t\t"570"\n\t\t{\n\t\t\t"Playtime"\t"1"\n\t\t}\n'
+            '\t\t"PersonaName"\t"quote \\" {brace}"\n\t}\n'
+            '\t"Software"\n\t{\n\t\t"Valve"\n\t\t{\n\t\t\t"Steam"\n\t\t\t{\n'
+            '\t\t\t\t"apps"\n\t\t\t\t{\n'
+            '\t\t\t\t\t"570"\n\t\t\t\t\t{\n'
+            '\t\t\t\t\t\t"Playtime"\t"11290"\n\t\t\t\t\t\t"LastPlayed"\t"1776516641"\n'
+            '\t\t\t\t\t\t"cloud"\n\t\t\t\t\t\t{\n\t\t\t\t\t\t\t"Playtime"\t"5"\n\t\t\t\t\t\t}\n'
+            '\t\t\t\t\t}\n'
+            '\t\t\t\t\t"10"\n\t\t\t\t\t{\n\t\t\t\t\t\t"Playtime"\t"bad"\n\t\t\t\t\t\t"LastPlayed"\t"1"\n\t\t\t\t\t}\n'
+            '\t\t\t\t}\n\t\t\t}\n\t\t}\n\t}\n}\n'
+        )
+
+        playtimes, last_played = extract_localconfig_app_stats_from_bytes(localconfig_text.encode("utf-8"))
+
+        self.assertEqual(playtimes, {"570": 11290})
+        self.assertEqual(last_played, {"570": 1776516641, "10": 1})
+
     def test_build_installed_game_record_filters_hidden_or_blacklisted_manifests(self):
         self.assertIsNone(
             build_installed_game_record(
@@ -203,8 +230,118 @@ class LocalLibraryServiceTests(unittest.TestCase):
         self.assertEqual(snapshot.installed_games, {"1451940": "NEEDY GIRL OVERDOSE"})
         self.assertEqual(snapshot.installed_game_statuses, {"1451940": "status:1451940"})
         self.assertIn("NEEDY GIRL OVERDOSE", snapshot.installed_game_paths["1451940"])
+        self.assertEqual(snapshot.installed_game_manifests, {"1451940": str(manifest_path)})
         self.assertEqual(snapshot.manifest_keys_in_use, {str(manifest_path)})
 
+    def test_collect_installed_games_snapshot_merges_libraries_in_order_and_isolates_failures(self):
+        with TemporaryDirectory() as temp_dir:
+            library_paths = []
+            for library_name, app_ids in (("fast", ["10", "20", "30"]), ("broken", ["40"]), ("slow", ["10", "50"])):
+                steamapps_path = Path(temp_dir) / library_name / "steamapps"
+                steamapps_path.mkdir(parents=True)
+                for app_id in app_ids:
+                    (steamapps_path / f"appmanifest_{app_id}.acf").write_text("", encoding="utf-8")
+                library_paths.append(steamapps_path)
+            missing_path = Path(temp_dir) / "missing" / "steamapps"
+            timings = []
+            logged = []
+
+            def load_manifest_data(manifest_path):
+                app_id = manifest_path.stem.split("_", 1)[1]
+                if manifest_path.parent.parent.name == "broken":
+                    raise OSError("unreadable")
+                return {
+                    "app_id": app_id,
+                    "name": f"{manifest_path.parent.parent.name}:{app_id}",
+                    "install_dir": app_id,
+                    "state_flags": {"is_visible": True},
+                }
+
+            snapshot = collect_installed_games_snapshot(
+                [library_paths[0], missing_path, library_paths[1], library_paths[2]],
+                load_manifest_data,
+                lambda _app_id, _state_flags, _manifest_data: "",
+                log_exception=logged.append,
+                log_library_timing=lambda path, duration_ms, count: timings.append((path, count)),
+                max_workers=3,
+                batch_size=1,
+            )
+
+        self.assertEqual(
+            snapshot.installed_games,
+            {"10": "slow:10", "20": "fast:20", "30": "fast:30", "50": "slow:50"},
+        )
+        self.assertEqual(len(snapshot.manifest_keys_in_use), 6)
+        self.assertEqual(len(logged), 1)
+        self.assertIn("appmanifest_40.acf", logged[0])
+        self.assertEqual(
+            timings,
+            [(library_paths[0], 3), (missing_path, 0), (library_paths[1], 1), (library_paths[2], 2)],
+        )
+
+    def test_collect_installed_games_snapshot_parses_fast_libraries_while_a_slow_listing_runs(self):
+        with TemporaryDirectory() as temp_dir:
+            library_paths = []
+            for library_name in ("slow", "fast"):
+                steamapps_path = Path(temp_dir) / library_name / "steamapps"
+                steamapps_path.mkdir(parents=True)
+                (steamapps_path / f"appmanifest_{len(library_paths) + 10}.acf").write_text("", encoding="utf-8")
+                library_paths.append(steamapps_path)
+            fast_library_parsed = threading.Event()
+            list_manifest_paths = local_library_service.list_library_manifest_paths
+
+            def list_slowly(steamapps_path):
+                if steamapps_path == library_paths[0]:
+                    self.assertTrue(fast_library_parsed.wait(2))
+                return list_manifest_paths(steamapps_path)
+
+            def load_manifest_data(manifest_path):
+                if manifest_path.parent == library_paths[1]:
+                    fast_library_parsed.set()
+                app_id = manifest_path.stem.split("_", 1)[1]
+                return {"app_id": app_id, "name": app_id, "install_dir": app_id, "state_flags": {"is_visible": True}}
+
+            with patch.object(local_library_service, "list_library_manifest_paths", list_slowly):
+                snapshot = collect_installed_games_snapshot(
+                    library_paths,
+                    load_manifest_data,
+                    lambda _app_id, _state_flags, _manifest_data: "",
+                    max_workers=2,
+                )
+
+        self.assertTrue(fast_library_parsed.is_set())
+        self.assertEqual(snapshot.installed_games, {"10": "10", "11": "11"})
+
+    def test_installed_games_cache_payload_round_trips_through_json(self):
+        snapshot = InstalledGamesSnapshot(
+            installed_games={"1451940": "NEEDY GIRL OVERDOSE"},
+            installed_game_paths={"1451940": "D:/SteamLibrary/steamapps/common/NEEDY GIRL OVERDOSE"},
+            installed_game_statuses={"1451940": ""},
+            installed_game_manifests={"1451940": "keep.acf"},
+            manifest_keys_in_use={"keep.acf", "missing.acf"},
+        )
+        appmanifest_cache = {
+            "keep.acf": {"signature": (123, 456), "data": {"app_id": "1451940"}},
+            "stale.acf": {"signature": (1, 1), "data": {"app_id": "10"}},
+        }
+
+        payload = json.loads(json.dumps(build_installed_games_cache_payload(snapshot, appmanifest_cache, saved_at=5)))
+        loaded_snapshot, loaded_cache = normalize_installed_games_cache_payload(payload)
+
+        self.assertEqual(loaded_cache, {"keep.acf": {"signature": (123, 456), "data": {"app_id": "1451940"}}})
+        self.assertEqual(loaded_snapshot.installed_games, snapshot.installed_games)
+        self.assertEqual(loaded_snapshot.installed_game_paths, snapshot.installed_game_paths)
+        self.assertEqual(loaded_snapshot.installed_game_manifests, {"1451940": "keep.acf"})
+        self.assertEqual(loaded_snapshot.manifest_keys_in_use, {"keep.acf"})
+
+    def test_normalize_installed_games_cache_payload_ignores_other_versions(self):
+        snapshot, appmanifest_cache = normalize_installed_games_cache_payload(
+            {"version": 0, "manifests": {"a.acf": {"signature": [1, 2], "data": {}}}}
+        )
+
+        self.assertEqual(snapshot.installed_games, {})
+        self.assertEqual(appmanifest_cache, {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -166,6 +166,44 @@ class LocalAccountNoticeTests(unittest.TestCase):
         self.assertEqual(notice, " | No current-account data")
 
 
+class LocalGameViewTests(unittest.TestCase):
+    def setUp(self):
+        self.plugin = LocalLogicHarness()
+        self.plugin.installed_game_paths = {"570": "C:/Games/dota 2 beta"}
+        self.plugin.installed_game_statuses = {"570": "Update Required"}
+        self.plugin.playtime_minutes = {"570": 90}
+        self.plugin.last_played_timestamps = {"570": 1776516641}
+        self.plugin.local_game_views = {}
+        self.plugin.current_account_data_by_id["570"] = True
+        self.icon_calls = []
+        self.plugin.get_local_game_icon = lambda app_id: self.icon_calls.append(app_id) or "icon.jpg"
+
+    def test_view_collects_local_metadata_once_per_snapshot(self):
+        first = self.plugin.get_local_game_view("570")
+        second = self.plugin.get_local_game_view(570)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.install_path, "C:/Games/dota 2 beta")
+        self.assertEqual(first.status_label, "Update Required")
+        self.assertEqual(first.playtime_minutes, 90)
+        self.assertEqual(first.last_played_timestamp, 1776516641)
+        self.assertEqual(first.icon_path, "icon.jpg")
+        self.assertTrue(first.has_current_account_data)
+        self.assertEqual(self.icon_calls, ["570"])
+        with self.assertRaises(AttributeError):
+            first.playtime_minutes = 0
+
+    def test_view_is_rebuilt_after_snapshot_reset(self):
+        first = self.plugin.get_local_game_view("570")
+        self.plugin.playtime_minutes = {"570": 150}
+        self.plugin.local_game_views = {}
+
+        second = self.plugin.get_local_game_view("570")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.playtime_minutes, 150)
+
+
 class StateFlagParsingTests(unittest.TestCase):
     def setUp(self):
         self.plugin = LocalLogicHarness()
@@ -0,0 +1,84 @@
+import sys
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow.local_search import LocalSearchIndex, normalize_search_text
+
+INSTALLED_GAMES = {
+    "730": "Counter-Strike: Global Offensive",
+    "1174180": "Red Dead Redemption 2",
+    "1145360": "Hades",
+    "1086940": "Baldur's Gate 3",
+    "105600": "Terraria",
+    "374320": "DARK SOULS™ III",
+    "504230": "Celeste",
+    "391540": "Pokémon Café Remix",
+}
+NOW = 1_800_000_000
+
+
+class LocalSearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.index = LocalSearchIndex.build(INSTALLED_GAMES)
+
+    def search_ids(self, search_term, **kwargs):
+        return [app_id for app_id, _name in self.index.search(search_term, now=NOW, **kwargs)]
+
+    def test_normalize_folds_diacritics_case_and_punctuation(self):
+        self.assertEqual(normalize_search_text("Pokémon Café: REMIX!"), "pokemon cafe remix")
+        self.assertEqual(normalize_search_text("Baldur's Gate 3"), "baldur s gate 3")
+
+    def test_exact_and_prefix_matches_rank_first(self):
+        self.assertEqual(self.search_ids("hades"), ["1145360"])
+        self.assertEqual(self.search_ids("ter")[0], "105600")
+
+    def test_acronyms_and_word_prefixes_match(self):
+        self.assertEqual(self.search_ids("rdr2")[0], "1174180")
+        self.assertEqual(self.search_ids("csgo")[0], "730")
+        self.assertEqual(self.search_ids("dark sou")[0], "374320")
+        self.assertEqual(self.search_ids("bal gate")[0], "1086940")
+
+    def test_diacritics_are_ignored_in_queries(self):
+        self.assertEqual(self.search_ids("pokemon cafe"), ["391540"])
+        self.assertEqual(self.search_ids("CAFÉ")[0], "391540")
+
+    def test_trigrams_tolerate_typos(self):
+        self.assertEqual(self.search_ids("celste")[0], "504230")
+        self.assertEqual(self.search_ids("terarria")[0], "105600")
+
+    def test_recent_play_breaks_ties_within_a_tier(self):
+        index = LocalSearchIndex.build({"1": "Portal", "2": "Portal 2"})
+
+        default_order = [app_id for app_id, _name in index.search("port", now=NOW)]
+        recent_order = [
+            app_id
+            for app_id, _name in index.search("port", now=NOW, last_played_timestamps={"2": NOW - 3600})
+        ]
+
+        self.assertEqual(default_order, ["1", "2"])
+        self.assertEqual(recent_order, ["2", "1"])
+
+    def test_limit_and_empty_queries(self):
+        self.assertEqual(len(self.index.search("e", limit=2, now=NOW)), 2)
+        self.assertEqual(self.index.search("  ", now=NOW), [])
+
+    def test_payload_round_trip_is_bound_to_installed_games(self):
+        payload = self.index.to_payload()
+
+        restored = LocalSearchIndex.from_payload(payload, dict(INSTALLED_GAMES))
+        changed = LocalSearchIndex.from_payload(payload, {**INSTALLED_GAMES, "620": "Portal 2"})
+
+        self.assertIsNotNone(restored)
+        self.assertEqual(restored.search("rdr2", now=NOW), self.index.search("rdr2", now=NOW))
+        self.assertIsNone(changed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import sys
 import unittest
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import patch
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -10,7 +11,16 @@ if str(PROJECT_ROOT) not in sys.path:
 if str(LIB_PATH) not in sys.path:
     sys.path.insert(0, str(LIB_PATH))
 
-from steamflow.localization import Localizer, normalize_locale, resolve_configured_locale
+from steamflow import localization
+from steamflow.localization import (
+    SUPPORTED_LOCALES,
+    Localizer,
+    compile_message_template,
+    format_compiled_message,
+    load_compiled_catalog,
+    normalize_locale,
+    resolve_configured_locale,
+)
 
 
 class LocalizationTests(unittest.TestCase):
@@ -107,6 +117,42 @@ class LocalizationTests(unittest.TestCase):
             self.assertEqual(resolve_configured_locale("auto"), "zh-Hant")
             self.assertEqual(resolve_configured_locale("Auto (system language)"), "zh-Hant")
 
+    def test_compiled_templates_match_str_format(self):
+        values = {"search_term": "portal", "count": 3, "status": "Online", "used": "1 KB", "budget": "2 KB"}
+        for template in ("Plain", "No games found for '{search_term}'", "{count} of {count}", "{{literal}} {status}"):
+            self.assertEqual(
+                format_compiled_message(template, compile_message_template(template), values),
+                template.format(**values),
+            )
+        self.assertIsNone(compile_message_template("{count:>4}"))
+        self.assertEqual(format_compiled_message("{missing}", compile_message_template("{missing}"), values), "{missing}")
+        self.assertEqual(format_compiled_message("{}", compile_message_template("{}"), values), "{}")
+
+    def test_compiled_catalog_flattens_english_fallback_for_every_locale(self):
+        english_keys = set(load_compiled_catalog("en", cache_file=None))
+        for locale_name in SUPPORTED_LOCALES:
+            self.assertTrue(english_keys <= set(load_compiled_catalog(locale_name, cache_file=None)), locale_name)
+
+    def test_compiled_catalog_cache_skips_json_until_sources_change(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "catalog.marshal"
+            built = load_compiled_catalog("de", cache_file=cache_file)
+            with patch.object(localization, "build_locale_catalog") as build_catalog:
+                cached = load_compiled_catalog("de", cache_file=cache_file)
+            self.assertFalse(build_catalog.called)
+
+            sources = localization.get_locale_source_signatures("de")
+            changed_sources = sources[:-1] + (("de", (0, 0)),)
+            with patch.object(localization, "get_locale_source_signatures", return_value=changed_sources), patch.object(
+                localization,
+                "build_locale_catalog",
+                return_value={"ui.launch_steam": ("Neu", None)},
+            ):
+                rebuilt = load_compiled_catalog("de", cache_file=cache_file)
+
+        self.assertEqual(cached, built)
+        self.assertEqual(rebuilt, {"ui.launch_steam": ("Neu", None)})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,209 @@
+import json
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow.cache_utils import exclusive_lock_file
+from steamflow.metric_journal import MetricCacheJournal, apply_metric_journal_records
+from steamflow.storage import SteamPluginStorageMixin
+
+
+class FakeAppDetailsStore:
+    def migrate_legacy_entries(self, entries):
+        return True
+
+
+class StorageHarness(SteamPluginStorageMixin):
+    def __init__(self, temp_dir):
+        self.metric_cache_file = Path(temp_dir) / "cache_metric.json"
+        self.metric_cache_journal_file = Path(temp_dir) / "cache_metric.journal"
+        self.state_lock = threading.RLock()
+        self.player_count_cache = {}
+        self.review_score_cache = {}
+        self.achievement_schema_cache = {}
+        self.achievement_progress_cache = {}
+        self.app_details_cache = {}
+        self.app_details_file_cache = FakeAppDetailsStore()
+        self.metric_cache_pending_records = {}
+        self.metric_cache_compaction_pending = False
+        self.last_metric_cache_save = 0
+        self.logged_exceptions = []
+
+    def log_exception(self, message):
+        self.logged_exceptions.append(message)
+
+    def set_player_count(self, app_id, player_count, timestamp):
+        entry = {"timestamp": timestamp, "player_count": player_count}
+        self.player_count_cache[app_id] = entry
+        self.metric_cache_pending_records[("player_count_cache", app_id)] = entry
+
+
+class MetricCacheJournalTests(unittest.TestCase):
+    def test_replay_applies_newest_entry_per_key_and_skips_torn_lines(self):
+        with TemporaryDirectory() as temp_dir:
+            journal = MetricCacheJournal(Path(temp_dir) / "cache_metric.journal")
+            journal.append([("player_count_cache", "570", {"timestamp": 20, "player_count": 2})])
+            journal.append([("player_count_cache", "570", {"timestamp": 10, "player_count": 1})])
+            with open(journal.journal_file, "ab") as file_obj:
+                file_obj.write(b'["player_count_cache","400",{"timest')
+            caches = {"player_count_cache": {}}
+
+            applied_count = journal.replay(caches)
+
+        self.assertEqual(applied_count, 1)
+        self.assertEqual(caches["player_count_cache"], {"570": {"timestamp": 20, "player_count": 2}})
+
+    def test_apply_ignores_unknown_caches(self):
+        caches = {"review_score_cache": {}}
+
+        applied_count = apply_metric_journal_records(caches, [("player_count_cache", "570", {"timestamp": 1})])
+
+        self.assertEqual(applied_count, 0)
+        self.assertEqual(caches, {"review_score_cache": {}})
+
+    def test_sealed_journal_is_replayed_until_discarded(self):
+        with TemporaryDirectory() as temp_dir:
+            journal = MetricCacheJournal(Path(temp_dir) / "cache_metric.journal")
+            journal.append([("review_score_cache", "570", {"timestamp": 5, "summary": {}})])
+            sealed_file = journal.seal()
+            journal.append([("review_score_cache", "400", {"timestamp": 6, "summary": {}})])
+            caches = {"review_score_cache": {}}
+
+            journal.replay(caches)
+            journal.discard([sealed_file])
+
+            self.assertEqual(sorted(caches["review_score_cache"]), ["400", "570"])
+            self.assertEqual(journal.list_sealed_files(), [])
+            self.assertIsNone(MetricCacheJournal(Path(temp_dir) / "missing.journal").seal())
+
+
+class MetricCacheStorageTests(unittest.TestCase):
+    def test_save_appends_only_changed_entries(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StorageHarness(temp_dir)
+            plugin.set_player_count("570", 100, 10)
+            plugin.save_metric_caches(force=True)
+            plugin.set_player_count("400", 50, 11)
+            plugin.save_metric_caches(force=True)
+
+            journal_lines = plugin.metric_cache_journal_file.read_text(encoding="utf-8").splitlines()
+
+            self.assertFalse(plugin.metric_cache_file.exists())
+            self.assertEqual(len(journal_lines), 2)
+            self.assertEqual(json.loads(journal_lines[1])[1], "400")
+            self.assertEqual(plugin.metric_cache_pending_records, {})
+
+    def test_load_replays_journal_over_compacted_snapshot(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StorageHarness(temp_dir)
+            plugin.set_player_count("570", 100, 10)
+            plugin.save_metric_caches(force=True)
+            plugin.metric_cache_compaction_pending = True
+            plugin.save_metric_caches(force=True)
+            plugin.set_player_count("570", 120, 20)
+            plugin.save_metric_caches(force=True)
+            other_process = MetricCacheJournal(plugin.metric_cache_journal_file)
+            other_process.append([("achievement_schema_cache", "400", {"timestamp": 30, "total_count": 5})])
+
+            restored = StorageHarness(temp_dir)
+            restored.load_metric_caches()
+
+            snapshot = json.loads(plugin.metric_cache_file.read_text(encoding="utf-8"))
+            self.assertEqual(snapshot["player_count_cache"]["570"]["player_count"], 100)
+            self.assertEqual(restored.player_count_cache["570"]["player_count"], 120)
+            self.assertEqual(restored.achievement_schema_cache["400"]["total_count"], 5)
+
+    def test_compaction_folds_journal_into_snapshot_and_truncates_it(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StorageHarness(temp_dir)
+            plugin.set_player_count("570", 100, 10)
+            plugin.save_metric_caches(force=True)
+            MetricCacheJournal(plugin.metric_cache_journal_file).append(
+                [("player_count_cache", "400", {"timestamp": 15, "player_count": 7})]
+            )
+            plugin.metric_cache_compaction_pending = True
+
+            plugin.save_metric_caches(force=True)
+
+            snapshot = json.loads(plugin.metric_cache_file.read_text(encoding="utf-8"))
+            self.assertEqual(sorted(snapshot["player_count_cache"]), ["400", "570"])
+            self.assertFalse(plugin.metric_cache_journal_file.exists())
+            self.assertEqual(plugin.player_count_cache["400"]["player_count"], 7)
+
+    def test_failed_append_keeps_records_pending(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StorageHarness(temp_dir)
+            plugin.metric_cache_journal_file = Path(temp_dir) / "missing" / "dir" / "cache_metric.journal"
+            plugin.metric_cache_journal_file.parent.parent.write_text("", encoding="utf-8")
+            plugin.set_player_count("570", 100, 10)
+
+            plugin.save_metric_caches(force=True)
+
+            self.assertIn(("player_count_cache", "570"), plugin.metric_cache_pending_records)
+            self.assertEqual(plugin.logged_exceptions, ["Failed to append metric cache journal"])
+
+
+    def test_compaction_keeps_entries_compacted_by_another_process(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StorageHarness(temp_dir)
+            other_process = StorageHarness(temp_dir)
+            now = time.time()
+            other_process.set_player_count("400", 7, now)
+            other_process.metric_cache_compaction_pending = True
+            other_process.save_metric_caches(force=True)
+            plugin.set_player_count("570", 100, now)
+            plugin.metric_cache_compaction_pending = True
+
+            plugin.save_metric_caches(force=True)
+
+            snapshot = json.loads(plugin.metric_cache_file.read_text(encoding="utf-8"))
+            self.assertEqual(sorted(snapshot["player_count_cache"]), ["400", "570"])
+            self.assertEqual(plugin.player_count_cache["400"]["player_count"], 7)
+
+    def test_compaction_drops_expired_entries_it_reads_back(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StorageHarness(temp_dir)
+            plugin.metric_cache_file.write_text(
+                json.dumps({"player_count_cache": {"400": {"timestamp": 1, "player_count": 7}}}),
+                encoding="utf-8",
+            )
+            plugin.set_player_count("570", 100, time.time())
+            plugin.metric_cache_compaction_pending = True
+
+            plugin.save_metric_caches(force=True)
+
+            snapshot = json.loads(plugin.metric_cache_file.read_text(encoding="utf-8"))
+            self.assertEqual(sorted(snapshot["player_count_cache"]), ["570"])
+
+    def test_compaction_waits_for_the_metric_cache_lock(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StorageHarness(temp_dir)
+            plugin.set_player_count("570", 100, 10)
+            plugin.save_metric_caches(force=True)
+            results = []
+
+            with exclusive_lock_file(plugin.get_metric_cache_lock_file()):
+                worker = threading.Thread(target=lambda: results.append(plugin.compact_metric_caches()))
+                worker.start()
+                time.sleep(0.1)
+                self.assertTrue(plugin.metric_cache_journal_file.exists())
+                self.assertFalse(plugin.metric_cache_file.exists())
+            worker.join(5)
+
+            self.assertEqual(results, [True])
+            self.assertFalse(plugin.metric_cache_journal_file.exists())
+            self.assertFalse(plugin.get_metric_cache_lock_file().exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,7 +29,13 @@ class ProfileHarness(SteamPluginProfileMixin):
         self.api_key_bound = True
         self.active_steamid64 = "76561198000000000"
         self.api_key = "A" * 32
-        self.fetch_result = ({"570"}, {"570": 11290})
+        self.fetch_result = {
+            "not_modified": False,
+            "owned_app_ids": {"570"},
+            "owned_game_playtimes": {"570": 11290},
+            "validators": {"etag": '"v1"'},
+        }
+        self.fetch_validators = []
         self.fetch_error = None
         self.cleared_cache = False
         self.saved_cache = False
@@ -59,7 +65,8 @@ class ProfileHarness(SteamPluginProfileMixin):
     def clear_owned_games_cache(self):
         self.cleared_cache = True
 
-    def fetch_owned_app_ids_from_api(self, api_key, steamid64, timeout=3):
+    def fetch_owned_games_update_from_api(self, api_key, steamid64, timeout=3, validators=None):
+        self.fetch_validators.append(validators)
         if self.fetch_error is not None:
             raise self.fetch_error
         return self.fetch_result
@@ -88,6 +95,29 @@ class ProfileMixinTests(unittest.TestCase):
         self.assertEqual(plugin.logged_exceptions, [])
         self.assertIn("success=True", plugin.slow_calls[-1][2])
 
+    def test_refresh_owned_games_cache_keeps_cached_games_when_not_modified(self):
+        plugin = ProfileHarness()
+        plugin.owned_games_cache_loaded = True
+        plugin.owned_games_steamid64 = "76561198000000000"
+        plugin.owned_app_ids = {"400"}
+        plugin.owned_game_playtimes = {"400": 5}
+        plugin.owned_games_validators = {"etag": '"v1"'}
+        plugin.fetch_result = {
+            "not_modified": True,
+            "owned_app_ids": set(),
+            "owned_game_playtimes": {},
+            "validators": {"etag": '"v1"'},
+        }
+
+        plugin.refresh_owned_games_cache()
+
+        self.assertEqual(plugin.fetch_validators, [{"etag": '"v1"'}])
+        self.assertTrue(plugin.saved_cache)
+        self.assertGreater(plugin.owned_games_last_sync, 0)
+        self.assertEqual(plugin.owned_app_ids, {"400"})
+        self.assertEqual(plugin.owned_game_playtimes, {"400": 5})
+        self.assertIn("count=1 success=True", plugin.slow_calls[-1][2])
+
     def test_refresh_owned_games_cache_ignores_expected_network_errors(self):
         plugin = ProfileHarness()
         plugin.fetch_error = TimeoutError("slow")
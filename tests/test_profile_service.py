@@ -150,7 +150,12 @@ class ProfileServiceTests(unittest.TestCase):
         urllib3_module = SimpleNamespace(exceptions=SimpleNamespace(TimeoutError=TimeoutError, HTTPError=HTTPError))
 
         result = fetch_owned_games_refresh_result(
-            lambda _api_key, _steamid64, timeout=3: ({"570"}, {"570": 10}),
+            lambda _api_key, _steamid64, timeout=3, validators=None: {
+                "not_modified": False,
+                "owned_app_ids": {"570"},
+                "owned_game_playtimes": {"570": 10},
+                "validators": {"etag": '"v1"'},
+            },
             "KEY",
             "steamid",
             urllib3_module,
@@ -158,6 +163,7 @@ class ProfileServiceTests(unittest.TestCase):
 
         self.assertTrue(result["success"])
         self.assertEqual(result["owned_app_ids"], {"570"})
+        self.assertEqual(result["validators"], {"etag": '"v1"'})
         self.assertFalse(result["should_log_error"])
 
         timeout_result = fetch_owned_games_refresh_result(
@@ -0,0 +1,190 @@
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from multiprocessing.connection import Listener
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow.query_daemon import (
+    QUERY_DAEMON_START_LOCK_FILE_NAME,
+    QUERY_DAEMON_STATE_FILE_NAME,
+    QueryDaemonCapturingClient,
+    QueryDaemonServer,
+    build_query_daemon_address,
+    forward_query_daemon_request,
+    is_query_daemon_enabled,
+    should_forward_rpc_request,
+    start_query_daemon_process,
+)
+
+
+class FakePlugin:
+    instances = 0
+
+    def __init__(self, watched_file=None):
+        FakePlugin.instances += 1
+        self.instance_id = FakePlugin.instances
+        self.owned_games_cache_file = watched_file
+        self.rpc_request = {}
+        self._client = None
+
+    def bind_rpc_request(self, rpc_request, client=None):
+        self._client = client
+        self.rpc_request = rpc_request
+
+    def run(self):
+        query = self.rpc_request["parameters"][0]
+        self._client.send({"Result": [{"Title": query, "Instance": self.instance_id}]})
+
+
+class QueryDaemonSettingsTests(unittest.TestCase):
+    def test_enabled_flag_reads_request_settings(self):
+        self.assertTrue(is_query_daemon_enabled({"settings": {"enable_query_daemon": True}}))
+        self.assertTrue(is_query_daemon_enabled({"settings": {"enable_query_daemon": "true"}}))
+        self.assertFalse(is_query_daemon_enabled({"settings": {"enable_query_daemon": "false"}}))
+        self.assertFalse(is_query_daemon_enabled({"settings": None}))
+        self.assertFalse(is_query_daemon_enabled(None))
+
+    def test_only_queries_are_forwarded(self):
+        settings = {"enable_query_daemon": True}
+        self.assertTrue(should_forward_rpc_request({"method": "query", "settings": settings}))
+        self.assertFalse(should_forward_rpc_request({"method": "context_menu", "settings": settings}))
+        self.assertFalse(should_forward_rpc_request({"method": "launch_game", "settings": settings}))
+        self.assertFalse(should_forward_rpc_request({"method": "query", "settings": {}}))
+
+
+class QueryDaemonServerTests(unittest.TestCase):
+    def test_capturing_client_returns_request_and_collects_payloads(self):
+        client = QueryDaemonCapturingClient({"method": "query"})
+
+        client.send({"Result": []})
+
+        self.assertEqual(client.recieve(), {"method": "query"})
+        self.assertEqual(client.payloads, ['{"Result": []}'])
+
+    def test_handle_request_reuses_plugin_until_watched_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            watched_file = Path(temp_dir) / "cache_owned_games.json"
+            server = QueryDaemonServer(lambda: FakePlugin(watched_file))
+
+            first = server.handle_request({"method": "query", "parameters": ["portal"]})
+            second = server.handle_request({"method": "query", "parameters": ["hades"]})
+            watched_file.write_text("{}", encoding="utf-8")
+            third = server.handle_request({"method": "query", "parameters": ["doom"]})
+
+        first_result = json.loads(first[0])["Result"][0]
+        second_result = json.loads(second[0])["Result"][0]
+        third_result = json.loads(third[0])["Result"][0]
+        self.assertEqual(first_result["Title"], "portal")
+        self.assertEqual(second_result["Title"], "hades")
+        self.assertEqual(first_result["Instance"], second_result["Instance"])
+        self.assertNotEqual(second_result["Instance"], third_result["Instance"])
+        self.assertEqual(server.plugin_builds, 2)
+        self.assertEqual(server.requests_handled, 3)
+
+    def test_handle_request_rebuilds_plugin_when_settings_change(self):
+        server = QueryDaemonServer(FakePlugin)
+        settings = {"show_prices": True}
+
+        first = server.handle_request({"method": "query", "parameters": ["portal"], "settings": dict(settings)})
+        second = server.handle_request({"method": "query", "parameters": ["hades"], "settings": dict(settings)})
+        settings["show_prices"] = False
+        third = server.handle_request({"method": "query", "parameters": ["doom"], "settings": dict(settings)})
+
+        instances = [json.loads(payloads[0])["Result"][0]["Instance"] for payloads in (first, second, third)]
+        self.assertEqual(instances[0], instances[1])
+        self.assertNotEqual(instances[1], instances[2])
+        self.assertEqual(server.plugin_builds, 2)
+
+    def test_is_idle_uses_last_activity(self):
+        now = [100.0]
+        server = QueryDaemonServer(FakePlugin, idle_timeout_seconds=60, clock=lambda: now[0])
+
+        self.assertFalse(server.is_idle())
+        now[0] = 161.0
+        self.assertTrue(server.is_idle())
+
+
+class QueryDaemonClientTests(unittest.TestCase):
+    def test_forward_returns_none_without_state_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertIsNone(forward_query_daemon_request(temp_dir, {"method": "query"}, version="1.0"))
+
+    def test_forward_returns_none_on_version_mismatch(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            state_file = Path(temp_dir) / QUERY_DAEMON_STATE_FILE_NAME
+            state_file.write_text(json.dumps({"address": "x", "authkey": "00", "version": "1.0"}), encoding="utf-8")
+
+            def fail_client(*args, **kwargs):
+                raise AssertionError("client should not connect")
+
+            self.assertIsNone(
+                forward_query_daemon_request(temp_dir, {"method": "query"}, version="2.0", client_factory=fail_client)
+            )
+
+    def test_forward_round_trips_through_listener(self):
+        if sys.platform == "win32":
+            address = build_query_daemon_address()
+        else:
+            address = ("127.0.0.1", 0)
+        authkey = b"steamflow-test"
+        listener = Listener(address, authkey=authkey)
+        server = QueryDaemonServer(FakePlugin)
+
+        def serve_once():
+            with listener.accept() as connection:
+                server.handle_connection(connection)
+
+        thread = threading.Thread(target=serve_once, daemon=True)
+        thread.start()
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                state_file = Path(temp_dir) / QUERY_DAEMON_STATE_FILE_NAME
+                state_file.write_text(
+                    json.dumps({"address": listener.address, "authkey": authkey.hex(), "version": "1.0"}),
+                    encoding="utf-8",
+                )
+                payloads = forward_query_daemon_request(
+                    temp_dir,
+                    {"method": "query", "parameters": ["celeste"]},
+                    version="1.0",
+                    timeout=5,
+                )
+            thread.join(timeout=5)
+        finally:
+            listener.close()
+
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(json.loads(payloads[0])["Result"][0]["Title"], "celeste")
+
+    def test_start_process_skips_while_spawn_lock_is_fresh(self):
+        calls = []
+
+        def fake_popen(command, **kwargs):
+            calls.append(command)
+            return object()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plugin_dir = Path(temp_dir)
+            (plugin_dir / "steam_query_daemon.py").write_text("", encoding="utf-8")
+
+            first = start_query_daemon_process(plugin_dir, python_executable="python", popen=fake_popen, platform="linux")
+            second = start_query_daemon_process(plugin_dir, python_executable="python", popen=fake_popen, platform="linux")
+            lock_exists = (plugin_dir / QUERY_DAEMON_START_LOCK_FILE_NAME).exists()
+
+        self.assertIsNotNone(first)
+        self.assertIsNone(second)
+        self.assertTrue(lock_exists)
+        self.assertEqual(calls, [["python", str(plugin_dir / "steam_query_daemon.py")]])
+
+
+if __name__ == "__main__":
+    unittest.main()
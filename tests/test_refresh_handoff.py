@@ -0,0 +1,211 @@
+import json
+import sys
+import threading
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow.core import SteamPluginCoreMixin
+from steamflow.refresh_handoff import (
+    build_refresh_job,
+    claim_refresh_jobs,
+    merge_refresh_jobs,
+    run_refresh_jobs,
+)
+from steamflow.tasks import BackgroundTaskManager, TaskScheduler
+import steam_refresh_worker
+
+
+class DeferredThread:
+    def __init__(self, target=None, daemon=None):
+        self.target = target
+
+    def start(self):
+        pass
+
+
+class DrainHarness(SteamPluginCoreMixin):
+    def __init__(self, temp_dir):
+        self.plugin_dir = Path(temp_dir)
+        self.refresh_jobs_file = Path(temp_dir) / "steam_refresh_jobs.json"
+        self.refresh_worker_lock_file = Path(temp_dir) / "steam_refresh_worker.lock"
+        self.state_lock = threading.RLock()
+        self.background_task_manager = BackgroundTaskManager(
+            scheduler=TaskScheduler(thread_factory=DeferredThread, idle_timeout_seconds=0)
+        )
+        self.metric_cache_pending_records = {}
+        self.metric_cache_compaction_pending = False
+        self.settings = {"enable_perf_logging": True}
+        self.saved_metric_records = []
+        self.messages = []
+
+    def save_metric_caches(self, force=False):
+        self.saved_metric_records.extend(self.metric_cache_pending_records)
+        self.metric_cache_pending_records = {}
+
+    def log(self, level, message):
+        self.messages.append(message)
+
+    def refresh_player_count(self, app_id):
+        self.metric_cache_pending_records[("player_count_cache", app_id)] = {"timestamp": 1}
+
+
+class FakeRefreshPlugin:
+    def __init__(self):
+        self.calls = []
+
+    def _refresh_app_details_worker(self, app_id):
+        self.calls.append(("app_details", app_id))
+
+    def _refresh_wishlist_worker(self):
+        raise RuntimeError("offline")
+
+    def persist_runtime_caches(self):
+        self.calls.append(("persist", None))
+        return []
+
+
+class RefreshHandoffTests(unittest.TestCase):
+    def test_only_known_refresh_keys_become_jobs(self):
+        self.assertEqual(
+            build_refresh_job(("pending_player_count_refresh", 570)),
+            ["pending_player_count_refresh", "570"],
+        )
+        self.assertEqual(build_refresh_job("pending_wishlist_refresh"), ["pending_wishlist_refresh", None])
+        self.assertEqual(build_refresh_job("pending_icon_refresh"), ["pending_icon_refresh", None])
+        self.assertIsNone(build_refresh_job("installed_games_update_in_progress"))
+        self.assertIsNone(build_refresh_job(None))
+
+    def test_merged_jobs_are_deduplicated_and_claimed_once(self):
+        with TemporaryDirectory() as temp_dir:
+            jobs_file = Path(temp_dir) / "steam_refresh_jobs.json"
+            merge_refresh_jobs(jobs_file, [["pending_app_details_refresh", "570"]], settings={"a": 1})
+            merged_jobs = merge_refresh_jobs(
+                jobs_file,
+                [["pending_app_details_refresh", "570"], ["pending_wishlist_refresh", None], ["unknown", "1"]],
+                settings={"a": 2},
+            )
+
+            settings, claimed_jobs = claim_refresh_jobs(jobs_file)
+
+            self.assertEqual(merged_jobs, claimed_jobs)
+            self.assertEqual(
+                claimed_jobs,
+                [["pending_app_details_refresh", "570"], ["pending_wishlist_refresh", None]],
+            )
+            self.assertEqual(settings, {"a": 2})
+            self.assertIsNone(claim_refresh_jobs(jobs_file))
+            self.assertEqual(list(Path(temp_dir).iterdir()), [])
+
+    def test_concurrent_merges_keep_every_handoff(self):
+        with TemporaryDirectory() as temp_dir:
+            jobs_file = Path(temp_dir) / "steam_refresh_jobs.json"
+
+            def hand_off(worker_index):
+                for job_index in range(5):
+                    merge_refresh_jobs(jobs_file, [["pending_app_details_refresh", f"{worker_index}{job_index}"]])
+
+            threads = [threading.Thread(target=hand_off, args=(worker_index,)) for worker_index in range(1, 7)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            _settings, claimed_jobs = claim_refresh_jobs(jobs_file)
+
+        self.assertEqual(len(claimed_jobs), 30)
+
+    def test_run_refresh_jobs_reports_failures_and_continues(self):
+        plugin = FakeRefreshPlugin()
+        failures = []
+
+        completed_count = run_refresh_jobs(
+            plugin,
+            [["pending_wishlist_refresh", None], ["pending_app_details_refresh", "570"]],
+            on_error=lambda pending_name, key: failures.append(pending_name),
+        )
+
+        self.assertEqual(completed_count, 1)
+        self.assertEqual(plugin.calls, [("app_details", "570")])
+        self.assertEqual(failures, ["pending_wishlist_refresh"])
+
+
+class DrainBackgroundWorkTests(unittest.TestCase):
+    def test_drain_persists_completed_refreshes_and_hands_off_the_rest(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = DrainHarness(temp_dir)
+            manager = plugin.background_task_manager
+            manager.start(plugin.refresh_player_count, "570", key=("pending_player_count_refresh", "570"))
+            manager.start(lambda: None, key=("pending_app_details_refresh", "400"))
+            manager.start(lambda: None)
+            refresh_tasks = plugin.list_pending_refresh_tasks()
+            manager.scheduler.take_next_task().run()
+
+            stats = plugin.drain_background_work(refresh_tasks, budget_ms=0)
+
+            payload = json.loads(plugin.refresh_jobs_file.read_text(encoding="utf-8"))
+            self.assertEqual(stats["completed"], 1)
+            self.assertEqual(stats["refreshes"], 2)
+            self.assertEqual(stats["persisted"], ["metrics"])
+            self.assertEqual(stats["handed_off"], 1)
+            self.assertEqual(plugin.saved_metric_records, [("player_count_cache", "570")])
+            self.assertEqual(payload["jobs"], [["pending_app_details_refresh", "400"]])
+            self.assertEqual(payload["settings"], {"enable_perf_logging": True})
+            self.assertIn("completed=1/2 persisted=metrics handed_off=1", plugin.messages[0])
+
+    def test_short_lived_request_skips_drain_without_refreshes(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = DrainHarness(temp_dir)
+            plugin.background_task_manager.start(lambda: None)
+
+            with patch.object(DrainHarness, "close_response_stream", create=True) as close_response_stream:
+                self.assertIsNone(plugin.finish_short_lived_request())
+
+            close_response_stream.assert_not_called()
+            self.assertFalse(plugin.refresh_jobs_file.exists())
+
+
+class RefreshWorkerTests(unittest.TestCase):
+    def test_worker_runs_claimed_jobs_with_saved_settings(self):
+        with TemporaryDirectory() as temp_dir:
+            jobs_file = Path(temp_dir) / "steam_refresh_jobs.json"
+            merge_refresh_jobs(jobs_file, [["pending_app_details_refresh", "570"]], settings={"steam_language": "german"})
+            plugins = []
+            received_settings = []
+
+            def plugin_factory(settings):
+                received_settings.append(settings)
+                plugins.append(FakeRefreshPlugin())
+                plugins[-1].background_task_manager = BackgroundTaskManager()
+                return plugins[-1]
+
+            processed_count = steam_refresh_worker.process_claimed_jobs(jobs_file, plugin_factory=plugin_factory)
+
+            self.assertEqual(processed_count, 1)
+            self.assertEqual(received_settings, [{"steam_language": "german"}])
+            self.assertEqual(plugins[0].calls, [("app_details", "570"), ("persist", None)])
+            self.assertFalse(jobs_file.exists())
+
+    def test_worker_logs_to_file_only_once_configured(self):
+        self.assertEqual(steam_refresh_worker.logger.handlers, [])
+        with TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "steam_refresh_worker.log"
+            logger = steam_refresh_worker.configure_logger(log_file)
+            try:
+                logger.info("configured")
+                self.assertTrue(log_file.exists())
+            finally:
+                for handler in list(logger.handlers):
+                    handler.close()
+                logger.handlers.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import json
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow.core import SteamPluginCoreMixin
+from steamflow.settings_snapshot import (
+    build_settings_snapshot,
+    get_settings_signature,
+    parse_blacklisted_app_ids,
+    resolve_plugin_keyword,
+)
+
+
+class SnapshotHarness(SteamPluginCoreMixin):
+    id = "plugin-id"
+    user_keyword = "steam"
+
+    def __init__(self, appdata):
+        self.appdata = str(appdata)
+        self.rpc_request = {"method": "query"}
+        self.plugin_settings = {"show_prices": "false", "blacklisted_app_ids": "10, 20\n30"}
+        self.settings_reads = 0
+        self.app_settings_reads = 0
+        self.hidden_loads = 0
+
+    @property
+    def settings(self):
+        self.settings_reads += 1
+        return dict(self.plugin_settings)
+
+    @property
+    def app_settings(self):
+        self.app_settings_reads += 1
+        settings_path = Path(self.appdata) / "Settings" / "Settings.json"
+        return json.loads(settings_path.read_text(encoding="utf-8"))
+
+    def load_hidden_app_ids(self):
+        self.hidden_loads += 1
+        return {"99"}
+
+
+def write_flow_settings(appdata, keywords):
+    settings_path = Path(appdata) / "Settings" / "Settings.json"
+    settings_path.parent.mkdir(parents=True, exist_ok=True)
+    settings_path.write_text(
+        json.dumps({"PluginSettings": {"Plugins": {"plugin-id": {"UserKeywords": keywords}}}}),
+        encoding="utf-8",
+    )
+
+
+class SettingsSnapshotBuilderTests(unittest.TestCase):
+    def test_snapshot_coerces_settings_once(self):
+        snapshot = build_settings_snapshot(
+            {"show_platforms": "yes", "show_prices": 0, "blacklisted_app_ids": ["10", " ", "20"]},
+            ("sig", None),
+            "de",
+            "german",
+            "st",
+            default_blacklisted_app_ids=frozenset({"228980"}),
+        )
+
+        self.assertTrue(snapshot.show_platforms)
+        self.assertFalse(snapshot.show_prices)
+        self.assertTrue(snapshot.show_player_count)
+        self.assertEqual(snapshot.blacklisted_app_ids, frozenset({"10", "20", "228980"}))
+        self.assertEqual((snapshot.language, snapshot.steam_language, snapshot.plugin_keyword), ("de", "german", "st"))
+
+    def test_blacklist_and_keyword_parsing(self):
+        self.assertEqual(parse_blacklisted_app_ids("1,2\n3", {"4"}), frozenset({"1", "2", "3", "4"}))
+        self.assertEqual(resolve_plugin_keyword({"PluginSettings": {"Plugins": {"x": {"ActionKeywords": "sf"}}}}, "x"), "sf")
+        self.assertEqual(resolve_plugin_keyword({}, "x"), "")
+
+    def test_signature_tracks_settings_content(self):
+        self.assertEqual(get_settings_signature({"a": 1, "b": 2}), get_settings_signature({"b": 2, "a": 1}))
+        self.assertNotEqual(get_settings_signature({"a": 1}), get_settings_signature({"a": 2}))
+
+
+class SettingsSnapshotPluginTests(unittest.TestCase):
+    def test_snapshot_is_built_once_per_request(self):
+        with TemporaryDirectory() as temp_dir:
+            write_flow_settings(temp_dir, ["st"])
+            plugin = SnapshotHarness(temp_dir)
+
+            for _ in range(3):
+                self.assertFalse(plugin.should_show_prices())
+                self.assertEqual(plugin.build_plugin_query("wishlist"), "st wishlist")
+                blacklist = plugin.get_blacklisted_app_ids()
+
+        self.assertEqual(blacklist, frozenset({"10", "20", "30", "99", "228980"}))
+        self.assertEqual((plugin.settings_reads, plugin.app_settings_reads, plugin.hidden_loads), (1, 1, 1))
+
+    def test_new_request_reuses_snapshot_until_settings_change(self):
+        with TemporaryDirectory() as temp_dir:
+            write_flow_settings(temp_dir, ["st"])
+            plugin = SnapshotHarness(temp_dir)
+            first = plugin.get_settings_snapshot()
+
+            plugin.rpc_request = {"method": "query"}
+            unchanged = plugin.get_settings_snapshot()
+            plugin.rpc_request = {"method": "query"}
+            plugin.plugin_settings["show_prices"] = True
+            changed = plugin.get_settings_snapshot()
+
+        self.assertIs(unchanged, first)
+        self.assertIsNot(changed, first)
+        self.assertTrue(changed.show_prices)
+        self.assertEqual(plugin.app_settings_reads, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
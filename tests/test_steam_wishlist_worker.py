@@ -9,20 +9,21 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from steamflow.app_details import AppDetailsFileCache
+from steamflow.app_details import AppDetailsStore
 import steam_wishlist_worker
 
 
 class SteamWishlistWorkerTests(unittest.TestCase):
-    def test_appdetails_cache_requires_matching_country_path(self):
+    def test_appdetails_cache_requires_matching_country(self):
         with TemporaryDirectory() as temp_dir:
-            cache = AppDetailsFileCache(Path(temp_dir))
+            cache = AppDetailsStore(Path(temp_dir))
             cache.write_entry("570", {"name": "Dota 2"}, success=True, country_code="us")
 
             self.assertEqual(cache.get_metadata("570", "us"), {"name": "Dota 2"})
             self.assertIsNone(cache.get_metadata("570", "uz"))
+            cache.close()
 
-    def test_worker_hydration_writes_shared_appdetails_file(self):
+    def test_worker_hydration_writes_shared_appdetails_store(self):
         with TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
             with (
@@ -33,15 +34,16 @@ class SteamWishlistWorkerTests(unittest.TestCase):
             ):
                 result = steam_wishlist_worker.main()
 
-            cache = AppDetailsFileCache(temp_path / "cache_app_details")
+            cache = AppDetailsStore(temp_path / "cache_app_details")
 
             self.assertEqual(result, 0)
             self.assertEqual(cache.get_metadata("570", "kz"), {"name": "Dota 2"})
+            cache.close()
 
     def test_worker_refreshes_fresh_cache_when_language_mismatches(self):
         with TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
-            cache = AppDetailsFileCache(temp_path / "cache_app_details")
+            cache = AppDetailsStore(temp_path / "cache_app_details")
             cache.write_entry("570", {"name": "Old"}, success=True, country_code="kz", steam_language="en")
             with (
                 patch.object(steam_wishlist_worker, "APP_DETAILS_CACHE_DIR", temp_path / "cache_app_details"),
@@ -52,6 +54,7 @@ class SteamWishlistWorkerTests(unittest.TestCase):
                 result = steam_wishlist_worker.main()
 
             updated_entry = cache.read_entry("570", "kz")
+            cache.close()
 
             self.assertEqual(result, 0)
             fetch.assert_called_once()
@@ -16,6 +16,23 @@ if str(LIB_PATH) not in sys.path:
     sys.path.insert(0, str(LIB_PATH))
 
 from steamflow.store import SteamPluginStoreMixin
+from steamflow.tasks import BackgroundTaskManager
+
+
+class ImmediateThread:
+    def __init__(self, target, daemon=None):
+        self.target = target
+
+    def start(self):
+        self.target()
+
+    def join(self, timeout=None):
+        return None
+
+
+class DeferredThread(ImmediateThread):
+    def start(self):
+        return None
 
 
 class StoreHarness(SteamPluginStoreMixin):
@@ -102,6 +119,24 @@ class StoreTests(unittest.TestCase):
             self.assertEqual(plugin.fetch_calls, ["400"])
             self.assertEqual(plugin.app_details_cache["400"]["country_code"], "uz")
 
+    def test_preload_app_details_entries_reads_store_in_one_batch(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StoreHarness(temp_dir, country_code="us")
+            plugin.app_details_file_cache.write_many(
+                {"570": ({"name": "Dota 2"}, True), "400": ({"name": "Portal"}, True)},
+                steam_language="english",
+            )
+
+            with patch.object(plugin.app_details_file_cache, "read_entry") as read_entry:
+                loaded_count = plugin.preload_app_details_entries(["570", "400", "730"])
+                metadata = plugin.get_app_details_metadata("400", allow_network_on_miss=False)
+            plugin.app_details_file_cache.close()
+
+            self.assertEqual(loaded_count, 2)
+            self.assertEqual(metadata, {"name": "Portal"})
+            read_entry.assert_not_called()
+            self.assertEqual(plugin.fetch_calls, [])
+
     def test_search_steam_api_caches_successful_network_result(self):
         with TemporaryDirectory() as temp_dir:
             plugin = StoreHarness(temp_dir, country_code="us")
@@ -114,6 +149,50 @@ class StoreTests(unittest.TestCase):
             self.assertEqual(plugin.search_cache[("dota", "us")]["games"], games)
             self.assertEqual(plugin.logged_exceptions, [])
 
+    def test_search_steam_api_reuses_persisted_result_without_network(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StoreHarness(temp_dir, country_code="us")
+            plugin.store_search_cache_file = Path(temp_dir) / "cache_store_search.json"
+            games = [{"id": 570, "name": "Dota 2"}]
+            plugin.store_search_disk_cache.put("us|english|dota", games)
+            plugin.save_store_search_cache()
+            restarted = StoreHarness(temp_dir, country_code="us")
+            restarted.store_search_cache_file = plugin.store_search_cache_file
+
+            result = restarted.search_steam_api("dota")
+
+            self.assertEqual(result, {"games": games, "error": None})
+            self.assertEqual(restarted.search_cache[("dota", "us")]["games"], games)
+
+    def test_search_steam_api_returns_stale_result_and_refreshes_in_background(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StoreHarness(temp_dir, country_code="us")
+            plugin.background_task_manager = BackgroundTaskManager(thread_factory=ImmediateThread)
+            stale_games = [{"id": 570, "name": "Dota 2"}]
+            fresh_games = [{"id": 570, "name": "Dota 2"}, {"id": 1, "name": "Dota Underlords"}]
+            plugin.store_search_disk_cache.put("us|english|dota", stale_games, now=time.time() - 3600)
+
+            with patch("steamflow.store.fetch_store_search_games", return_value=fresh_games):
+                result = plugin.search_steam_api("dota")
+
+            self.assertEqual(result, {"games": stale_games, "error": None, "stale": True})
+            self.assertEqual(plugin.search_cache[("dota", "us")]["games"], fresh_games)
+            self.assertEqual(plugin.store_search_disk_cache.get("us|english|dota")["games"], fresh_games)
+
+    def test_search_steam_api_filters_prefix_result_while_refresh_is_pending(self):
+        with TemporaryDirectory() as temp_dir:
+            plugin = StoreHarness(temp_dir, country_code="us")
+            plugin.background_task_manager = BackgroundTaskManager(thread_factory=DeferredThread)
+            plugin.store_search_disk_cache.put(
+                "us|english|dot",
+                [{"id": 570, "name": "Dota 2"}, {"id": 1, "name": "Dotori"}],
+            )
+
+            result = plugin.search_steam_api("dota")
+
+            self.assertEqual(result, {"games": [{"id": 570, "name": "Dota 2"}], "error": None, "provisional": True})
+            self.assertIn("us|english|dota", plugin.store_search_refreshes_in_progress)
+
     def test_store_collection_uses_fresh_cache_without_network(self):
         with TemporaryDirectory() as temp_dir:
             plugin = StoreHarness(temp_dir, country_code="us")
@@ -1,4 +1,6 @@
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
 
@@ -10,6 +12,7 @@ if str(LIB_PATH) not in sys.path:
     sys.path.insert(0, str(LIB_PATH))
 
 from steamflow.store_metrics import SteamPluginStoreMetricsMixin
+from steamflow.tasks import BackgroundTaskManager
 
 
 class StoreMetricsHarness(SteamPluginStoreMetricsMixin):
@@ -92,7 +95,59 @@ class StoreMetricsHarness(SteamPluginStoreMetricsMixin):
         self.scheduled_wishlist_refreshes.append(force)
 
 
+class SlowMetricsHarness(StoreMetricsHarness):
+    def __init__(self):
+        super().__init__()
+        self.background_task_manager = BackgroundTaskManager()
+        self.metric_lock = threading.Lock()
+        self.active_fetches = 0
+        self.max_active_fetches = 0
+
+    def should_show_positive_reviews(self):
+        return True
+
+    def should_show_player_count(self):
+        return True
+
+    def fetch_slowly(self):
+        with self.metric_lock:
+            self.active_fetches += 1
+            self.max_active_fetches = max(self.max_active_fetches, self.active_fetches)
+        time.sleep(0.2)
+        with self.metric_lock:
+            self.active_fetches -= 1
+
+    def get_review_score(self, app_id, allow_network_on_miss=True):
+        self.fetch_slowly()
+        return None
+
+    def get_current_players(self, app_id, allow_network_on_miss=True):
+        self.fetch_slowly()
+        return None
+
+
 class StoreMetricsTests(unittest.TestCase):
+    def test_process_store_results_fetches_metrics_of_every_game_concurrently(self):
+        harness = SlowMetricsHarness()
+        api_results = [
+            {
+                "type": "app",
+                "id": str(app_id),
+                "name": f"Game {app_id}",
+                "platforms": {},
+                "tiny_image": None,
+                "has_price": False,
+                "price": None,
+                "is_free": True,
+            }
+            for app_id in range(10, 18)
+        ]
+
+        results = harness.process_store_results(api_results, allow_cold_metric_fetch=False)
+
+        self.assertEqual(len(results), 8)
+        self.assertGreater(harness.max_active_fetches, 8)
+
     def test_only_true_free_games_render_free_badge(self):
         harness = StoreMetricsHarness()
 
@@ -59,8 +59,8 @@ class StoreSearchTests(unittest.TestCase):
     def test_fetch_store_search_games_uses_http_get_and_parser(self):
         calls = []
 
-        def http_get(url, timeout, headers):
-            calls.append((url, timeout, headers))
+        def http_get(url, timeout, headers, flight_key=None):
+            calls.append((url, timeout, headers, flight_key))
             payload = {"items": [{"type": "app", "id": 570, "name": "Dota 2", "is_free": True}]}
             return SimpleNamespace(data=json.dumps(payload).encode("utf-8"))
 
@@ -69,7 +69,8 @@ class StoreSearchTests(unittest.TestCase):
         self.assertEqual(games[0]["name"], "Dota 2")
         self.assertTrue(games[0]["is_free"])
         self.assertEqual(calls[0][1], 0.7)
-        self.assertEqual(calls[0][2], {"User-Agent": "Mozilla/5.0"})
+        self.assertEqual(calls[0][2], {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"})
+        self.assertEqual(calls[0][3], "storesearch")
 
 
 if __name__ == "__main__":
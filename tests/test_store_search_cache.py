@@ -0,0 +1,88 @@
+import json
+import sys
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow.store_search_cache import (
+    StoreSearchDiskCache,
+    build_store_search_cache_key,
+    filter_store_search_games,
+)
+
+
+class StoreSearchCacheTests(unittest.TestCase):
+    def test_cache_key_normalizes_case_and_whitespace(self):
+        self.assertEqual(
+            build_store_search_cache_key("  Dota   2 ", "US", "English"),
+            "us|english|dota 2",
+        )
+
+    def test_filter_keeps_games_matching_every_query_word_prefix(self):
+        games = [
+            {"id": 570, "name": "Dota 2"},
+            {"id": 1, "name": "Dota Underlords"},
+            {"id": 2, "name": "Anecdota"},
+        ]
+
+        self.assertEqual(filter_store_search_games(games, "dota u"), [games[1]])
+        self.assertEqual(filter_store_search_games(games, "dot"), games[:2])
+
+    def test_entries_round_trip_through_disk(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "cache_store_search.json"
+            cache = StoreSearchDiskCache(cache_file)
+            key = build_store_search_cache_key("dota")
+            cache.put(key, [{"id": 570, "name": "Dota 2"}])
+
+            self.assertTrue(cache.save())
+            self.assertFalse(cache.save())
+
+            restored = StoreSearchDiskCache(cache_file)
+            self.assertEqual(restored.get(key)["games"], [{"id": 570, "name": "Dota 2"}])
+
+    def test_unknown_version_is_ignored(self):
+        with TemporaryDirectory() as temp_dir:
+            cache_file = Path(temp_dir) / "cache_store_search.json"
+            key = build_store_search_cache_key("dota")
+            cache_file.write_text(
+                json.dumps({"version": 0, "entries": [[key, {"timestamp": time.time(), "games": []}]]}),
+                encoding="utf-8",
+            )
+
+            self.assertIsNone(StoreSearchDiskCache(cache_file).get(key))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = StoreSearchDiskCache(None, max_entries=2)
+        cache.put("us|english|a", [])
+        cache.put("us|english|b", [])
+        cache.get("us|english|a")
+        cache.put("us|english|c", [])
+
+        self.assertEqual(list(cache.entries), ["us|english|a", "us|english|c"])
+
+    def test_find_prefix_entry_prefers_longest_fresh_prefix(self):
+        cache = StoreSearchDiskCache(None)
+        now = time.time()
+        cache.put(build_store_search_cache_key("do"), [{"id": 1, "name": "Doom"}], now=now)
+        cache.put(build_store_search_cache_key("dot"), [{"id": 570, "name": "Dota 2"}], now=now - 120)
+
+        prefix, entry = cache.find_prefix_entry("dota")
+        self.assertEqual(prefix, "dot")
+        self.assertEqual(entry["games"], [{"id": 570, "name": "Dota 2"}])
+
+        prefix, _entry = cache.find_prefix_entry("dota", max_age_seconds=60)
+        self.assertEqual(prefix, "do")
+        self.assertIsNone(cache.find_prefix_entry("dota", country_code="de"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,15 @@ if str(PROJECT_ROOT) not in sys.path:
 if str(LIB_PATH) not in sys.path:
     sys.path.insert(0, str(LIB_PATH))
 
-from steamflow.tasks import BackgroundTaskManager, finish_flagged_refresh, get_background_task_manager, start_flagged_refresh
+from steamflow.tasks import (
+    TASK_PRIORITY_BACKGROUND,
+    TASK_PRIORITY_INTERACTIVE,
+    BackgroundTaskManager,
+    TaskScheduler,
+    finish_flagged_refresh,
+    get_background_task_manager,
+    start_flagged_refresh,
+)
 
 
 class ImmediateThread:
@@ -25,6 +33,17 @@ class ImmediateThread:
             self.target()
 
 
+class DeferredThread(ImmediateThread):
+    created = []
+
+    def start(self):
+        self.started = True
+        DeferredThread.created.append(self)
+
+    def run(self):
+        self.target()
+
+
 class TaskHarness:
     def __init__(self, manager=None):
         self.state_lock = threading.RLock()
@@ -35,14 +54,17 @@ class TaskHarness:
 
 
 class BackgroundTaskManagerTests(unittest.TestCase):
-    def test_start_runs_target_with_args_and_returns_thread(self):
+    def test_start_runs_target_with_args_on_daemon_worker(self):
         calls = []
-        manager = BackgroundTaskManager(thread_factory=ImmediateThread)
+        DeferredThread.created = []
+        manager = BackgroundTaskManager(thread_factory=DeferredThread)
 
-        thread = manager.start(lambda alpha, beta=None: calls.append((alpha, beta)), "a", beta="b")
+        task = manager.start(lambda alpha, beta=None: calls.append((alpha, beta)) or "done", "a", beta="b")
+        DeferredThread.created[0].run()
 
-        self.assertTrue(thread.started)
-        self.assertTrue(thread.daemon)
+        self.assertTrue(DeferredThread.created[0].daemon)
+        self.assertTrue(task.done())
+        self.assertEqual(task.result(), "done")
         self.assertEqual(calls, [("a", "b")])
 
     def test_start_delayed_sleeps_before_running_target(self):
@@ -110,5 +132,85 @@ class BackgroundTaskManagerTests(unittest.TestCase):
         self.assertFalse(harness.pending_refresh)
 
 
+class TaskSchedulerTests(unittest.TestCase):
+    def setUp(self):
+        DeferredThread.created = []
+
+    def test_interactive_tasks_run_before_background_tasks(self):
+        calls = []
+        scheduler = TaskScheduler(max_workers=1, thread_factory=DeferredThread, idle_timeout_seconds=0)
+
+        scheduler.submit(calls.append, "background", priority=TASK_PRIORITY_BACKGROUND)
+        scheduler.submit(calls.append, "interactive", priority=TASK_PRIORITY_INTERACTIVE)
+        DeferredThread.created[0].run()
+
+        self.assertEqual(calls, ["interactive", "background"])
+        self.assertEqual(len(DeferredThread.created), 1)
+
+    def test_worker_count_is_bounded(self):
+        scheduler = TaskScheduler(max_workers=2, thread_factory=DeferredThread, idle_timeout_seconds=0)
+
+        for index in range(5):
+            scheduler.submit(lambda: None)
+
+        self.assertEqual(len(DeferredThread.created), 2)
+        self.assertEqual(scheduler.get_stats()["queued"], {"interactive": 0, "background": 5})
+
+    def test_duplicate_keys_are_coalesced_and_promoted(self):
+        calls = []
+        scheduler = TaskScheduler(max_workers=1, thread_factory=DeferredThread, idle_timeout_seconds=0)
+
+        scheduler.submit(calls.append, "other", priority=TASK_PRIORITY_INTERACTIVE)
+        first = scheduler.submit(calls.append, "refresh", key="570")
+        duplicate = scheduler.submit(calls.append, "again", priority=TASK_PRIORITY_INTERACTIVE, key="570")
+        DeferredThread.created[0].run()
+
+        self.assertIs(first, duplicate)
+        self.assertEqual(calls, ["other", "refresh"])
+        self.assertEqual(scheduler.get_stats()["coalesced"], 1)
+        self.assertIsNot(scheduler.submit(calls.append, "later", key="570"), first)
+
+    def test_background_lane_leaves_workers_for_interactive_tasks(self):
+        scheduler = TaskScheduler(max_workers=2, max_background_workers=1, thread_factory=threading.Thread)
+        release = threading.Event()
+        background = scheduler.submit(release.wait, 5)
+
+        interactive = scheduler.submit(lambda: "ready", priority=TASK_PRIORITY_INTERACTIVE)
+        queued_background = scheduler.submit(lambda: "queued")
+
+        self.assertEqual(interactive.result(timeout=5), "ready")
+        self.assertFalse(queued_background.join(0.05))
+        release.set()
+        self.assertTrue(background.result(timeout=5))
+        self.assertEqual(queued_background.result(timeout=5), "queued")
+
+    def test_result_runs_queued_task_on_waiting_thread(self):
+        scheduler = TaskScheduler(max_workers=1, thread_factory=DeferredThread, idle_timeout_seconds=0)
+
+        task = scheduler.submit(threading.get_ident, priority=TASK_PRIORITY_INTERACTIVE)
+
+        self.assertEqual(task.result(), threading.get_ident())
+        self.assertEqual(scheduler.get_stats()["completed"], 1)
+
+    def test_result_reraises_task_errors(self):
+        scheduler = TaskScheduler(thread_factory=ImmediateThread, idle_timeout_seconds=0)
+
+        task = scheduler.submit(lambda: 1 / 0)
+
+        with self.assertRaises(ZeroDivisionError):
+            task.result()
+
+    def test_unfinished_tasks_are_listed_until_they_finish(self):
+        scheduler = TaskScheduler(max_workers=1, thread_factory=DeferredThread, idle_timeout_seconds=0)
+
+        first = scheduler.submit(lambda: None, key="first")
+        second = scheduler.submit(lambda: None)
+        first.result()
+
+        self.assertEqual(scheduler.list_unfinished_tasks(), [second])
+        DeferredThread.created[0].run()
+        self.assertEqual(scheduler.list_unfinished_tasks(), [])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -233,6 +233,20 @@ class UICommandsTests(unittest.TestCase):
             ],
         )
 
+    def test_build_status_results_appends_cache_usage_line(self):
+        harness = UICommandsHarness()
+        harness.DEFAULT_ICON = "default-icon"
+        harness.get_cache_footprint = lambda: {
+            "budget_bytes": 128 * 1024 * 1024,
+            "caches": {"images": 2 * 1024 * 1024, "metrics": 2048, "avatars": 0},
+        }
+
+        results = harness.build_status_results()
+
+        self.assertEqual(results[-1]["Title"], "Cache Usage: 2.0 MB of 128.0 MB")
+        self.assertEqual(results[-1]["SubTitle"], "images 2.0 MB | metrics 2.0 KB")
+        self.assertLess(results[-1]["Score"], results[-2]["Score"])
+
     def test_build_status_results_uses_warning_icon_for_unknown_status(self):
         harness = UICommandsHarness()
         harness.active_local_persona_state = None
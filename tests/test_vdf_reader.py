@@ -0,0 +1,100 @@
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+LIB_PATH = PROJECT_ROOT / "lib"
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+if str(LIB_PATH) not in sys.path:
+    sys.path.insert(0, str(LIB_PATH))
+
+from steamflow.vdf_reader import compile_vdf_key_path, load_vdf_path, parse_vdf_bytes
+
+
+APPMANIFEST_BYTES = (
+    b'\xef\xbb\xbf"AppState"\n{\n'
+    b'\t"appid"\t\t"1451940"\n'
+    b'\t"name"\t\t"NEEDY GIRL \\"OVERDOSE\\""\n'
+    b'\t"StateFlags"\t\t"4"\n'
+    b'\t"installdir"\t\t"NEEDY GIRL OVERDOSE"\n'
+    b'\t"BytesToDownload"\t\t"10"\n'
+    b'\t"BytesDownloaded"\t\t"5"\n'
+    b'\t"InstalledDepots"\n\t{\n\t\t"1451941"\n\t\t{\n\t\t\t"manifest"\t\t"123"\n\t\t}\n\t}\n'
+    b'\t"UserConfig"\n\t{\n\t\t"language"\t\t"english"\n\t}\n'
+    b"}\n"
+)
+
+
+class VdfReaderTests(unittest.TestCase):
+    def test_parse_without_filter_builds_full_tree(self):
+        parsed = parse_vdf_bytes(APPMANIFEST_BYTES)
+
+        app_state = parsed["AppState"]
+        self.assertEqual(app_state["name"], 'NEEDY GIRL "OVERDOSE"')
+        self.assertEqual(app_state["InstalledDepots"]["1451941"]["manifest"], "123")
+        self.assertEqual(app_state["UserConfig"], {"language": "english"})
+
+    def test_key_path_filter_keeps_selected_keys_and_prefix_matches(self):
+        parsed = parse_vdf_bytes(APPMANIFEST_BYTES, key_path="AppState/{appid,installdir,Bytes*}")
+
+        self.assertEqual(
+            parsed,
+            {
+                "AppState": {
+                    "appid": "1451940",
+                    "installdir": "NEEDY GIRL OVERDOSE",
+                    "BytesToDownload": "10",
+                    "BytesDownloaded": "5",
+                }
+            },
+        )
+
+    def test_key_path_filter_stops_after_all_exact_keys_are_found(self):
+        truncated = APPMANIFEST_BYTES.replace(b'\t"InstalledDepots"', b'\t"InstalledDepots" {{{ broken')
+
+        parsed = parse_vdf_bytes(truncated, key_path="AppState/{appid,name}")
+
+        self.assertEqual(parsed["AppState"], {"appid": "1451940", "name": 'NEEDY GIRL "OVERDOSE"'})
+
+    def test_key_path_wildcard_segment_walks_every_child_block(self):
+        data = (
+            b'"libraryfolders"\n{\n'
+            b'\t"0"\n\t{\n\t\t"path"\t\t"C:\\\\Steam"\n\t\t"apps"\n\t\t{\n\t\t\t"10"\t\t"1"\n\t\t}\n\t}\n'
+            b'\t"1"\n\t{\n\t\t"path"\t\t"D:\\\\SteamLibrary"\n\t}\n'
+            b"}\n"
+        )
+
+        parsed = parse_vdf_bytes(data, key_path="libraryfolders/*/path")
+
+        self.assertEqual(
+            parsed,
+            {"libraryfolders": {"0": {"path": "C:\\Steam"}, "1": {"path": "D:\\SteamLibrary"}}},
+        )
+
+    def test_skipped_blocks_ignore_braces_inside_strings(self):
+        data = b'"root"\n{\n\t"skip"\n\t{\n\t\t"text"\t\t"} { }"\n\t}\n\t"keep"\t\t"yes"\n}\n'
+
+        self.assertEqual(parse_vdf_bytes(data, key_path="root/keep"), {"root": {"keep": "yes"}})
+
+    def test_compile_vdf_key_path_splits_on_slashes_outside_braces(self):
+        segments = compile_vdf_key_path("a/{b,c*}/d")
+
+        self.assertEqual(len(segments), 3)
+        self.assertTrue(segments[1].matches(b"b"))
+        self.assertTrue(segments[1].matches(b"cat"))
+        self.assertFalse(segments[1].matches(b"x"))
+
+    def test_load_vdf_path_reads_file_bytes(self):
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "appmanifest_1451940.acf"
+            path.write_bytes(APPMANIFEST_BYTES)
+
+            parsed = load_vdf_path(path, key_path="AppState/{appid}")
+
+        self.assertEqual(parsed, {"AppState": {"appid": "1451940"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,9 +16,11 @@ from tests._pyflowlauncher_stub import install_pyflowlauncher_stub
 
 install_pyflowlauncher_stub()
 
+from steamflow.app_details import build_app_search_entry
 from steamflow.storage import SteamPluginStorageMixin
 from steamflow.ui_commands import SteamPluginUICommandsMixin
 from steamflow.wishlist import SteamPluginWishlistMixin
+from steamflow.wishlist_service import WishlistIndex
 from steamflow.constants import STEAMFLOW_CONFIG
 
 
@@ -35,7 +37,7 @@ class WishlistHarness(SteamPluginWishlistMixin, SteamPluginStorageMixin, SteamPl
         self.app_settings = {"PluginSettings": {"Plugins": {}}}
         self.wishlist_cache_file = Path(temp_dir) / "cache_wishlist.json"
         self.wishlist_cache_loaded = False
-        self.wishlist_items = []
+        self.wishlist_index = None
         self.wishlist_last_attempt = 0
         self.wishlist_last_sync = 0
         self.wishlist_steamid64 = None
@@ -48,6 +50,8 @@ class WishlistHarness(SteamPluginWishlistMixin, SteamPluginStorageMixin, SteamPl
         self.started_workers = []
         self.started_mutation_workers = []
         self.metadata_by_app_id = {}
+        self.metadata_reads = []
+        self.search_entry_reads = []
         self.enabled_features = {
             "steam_session_token": True,
             "steam_wishlist": True,
@@ -77,12 +81,16 @@ class WishlistHarness(SteamPluginWishlistMixin, SteamPluginStorageMixin, SteamPl
     def get_active_steam_user_steamid64(self):
         return self.active_steamid64
 
-    def fetch_wishlist_items_from_api(self, api_key, steamid64, timeout=3):
+    def fetch_wishlist_update_from_api(self, api_key, steamid64, timeout=3, validators=None):
         self.fetch_calls.append((api_key, steamid64, timeout))
-        return [
-            {"appid": "20", "date_added": 200, "priority": 0},
-            {"appid": "10", "date_added": 100, "priority": 0},
-        ]
+        return {
+            "not_modified": False,
+            "items": [
+                {"appid": "20", "date_added": 200, "priority": 0},
+                {"appid": "10", "date_added": 100, "priority": 0},
+            ],
+            "validators": {},
+        }
 
     def schedule_wishlist_refresh(self, force=False):
         self.scheduled_refreshes.append(force)
@@ -134,8 +142,21 @@ class WishlistHarness(SteamPluginWishlistMixin, SteamPluginStorageMixin, SteamPl
         return {"app_id": app_id, "name": name}
 
     def get_app_details_metadata(self, app_id, allow_network_on_miss=True):
+        self.metadata_reads.append(str(app_id))
         return self.metadata_by_app_id.get(str(app_id))
 
+    def read_app_search_entries(self, app_ids):
+        self.search_entry_reads.append(list(app_ids))
+        search_entries = {}
+        for app_id in app_ids:
+            search_entry = build_app_search_entry(self.metadata_by_app_id.get(str(app_id)))
+            if search_entry:
+                search_entries[str(app_id)] = search_entry
+        return search_entries
+
+    def get_app_search_signature(self):
+        return ("us", "english", tuple(sorted(self.metadata_by_app_id)))
+
     def process_game_data(self, game_data, allow_cold_metric_fetch=True):
         return {
             "Title": f"\U0001F6D2 {game_data['name']}",
@@ -175,7 +196,7 @@ class WishlistTests(unittest.TestCase):
             harness.load_wishlist_cache()
 
             self.assertTrue(harness.wishlist_cache_loaded)
-            self.assertEqual(harness.wishlist_items[0]["appid"], "20")
+            self.assertEqual(harness.wishlist_index.app_ids(), ["20"])
 
     def test_build_wishlist_results_sorts_by_date_added_desc(self):
         with TemporaryDirectory() as temp_dir:
@@ -220,6 +241,34 @@ class WishlistTests(unittest.TestCase):
             self.assertEqual(len(results), 1)
             self.assertEqual(results[0]["Title"], "\U0001F6D2 Final Fantasy")
 
+    def test_wishlist_search_reads_index_once_and_renders_only_visible_items(self):
+        with TemporaryDirectory() as temp_dir:
+            harness = WishlistHarness(temp_dir)
+            harness.metadata_by_app_id = {
+                "10": {"name": "Final Fantasy", "type": "game", "is_free": False, "platforms": {}, "has_price": False, "price": None},
+                "20": {"name": "Portal", "type": "game", "is_free": False, "platforms": {}, "has_price": False, "price": None},
+            }
+
+            harness.build_wishlist_results("f")
+            results = harness.build_wishlist_results("final")
+
+            self.assertEqual([result["Title"] for result in results], ["\U0001F6D2 Final Fantasy"])
+            self.assertEqual(harness.search_entry_reads, [["20", "10"]])
+            self.assertEqual(harness.metadata_reads, ["10", "10"])
+
+    def test_hydrated_app_details_update_wishlist_search_index(self):
+        with TemporaryDirectory() as temp_dir:
+            harness = WishlistHarness(temp_dir)
+            harness.build_wishlist_results()
+
+            harness.update_wishlist_search_entry("10", build_app_search_entry({"name": "Hydrated"}), ("us", "english"))
+            harness.update_wishlist_search_entry("20", build_app_search_entry({"name": "Other"}), ("kz", "english"))
+
+            self.assertEqual(list(harness.wishlist_search_index.entries), ["10"])
+            self.assertEqual(harness.get_wishlist_missing_appdetails_items(harness.wishlist_index.by_date), [
+                {"appid": "20", "date_added": 200, "priority": 0},
+            ])
+
     def test_build_wishlist_results_returns_search_status_when_matches_are_still_loading(self):
         with TemporaryDirectory() as temp_dir:
             harness = WishlistHarness(temp_dir)
@@ -302,7 +351,7 @@ class WishlistTests(unittest.TestCase):
         with TemporaryDirectory() as temp_dir:
             harness = WishlistHarness(temp_dir)
             harness.wishlist_cache_loaded = True
-            harness.wishlist_items = [{"appid": "10", "date_added": 100, "priority": 0}]
+            harness.wishlist_index = WishlistIndex.from_items([{"appid": "10", "date_added": 100, "priority": 0}])
             harness.wishlist_steamid64 = harness.active_steamid64
             harness.wishlist_last_sync = 1
 
@@ -312,11 +361,36 @@ class WishlistTests(unittest.TestCase):
             self.assertEqual(items[0]["appid"], "10")
             self.assertEqual(harness.scheduled_refreshes, [False])
 
+    def test_refresh_wishlist_keeps_cached_items_when_not_modified(self):
+        with TemporaryDirectory() as temp_dir:
+            harness = WishlistHarness(temp_dir)
+            harness.wishlist_cache_loaded = True
+            harness.wishlist_index = WishlistIndex.from_items([{"appid": "10", "date_added": 100, "priority": 0}])
+            harness.wishlist_steamid64 = harness.active_steamid64
+            harness.wishlist_validators = {"etag": '"v1"'}
+            fetched_validators = []
+
+            def fetch_wishlist_update_from_api(api_key, steamid64, timeout=3, validators=None):
+                fetched_validators.append(validators)
+                return {"not_modified": True, "items": [], "validators": {"etag": '"v1"'}}
+
+            harness.fetch_wishlist_update_from_api = fetch_wishlist_update_from_api
+
+            harness.refresh_wishlist()
+
+            with open(harness.wishlist_cache_file, "r", encoding="utf-8") as file_obj:
+                cache_data = json.load(file_obj)
+            self.assertEqual(fetched_validators, [{"etag": '"v1"'}])
+            self.assertEqual(harness.wishlist_index.app_ids(), ["10"])
+            self.assertGreater(harness.wishlist_last_sync, 0)
+            self.assertEqual(cache_data["validators"], {"etag": '"v1"'})
+            self.assertEqual(cache_data["items"][0]["appid"], "10")
+
     def test_add_to_steam_wishlist_updates_cache_and_starts_worker(self):
         with TemporaryDirectory() as temp_dir:
             harness = WishlistHarness(temp_dir)
             harness.wishlist_cache_loaded = True
-            harness.wishlist_items = [{"appid": "10", "date_added": 100, "priority": 0}]
+            harness.wishlist_index = WishlistIndex.from_items([{"appid": "10", "date_added": 100, "priority": 0}])
             harness.wishlist_steamid64 = harness.active_steamid64
 
             message = harness.add_to_steam_wishlist("20")
@@ -333,7 +407,7 @@ class WishlistTests(unittest.TestCase):
         with TemporaryDirectory() as temp_dir:
             harness = WishlistHarness(temp_dir)
             harness.wishlist_cache_loaded = True
-            harness.wishlist_items = [{"appid": "10", "date_added": 100, "priority": 0}]
+            harness.wishlist_index = WishlistIndex.from_items([{"appid": "10", "date_added": 100, "priority": 0}])
             harness.wishlist_steamid64 = harness.active_steamid64
 
             message = harness.add_to_steam_wishlist("10")
@@ -346,7 +420,7 @@ class WishlistTests(unittest.TestCase):
         with TemporaryDirectory() as temp_dir:
             harness = WishlistHarness(temp_dir)
             harness.wishlist_cache_loaded = True
-            harness.wishlist_items = [{"appid": "10", "date_added": 100, "priority": 0}]
+            harness.wishlist_index = WishlistIndex.from_items([{"appid": "10", "date_added": 100, "priority": 0}])
             harness.wishlist_steamid64 = harness.active_steamid64
 
             message = harness.remove_from_steam_wishlist("10")
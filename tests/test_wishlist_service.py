@@ -13,7 +13,8 @@ if str(LIB_PATH) not in sys.path:
     sys.path.insert(0, str(LIB_PATH))
 
 from steamflow.wishlist_service import (
-    add_wishlist_cache_item,
+    WishlistIndex,
+    WishlistSearchIndex,
     build_wishlist_cache_payload,
     build_wishlist_results_plan,
     collect_unique_wishlist_app_ids,
@@ -25,11 +26,8 @@ from steamflow.wishlist_service import (
     normalize_wishlist_cache_payload,
     normalize_wishlist_items,
     parse_wishlist_payload,
-    remove_wishlist_cache_item,
     select_wishlist_prewarm_items,
-    sort_wishlist_items,
     start_wishlist_hydration_worker_process,
-    wishlist_contains_app_id,
 )
 
 
@@ -77,7 +75,11 @@ class WishlistServiceTests(unittest.TestCase):
 
     def test_fetch_wishlist_result_wraps_success_and_error(self):
         success = fetch_wishlist_result(
-            lambda _api_key, _steamid64, timeout=3: [{"appid": "570"}],
+            lambda _api_key, _steamid64, timeout=3, validators=None: {
+                "not_modified": False,
+                "items": [{"appid": "570"}],
+                "validators": {},
+            },
             "KEY",
             "steamid",
         )
@@ -108,13 +110,14 @@ class WishlistServiceTests(unittest.TestCase):
         self.assertEqual(normalized["last_attempt"], 10.5)
         self.assertEqual(normalized["last_sync"], 0.0)
         self.assertEqual(normalized["steamid64"], "76561198000000000")
-        self.assertEqual(normalized["items"], [{"appid": "570", "date_added": 100, "priority": 0}])
+        self.assertEqual(normalized["index"].by_date, [{"appid": "570", "date_added": 100, "priority": 0}])
 
-        payload = build_wishlist_cache_payload(1, 2, "steamid", normalized["items"])
+        payload = build_wishlist_cache_payload(1, 2, "steamid", normalized["index"])
 
         self.assertEqual(payload["last_attempt"], 1)
         self.assertEqual(payload["timestamp"], 2)
-        self.assertEqual(payload["items"], normalized["items"])
+        self.assertEqual(payload["items"], normalized["index"].by_date)
+        self.assertEqual(normalize_wishlist_cache_payload(payload)["index"].by_date, payload["items"])
 
     def test_is_wishlist_cache_fresh_requires_matching_user_and_fresh_timestamp(self):
         self.assertTrue(is_wishlist_cache_fresh("steamid", "steamid", 10, 20, lambda timestamp, ttl: True))
@@ -168,25 +171,46 @@ class WishlistServiceTests(unittest.TestCase):
 
         self.assertEqual(calls[0][0][0], ["python", str(worker_script), "us", "570", "english", "--force"])
 
-    def test_sort_wishlist_items_orders_newest_first_then_app_id(self):
-        sorted_items = sort_wishlist_items([{"appid": "20", "date_added": 1}, {"appid": "10", "date_added": 2}])
+    def test_wishlist_index_orders_newest_first_then_app_id(self):
+        sorted_items = WishlistIndex.from_items([{"appid": "20", "date_added": 1}, {"appid": "10", "date_added": 2}]).by_date
 
         self.assertEqual([item["appid"] for item in sorted_items], ["10", "20"])
-        self.assertEqual(select_wishlist_prewarm_items(sorted_items, 1), [{"appid": "10", "date_added": 2}])
+        self.assertEqual(
+            select_wishlist_prewarm_items(sorted_items, 1),
+            [{"appid": "10", "date_added": 2, "priority": 0}],
+        )
+
+    def test_wishlist_index_updates_membership_and_sort_orders_incrementally(self):
+        index = WishlistIndex.from_items(
+            [
+                {"appid": "10", "date_added": 100, "priority": 2},
+                {"appid": "30", "date_added": 300, "priority": 1},
+                {"appid": "10", "date_added": 999, "priority": 0},
+            ]
+        )
 
-    def test_wishlist_cache_mutation_helpers_update_membership(self):
-        items = [{"appid": "10", "date_added": 100, "priority": 0}]
+        self.assertIn("10", index)
+        self.assertNotIn("20", index)
+        self.assertTrue(index.add("20", date_added=200, priority=0))
+        self.assertFalse(index.add(" 20 ", date_added=400))
+        self.assertEqual(index.app_ids(), ["30", "20", "10"])
 
-        self.assertTrue(wishlist_contains_app_id(items, "10"))
-        self.assertFalse(wishlist_contains_app_id(items, "20"))
+        self.assertTrue(index.remove("30"))
+        self.assertFalse(index.remove("30"))
+        self.assertEqual((len(index), index.app_ids()), (2, ["20", "10"]))
 
-        added = add_wishlist_cache_item(items, "20", now=200)
-        self.assertEqual([item["appid"] for item in added], ["10", "20"])
-        self.assertEqual(added[1]["date_added"], 200)
-        self.assertEqual(add_wishlist_cache_item(added, "20", now=300), added)
+    def test_wishlist_index_payload_round_trip_restores_date_order(self):
+        index = WishlistIndex.from_items(
+            [{"appid": "10", "date_added": 100, "priority": 1}, {"appid": "20", "date_added": 200, "priority": 0}]
+        )
+        payload = json.loads(json.dumps(index.to_payload()))
+        restored = WishlistIndex.from_payload(payload)
+        payload["items"].reverse()
+        resorted = WishlistIndex.from_payload(payload)
 
-        removed = remove_wishlist_cache_item(added, "10")
-        self.assertEqual([item["appid"] for item in removed], ["20"])
+        self.assertEqual(list(payload), ["items"])
+        self.assertEqual(restored.by_date, index.by_date)
+        self.assertEqual(resorted.by_date, index.by_date)
 
     def test_build_wishlist_results_plan_splits_loaded_visible_and_missing_items(self):
         wishlist_items = [
@@ -194,15 +218,15 @@ class WishlistServiceTests(unittest.TestCase):
             {"appid": "20", "date_added": 200},
             {"appid": "10", "date_added": 100},
         ]
-        metadata_by_app_id = {
-            "10": {"name": "Final Fantasy"},
-            "20": {"name": "Portal"},
+        search_entries = {
+            "10": {"name": "final fantasy"},
+            "20": {"name": "portal"},
         }
 
         plan = build_wishlist_results_plan(
             wishlist_items,
-            "final",
-            lambda app_id: metadata_by_app_id.get(str(app_id)),
+            "Final",
+            search_entries,
             max_results=5,
         )
 
@@ -211,6 +235,16 @@ class WishlistServiceTests(unittest.TestCase):
         self.assertEqual([item["appid"] for item in plan["missing_items"]], ["30"])
         self.assertEqual([item["appid"] for item in plan["visible_items"]], ["10"])
 
+    def test_wishlist_search_index_tracks_loaded_ids_and_scope(self):
+        search_index = WishlistSearchIndex(("us", "english", (1, 0)))
+        search_index.update(["10", "20"], {"10": {"name": "portal"}})
+
+        self.assertEqual(search_index.list_unloaded_app_ids(["10", "20", "30", "30"]), ["30"])
+        self.assertTrue(search_index.matches_scope(("us", "english")))
+        self.assertFalse(search_index.matches_scope(("kz", "english")))
+        search_index.set_entry("10", None)
+        self.assertEqual(search_index.entries, {})
+
 
 if __name__ == "__main__":
     unittest.main()